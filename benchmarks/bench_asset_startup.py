@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark time to the main menu with eager and lazy asset loading
+
+Each mode runs in a fresh interpreter: the asset loader is built, the main
+menu constructed and its first frame drawn. Reports the time that took and
+the resident memory at that point, then - for lazy mode - how long the
+background decoding took to finish and the memory once everything is loaded.
+Run it from the project root so the asset loader finds the assets.
+
+Usage:
+    python benchmarks/bench_asset_startup.py [eager|lazy|both] [--json]
+"""
+
+import sys
+import os
+import json
+import time
+import subprocess
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def resident_mb():
+    """Current resident set size in MB"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024  # Peak, in KB on Linux
+
+
+def measure(mode):
+    """Time to the first main menu frame in this process"""
+    import pygame
+    from types import SimpleNamespace
+    from src.core.assets import AssetLoader
+    from src.ui.menu.main_menu import MainMenu
+
+    pygame.init()
+    screen = pygame.display.set_mode((1024, 768))
+    baseline = resident_mb()
+
+    started = time.perf_counter()
+    loader = AssetLoader({"lazy_asset_loading": mode == "lazy"})
+    menu = MainMenu(SimpleNamespace(asset_loader=loader, settings=None))
+    menu.render(screen)
+    pygame.display.flip()
+    result = {
+        "mode": mode,
+        "time_to_menu_s": time.perf_counter() - started,
+        "rss_at_menu_mb": resident_mb(),
+        "rss_baseline_mb": baseline,
+    }
+
+    started = time.perf_counter()
+    loader.finish_loading()
+    result["finish_loading_s"] = time.perf_counter() - started
+    result["rss_all_loaded_mb"] = resident_mb()
+    if loader.manifest is not None:
+        result["manifest_rehashed"] = loader.manifest.rehashed
+    return result
+
+
+def run_child(mode):
+    """Measure a mode in a fresh interpreter"""
+    output = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', mode],
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    flags = [arg for arg in sys.argv[1:] if arg.startswith('--')]
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+
+    if '--child' in flags:
+        print(json.dumps(measure(args[0])))
+        return
+
+    mode = args[0] if args else 'both'
+    modes = ['eager', 'lazy'] if mode == 'both' else [mode]
+    results = [run_child(name) for name in modes]
+
+    if '--json' in flags:
+        print(json.dumps(results, indent=2))
+        return
+    for result in results:
+        print(f"{result['mode']:>5}: main menu in {result['time_to_menu_s']:.2f}s, "
+              f"RSS {result['rss_at_menu_mb']:.0f}MB at menu "
+              f"({result['rss_baseline_mb']:.0f}MB before loading), "
+              f"{result['rss_all_loaded_mb']:.0f}MB once all loaded "
+              f"(+{result['finish_loading_s']:.2f}s to finish)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark biome and tile generation per chunk
+
+Compares the pure Python BiomeGenerator backend against the NumPy backend,
+both through the list-of-lists API used by WorldGenerator and as raw arrays,
+plus batched biome generation for many chunks at once.
+
+Usage:
+    python benchmarks/bench_biome_generation.py [chunks]
+"""
+
+import sys
+import os
+import time
+import contextlib
+import io
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.procedural_generation.src.biome_generator import BiomeGenerator, NUMPY_AVAILABLE
+from src.procedural_generation.src.seeding import derive_seed
+from src.world.chunk import Chunk
+
+if NUMPY_AVAILABLE:
+    from src.procedural_generation.src.biome_generator import generate_biome_id_batch
+
+
+def chunk_seeds(count):
+    """Chunk seeds the way WorldGenerator derives them"""
+    return [derive_seed(12345, x, 0) for x in range(count)]
+
+
+def time_per_chunk(label, seeds, generate):
+    """Run generate(seed) for every seed and report the mean time per chunk"""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for seed in seeds:
+            generate(seed)
+    elapsed = time.perf_counter() - start
+    per_chunk_ms = elapsed * 1000 / len(seeds)
+    print(f"  {label:<32} {per_chunk_ms:8.3f} ms/chunk")
+    return per_chunk_ms
+
+
+def generate_lists(backend):
+    """Generate a chunk's biome and tile lists with the given backend"""
+    def generate(seed):
+        biome_gen = BiomeGenerator(Chunk.CHUNK_SIZE, Chunk.CHUNK_SIZE, seed, backend=backend)
+        biome_gen.generate_tiles(biome_gen.generate_biome_map())
+    return generate
+
+
+def generate_arrays(seed):
+    """Generate a chunk's biome and tile arrays without list conversion"""
+    biome_gen = BiomeGenerator(Chunk.CHUNK_SIZE, Chunk.CHUNK_SIZE, seed, backend='numpy')
+    biome_gen.generate_tile_ids(biome_gen.generate_biome_ids())
+
+
+def main():
+    """Run the benchmark"""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    seeds = chunk_seeds(count)
+    print(f"Biome generation, {count} chunks of {Chunk.CHUNK_SIZE}x{Chunk.CHUNK_SIZE} tiles")
+
+    baseline = time_per_chunk("python (lists)", seeds, generate_lists('python'))
+    if not NUMPY_AVAILABLE:
+        print("  numpy not installed - skipping the NumPy backend")
+        return
+
+    for label, generate in (("numpy (lists adapter)", generate_lists('numpy')),
+                            ("numpy (arrays)", generate_arrays)):
+        per_chunk = time_per_chunk(label, seeds, generate)
+        print(f"  {'':<32} {baseline / per_chunk:8.1f}x faster")
+
+    start = time.perf_counter()
+    generate_biome_id_batch(seeds, Chunk.CHUNK_SIZE, Chunk.CHUNK_SIZE)
+    batch_ms = (time.perf_counter() - start) * 1000 / count
+    print(f"  {'numpy batch (biome ids only)':<32} {batch_ms:8.3f} ms/chunk")
+
+
+if __name__ == "__main__":
+    main()
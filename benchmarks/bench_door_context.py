@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Benchmark door-aware collision queries near a settlement
+
+Generates the chunks around a seeded settlement and measures check_collision,
+analyze_door_context and is_direct_path_clear at points around its buildings,
+with the per-chunk door field and with the per-call tile scans it replaced.
+Run it from the project root so the building templates are found.
+
+Usage:
+    python benchmarks/bench_door_context.py [queries] [seed] [chunk_x] [chunk_y]
+"""
+
+import sys
+import os
+import io
+import contextlib
+import random
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.world.chunk import Chunk
+from src.world.world_generator import WorldGenerator
+from src.world.building_registry import WALL_TILES
+from src.level.level_collision import CollisionMixin
+from src.door_pathfinder import DoorPathfinder
+
+WALKABLE_TILES = {0, 1, 2, 5, 13, 16, 17, 18, 19}
+
+
+class BenchChunks:
+    """Loaded chunks, standing in for the chunk manager"""
+
+    def __init__(self, chunks):
+        self.loaded_chunks = {(chunk.chunk_x, chunk.chunk_y): chunk for chunk in chunks}
+        self.tile_listeners = []
+
+
+class Walls:
+    """Wall renderer stand-in"""
+
+    def is_wall_tile(self, tile_type):
+        return tile_type in WALL_TILES
+
+
+class BenchLevel(CollisionMixin):
+    """Level over generated chunks using the door field"""
+
+    TILE_DOOR = 5
+
+    def __init__(self, chunks):
+        self.chunk_manager = BenchChunks(chunks)
+        size = Chunk.CHUNK_SIZE
+        self.width = (max(chunk.chunk_x for chunk in chunks) + 1) * size
+        self.height = (max(chunk.chunk_y for chunk in chunks) + 1) * size
+        self.walkable = [[1] * self.width for _ in range(self.height)]
+        for chunk in chunks:
+            for local_y, row in enumerate(chunk.tiles):
+                walkable_row = self.walkable[chunk.chunk_y * size + local_y]
+                for local_x, tile in enumerate(row):
+                    walkable_row[chunk.chunk_x * size + local_x] = 1 if tile in WALKABLE_TILES else 0
+        self.objects, self.chests, self.furniture, self.npcs, self.enemies = [], [], [], [], []
+        self.wall_renderer = Walls()
+        self.door_pathfinder = DoorPathfinder(self)
+
+    def get_tile(self, x, y):
+        chunk = self.chunk_manager.loaded_chunks.get((x // Chunk.CHUNK_SIZE, y // Chunk.CHUNK_SIZE))
+        return chunk.tiles[y % Chunk.CHUNK_SIZE][x % Chunk.CHUNK_SIZE] if chunk else 0
+
+
+class ScanLevel(BenchLevel):
+    """Level without the door field - every query scans the tiles around it"""
+
+    def get_door_field(self):
+        return None
+
+
+def sample_queries(buildings, count, seed=7):
+    """Points around buildings and short paths through their doors"""
+    rng = random.Random(seed)
+    points = []
+    paths = []
+    for _ in range(count):
+        building = rng.choice(buildings)
+        min_x, min_y, max_x, max_y = building['bounds']
+        points.append((rng.uniform(min_x - 3, max_x + 4), rng.uniform(min_y - 3, max_y + 4)))
+        door_x, door_y, orientation = rng.choice(building['doors'])
+        if orientation == "vertical":
+            paths.append((door_x + 0.5, door_y - 2.5, door_x + 0.5, door_y + 3.5))
+        else:
+            paths.append((door_x - 2.5, door_y + 0.5, door_x + 3.5, door_y + 0.5))
+    return points, paths[:count // 10]
+
+
+def run(level, points, paths):
+    """Time each query type, returning (rates, results)"""
+    rates = {}
+    results = []
+    door_pathfinder = level.door_pathfinder
+
+    start = time.perf_counter()
+    results.append([level.check_collision(x, y) for x, y in points])
+    rates['check_collision'] = len(points) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    results.append([door_pathfinder.analyze_door_context(int(x), int(y), x, y) for x, y in points])
+    rates['analyze_door_context'] = len(points) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    results.append([level.is_direct_path_clear(*path) for path in paths])
+    rates['is_direct_path_clear'] = len(paths) / (time.perf_counter() - start)
+    return rates, results
+
+
+def main():
+    """Run the benchmark"""
+    queries = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 12345
+    center_x = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+    center_y = int(sys.argv[4]) if len(sys.argv) > 4 else 11
+
+    generator = WorldGenerator(seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        chunks = [generator.generate_chunk(center_x + dx, center_y + dy)
+                  for dy in (-1, 0, 1) for dx in (-1, 0, 1)]
+    if min(min(chunk.chunk_x, chunk.chunk_y) for chunk in chunks) < 0:
+        sys.exit("The tile scans only cover non-negative coordinates - pick a settlement chunk away from the origin")
+    buildings = [building for chunk in chunks for building in chunk.buildings if building['doors']]
+    if not buildings:
+        sys.exit(f"No buildings around chunk ({center_x}, {center_y}) with seed {seed}")
+
+    points, paths = sample_queries(buildings, queries)
+    print(f"Door context queries: {len(buildings)} buildings around chunk ({center_x}, {center_y}), "
+          f"{len(points)} points, {len(paths)} paths")
+
+    scan_rates, scan_results = run(ScanLevel(chunks), points, paths)
+    field_level = BenchLevel(chunks)
+    field_level.get_door_field().get_field(center_x, center_y)  # Built when the chunk is first queried
+    field_rates, field_results = run(field_level, points, paths)
+
+    for name in scan_rates:
+        print(f"  {name:<22} tile scan {scan_rates[name]:>10,.0f}/s   door field {field_rates[name]:>10,.0f}/s"
+              f"   ({field_rates[name] / scan_rates[name]:.1f}x)")
+    print(f"  identical results: {scan_results == field_results}")
+
+
+if __name__ == "__main__":
+    main()
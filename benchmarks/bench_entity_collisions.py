@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark entity collision queries with and without the spatial hash
+
+Simulates frames of a busy loaded area: every enemy tests a step with
+check_collision and a share of them test a direct path to the player with
+is_direct_path_clear. The baseline swaps in an index that returns every
+entity, which is what the old linear scans did.
+
+Usage:
+    python benchmarks/bench_entity_collisions.py [enemies] [objects]
+"""
+
+import sys
+import os
+import random
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.level.level_collision import CollisionMixin
+from src.level.spatial_hash import SpatialHash, ENTITY_CATEGORIES
+
+WORLD_SIZE = 192  # 3x3 chunks of 64 tiles
+FRAMES = 20
+
+
+class BenchEntity:
+    """Minimal stand-in for a game entity"""
+
+    def __init__(self, x, y, blocks_movement=True):
+        self.x = x
+        self.y = y
+        self.blocks_movement = blocks_movement
+        self.width = 1
+        self.height = 1
+        self.size = 0.4
+
+
+class NoDoors:
+    """Door pathfinder that never reports a door"""
+
+    def analyze_door_context(self, tile_x, tile_y, world_x, world_y):
+        return {'is_door_area': False, 'is_double_door': False}
+
+
+class LinearIndex(SpatialHash):
+    """Returns every entity for every query - the old linear scan"""
+
+    def query(self, x, y, radius, categories=None):
+        for category in categories or self.categories:
+            for entity in getattr(self.owner, category):
+                yield category, entity
+
+
+class BenchLevel(CollisionMixin):
+    """Level with open terrain and randomly placed entities"""
+
+    TILE_DOOR = 5
+
+    def __init__(self, enemy_count, object_count, seed=1):
+        rng = random.Random(seed)
+        self.width = self.height = WORLD_SIZE
+        self.walkable = [[1] * WORLD_SIZE for _ in range(WORLD_SIZE)]
+        self.tiles = [[0] * WORLD_SIZE for _ in range(WORLD_SIZE)]
+        self.door_pathfinder = NoDoors()
+
+        def place():
+            return rng.uniform(2, WORLD_SIZE - 2), rng.uniform(2, WORLD_SIZE - 2)
+
+        self.enemies = [BenchEntity(*place(), blocks_movement=False) for _ in range(enemy_count)]
+        self.objects = [BenchEntity(*place()) for _ in range(object_count)]
+        self.npcs = [BenchEntity(*place(), blocks_movement=False) for _ in range(enemy_count // 4)]
+        self.chests = [BenchEntity(*place()) for _ in range(20)]
+        self.furniture = [BenchEntity(*place()) for _ in range(100)]
+        self.player = BenchEntity(WORLD_SIZE / 2, WORLD_SIZE / 2)
+
+    def get_tile(self, x, y):
+        return self.tiles[y][x]
+
+
+def run_frames(level):
+    """Move every enemy one step and test paths for a quarter of them"""
+    rng = random.Random(7)
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        level.get_spatial_index().refresh()
+        for i, enemy in enumerate(level.enemies):
+            new_x = enemy.x + rng.uniform(-0.1, 0.1)
+            new_y = enemy.y + rng.uniform(-0.1, 0.1)
+            if not level.check_collision(new_x, new_y, enemy.size, exclude_entity=enemy):
+                enemy.x, enemy.y = new_x, new_y
+            if i % 4 == 0:
+                # Short-range chase check toward a point 6 tiles away
+                level.is_direct_path_clear(enemy.x, enemy.y, enemy.x + 6, enemy.y + 3, enemy.size)
+    return (time.perf_counter() - start) * 1000 / FRAMES
+
+
+def main():
+    """Run the benchmark"""
+    enemy_count = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    object_count = int(sys.argv[2]) if len(sys.argv) > 2 else 1500
+    print(f"Collision queries: {enemy_count} enemies, {object_count} objects, {FRAMES} frames")
+
+    linear_level = BenchLevel(enemy_count, object_count)
+    linear_level.spatial_index = LinearIndex(linear_level, categories=ENTITY_CATEGORIES)
+    linear_ms = run_frames(linear_level)
+    print(f"  {'linear scan':<16} {linear_ms:9.2f} ms/frame")
+
+    hashed_level = BenchLevel(enemy_count, object_count)
+    hashed_ms = run_frames(hashed_level)
+    print(f"  {'spatial hash':<16} {hashed_ms:9.2f} ms/frame ({linear_ms / hashed_ms:.1f}x faster)")
+
+    # Both runs must make the same movement decisions
+    moved = [(e.x, e.y) for e in linear_level.enemies] == [(e.x, e.y) for e in hashed_level.enemies]
+    print(f"  identical results: {moved}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark keeping level entities in depth order for rendering
+
+Compares collecting every entity list and calling sort_by_depth - what
+LevelRendererMixin did each time the player entered a new tile, leaving
+moving enemies at a stale depth in between - with the RenderList, which
+re-inserts only the entities that moved and culls to the camera view every
+frame. The level is a populated area of entities scattered over a few loaded
+chunks, with a share of the enemies moving every frame.
+
+Usage:
+    python benchmarks/bench_render_list.py [entities] [frames] [moving]
+"""
+
+import sys
+import os
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.core.isometric import IsometricRenderer, sort_by_depth
+from src.level.level_renderer import LevelRendererMixin
+from src.level.render_list import RENDER_CATEGORIES
+
+VIEW_SIZE = (1024, 618)
+WORLD_RADIUS = 96  # Entities are spread over 3x3 chunks around the player
+
+
+class Thing:
+    """Entity stand-in with a position, type and name"""
+
+    def __init__(self, x, y, entity_type, name):
+        self.x = x
+        self.y = y
+        self.entity_type = entity_type
+        self.name = name
+
+
+class BenchLevel(LevelRendererMixin):
+    """Entity lists, a player and a camera"""
+
+    def __init__(self, count, rng):
+        def spot():
+            return rng.uniform(-WORLD_RADIUS, WORLD_RADIUS), rng.uniform(-WORLD_RADIUS, WORLD_RADIUS)
+        self.player = Thing(0.5, 0.5, "player", "Player")
+        self.enemies = [Thing(*spot(), "enemy", "Goblin") for _ in range(count // 10)]
+        self.npcs = [Thing(*spot(), "npc", "Villager") for _ in range(count // 50)]
+        self.items = [Thing(*spot(), "item", "Coin") for _ in range(count // 50)]
+        self.chests = [Thing(*spot(), "chest", "Chest") for _ in range(count // 100)]
+        self.furniture = [Thing(*spot(), "furniture", "Table") for _ in range(count // 20)]
+        self.objects = [Thing(*spot(), "object", rng.choice(("Oak Tree", "Pine Tree", "Rock", "Bush")))
+                        for _ in range(count - len(self.enemies) - len(self.npcs) - len(self.items)
+                                       - len(self.chests) - len(self.furniture))]
+        self.iso_renderer = IsometricRenderer(64, 32)
+        self.camera_x, self.camera_y = self.iso_renderer.cart_to_iso(0.5, 0.5)
+        self.camera_x -= VIEW_SIZE[0] // 2
+        self.camera_y -= VIEW_SIZE[1] // 2
+
+
+def full_sort(level):
+    """The old sorting pass: gather every list and sort it"""
+    entities = [level.player]
+    for category in RENDER_CATEGORIES:
+        entities.extend(getattr(level, category))
+    return sort_by_depth(entities)
+
+
+def time_frames(label, level, movers, frames, rng, draw):
+    """Move the movers a little each frame and average the time draw takes"""
+    total = 0.0
+    drawn = 0
+    for _ in range(frames):
+        for entity in movers:
+            entity.x += rng.uniform(-0.05, 0.05)
+            entity.y += rng.uniform(-0.05, 0.05)
+        start = time.perf_counter()
+        drawn = len(draw())
+        total += time.perf_counter() - start
+    per_frame_ms = total * 1000 / frames
+    print(f"  {label:<34} {per_frame_ms:8.3f} ms/frame  ({drawn} entities returned)")
+    return per_frame_ms
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    frames = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+    moving = int(sys.argv[3]) if len(sys.argv) > 3 else 50
+
+    rng = random.Random(12345)
+    level = BenchLevel(count, rng)
+    movers = rng.sample(level.enemies, min(moving, len(level.enemies)))
+    level.get_visible_entities(*VIEW_SIZE)  # Build the list once, as the first frame does
+
+    print(f"{count} entities, {len(movers)} moving per frame, {frames} frames")
+    sort_ms = time_frames("full sort every frame", level, movers, frames, rng, lambda: full_sort(level))
+    list_ms = time_frames("render list (refresh + cull)", level, movers, frames, rng,
+                          lambda: level.get_visible_entities(*VIEW_SIZE))
+    print(f"  {'':<34} {level.render_list.reinserted} re-insertions")
+    print(f"  Render list {sort_ms / list_ms:.1f}x faster than a per-frame sort; "
+          f"the old cache paid {sort_ms:.3f} ms on every tile the player entered")
+
+
+if __name__ == "__main__":
+    main()
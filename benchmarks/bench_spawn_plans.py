@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark the entity phase of chunk generation
+
+Compares building real Enemy/Entity objects for every spawn (what chunk
+generation used to do, only to copy their fields into the chunk and drop
+them) with planning plain SpawnRecords. Biomes and tiles are generated
+beforehand and not timed. With --assets the objects are built with the
+game's asset loader, as chunk generation on the main thread did; run it
+from the project root so the asset loader finds the assets.
+
+Usage:
+    python benchmarks/bench_spawn_plans.py [chunks] [--assets]
+"""
+
+import sys
+import os
+import time
+import pickle
+import contextlib
+import io
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.procedural_generation.src.biome_generator import BiomeGenerator
+from src.procedural_generation.src.enhanced_entity_spawner import EnhancedEntitySpawner
+from src.procedural_generation.src.seeding import derive_seed
+from src.world.chunk import Chunk
+
+
+def chunk_terrain(count):
+    """(seed, tiles, biomes) for the first count chunks along a row"""
+    terrain = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for x in range(count):
+            seed = derive_seed(12345, x, 0)
+            biome_gen = BiomeGenerator(Chunk.CHUNK_SIZE, Chunk.CHUNK_SIZE, seed)
+            biomes = biome_gen.generate_biome_map()
+            terrain.append((seed, biome_gen.generate_tiles(biomes), biomes))
+    return terrain
+
+
+def time_per_chunk(label, terrain, spawn):
+    """Run spawn(spawner, tiles, biomes) for every chunk and report the mean time per chunk"""
+    results = []
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for seed, tiles, biomes in terrain:
+            spawner = EnhancedEntitySpawner(Chunk.CHUNK_SIZE, Chunk.CHUNK_SIZE, seed)
+            results.append(spawn(spawner, tiles, biomes))
+    elapsed = time.perf_counter() - start
+    per_chunk_ms = elapsed * 1000 / len(terrain)
+    print(f"  {label:<32} {per_chunk_ms:8.3f} ms/chunk")
+    return per_chunk_ms, results
+
+
+def build_entities(asset_loader):
+    """Old entity phase: construct the game objects"""
+    def spawn(spawner, tiles, biomes):
+        return (spawner.spawn_objects(tiles, biomes, [], asset_loader) +
+                spawner.spawn_enemies(tiles, biomes, [], asset_loader))
+    return spawn
+
+
+def plan_records(spawner, tiles, biomes):
+    """New entity phase: plan spawn records"""
+    return spawner.plan_objects(tiles, biomes, []) + spawner.plan_enemies(tiles, biomes, [])
+
+
+def main():
+    """Run the benchmark"""
+    flags = [arg for arg in sys.argv[1:] if arg.startswith('--')]
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    count = int(args[0]) if args else 50
+    terrain = chunk_terrain(count)
+    print(f"Entity phase, {count} chunks of {Chunk.CHUNK_SIZE}x{Chunk.CHUNK_SIZE} tiles")
+
+    after, plans = time_per_chunk("spawn records", terrain, plan_records)
+    print(f"  {'':<32} {sum(map(len, plans)) / count:8.1f} spawns/chunk, "
+          f"{sum(len(pickle.dumps(plan)) for plan in plans) / count:6.0f} bytes pickled")
+    print(f"  {'':<32} pygame imported: {'pygame' in sys.modules}")
+
+    loaders = [("entities (no asset loader)", None)]
+    if '--assets' in flags:
+        import pygame
+        from src.core.assets import AssetLoader
+        pygame.init()
+        pygame.display.set_mode((1024, 768))
+        with contextlib.redirect_stdout(io.StringIO()):
+            loaders.append(("entities (asset loader)", AssetLoader()))
+
+    for label, asset_loader in loaders:
+        before, _ = time_per_chunk(label, terrain, build_entities(asset_loader))
+        print(f"  {'':<32} {before / after:8.1f}x slower than records")
+
+
+if __name__ == "__main__":
+    main()
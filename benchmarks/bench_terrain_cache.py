@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark level rendering with and without the cached terrain layer
+
+Generates a seeded world, moves the player to open terrain (no building
+tiles in view) and renders frames of the game view. The baseline draws the
+ground tile by tile, as LevelRendererMixin.render did before the terrain
+cache; the cached path blits pre-rendered blocks. Both the full frame and
+just the ground pass are timed. Run it from the project root so the asset
+loader finds the assets.
+
+Usage:
+    python benchmarks/bench_terrain_cache.py [frames] [seed]
+"""
+
+import sys
+import os
+import time
+import contextlib
+import io
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from src.headless import HeadlessRunner
+
+VIEW_SIZE = (1024, 768)
+UI_HEIGHT = 150
+
+
+def view_range(level):
+    """Tile range render() draws around the player"""
+    game_height = VIEW_SIZE[1] - UI_HEIGHT
+    visible_width = (VIEW_SIZE[0] // level.tile_width) + 4
+    visible_height = (game_height // (level.tile_height // 2)) + 8
+    x, y = int(level.player.x), int(level.player.y)
+    return x - visible_width, x + visible_width, y - visible_height, y + visible_height
+
+
+def find_open_terrain(level, start):
+    """Move the player to the first spot east of start with no building tiles in view"""
+    for step in range(0, 4096, 16):
+        level.player.tile_x, level.player.tile_y = int(start[0]) + step, int(start[1])
+        start_x, end_x, start_y, end_y = view_range(level)
+        if not any(level.is_simple_building_tile(level.get_tile(x, y))
+                   for y in range(start_y, end_y) for x in range(start_x, end_x)):
+            level.chunk_manager.update_loaded_chunks(level.player.x, level.player.y)
+            return level.player.tile_x, level.player.tile_y
+    raise RuntimeError("No open terrain found")
+
+
+def time_frames(label, frames, draw):
+    """Average milliseconds per call of draw"""
+    draw()  # Warm up caches
+    start = time.perf_counter()
+    for _ in range(frames):
+        draw()
+    per_frame_ms = (time.perf_counter() - start) * 1000 / frames
+    print(f"  {label:<28} {per_frame_ms:8.2f} ms/frame")
+    return per_frame_ms
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else 12345
+
+    pygame.init()
+    screen = pygame.display.set_mode(VIEW_SIZE)
+    runner = HeadlessRunner(seed, quiet=True)
+    original_cwd = os.getcwd()
+    try:
+        level = runner.setup()
+        os.chdir(runner.save_dir)  # Chunks generated while looking for open terrain are saved here
+        with contextlib.redirect_stdout(io.StringIO()):
+            position = find_open_terrain(level, runner.spawn)
+        level.update_camera(VIEW_SIZE[0], VIEW_SIZE[1] - UI_HEIGHT)
+        cache = level.get_terrain_cache()
+        game_surface = pygame.Surface((VIEW_SIZE[0], VIEW_SIZE[1] - UI_HEIGHT))
+        start_x, end_x, start_y, end_y = view_range(level)
+
+        def ground_per_tile():
+            for y in range(start_y, end_y):
+                for x in range(start_x, end_x):
+                    level.render_tile_at_position(game_surface, x, y)
+
+        def ground_cached():
+            level.render_cached_terrain(game_surface, cache, start_x, end_x, start_y, end_y)
+
+        print(f"Open terrain at {position}, {VIEW_SIZE[0]}x{VIEW_SIZE[1]}, "
+              f"{(end_x - start_x) * (end_y - start_y)} tiles in range, {frames} frames")
+        tile_ground = time_frames("ground, tile by tile", frames, ground_per_tile)
+        cached_ground = time_frames("ground, cached blocks", frames, ground_cached)
+        print(f"  {'':<28} {len(cache.blocks)} blocks, {cache.built} built")
+
+        uncached = time_frames("full frame, tile by tile", frames, lambda: render_without_cache(level, screen))
+        cached = time_frames("full frame, cached", frames, lambda: level.render(screen))
+        print(f"  Ground {tile_ground / cached_ground:.1f}x faster, frame {uncached / cached:.1f}x faster "
+              f"({1000 / uncached:.0f} -> {1000 / cached:.0f} FPS)")
+    finally:
+        os.chdir(original_cwd)
+        runner.close()
+        pygame.quit()
+
+
+def render_without_cache(level, screen):
+    """Render a frame with the tile-by-tile ground pass"""
+    level.get_terrain_cache = lambda: None
+    try:
+        level.render(screen)
+    finally:
+        del level.get_terrain_cache
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark drawing the in-game UI: the XP bar and the bottom panel with the game log
+
+Compares the UI as it was drawn before the text cache - a new pygame Font
+for every panel and bar each frame, every label rendered again and long log
+lines truncated with repeated font.size calls - with the shared fonts and
+text surfaces of AssetLoader, both with the panels drawn from scratch every
+frame, and then with the retained panels that redraw only what changed.
+Only the UI is drawn, onto a blank screen; the player regenerates stamina
+now and then and the older log messages fade.
+
+Usage:
+    python benchmarks/bench_ui_text.py [frames] [messages]
+"""
+
+import sys
+import os
+import time
+import contextlib
+import io
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pygame
+
+from src.core.assets import AssetLoader
+from src.core.game_log import GameLog
+from src.level.ui_renderer import UIRendererMixin
+
+SCREEN_SIZE = (1280, 720)
+
+MESSAGES = [
+    ("You picked up a Health Potion", "item"),
+    ("The goblin hits you for 4 damage and then runs off into the trees to the north", "combat"),
+    ("You gained 25 experience", "experience"),
+    ("Quest updated: find the blacksmith's missing hammer somewhere in the old mine", "quest"),
+    ("Welcome to the village", "story"),
+    ("You discovered a new area: the Whispering Woods beyond the river crossing", "exploration"),
+]
+
+
+class Equipment:
+    """Equipped item stand-in with a name and a sprite"""
+
+    def __init__(self, name, color):
+        self.name = name
+        self.sprite = pygame.Surface((32, 32), pygame.SRCALPHA)
+        self.sprite.fill(color)
+
+
+class Player:
+    """The player values the UI shows"""
+
+    def __init__(self, game_log):
+        self.game_log = game_log
+        self.health, self.max_health = 87, 100
+        self.stamina, self.max_stamina = 40, 100
+        self.level, self.gold = 4, 1320
+        self.experience, self.experience_to_next = 340, 500
+        self.equipped_weapon = Equipment("Iron Longsword of Embers", (192, 192, 192))
+        self.equipped_armor = Equipment("Leather Armor", (139, 69, 19))
+
+
+class BenchUI(UIRendererMixin):
+    """What render_ui needs from a level"""
+
+    def __init__(self, asset_loader, game_log):
+        self.asset_loader = asset_loader
+        self.player = Player(game_log)
+
+
+class FreshAssets:
+    """The old way: a new Font every time one is needed and every string rendered again"""
+
+    def get_font(self, size):
+        return pygame.font.Font(None, size)
+
+    def render_text(self, font, text, color, alpha=255):
+        surface = font.render(text, True, color)
+        if alpha < 255:
+            surface.set_alpha(alpha)
+        return surface
+
+
+def time_frames(label, ui, screen, frames, forget_fitting, retained=False, fading=True):
+    """Draw the UI frames times, advancing stamina and the log fade, and average it"""
+    messages = ui.player.game_log.messages
+    total = 0.0
+    for frame in range(frames):
+        if frame % 30 == 0:
+            ui.player.stamina = min(ui.player.max_stamina, ui.player.stamina + 1)
+        for index, message in enumerate(messages[-6:-3] if fading else ()):  # The oldest lines on show fade
+            message["alpha"] = 255 - (frame + index * 40) % 200
+        if forget_fitting:
+            for message in messages:
+                message.pop("fitted", None)
+        if not retained:
+            # New panel surfaces with everything drawn on them, as every frame used to
+            ui._ui_panel = ui._xp_bar_panel = None
+        start = time.perf_counter()
+        ui.render_xp_bar(screen)
+        ui.render_ui(screen)
+        total += time.perf_counter() - start
+    per_frame_ms = total * 1000 / frames
+    print(f"  {label:<34} {per_frame_ms:8.3f} ms/frame")
+    return per_frame_ms
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 600
+    message_count = int(sys.argv[2]) if len(sys.argv) > 2 else 12
+
+    pygame.init()
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+    os.chdir(ROOT)
+    with contextlib.redirect_stdout(io.StringIO()):
+        asset_loader = AssetLoader()
+        game_log = GameLog()
+        for index in range(message_count):
+            game_log.add_message(*MESSAGES[index % len(MESSAGES)])
+
+    ui = BenchUI(asset_loader, game_log)
+    print(f"UI only at {SCREEN_SIZE[0]}x{SCREEN_SIZE[1]}, {message_count} log messages, {frames} frames")
+    ui.asset_loader = FreshAssets()
+    fresh_ms = time_frames("fonts and text every frame", ui, screen, frames, forget_fitting=True)
+    ui.asset_loader = asset_loader
+    cached_ms = time_frames("shared fonts + text cache", ui, screen, frames, forget_fitting=False)
+    stats = asset_loader.text_cache_stats()
+    print(f"  {'':<34} {stats['entries']} text surfaces cached, hit rate {stats['hit_rate']:.0%}")
+    retained_ms = time_frames("retained panels, log fading", ui, screen, frames, forget_fitting=False, retained=True)
+    redraws = ui._ui_panel.redraws
+    for message in game_log.messages:
+        message["alpha"] = 255
+    idle_ms = time_frames("retained panels, idle log", ui, screen, frames, forget_fitting=False,
+                          retained=True, fading=False)
+    print(f"  {'':<34} {redraws} widget redraws while fading, {ui._ui_panel.redraws - redraws} idle")
+    print(f"  Text cache {fresh_ms / cached_ms:.1f}x faster, retained panels {fresh_ms / retained_ms:.1f}x "
+          f"({fresh_ms / idle_ms:.1f}x with the log idle)")
+
+
+if __name__ == "__main__":
+    main()
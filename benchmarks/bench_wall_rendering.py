@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Benchmark wall rendering with and without the pre-rendered face atlas
+
+Renders a settlement-dense view: a grid of 6x6 houses whose outer tiles
+are walls (some with windows), drawn with roofs the way distant buildings
+are. The baseline renders every face from its texture on every call, which
+is what WallRenderer did before the atlas.
+
+Usage:
+    python benchmarks/bench_wall_rendering.py [frames]
+"""
+
+import sys
+import os
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from src.wall_renderer import WallRenderer
+from src.wall_face_atlas import face_shape, render_face
+
+VIEW_SIZE = (1280, 720)
+VIEW_TILES = 40
+HOUSE_SIZE = 6
+STREET_WIDTH = 2
+TEXTURES = ('wall_texture', 'wall_texture_window', 'roof_texture')
+
+
+class BenchAssets:
+    """Asset loader serving the building textures"""
+
+    def __init__(self):
+        image_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'assets', 'images', 'buildings')
+        self.images = {name: pygame.image.load(os.path.join(image_dir, f'{name}.png')).convert_alpha() for name in TEXTURES}
+
+    def get_image(self, name):
+        return self.images.get(name)
+
+
+class BenchLevel:
+    """Village of identical houses separated by streets"""
+
+    TILE_WALL = 4
+    TILE_DOOR = 5
+    TILE_WALL_CORNER_TL = 6
+    TILE_WALL_CORNER_TR = 7
+    TILE_WALL_CORNER_BL = 8
+    TILE_WALL_CORNER_BR = 9
+    TILE_WALL_HORIZONTAL = 10
+    TILE_WALL_VERTICAL = 11
+    TILE_WALL_WINDOW = 12
+    TILE_WALL_WINDOW_HORIZONTAL = 14
+    TILE_WALL_WINDOW_VERTICAL = 15
+
+    tile_width = 64
+    tile_height = 32
+    width = VIEW_TILES
+    height = VIEW_TILES
+
+    def __init__(self):
+        self.asset_loader = BenchAssets()
+        self.tile_sprites = {}
+        period = HOUSE_SIZE + STREET_WIDTH
+        self.tiles = []
+        for y in range(VIEW_TILES):
+            row = []
+            for x in range(VIEW_TILES):
+                local_x, local_y = x % period, y % period
+                last = HOUSE_SIZE - 1
+                if local_x >= HOUSE_SIZE or local_y >= HOUSE_SIZE:
+                    row.append(0)
+                elif (local_x, local_y) in ((0, 0), (last, 0), (0, last), (last, last)):
+                    row.append(self.TILE_WALL_CORNER_TL)
+                elif local_y in (0, last):
+                    row.append(self.TILE_WALL_WINDOW_HORIZONTAL if local_x == 2 else self.TILE_WALL_HORIZONTAL)
+                elif local_x in (0, last):
+                    row.append(self.TILE_WALL_WINDOW_VERTICAL if local_y == 3 else self.TILE_WALL_VERTICAL)
+                else:
+                    row.append(13)
+            self.tiles.append(row)
+
+    def get_tile(self, x, y):
+        return self.tiles[y][x]
+
+
+class UncachedAtlas:
+    """Renders every face from scratch - the old per-frame path"""
+
+    def blit_face(self, surface, texture, face_points, face_direction, rotate=False, border=True):
+        min_x, min_y, shape = face_shape(face_points)
+        sprite = render_face(texture, face_direction, shape, rotate, border)
+        if sprite is not None:
+            surface.blit(sprite, (min_x, min_y))
+
+
+class UncachedWallRenderer(WallRenderer):
+    def get_face_atlas(self):
+        return UncachedAtlas()
+
+
+def render_frame(renderer, level, screen):
+    """Draw every wall tile of the view with its roof; returns the number of walls drawn"""
+    walls = 0
+    for y in range(VIEW_TILES):
+        for x in range(VIEW_TILES):
+            tile_type = level.tiles[y][x]
+            if not renderer.is_wall_tile(tile_type):
+                continue
+            screen_x = (x - y) * level.tile_width // 2 + VIEW_SIZE[0] // 2
+            screen_y = (x + y) * level.tile_height // 2 - VIEW_SIZE[1] // 3
+            renderer.render_flat_wall_with_roof_top(screen, screen_x, screen_y, tile_type, x, y)
+            walls += 1
+    return walls
+
+
+def time_frames(renderer, level, screen, frames):
+    """Average milliseconds per frame"""
+    render_frame(renderer, level, screen)  # Warm up textures and the atlas
+    start = time.perf_counter()
+    for _ in range(frames):
+        screen.fill((0, 0, 0))
+        render_frame(renderer, level, screen)
+    return (time.perf_counter() - start) * 1000 / frames
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    pygame.init()
+    screen = pygame.display.set_mode(VIEW_SIZE)
+    level = BenchLevel()
+
+    baseline = UncachedWallRenderer(level)
+    atlas = WallRenderer(level)
+
+    walls = render_frame(atlas, level, screen)
+    print(f"Settlement view: {VIEW_TILES}x{VIEW_TILES} tiles, {walls} wall tiles, {frames} frames")
+
+    baseline_ms = time_frames(baseline, level, screen, frames)
+    atlas_ms = time_frames(atlas, level, screen, frames)
+
+    print(f"  Per-frame texture scaling: {baseline_ms:7.2f} ms/frame")
+    print(f"  Face atlas:                {atlas_ms:7.2f} ms/frame")
+    print(f"  Speedup: {baseline_ms / atlas_ms:.1f}x")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
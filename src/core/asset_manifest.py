@@ -0,0 +1,281 @@
+"""
+Asset manifest and background decoding for lazy asset loading.
+
+The manifest (assets/manifest.json) records each asset file's size, checksum
+and, for PNGs, pixel dimensions. It is generated on first start and after that
+only entries whose file size or modification time changed are hashed again, so
+checking it costs one stat per file. BackgroundLoader decodes assets on a
+worker thread - ones the game asked for first, then the rest - so startup only
+pays for what the main menu shows.
+"""
+
+import hashlib
+import json
+import os
+import struct
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+MANIFEST_VERSION = 1
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def file_checksum(path: str) -> str:
+    """SHA-1 of a file's contents"""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def image_size(path: str) -> Optional[Tuple[int, int]]:
+    """Width and height of a PNG from its header without decoding it (None for other files)"""
+    with open(path, 'rb') as f:
+        header = f.read(24)
+    if len(header) < 24 or not header.startswith(PNG_SIGNATURE) or header[12:16] != b"IHDR":
+        return None
+    return struct.unpack(">II", header[16:24])
+
+
+class AssetManifest:
+    """File size, checksum and image size of each asset, kept in sync with the files on disk"""
+
+    def __init__(self, root: str = "assets", path: Optional[str] = None):
+        """
+        Initialize an empty manifest
+
+        Args:
+            root: Directory asset paths are relative to
+            path: Manifest file (default root/manifest.json)
+        """
+        self.root = root
+        self.path = path or os.path.join(root, "manifest.json")
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self.changed = False
+
+        # Metrics
+        self.rehashed = 0
+
+    @classmethod
+    def load(cls, root: str = "assets", files: Iterable[str] = (), path: Optional[str] = None) -> "AssetManifest":
+        """
+        Read the manifest, bring the given files up to date and save it if anything changed
+
+        Args:
+            root: Directory asset paths are relative to
+            files: Asset paths relative to root
+            path: Manifest file (default root/manifest.json)
+
+        Returns:
+            The manifest
+        """
+        manifest = cls(root, path)
+        manifest.read()
+        manifest.update(files)
+        return manifest
+
+    def read(self):
+        """Load entries from the manifest file, if there is a usable one"""
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == MANIFEST_VERSION:
+            self.entries = data.get("assets", {})
+
+    def update(self, files: Iterable[str]) -> int:
+        """
+        Refresh entries whose file changed since the manifest was written and save
+
+        Args:
+            files: Asset paths relative to root
+
+        Returns:
+            Number of files hashed again
+        """
+        rehashed = 0
+        for relative_path in files:
+            full_path = os.path.join(self.root, relative_path)
+            try:
+                stat = os.stat(full_path)
+            except OSError:
+                if self.entries.pop(relative_path, None) is not None:
+                    self.changed = True
+                continue
+
+            entry = self.entries.get(relative_path)
+            if entry and entry["bytes"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+                continue
+
+            checksum = file_checksum(full_path)
+            rehashed += 1
+            if not entry or entry["sha1"] != checksum:
+                size = image_size(full_path)
+                entry = {"sha1": checksum, "size": list(size) if size else None}
+            entry["bytes"] = stat.st_size
+            entry["mtime_ns"] = stat.st_mtime_ns
+            self.entries[relative_path] = entry
+            self.changed = True
+
+        self.rehashed += rehashed
+        if self.changed:
+            self.save()
+        return rehashed
+
+    def save(self):
+        """Write the manifest file"""
+        temp_path = f"{self.path}.tmp"
+        try:
+            with open(temp_path, 'w') as f:
+                json.dump({"version": MANIFEST_VERSION, "assets": self.entries}, f, indent=1, sort_keys=True)
+            os.replace(temp_path, self.path)
+            self.changed = False
+        except OSError as e:
+            print(f"⚠️  Could not write asset manifest {self.path}: {e}")
+
+    def __contains__(self, relative_path: str) -> bool:
+        return relative_path in self.entries
+
+    def checksum(self, relative_path: str) -> Optional[str]:
+        """Content checksum of a file (None if it's not in the manifest)"""
+        entry = self.entries.get(relative_path)
+        return entry["sha1"] if entry else None
+
+    def image_size(self, relative_path: str) -> Optional[Tuple[int, int]]:
+        """Pixel size of an image (None if unknown)"""
+        entry = self.entries.get(relative_path)
+        return tuple(entry["size"]) if entry and entry.get("size") else None
+
+    def total_bytes(self) -> int:
+        """Size on disk of every asset in the manifest"""
+        return sum(entry["bytes"] for entry in self.entries.values())
+
+
+class BackgroundLoader:
+    """
+    Runs asset decode jobs on one worker thread
+
+    Jobs are keyed so the same file is only decoded once. Jobs submitted as
+    urgent (something is waiting to draw it) go ahead of the warm-up queue.
+    Results are collected with take() from the main thread.
+    """
+
+    def __init__(self, name: str = "asset-loader"):
+        """
+        Initialize the loader - the worker thread starts with the first job
+
+        Args:
+            name: Worker thread name
+        """
+        self.name = name
+        self._condition = threading.Condition()
+        self._queue: "deque[Any]" = deque()
+        self._jobs: Dict[Any, Callable[[], Any]] = {}
+        self._results: Dict[Any, Any] = {}
+        self._errors: Dict[Any, Exception] = {}
+        self._taken = set()
+        self._busy = False
+        self._thread: Optional[threading.Thread] = None
+        self.closed = False
+
+        # Metrics
+        self.decoded = 0
+        self.decode_seconds = 0.0
+
+    def submit(self, key: Any, job: Callable[[], Any], urgent: bool = False):
+        """
+        Queue a job unless it is already queued or done
+
+        Args:
+            key: Identifies the result (e.g. file checksum)
+            job: Function returning the decoded asset
+            urgent: Run before jobs that were only queued to warm up
+        """
+        with self._condition:
+            if key in self._results or key in self._errors or key in self._taken:
+                return
+            if key in self._jobs:
+                if urgent and key in self._queue and self._queue[0] != key:
+                    self._queue.remove(key)
+                    self._queue.appendleft(key)
+                return
+            self._jobs[key] = job
+            if urgent:
+                self._queue.appendleft(key)
+            else:
+                self._queue.append(key)
+            if self._thread is None and not self.closed:
+                self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+
+    def take(self, key: Any) -> Tuple[bool, Any]:
+        """
+        Collect a finished job's result without waiting - the loader lets go of it
+
+        Returns:
+            (done, value) - value is the exception if the job raised
+        """
+        with self._condition:
+            if key in self._results:
+                self._taken.add(key)
+                return True, self._results.pop(key)
+            if key in self._errors:
+                self._taken.add(key)
+                return True, self._errors.pop(key)
+            return False, None
+
+    def pending(self) -> int:
+        """Jobs queued or running"""
+        with self._condition:
+            return len(self._queue) + self._busy
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every queued job has run
+
+        Returns:
+            False if the timeout passed first
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._queue and not self._busy, timeout)
+
+    def close(self):
+        """Drop queued jobs and stop the worker after its current job"""
+        with self._condition:
+            self.closed = True
+            for key in self._queue:
+                self._jobs.pop(key, None)
+            self._queue.clear()
+            self._condition.notify_all()
+
+    def _run(self):
+        """Worker thread: run jobs until closed"""
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._queue or self.closed)
+                if self.closed:
+                    return
+                key = self._queue.popleft()
+                job = self._jobs.pop(key)
+                self._busy = True
+
+            started = time.perf_counter()
+            try:
+                value, error = job(), None
+            except Exception as e:
+                value, error = None, e
+
+            with self._condition:
+                if error is None:
+                    self._results[key] = value
+                else:
+                    self._errors[key] = error
+                self.decoded += 1
+                self.decode_seconds += time.perf_counter() - started
+                self._busy = False
+                self._condition.notify_all()
@@ -4,6 +4,17 @@ Asset loader for the RPG
 
 import pygame
 import os
+from collections import OrderedDict
+from .asset_manifest import AssetManifest, BackgroundLoader
+
+# Most scaled sprites kept by get_sprite before the least recently used are dropped
+DEFAULT_SPRITE_CACHE_SIZE = 512
+
+# Most rendered text surfaces kept by render_text before the least recently used are dropped
+DEFAULT_TEXT_CACHE_SIZE = 256
+
+# Images the main menu and window icon need, loaded up front even in lazy mode
+CRITICAL_IMAGES = ("goose_rpg_logo", "goose_rpg_icon", "goose_rpg_icon_bg", "goose_rpg_square_logo", "menu_background")
 
 class AssetLoader:
     """Handles loading and managing game assets"""
@@ -15,6 +26,27 @@ class AssetLoader:
         self.fonts = {}
         self.asset_path = "assets"
         
+        # Scaled and mirrored sprites shared by every entity, least recently used first
+        self.sprite_cache = OrderedDict()
+        self.sprite_cache_size = (settings.get("sprite_cache_size") if settings else None) or DEFAULT_SPRITE_CACHE_SIZE
+        self.sprite_cache_bytes = 0
+        self.sprite_cache_hits = 0
+        self.sprite_cache_misses = 0
+        
+        # Rendered UI text keyed by (font, text, colour, alpha), least recently used first
+        self.text_cache = OrderedDict()
+        self.text_cache_size = (settings.get("text_cache_size") if settings else None) or DEFAULT_TEXT_CACHE_SIZE
+        self.text_cache_hits = 0
+        self.text_cache_misses = 0
+        
+        # Lazy loading decodes images and sounds on a background thread the first time they're used
+        self.lazy = bool(settings.get("lazy_asset_loading")) if settings else False
+        self.manifest = None
+        self.background = BackgroundLoader() if self.lazy else None
+        self.pending_images = {}  # Name -> (decode key, file path) until handed over
+        self.placeholders = {}
+        self._decoded = {}  # Decode key -> converted surface, shared by names using the same file
+        
         # Create asset directories if they don't exist
         os.makedirs(os.path.join(self.asset_path, "images"), exist_ok=True)
         os.makedirs(os.path.join(self.asset_path, "sounds"), exist_ok=True)
@@ -237,9 +269,18 @@ class AssetLoader:
             "goose_rpg_square_logo": "ui/goose_rpg_square_logo.png"
         }
         
+        if self.lazy:
+            self.manifest = AssetManifest.load(self.asset_path, {f"images/{filename}" for filename in image_files.values()})
+        
         for name, filename in image_files.items():
             filepath = os.path.join(image_path, filename)
-            if os.path.exists(filepath):
+            if self.lazy and name not in CRITICAL_IMAGES and f"images/{filename}" in self.manifest:
+                # Warm up in the background; get_image hands it over once decoded
+                key = self.manifest.checksum(f"images/{filename}")
+                filepath = os.path.abspath(filepath)  # Decoded later, maybe from another working directory
+                self.pending_images[name] = (key, filepath)
+                self.background.submit(key, self._decode_job(filepath))
+            elif os.path.exists(filepath):
                 try:
                     image = pygame.image.load(filepath).convert_alpha()
                     self.images[name] = image
@@ -473,7 +514,7 @@ class AssetLoader:
     def load_sounds(self):
         """Load sound assets using the audio manager"""
         from .audio import AudioManager
-        self.audio_manager = AudioManager()
+        self.audio_manager = AudioManager(manifest=self.manifest, background=self.background)
         print("Audio system integrated into AssetLoader")
     
     def load_fonts(self):
@@ -484,8 +525,10 @@ class AssetLoader:
         self.fonts["title"] = pygame.font.Font(None, 72)
     
     def get_image(self, name):
-        """Get an image by name"""
+        """Get an image by name - in lazy mode a placeholder until it has been decoded"""
         image = self.images.get(name)
+        if image is None and name in self.pending_images:
+            image = self._collect_image(name) or self.get_placeholder(name)
         if name == 'generic_npc':
             print(f"🖼️  AssetLoader.get_image('{name}') -> {image is not None}")
             if image:
@@ -495,14 +538,213 @@ class AssetLoader:
                 print(f"   🔍 Available images: {list(self.images.keys())[:10]}...")  # Show first 10
         return image
     
+    def has_image(self, name):
+        """Whether there is an image by this name, decoded yet or not"""
+        return name in self.images or name in self.pending_images
+    
+    def get_placeholder(self, name):
+        """Fallback image shown while an image is still being decoded"""
+        placeholder = self.placeholders.get(name)
+        if placeholder is None:
+            placeholder = self.placeholders[name] = self.create_fallback_image(name)
+        return placeholder
+    
+    def finish_loading(self, timeout=None):
+        """
+        Wait for background decoding and hand over every image
+        
+        Call before building a level so tiles and entities never keep a placeholder.
+        
+        Args:
+            timeout: Most seconds to wait (None to wait for everything)
+            
+        Returns:
+            Number of images handed over
+        """
+        if not self.pending_images:
+            return 0
+        self.background.wait(timeout)
+        pending = len(self.pending_images)
+        for name in list(self.pending_images):
+            self._collect_image(name)
+        return pending - len(self.pending_images)
+    
+    def _collect_image(self, name):
+        """Move a decoded image into self.images, or queue it ahead of the warm-up if it isn't ready"""
+        key, filepath = self.pending_images[name]
+        image = self._decoded.get(key)
+        if image is None:
+            done, image = self.background.take(key)
+            if not done:
+                self.background.submit(key, self._decode_job(filepath), urgent=True)
+                return None
+            self._decoded[key] = image
+        
+        if isinstance(image, Exception):
+            print(f"Failed to load image {name}: {image}")
+            image = self.create_fallback_image(name)
+        self.images[name] = image
+        del self.pending_images[name]
+        return image
+    
+    @staticmethod
+    def _decode_job(filepath):
+        """Background job decoding an image file"""
+        def decode():
+            image = pygame.image.load(filepath)
+            if pygame.display.get_surface() is None:
+                return image
+            # Convert on the worker so the unconverted copy is freed straight away rather
+            # than piling up until the main thread collects it
+            return image.convert_alpha()
+        return decode
+    
     def get_sound(self, name):
         """Get a sound by name - now uses audio manager"""
         return getattr(self, 'audio_manager', None)
     
     def get_font(self, name):
-        """Get a font by name"""
+        """
+        Get a font by name, or the default typeface at a point size
+        
+        Sized fonts are created on first use and shared, so UI code can ask
+        for one every frame instead of constructing a pygame Font.
+        
+        Args:
+            name: Font name ("default", "large", "title") or a point size
+            
+        Returns:
+            The font
+        """
+        if isinstance(name, int):
+            font = self.fonts.get(name)
+            if font is None:
+                font = self.fonts[name] = pygame.font.Font(None, name)
+            return font
         return self.fonts.get(name, self.fonts["default"])
     
+    def render_text(self, font, text, color, alpha=255):
+        """
+        Get antialiased text rendered in a font from the shared text cache
+        
+        The same Surface is handed to every caller, so draw on a copy, never on it.
+        
+        Args:
+            font: Font to render with (one from get_font, so the key stays valid)
+            text: Text to render
+            color: RGB colour
+            alpha: Surface alpha, for fading text
+            
+        Returns:
+            The rendered text
+        """
+        color = tuple(color[:3])
+        key = (font, text, color, alpha)
+        surface = self.text_cache.get(key)
+        if surface is not None:
+            self.text_cache.move_to_end(key)
+            self.text_cache_hits += 1
+            return surface
+        self.text_cache_misses += 1
+        
+        if alpha < 255:
+            # Fade a copy of the opaque text rather than rendering the glyphs again
+            surface = self.render_text(font, text, color).copy()
+            surface.set_alpha(alpha)
+        else:
+            surface = font.render(text, True, color)
+        
+        self.text_cache[key] = surface
+        while len(self.text_cache) > self.text_cache_size:
+            self.text_cache.popitem(last=False)
+        return surface
+    
+    def clear_text_cache(self):
+        """Drop every cached text surface"""
+        self.text_cache.clear()
+    
+    def text_cache_stats(self):
+        """Text cache hit rate"""
+        lookups = self.text_cache_hits + self.text_cache_misses
+        return {
+            "entries": len(self.text_cache),
+            "max_entries": self.text_cache_size,
+            "hits": self.text_cache_hits,
+            "misses": self.text_cache_misses,
+            "hit_rate": self.text_cache_hits / lookups if lookups else 0.0
+        }
+    
+    def get_sprite(self, name, size, flip_x=False):
+        """
+        Get an image scaled to a size, and optionally mirrored, from the shared sprite cache
+        
+        The same Surface is handed to every caller, so draw on a copy, never on it.
+        
+        Args:
+            name: Image name as for get_image
+            size: Side length in pixels, or (width, height)
+            flip_x: Mirror horizontally
+            
+        Returns:
+            The sprite, or None if there is no such image
+        """
+        if isinstance(size, int):
+            size = (size, size)
+        key = (name, size[0], size[1], flip_x)
+        
+        sprite = self.sprite_cache.get(key)
+        if sprite is not None:
+            self.sprite_cache.move_to_end(key)
+            self.sprite_cache_hits += 1
+            return sprite
+        
+        image = self.images.get(name)
+        if image is None and name in self.pending_images:
+            image = self._collect_image(name)
+            if image is None:
+                # Still decoding - scale the placeholder, but don't cache it
+                return pygame.transform.scale(self.get_placeholder(name), size)
+        if image is None:
+            return None
+        self.sprite_cache_misses += 1
+        
+        if flip_x:
+            # Mirror the cached upright sprite rather than scaling the source again
+            sprite = pygame.transform.flip(self.get_sprite(name, size), True, False)
+        else:
+            sprite = pygame.transform.scale(image, size)
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha()  # Once here instead of on every blit
+        
+        self.sprite_cache[key] = sprite
+        self.sprite_cache_bytes += self._surface_bytes(sprite)
+        while len(self.sprite_cache) > self.sprite_cache_size:
+            _, evicted = self.sprite_cache.popitem(last=False)
+            self.sprite_cache_bytes -= self._surface_bytes(evicted)
+        return sprite
+    
+    def clear_sprite_cache(self):
+        """Drop every cached sprite (e.g. after images are reloaded)"""
+        self.sprite_cache.clear()
+        self.sprite_cache_bytes = 0
+    
+    def sprite_cache_stats(self):
+        """Sprite cache hit rate and memory held"""
+        lookups = self.sprite_cache_hits + self.sprite_cache_misses
+        return {
+            "entries": len(self.sprite_cache),
+            "max_entries": self.sprite_cache_size,
+            "hits": self.sprite_cache_hits,
+            "misses": self.sprite_cache_misses,
+            "hit_rate": self.sprite_cache_hits / lookups if lookups else 0.0,
+            "bytes": self.sprite_cache_bytes
+        }
+    
+    @staticmethod
+    def _surface_bytes(surface):
+        """Pixel memory held by a surface"""
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+    
     def scale_image(self, image, scale_factor):
         """Scale an image by a factor"""
         if image:
@@ -8,14 +8,29 @@ import os
 import random
 from pathlib import Path
 
+# UI sounds the main menu plays, loaded up front even in lazy mode
+CRITICAL_SOUNDS = {'ui': ('menu_select', 'button_click')}
+
 class AudioManager:
     """Manages all audio playback for the game"""
     
-    def __init__(self, sounds_dir="assets/sounds", enabled=True):
-        """Initialize the audio manager"""
+    def __init__(self, sounds_dir="assets/sounds", enabled=True, manifest=None, background=None):
+        """
+        Initialize the audio manager
+        
+        Args:
+            sounds_dir: Directory with the sound category folders and music
+            enabled: Whether to start the mixer at all
+            manifest: AssetManifest to record sound files in
+            background: BackgroundLoader to decode sounds on when first played (None loads everything now)
+        """
         self.enabled = enabled
         self.sounds_dir = Path(sounds_dir)
         self.sounds = {}
+        self.manifest = manifest
+        self.background = background
+        self.pending_sounds = {}  # (category, name) -> file paths until decoded
+        self._decoded = {}  # File path -> sound, shared by sounds using the same file
         self.volume_master = 1.0
         self.volume_sfx = 0.7
         self.volume_ui = 0.6
@@ -94,6 +109,12 @@ class AudioManager:
             }
         }
         
+        if self.manifest is not None:
+            self.manifest.update(os.path.relpath(self.sounds_dir / category / filename, self.manifest.root)
+                                 for category, sound_groups in sound_categories.items()
+                                 for filenames in sound_groups.values()
+                                 for filename in filenames)
+        
         # Load sounds from each category
         sounds_loaded = 0
         for category, sound_groups in sound_categories.items():
@@ -105,6 +126,16 @@ class AudioManager:
                 continue
             
             for sound_name, filenames in sound_groups.items():
+                if self.background is not None and sound_name not in CRITICAL_SOUNDS.get(category, ()):
+                    # Decoded in the background, and first thing when it's played
+                    paths = [os.path.abspath(category_path / filename) for filename in filenames
+                             if (category_path / filename).exists()]
+                    if paths:
+                        self.pending_sounds[(category, sound_name)] = paths
+                        for path in paths:
+                            self.background.submit(path, self._decode_job(path))
+                    continue
+                
                 loaded_sounds = []
                 for filename in filenames:
                     file_path = category_path / filename
@@ -122,6 +153,36 @@ class AudioManager:
                     self.sounds[category][sound_name] = loaded_sounds
         
         print(f"Loaded {sounds_loaded} sound effects across {len(self.sounds)} categories")
+        if self.pending_sounds:
+            print(f"Decoding {len(self.pending_sounds)} more sound effects in the background")
+    
+    def _collect_sounds(self, category, sound_name):
+        """Move decoded variations of a sound into self.sounds and hurry up the rest"""
+        waiting = []
+        for path in self.pending_sounds[(category, sound_name)]:
+            sound = self._decoded.get(path)
+            if sound is None:
+                done, sound = self.background.take(path)
+                if not done:
+                    self.background.submit(path, self._decode_job(path), urgent=True)
+                    waiting.append(path)
+                    continue
+                self._decoded[path] = sound
+            
+            if isinstance(sound, Exception):
+                print(f"Could not load {path}: {sound}")
+            else:
+                self.sounds.setdefault(category, {}).setdefault(sound_name, []).append(sound)
+        
+        if waiting:
+            self.pending_sounds[(category, sound_name)] = waiting
+        else:
+            del self.pending_sounds[(category, sound_name)]
+    
+    @staticmethod
+    def _decode_job(path):
+        """Background job decoding a sound file"""
+        return lambda: pygame.mixer.Sound(path)
     
     def load_music(self):
         """Load background music files"""
@@ -149,6 +210,9 @@ class AudioManager:
         """Play a sound effect"""
         if not self.enabled:
             return False
+        
+        if (category, sound_name) in self.pending_sounds:
+            self._collect_sounds(category, sound_name)  # Silent until a variation is decoded
             
         if category in self.sounds and sound_name in self.sounds[category]:
             sounds = self.sounds[category][sound_name]
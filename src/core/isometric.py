@@ -115,19 +115,19 @@ class IsometricRenderer:
         
         return surface
 
+def depth_bias(obj):
+    """Depth added to an object's x + y so it draws after others at the same position"""
+    if hasattr(obj, 'entity_type'):
+        if obj.entity_type == "object" and ("Tree" in obj.name or "Wall" in obj.name):
+            # Trees and walls should render after other entities at the same position
+            # to provide proper occlusion
+            return 0.5
+    return 0
+
 def sort_by_depth(objects):
     """Sort objects by their depth for proper isometric rendering with occlusion"""
     def get_sort_key(obj):
-        # Base depth calculation
-        base_depth = obj.x + obj.y
-        
-        # Adjust depth based on entity type for proper layering
-        if hasattr(obj, 'entity_type'):
-            if obj.entity_type == "object" and ("Tree" in obj.name or "Wall" in obj.name):
-                # Trees and walls should render after other entities at the same position
-                # to provide proper occlusion
-                return base_depth + 0.5
-        
-        return base_depth
+        # Base depth calculation, adjusted by entity type for proper layering
+        return obj.x + obj.y + depth_bias(obj)
     
-    return sorted(objects, key=get_sort_key)
\ No newline at end of file
+    return sorted(objects, key=get_sort_key)
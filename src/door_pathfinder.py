@@ -4,6 +4,8 @@ Door pathfinding and navigation system for the RPG
 
 import math
 
+from .level.door_field import DOOR_AREA, DOUBLE_DOOR, VERTICAL, NO_DOOR
+
 
 class DoorPathfinder:
     """Handles all door-related pathfinding functionality"""
@@ -26,6 +28,42 @@ class DoorPathfinder:
                 return self.level.tiles[y][x]
             return None
     
+    def has_building_registry(self):
+        """Check if the level records its buildings' doors at generation time"""
+        return hasattr(self.level, 'get_building_at')
+    
+    def get_registered_door(self, x, y):
+        """Get the orientation of the recorded door at a tile, or None if there is no door"""
+        building = self.level.get_building_at(x, y)
+        if building:
+            for door_x, door_y, orientation in building['doors']:
+                if door_x == x and door_y == y:
+                    return orientation
+        return None
+    
+    def is_door_tile(self, x, y):
+        """Check if a tile is a door"""
+        if self.has_building_registry():
+            return self.get_registered_door(x, y) is not None
+        return self.get_tile_safe(x, y) == self.level.TILE_DOOR
+    
+    def find_doors_near(self, tile_x, tile_y, radius):
+        """Find door tiles within a square radius, as (x, y) tuples"""
+        if self.has_building_registry():
+            return [(door_x, door_y)
+                    for building in self.level.get_buildings_near(tile_x, tile_y, radius)
+                    for door_x, door_y, _ in building['doors']
+                    if abs(door_x - tile_x) <= radius and abs(door_y - tile_y) <= radius]
+        
+        doors = []
+        for dy in range(-radius, radius + 1):
+            for dx in range(-radius, radius + 1):
+                check_x = tile_x + dx
+                check_y = tile_y + dy
+                if self.get_tile_safe(check_x, check_y) == self.level.TILE_DOOR:
+                    doors.append((check_x, check_y))
+        return doors
+    
     def analyze_door_context(self, tile_x, tile_y, world_x, world_y):
         """Analyze the door context around a position for better collision handling"""
         context = {
@@ -35,24 +73,31 @@ class DoorPathfinder:
             'distance_to_door': float('inf')
         }
         
+        # Chunk-based worlds keep this precomputed per tile
+        door_field = self.level.get_door_field() if hasattr(self.level, 'get_door_field') else None
+        if door_field is not None:
+            flags, distance = door_field.lookup(tile_x, tile_y)
+            if distance != NO_DOOR:
+                context['distance_to_door'] = math.sqrt(distance)
+            if flags & DOOR_AREA:
+                context['is_door_area'] = True
+                context['is_double_door'] = bool(flags & DOUBLE_DOOR)
+                context['door_orientation'] = "vertical" if flags & VERTICAL else "horizontal"
+            return context
+        
         # Check current tile and surrounding area for doors
         check_radius = 2  # Check 2 tiles around
         doors_found = []
         
-        for dy in range(-check_radius, check_radius + 1):
-            for dx in range(-check_radius, check_radius + 1):
-                check_x = tile_x + dx
-                check_y = tile_y + dy
-                
-                if (0 <= check_x < self.level.width and 0 <= check_y < self.level.height):
-                    tile_type = self.get_tile_safe(check_x, check_y)
-                    if tile_type == self.level.TILE_DOOR:
-                        door_distance = math.sqrt(dx*dx + dy*dy)
-                        doors_found.append({
-                            'pos': (check_x, check_y),
-                            'distance': door_distance,
-                            'world_pos': (check_x + 0.5, check_y + 0.5)
-                        })
+        for check_x, check_y in self.find_doors_near(tile_x, tile_y, check_radius):
+            dx = check_x - tile_x
+            dy = check_y - tile_y
+            door_distance = math.sqrt(dx*dx + dy*dy)
+            doors_found.append({
+                'pos': (check_x, check_y),
+                'distance': door_distance,
+                'world_pos': (check_x + 0.5, check_y + 0.5)
+            })
         
         if doors_found:
             # Find closest door
@@ -68,11 +113,8 @@ class DoorPathfinder:
                 adjacent_doors = 0
                 
                 for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                    adj_x, adj_y = door_x + dx, door_y + dy
-                    if (0 <= adj_x < self.level.width and 0 <= adj_y < self.level.height):
-                        tile_type = self.get_tile_safe(adj_x, adj_y)
-                        if tile_type == self.level.TILE_DOOR:
-                            adjacent_doors += 1
+                    if self.is_door_tile(door_x + dx, door_y + dy):
+                        adjacent_doors += 1
                 
                 context['is_double_door'] = adjacent_doors > 0
                 context['door_orientation'] = self.get_door_orientation(door_x, door_y)
@@ -154,8 +196,7 @@ class DoorPathfinder:
             y = start[1] + dy * t
             
             tile_x, tile_y = int(x), int(y)
-            tile_type = self.get_tile_safe(tile_x, tile_y)
-            if tile_type == self.level.TILE_DOOR:
+            if self.is_door_tile(tile_x, tile_y):
                 
                 door_pos = (tile_x + 0.5, tile_y + 0.5)
                 
@@ -288,8 +329,7 @@ class DoorPathfinder:
             y = start[1] + dy * t
             
             tile_x, tile_y = int(x), int(y)
-            tile_type = self.get_tile_safe(tile_x, tile_y)
-            if tile_type == self.level.TILE_DOOR:
+            if self.is_door_tile(tile_x, tile_y):
                 door_pos = (tile_x + 0.5, tile_y + 0.5)
                 if door_pos not in doors:
                     doors.append(door_pos)
@@ -338,6 +378,12 @@ class DoorPathfinder:
     
     def get_door_orientation(self, door_x, door_y):
         """Determine if door is horizontal or vertical based on surrounding walls"""
+        # Doors recorded at generation time already know their orientation
+        if self.has_building_registry():
+            orientation = self.get_registered_door(door_x, door_y)
+            if orientation:
+                return orientation
+        
         # Check adjacent tiles to determine orientation
         horizontal_walls = 0
         vertical_walls = 0
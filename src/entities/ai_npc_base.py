@@ -2,14 +2,20 @@
 Base AI NPC class with embedded recipes and centralized AI communication
 """
 
-import subprocess
 import os
-import tempfile
 import re
 import random
+import threading
+import time
 import pygame
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from .base import Entity
+from ..systems.npc_conversations import (
+    ConversationEvent, ConversationRequest, GooseSession, DEFAULT_TIMEOUT,
+    get_conversation_pipeline, goose_command
+)
+from ..systems.session_pool import get_session_pool
+from ..systems.response_cache import ContextDiff, get_response_cache
 
 
 class BaseAINPC(Entity):
@@ -18,6 +24,11 @@ class BaseAINPC(Entity):
     # Override this in subclasses with the specific recipe
     recipe: Optional[Dict[str, Any]] = None
     
+    # Seconds to wait for a new Goose session to say it's ready
+    session_startup_timeout = 10.0
+    # Seconds without output after which a reply is considered complete
+    response_idle_threshold = 1.5
+    
     def __init__(self, x: int, y: int, name: str, dialog: Optional[List[str]] = None, 
                  asset_loader=None, has_shop: bool = False, shop_items: Optional[List] = None, 
                  unique_id: Optional[str] = None, **kwargs):
@@ -53,9 +64,10 @@ class BaseAINPC(Entity):
         # Track first interaction for better AI responses
         self.first_interaction = True
         
-        # Session management
-        self.goose_process = None
-        self.session_initialized = False
+        # Session management - sessions live in the shared session pool
+        self.goose_session: Optional[GooseSession] = None  # Session borrowed for the reply in progress
+        self.context_diff = ContextDiff()  # Game state the session has been told
+        self.current_player = None  # Player in the current AI chat
         
         # MCP integration - use unique ID for this specific NPC instance
         self.npc_id = self.unique_id
@@ -64,14 +76,62 @@ class BaseAINPC(Entity):
         self.create_npc_sprite()
     
     def send_ai_message(self, message: str, context: str = "") -> str:
-        """Send message to AI using embedded recipe with one-shot execution"""
-        print(f"🔧 [BaseAINPC] send_ai_message for {self.name}: '{message}'")
+        """Send message to AI and wait for the reply (blocks - the game uses request_ai_message)"""
+        return self.answer_ai_message(message, context)
+    
+    def request_ai_message(self, message: str, context: str = "",
+                           on_event: Optional[Callable[[ConversationEvent], None]] = None,
+                           timeout: float = DEFAULT_TIMEOUT) -> ConversationRequest:
+        """
+        Ask for a reply without blocking the game loop
+        
+        Args:
+            message: The player's message
+            context: Game context for the prompt
+            on_event: Called on the main thread with the reply's ConversationEvents
+            timeout: Seconds the reply may take
+            
+        Returns:
+            The queued request
+        """
+        return get_conversation_pipeline().submit(self, message, context, on_event, timeout)
+    
+    def cancel_ai_message(self) -> int:
+        """Cancel replies this NPC is still working on"""
+        pipeline = get_conversation_pipeline(create=False)
+        return pipeline.cancel(self) if pipeline else 0
+    
+    def answer_ai_message(self, message: str, context: str = "",
+                          on_partial: Optional[Callable[[str], None]] = None,
+                          cancelled: Optional[threading.Event] = None,
+                          timeout: float = DEFAULT_TIMEOUT) -> str:
+        """Work out the reply to a message using the embedded recipe (runs on a conversation worker)"""
+        print(f"🔧 [BaseAINPC] answer_ai_message for {self.name}: '{message}'")
         
         if not self.recipe or self.use_fallback:
             return self._fallback_response(message)
         
+        # Opening messages in the same situation get the same reply without asking the model
+        session_key = self.session_key
+        cacheable = session_key is not None and not self.conversation_history
+        if cacheable:
+            cached = get_response_cache().get(session_key[0], message, context)
+            if cached:
+                print(f"✅ [BaseAINPC] Cached response for {self.name}: '{cached[:50]}...'")
+                self.first_interaction = False
+                self.conversation_history.append({"player": message, "npc": cached})
+                return cached
+        
         try:
-            response = self._execute_recipe(message, context)
+            response = self._execute_recipe(message, context, on_partial, cancelled, timeout)
+            
+            # A cancelled reply is dropped without counting against the AI
+            if cancelled is not None and cancelled.is_set():
+                return ""
+            
+            # Replies that used tools had side effects, so only plain text is reused
+            if cacheable and response and response.strip() and not getattr(self, 'tools_used_in_response', None):
+                get_response_cache().put(session_key[0], message, context, response)
             
             # Handle first interaction specially - allow empty response and show "looks at you" message
             if self.first_interaction:
@@ -113,26 +173,42 @@ class BaseAINPC(Entity):
                 self.use_fallback = True
                 return self._fallback_response(message)
     
-    def _execute_recipe(self, message: str, context: str) -> str:
-        """Execute the embedded recipe with Goose CLI using persistent session"""
+    def _execute_recipe(self, message: str, context: str,
+                        on_partial: Optional[Callable[[str], None]] = None,
+                        cancelled: Optional[threading.Event] = None,
+                        timeout: float = DEFAULT_TIMEOUT) -> str:
+        """Execute the embedded recipe with a pooled Goose session"""
         print(f"🔧 [BaseAINPC] _execute_recipe for {self.name}")
         
         if not self.recipe:
             print(f"❌ [BaseAINPC] No recipe available for {self.name}")
             return ""
         
-        # Initialize session if not already done
-        if not self.session_initialized:
-            if not self._initialize_session():
-                return ""
+        key = self.session_key
+        if key is None:
+            print(f"❌ [BaseAINPC] Recipe file not found for {self.name}")
+            return ""
         
-        # Send message to existing session
-        return self._send_message_to_session(message, context)
-    
-    def _initialize_session(self) -> bool:
-        """Initialize the Goose session for this NPC"""
-        print(f"🔧 [BaseAINPC] Initializing session for {self.name}")
+        # Borrow this NPC's session, starting it if it isn't running
+        pool = get_session_pool()
+        session = pool.acquire(key, lambda resume: self._initialize_session(resume, cancelled),
+                               timeout, cancelled)
+        if session is None:
+            return ""
         
+        self.goose_session = session
+        sent_at = time.monotonic()
+        try:
+            return self._send_message_to_session(message, context, on_partial, cancelled, timeout)
+        finally:
+            self.goose_session = None
+            # A cancelled or timed out session is still mid-reply and won't read "exit" - the next message gets a fresh one
+            interrupted = (cancelled is not None and cancelled.is_set()) or time.monotonic() - sent_at >= timeout
+            pool.release(key, discard=interrupted, exit_timeout=0.5 if interrupted else 5.0)
+    
+    @property
+    def recipe_file(self) -> Optional[str]:
+        """Recipe file the Goose session runs, if there is one for this NPC"""
         # Map NPC names to existing recipe files
         recipe_file_map = {
             "Village Elder": "recipes/village_elder.yaml",
@@ -153,18 +229,47 @@ class BaseAINPC(Entity):
         
         recipe_file = recipe_file_map.get(self.name)
         if not recipe_file or not os.path.exists(recipe_file):
+            return None
+        return recipe_file
+    
+    @property
+    def session_key(self) -> Optional[Tuple[str, str]]:
+        """Key of this NPC's session in the session pool - (recipe file, NPC id)"""
+        recipe_file = self.recipe_file
+        return (recipe_file, self.npc_id) if recipe_file else None
+    
+    def _initialize_session(self, resume: bool = False,
+                            cancelled: Optional[threading.Event] = None) -> Optional[GooseSession]:
+        """
+        Start a Goose session for this NPC (called by the session pool)
+        
+        Args:
+            resume: Resume this NPC's earlier session, which the pool closed to make room
+            cancelled: Event that abandons the startup when set
+            
+        Returns:
+            The ready session, or None if it failed to start
+        """
+        print(f"🔧 [BaseAINPC] Initializing session for {self.name}")
+        
+        recipe_file = self.recipe_file
+        if not recipe_file:
             print(f"❌ [BaseAINPC] Recipe file not found for {self.name}")
-            return False
+            return None
         
         try:
             # Start Goose process with recipe and NPC-specific context
-            cmd = [
-                "goose", "run",
+            cmd = goose_command() + [
+                "run",
                 "--recipe", recipe_file,
                 "--params", f"context=You are {self.name}, a {self.__class__.__name__.replace('NPC', '')} in a fantasy RPG village. Your unique identity is {self.unique_id}. Remember your individual personality and past conversations.",
                 "--interactive",
                 "--name", self.session_name
             ]
+            if resume:
+                cmd.append("--resume")
+            else:
+                self.context_diff.reset()  # A new session hasn't been told anything
             
             print(f"🔧 [BaseAINPC] Starting session: {' '.join(cmd)}")
             
@@ -179,70 +284,53 @@ class BaseAINPC(Entity):
             env["GOOSE_MODEL"] = ai_model
             print(f"🔧 [BaseAINPC] Using AI model: {ai_model}")
             
-            # Start the process
-            self.goose_process = subprocess.Popen(
-                cmd,
-                env=env,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=0  # Unbuffered for real-time reading
-            )
+            # Start the process and wait for it to say it's ready
+            session = GooseSession(cmd, env)
+            if not session.wait_until_ready(self.session_startup_timeout, cancelled):
+                output = ''.join(session.drain())
+                print(f"❌ [BaseAINPC] Session failed to start. Output: {output[:200]}")
+                session.close()
+                return None
             
-            # Wait for initialization and check if process is still running
-            import time
-            time.sleep(3)  # Give it time to start
-            
-            if self.goose_process.poll() is not None:
-                # Process has terminated
-                stdout, stderr = self.goose_process.communicate()
-                print(f"❌ [BaseAINPC] Session failed to start. Stderr: {stderr[:200]}")
-                return False
-            
-            self.session_initialized = True
             print(f"✅ [BaseAINPC] Session initialized for {self.name}")
-            return True
+            return session
             
         except Exception as e:
             print(f"❌ [BaseAINPC] Failed to initialize session: {e}")
-            return False
-    
-    def _send_message_to_session(self, message: str, context: str) -> str:
-        """Send a message to the existing Goose session with improved completion detection"""
-        if not self.goose_process or self.goose_process.poll() is not None:
-            print(f"❌ [BaseAINPC] Session is not active, reinitializing")
-            self.session_initialized = False
-            if not self._initialize_session():
-                return ""
-        
+            return None
+    
+    def prewarm_session(self) -> Optional[Tuple[Tuple[str, str], Callable[[bool], Optional[GooseSession]]]]:
+        """(key, start) for starting this NPC's session ahead of a chat, or None if it has no AI session"""
+        if not self.recipe or self.use_fallback:
+            return None
+        key = self.session_key
+        if key is None:
+            return None
+        return key, lambda resume: self._initialize_session(resume)
+    
+    def _send_message_to_session(self, message: str, context: str,
+                                 on_partial: Optional[Callable[[str], None]] = None,
+                                 cancelled: Optional[threading.Event] = None,
+                                 timeout: float = DEFAULT_TIMEOUT) -> str:
+        """Send a message to the borrowed Goose session with improved completion detection"""
         try:
-            # Clear any pending output first
-            import select
-            import time
-            
             # Drain any existing output to ensure clean state
-            while True:
-                ready, _, _ = select.select([self.goose_process.stdout], [], [], 0.1)
-                if not ready:
-                    break
-                line = self.goose_process.stdout.readline()
-                if not line:
-                    break
+            for line in self.goose_session.drain():
                 print(f"🔧 [BaseAINPC] Drained: {line.strip()}")
             
-            # Send the message with clear context
-            full_message = f"{message}\n"
-            print(f"🔧 [BaseAINPC] Sending to session: '{message}'")
+            # Send the message with the game state that changed since the last one
+            state = self.context_diff.changes(context)
+            prompt = f"[Game state: {state}] {message}" if state else message
+            print(f"🔧 [BaseAINPC] Sending to session: '{prompt}'")
+            self.goose_session.send(prompt)
             
-            self.goose_process.stdin.write(full_message)
-            self.goose_process.stdin.flush()
+            # Improved response reading with better completion detection
+            response = self._read_complete_response(on_partial, cancelled, timeout)
             
-            # Small delay to ensure message is processed
-            time.sleep(0.2)
+            if cancelled is not None and cancelled.is_set():
+                return ""
+            self.context_diff.commit(context)
             
-            # Improved response reading with better completion detection
-            response = self._read_complete_response()
             cleaned = self._clean_response(response)
             
             print(f"🔧 [BaseAINPC] Session response: '{cleaned}'")
@@ -252,17 +340,10 @@ class BaseAINPC(Entity):
             print(f"❌ [BaseAINPC] Error sending message to session: {e}")
             return ""
     
-    def _read_complete_response(self) -> str:
+    def _read_complete_response(self, on_partial: Optional[Callable[[str], None]] = None,
+                                cancelled: Optional[threading.Event] = None,
+                                timeout: float = DEFAULT_TIMEOUT) -> str:
         """Read response from Goose session with improved completion detection"""
-        import select
-        import time
-        
-        response_lines = []
-        start_time = time.time()
-        timeout = 30  # 30 second timeout
-        last_activity_time = start_time
-        idle_threshold = 1.5  # Reduced idle time
-        
         print(f"🔧 [BaseAINPC] Reading response with improved completion detection...")
         
         # Look for specific completion signals
@@ -278,49 +359,19 @@ class BaseAINPC(Entity):
             "anything else I can",  # Common NPC phrase
         ]
         
-        while time.time() - start_time < timeout:
-            # Check if there's data to read
-            ready, _, _ = select.select([self.goose_process.stdout], [], [], 0.1)
-            
-            if ready:
-                # Data is available
-                line = self.goose_process.stdout.readline()
-                if line:
-                    line_stripped = line.strip()
-                    if line_stripped:  # Only add non-empty lines
-                        response_lines.append(line_stripped)
-                        last_activity_time = time.time()
-                        print(f"🔧 [BaseAINPC] Read line: {line_stripped[:100]}...")
-                        
-                        # Check for completion signals
-                        for signal in completion_signals:
-                            if signal.lower() in line_stripped.lower():
-                                print(f"🔧 [BaseAINPC] Detected completion signal: {signal}")
-                                # Give a small buffer to catch any remaining output
-                                time.sleep(0.3)
-                                # Read any remaining lines
-                                while True:
-                                    ready_final, _, _ = select.select([self.goose_process.stdout], [], [], 0.1)
-                                    if ready_final:
-                                        final_line = self.goose_process.stdout.readline()
-                                        if final_line and final_line.strip():
-                                            response_lines.append(final_line.strip())
-                                        else:
-                                            break
-                                    else:
-                                        break
-                                # Parse and return immediately
-                                full_output = '\n'.join(response_lines)
-                                response = self._parse_goose_output(full_output)
-                                print(f"🔧 [BaseAINPC] Complete response read: {len(response_lines)} lines")
-                                return response
-            else:
-                # No data available - check if we've been idle long enough
-                if response_lines and (time.time() - last_activity_time) > idle_threshold:
-                    print(f"🔧 [BaseAINPC] No new output for {idle_threshold}s, assuming response complete")
-                    break
-                
-                time.sleep(0.1)
+        # Stream the reply so far as each line arrives
+        lines_so_far = []
+        
+        def on_line(line):
+            lines_so_far.append(line)
+            if on_partial:
+                partial = ' '.join(self._extract_response_lines(re.sub(r'\x1b\[[0-9;]*m', '', '\n'.join(lines_so_far))))
+                if partial:
+                    on_partial(partial)
+        
+        response_lines = self.goose_session.read_response(
+            timeout, self.response_idle_threshold, completion_signals, on_line, cancelled
+        )
         
         # Parse the complete response
         full_output = '\n'.join(response_lines)
@@ -330,18 +381,11 @@ class BaseAINPC(Entity):
         return response
     
     def cleanup_session(self):
-        """Clean up the Goose session"""
-        if hasattr(self, 'goose_process') and self.goose_process:
-            try:
-                self.goose_process.stdin.write("exit\n")
-                self.goose_process.stdin.flush()
-                self.goose_process.wait(timeout=5)
-            except:
-                self.goose_process.terminate()
-            finally:
-                self.goose_process = None
-                self.session_initialized = False
-                print(f"🔧 [BaseAINPC] Session cleaned up for {self.name}")
+        """Close this NPC's pooled Goose session if it isn't answering a message"""
+        pool = get_session_pool(create=False)
+        key = self.session_key if pool else None
+        if key and pool.discard(key):
+            print(f"🔧 [BaseAINPC] Session cleaned up for {self.name}")
     
     def _parse_goose_output(self, output: str) -> str:
         """Parse Goose CLI output to extract the AI response"""
@@ -350,12 +394,20 @@ class BaseAINPC(Entity):
         # Remove ANSI color codes
         clean_output = re.sub(r'\x1b\[[0-9;]*m', '', output)
         
-        lines = clean_output.strip().split('\n')
-        response_lines = []
-        
         # Check if tools were used (for tool-only responses)
         self.tools_used_in_response = self._detect_tool_usage(clean_output)
         
+        response_lines = self._extract_response_lines(clean_output)
+        response = ' '.join(response_lines) if response_lines else ""
+        print(f"🔧 [BaseAINPC] Extracted response: '{response}'")
+        print(f"🔧 [BaseAINPC] Tools used: {self.tools_used_in_response}")
+        return response
+    
+    def _extract_response_lines(self, clean_output: str) -> List[str]:
+        """Pick the AI's reply lines out of Goose output with color codes removed"""
+        lines = clean_output.strip().split('\n')
+        response_lines = []
+        
         # Skip system messages and find the actual AI response
         skip_patterns = [
             r'Loading recipe:',
@@ -412,10 +464,7 @@ class BaseAINPC(Entity):
             if line and len(line) > 5:
                 response_lines.append(line)
         
-        response = ' '.join(response_lines) if response_lines else ""
-        print(f"🔧 [BaseAINPC] Extracted response: '{response}'")
-        print(f"🔧 [BaseAINPC] Tools used: {self.tools_used_in_response}")
-        return response
+        return response_lines
     
     def _detect_tool_usage(self, output: str) -> List[str]:
         """Detect which tools were used in the AI response"""
@@ -597,12 +646,11 @@ class BaseAINPC(Entity):
             # Store chat window in player for rendering
             if hasattr(player, 'current_ai_chat'):
                 player.current_ai_chat = chat_window
+                self.current_player = player  # Chat window reads the player for context
                 print(f"✅ [BaseAINPC] AI chat started for {self.name}")
                 
-                # Send initial greeting
-                context = self._get_game_context(player)
-                greeting = self.send_ai_message("Hello", context)
-                chat_window.add_message(self.name, greeting)
+                # Send initial greeting - the reply streams into the window as it arrives
+                chat_window.request_reply("Hello")
             else:
                 print(f"❌ [BaseAINPC] Player has no current_ai_chat attribute")
                 
@@ -661,13 +709,13 @@ class BaseAINPC(Entity):
         if self.asset_loader:
             sprite_name = self._get_sprite_name()
             if sprite_name:
-                npc_image = self.asset_loader.get_image(sprite_name)
-                if npc_image:
+                npc_sprite = self.asset_loader.get_sprite(sprite_name, size)
+                if npc_sprite:
                     print(f"✅ [BaseAINPC] Loaded sprite '{sprite_name}' for {self.name}")
-                    self.sprite = pygame.transform.scale(npc_image, (size, size))
+                    self.sprite = npc_sprite
                     self.direction_sprites = [
                         self.sprite,  # Down (0)
-                        pygame.transform.flip(self.sprite, True, False),  # Left (1)
+                        self.asset_loader.get_sprite(sprite_name, size, flip_x=True),  # Left (1)
                         self.sprite,  # Up (2)
                         self.sprite   # Right (3)
                     ]
@@ -709,6 +757,7 @@ class BaseAINPC(Entity):
     def get_save_data(self):
         """Get data for saving"""
         # Clean up session before saving
+        self.cancel_ai_message()
         self.cleanup_session()
         
         data = super().get_save_data()
@@ -26,30 +26,27 @@ class Entity:
         """Create a basic sprite"""
         size = 48  # Increased from 32 to 48
         
-        # Try to use loaded assets first
+        # Try to use loaded assets first (scaled once and shared through the sprite cache)
         if self.asset_loader and self.entity_type == "object":
             # First try to load by exact name (for biome-specific objects)
-            object_image = self.asset_loader.get_image(self.name.lower())
-            if object_image:
-                self.sprite = pygame.transform.scale(object_image, (size, size))
+            object_sprite = self.asset_loader.get_sprite(self.name.lower(), size)
+            if object_sprite:
+                self.sprite = object_sprite
                 return
             
             # Fallback to generic types for backwards compatibility
+            fallback_name = None
             if "tree" in self.name.lower():
-                tree_image = self.asset_loader.get_image("tree")
-                if tree_image:
-                    self.sprite = pygame.transform.scale(tree_image, (size, size))
-                    return
+                fallback_name = "tree"
             elif "rock" in self.name.lower():
-                rock_image = self.asset_loader.get_image("rock")
-                if rock_image:
-                    self.sprite = pygame.transform.scale(rock_image, (size, size))
-                    return
+                fallback_name = "rock"
             elif "cactus" in self.name.lower():
                 # Try specific cactus first, fallback to generic tree
-                tree_image = self.asset_loader.get_image("tree")
-                if tree_image:
-                    self.sprite = pygame.transform.scale(tree_image, (size, size))
+                fallback_name = "tree"
+            if fallback_name:
+                fallback_sprite = self.asset_loader.get_sprite(fallback_name, size)
+                if fallback_sprite:
+                    self.sprite = fallback_sprite
                     return
         
         # Fallback to generated sprite
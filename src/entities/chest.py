@@ -36,9 +36,9 @@ class Chest(Entity):
             else:
                 sprite_name = f"{self.chest_type}_chest_closed"
             
-            chest_image = self.asset_loader.get_image(sprite_name)
-            if chest_image:
-                self.sprite = pygame.transform.scale(chest_image, (size, size))
+            chest_sprite = self.asset_loader.get_sprite(sprite_name, size)
+            if chest_sprite:
+                self.sprite = chest_sprite
                 return
         
         # Fallback to generated sprite (same as before)
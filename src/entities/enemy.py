@@ -7,6 +7,74 @@ import math
 import random
 from .base import Entity
 
+# Enemy name -> sprite asset
+ENEMY_SPRITES = {
+    # Forest enemies
+    "Forest Goblin": "goblin_sprite",
+    "Forest Sprite": "forest_sprite",
+    "Elder Forest Sprite": "elder_forest_sprite",
+    "Ancient Guardian": "ancient_guardian",
+    "Goblin Chieftain": "goblin_chieftain",  # Fixed: now uses correct sprite
+
+    # Plains enemies
+    "Bandit Scout": "bandit_scout",
+    "Wild Boar": "wild_boar",
+    "Bandit Raider": "bandit_raider",
+    "Orc Scout": "orc_scout",
+    "Orc Warrior": "orc_warrior",
+    "Bandit Captain": "bandit_captain",
+    "Orc Berserker": "orc_berserker",
+
+    # Desert enemies
+    "Desert Scorpion": "desert_scorpion",
+    "Sand Viper": "sand_viper",
+    "Giant Scorpion": "giant_scorpion",
+    "Sand Elemental": "sand_elemental",
+    "Desert Warlord": "desert_warlord",
+    "Ancient Scorpion King": "ancient_scorpion_king",
+
+    # Snow enemies
+    "Ice Wolf": "ice_wolf",
+    "Frost Sprite": "frost_sprite",
+    "Ice Troll": "ice_troll",
+    "Crystal Elemental": "crystal_elemental",
+    "Frost Giant": "frost_giant",
+    "Ice Dragon Wyrmling": "ice_dragon",
+
+    # Swamp enemies
+    "Swamp Rat": "swamp_rat",
+    "Bog Sprite": "bog_sprite",
+    "Swamp Troll": "swamp_troll",
+    "Ancient Swamp Lord": "swamp_lord",
+    "Plague Bearer": "plague_bearer",
+    "Swamp Dragon": "swamp_dragon",
+
+    # Boss enemies
+    "Forest Dragon": "forest_dragon",
+    "Orc Warlord": "orc_boss_sprite",
+    "Desert Lich": "desert_lich",
+    "Ancient Dragon": "ancient_dragon",
+    "Swamp Hydra": "swamp_hydra"
+}
+
+
+# Ranged enemy name -> sprite asset (boss variants reuse their base sprite)
+RANGED_ENEMY_SPRITES = {
+    "Goblin Archer": "goblin_archer",
+    "Orc Crossbow": "orc_crossbow",
+    "Skeleton Archer": "skeleton_archer",
+    "Dark Mage": "dark_mage",
+    "Desert Nomad": "desert_nomad",
+    "Frost Mage": "frost_mage",
+    "Poison Archer": "poison_archer",
+    "Bog Witch": "bog_witch",
+    # Boss variants
+    "Goblin Archer Chief": "goblin_archer",
+    "Orc Crossbow Captain": "orc_crossbow",
+    "Lich": "dark_mage"
+}
+
+
 class Enemy(Entity):
     """Enemy entity"""
     
@@ -196,68 +264,18 @@ class Enemy(Entity):
         
         # Try to use loaded sprite first
         if self.asset_loader:
-            # Map enemy names to sprite assets
-            sprite_mappings = {
-                # Forest enemies
-                "Forest Goblin": "goblin_sprite",
-                "Forest Sprite": "forest_sprite",
-                "Elder Forest Sprite": "elder_forest_sprite",
-                "Ancient Guardian": "ancient_guardian",
-                "Goblin Chieftain": "goblin_chieftain",  # Fixed: now uses correct sprite
-                
-                # Plains enemies
-                "Bandit Scout": "bandit_scout",
-                "Wild Boar": "wild_boar",
-                "Bandit Raider": "bandit_raider",
-                "Orc Scout": "orc_scout",
-                "Orc Warrior": "orc_warrior",
-                "Bandit Captain": "bandit_captain",
-                "Orc Berserker": "orc_berserker",
-                
-                # Desert enemies
-                "Desert Scorpion": "desert_scorpion",
-                "Sand Viper": "sand_viper",
-                "Giant Scorpion": "giant_scorpion",
-                "Sand Elemental": "sand_elemental",
-                "Desert Warlord": "desert_warlord",
-                "Ancient Scorpion King": "ancient_scorpion_king",
-                
-                # Snow enemies
-                "Ice Wolf": "ice_wolf",
-                "Frost Sprite": "frost_sprite",
-                "Ice Troll": "ice_troll",
-                "Crystal Elemental": "crystal_elemental",
-                "Frost Giant": "frost_giant",
-                "Ice Dragon Wyrmling": "ice_dragon",
-                
-                # Swamp enemies
-                "Swamp Rat": "swamp_rat",
-                "Bog Sprite": "bog_sprite",
-                "Swamp Troll": "swamp_troll",
-                "Ancient Swamp Lord": "swamp_lord",
-                "Plague Bearer": "plague_bearer",
-                "Swamp Dragon": "swamp_dragon",
-                
-                # Boss enemies
-                "Forest Dragon": "forest_dragon",
-                "Orc Warlord": "orc_boss_sprite",
-                "Desert Lich": "desert_lich",
-                "Ancient Dragon": "ancient_dragon",
-                "Swamp Hydra": "swamp_hydra"
-            }
-            
-            sprite_name = sprite_mappings.get(self.name)
+            sprite_name = ENEMY_SPRITES.get(self.name)
             if sprite_name:
-                enemy_image = self.asset_loader.get_image(sprite_name)
-                if enemy_image:
-                    # Create base sprite
-                    self.sprite = pygame.transform.scale(enemy_image, (size, size))
+                # Scaled sprites are shared by every enemy of this type
+                enemy_sprite = self.asset_loader.get_sprite(sprite_name, size)
+                if enemy_sprite:
+                    self.sprite = enemy_sprite
                     # Create direction sprites - mirror for right movement
                     self.direction_sprites = [
                         self.sprite,  # Down (0)
                         self.sprite,  # Left (1) - original (facing left)
                         self.sprite,  # Up (2)
-                        pygame.transform.flip(self.sprite, True, False)   # Right (3) - mirrored
+                        self.asset_loader.get_sprite(sprite_name, size, flip_x=True)   # Right (3) - mirrored
                     ]
                     return
         
@@ -661,32 +679,16 @@ class RangedEnemy(Enemy):
         
         # Try to use loaded sprite first
         if self.asset_loader:
-            sprite_mappings = {
-                "Goblin Archer": "goblin_archer",
-                "Orc Crossbow": "orc_crossbow", 
-                "Skeleton Archer": "skeleton_archer",
-                "Dark Mage": "dark_mage",
-                "Desert Nomad": "desert_nomad",
-                "Frost Mage": "frost_mage",
-                "Poison Archer": "poison_archer",
-                "Bog Witch": "bog_witch",
-                # Boss variants
-                "Goblin Archer Chief": "goblin_archer",
-                "Orc Crossbow Captain": "orc_crossbow",
-                "Lich": "dark_mage"
-            }
-            
-            sprite_name = sprite_mappings.get(self.name)
+            sprite_name = RANGED_ENEMY_SPRITES.get(self.name)
             if sprite_name:
-                enemy_image = self.asset_loader.get_image(sprite_name)
-                if enemy_image:
-                    print(f"🏹 Loading sprite for {self.name}: {sprite_name} ({enemy_image.get_size()})")
-                    self.sprite = pygame.transform.scale(enemy_image, (size, size))
+                enemy_sprite = self.asset_loader.get_sprite(sprite_name, size)
+                if enemy_sprite:
+                    self.sprite = enemy_sprite
                     self.direction_sprites = [
                         self.sprite,  # Down (0)
                         self.sprite,  # Left (1) - original (facing left)
                         self.sprite,  # Up (2)
-                        pygame.transform.flip(self.sprite, True, False)   # Right (3) - mirrored
+                        self.asset_loader.get_sprite(sprite_name, size, flip_x=True)   # Right (3) - mirrored
                     ]
                     return
                 else:
@@ -694,7 +696,7 @@ class RangedEnemy(Enemy):
                     print(f"   🔍 Available images: {[k for k in self.asset_loader.images.keys() if 'archer' in k.lower() or 'crossbow' in k.lower() or 'mage' in k.lower()]}")
             else:
                 print(f"❌ No sprite mapping for {self.name}")
-                print(f"   🔍 Available mappings: {list(sprite_mappings.keys())}")
+                print(f"   🔍 Available mappings: {list(RANGED_ENEMY_SPRITES.keys())}")
         else:
             print(f"❌ No asset_loader for {self.name}")
         
@@ -233,7 +233,12 @@ class Furniture(Entity):
         
         # Ensure valid dimensions for scaling
         if new_width > 0 and new_height > 0:
-            self.scaled_sprite = pygame.transform.scale(self.sprite, (new_width, new_height))
+            sprite_name = self.properties['sprite_name']
+            if self.asset_loader and self.sprite is self.asset_loader.get_image(sprite_name):
+                # Every piece of this furniture type shares one scaled sprite
+                self.scaled_sprite = self.asset_loader.get_sprite(sprite_name, (new_width, new_height))
+            else:
+                self.scaled_sprite = pygame.transform.scale(self.sprite, (new_width, new_height))
         else:
             # Fallback if dimensions are invalid
             self.scaled_sprite = self.sprite
@@ -6,6 +6,119 @@ import pygame
 import math
 import random
 from .base import Entity
+from ..systems.npc_conversations import DEFAULT_TIMEOUT, get_conversation_pipeline
+
+# Background NPC name -> generic sprite asset
+BACKGROUND_NPC_SPRITES = {
+    'Resident': 'generic_villager_1',
+    'House Owner': 'generic_villager_1',
+    'Villager': 'generic_villager_2',
+    'Worker': 'generic_worker',
+    'Laborer': 'generic_worker',
+    'House Servant': 'generic_servant',
+    'Servant': 'generic_servant',
+    'Farmer': 'generic_farmer',
+    'Peasant': 'generic_farmer',
+    'Citizen': 'generic_citizen',
+    'Townsperson': 'generic_citizen',
+    'Commoner': 'generic_citizen',
+    'Elder': 'generic_elder',
+    'Old Man': 'generic_elder',
+    'Old Woman': 'generic_elder',
+    'Child': 'generic_child',
+    'Young One': 'generic_child',
+    'Helper': 'generic_merchant_helper',
+    'Assistant': 'generic_merchant_helper',
+    'Apprentice': 'generic_merchant_helper'
+}
+
+
+# NPC name -> sprite asset
+NPC_SPRITES = {
+    # Existing NPCs with dedicated assets
+    "Master Merchant": "npc_shopkeeper",
+    "Shopkeeper": "npc_shopkeeper",
+    "Trader": "trader",  # Use dedicated trader asset
+    "Rich Merchant": "trade_master",
+    "Market Master": "trade_master",
+
+    "Village Elder": "elder_npc",
+    "Elder": "elder_npc",
+
+    "Guard Captain": "guard_captain",
+    "Guard": "village_guard_sprite",  # Use the village guard sprite
+    "Commander": "guard_captain",  # Reuse guard captain
+    "Barracks Chief": "guard_captain",
+
+    "Master Smith": "master_smith",
+    "Blacksmith": "master_smith",
+    "Tool Maker": "master_smith",  # Reuse smith for tool maker
+    "Weapon Master": "master_smith",
+
+    "Innkeeper": "innkeeper",
+    "Inn Master": "innkeeper",
+    "Lodge Keeper": "innkeeper",  # Reuse innkeeper
+
+    "High Priest": "high_priest",
+    "Archbishop": "high_priest",  # Reuse priest
+    "Forest Priest": "high_priest",
+
+    "Mine Foreman": "mine_foreman",
+    "Ore Master": "mine_foreman",  # Reuse mine foreman
+    "Veteran Miner": "mine_foreman",
+
+    "Harbor Master": "harbor_master",
+    "Dock Master": "harbor_master",  # Reuse harbor master
+    "Fisherman": "master_fisher",
+    "Old Fisherman": "master_fisher",
+    "Fish Merchant": "master_fisher",
+    "Net Weaver": "master_fisher",
+    "Smoke Master": "master_fisher",
+    "Sailor": "master_fisher",
+
+    "Caravan Master": "caravan_master",
+    "Desert Guide": "caravan_master",  # Reuse caravan master
+    "Desert Nomad": "caravan_master",
+    "Oasis Keeper": "caravan_master",
+
+    "Forest Ranger": "forest_ranger",
+    "Scout Leader": "forest_ranger",  # Reuse ranger
+    "Hunter": "forest_ranger",
+    "Tree Keeper": "forest_ranger",
+
+    "Master Herbalist": "master_herbalist",
+    "Herb Gatherer": "master_herbalist",  # Reuse herbalist
+    "Forest Druid": "master_herbalist",
+    "Swamp Alchemist": "master_herbalist",
+
+    "Mysterious Wizard": "mysterious_wizard",
+    "Court Wizard": "mysterious_wizard",  # Reuse wizard
+
+    "Old Hermit": "old_hermit",
+    "Swamp Dweller": "old_hermit",  # Reuse hermit
+    "Villager": "old_hermit",
+
+    "Stable Master": "stable_master",
+
+    # NPCs that need new assets (will use fallback generation)
+    "Mayor": "mayor",  # NEW ASSET NEEDED
+    "Noble": "noble",  # NEW ASSET NEEDED
+    "Banker": "banker",  # NEW ASSET NEEDED
+    "Librarian": "librarian",  # NEW ASSET NEEDED
+    "Guild Master": "guild_master",  # NEW ASSET NEEDED
+    "Barkeeper": "barkeeper",  # NEW ASSET NEEDED
+    "Craftsman": "craftsman",  # NEW ASSET NEEDED
+    "Master Woodcutter": "master_woodcutter",  # NEW ASSET NEEDED
+    "Miller": "miller",  # NEW ASSET NEEDED
+    "Boat Builder": "boat_builder",  # NEW ASSET NEEDED
+    "Swamp Witch": "swamp_witch",  # NEW ASSET NEEDED
+    "Fur Trader": "fur_trader",  # NEW ASSET NEEDED
+    "Ice Keeper": "ice_keeper",  # NEW ASSET NEEDED
+    "Water Keeper": "water_keeper",  # NEW ASSET NEEDED
+    "Mushroom Farmer": "mushroom_farmer",  # NEW ASSET NEEDED
+    "Assayer": "assayer",  # NEW ASSET NEEDED
+}
+
 
 class NPC(Entity):
     """Non-player character with optional AI support"""
@@ -86,10 +199,7 @@ class NPC(Entity):
             # Send initial context to AI
             if self.game_context:
                 print(f"🔧 Sending initial greeting to AI")
-                context = self.game_context.get_context()
-                initial_greeting = self.ai_integration.send_message("Hello", context)
-                self.chat_window.add_message(self.name, initial_greeting)
-                print(f"🔧 AI responded: {initial_greeting}")
+                self.request_ai_reply("Hello")
             else:
                 print(f"⚠️  No game_context available")
         else:
@@ -107,14 +217,46 @@ class NPC(Entity):
                 self.chat_window.add_message("Player", message)
                 
                 # Get AI response
-                context = self.game_context.get_context() if self.game_context else ""
-                ai_response = self.ai_integration.send_message(message, context)
-                self.chat_window.add_message(self.name, ai_response)
+                self.request_ai_reply(message)
             
             return True  # Event was handled
         
         return False
     
+    def request_ai_reply(self, message):
+        """
+        Ask the AI to answer a message without blocking the game loop
+        
+        The recipe runs on a conversation worker, so the MCP tool calls it
+        makes are served by the main loop's command bus while it waits. The
+        reply replaces a placeholder in the chat window when it arrives.
+        
+        Args:
+            message: The player's message
+            
+        Returns:
+            The queued ConversationRequest
+        """
+        context = self.game_context.get_context() if self.game_context else ""
+        self.chat_window.add_message(self.name, "...")
+        entry = self.chat_window.chat_history[-1]
+        
+        def on_event(event):
+            if event.kind == event.PARTIAL:
+                return
+            if event.kind == event.CANCELLED:
+                if entry in self.chat_window.chat_history:
+                    self.chat_window.chat_history.remove(entry)
+                return
+            entry["message"] = event.text
+            print(f"🔧 AI responded: {event.text}")
+        
+        return get_conversation_pipeline().submit(self, message, context, on_event)
+    
+    def answer_ai_message(self, message, context="", on_partial=None, cancelled=None, timeout=DEFAULT_TIMEOUT):
+        """Get the recipe integration's reply to a message (runs on a conversation worker)"""
+        return self.ai_integration.send_message(message, context)
+    
     def render_ai_chat(self, screen):
         """Render AI chat window if active"""
         if self.is_ai_enabled and self.chat_window:
@@ -136,46 +278,21 @@ class NPC(Entity):
         if hasattr(self, 'is_background') and self.is_background:
             print(f"   🎭 Background NPC detected: '{self.name}'")
             if self.asset_loader:
-                # Map background NPC names to specific generic sprites
-                background_sprite_mappings = {
-                    'Resident': 'generic_villager_1',
-                    'House Owner': 'generic_villager_1', 
-                    'Villager': 'generic_villager_2',
-                    'Worker': 'generic_worker',
-                    'Laborer': 'generic_worker',
-                    'House Servant': 'generic_servant',
-                    'Servant': 'generic_servant',
-                    'Farmer': 'generic_farmer',
-                    'Peasant': 'generic_farmer',
-                    'Citizen': 'generic_citizen',
-                    'Townsperson': 'generic_citizen',
-                    'Commoner': 'generic_citizen',
-                    'Elder': 'generic_elder',
-                    'Old Man': 'generic_elder',
-                    'Old Woman': 'generic_elder',
-                    'Child': 'generic_child',
-                    'Young One': 'generic_child',
-                    'Helper': 'generic_merchant_helper',
-                    'Assistant': 'generic_merchant_helper',
-                    'Apprentice': 'generic_merchant_helper'
-                }
-                
                 # Get appropriate sprite for this background NPC type
-                sprite_name = background_sprite_mappings.get(self.name, 'generic_npc')  # Fallback to original
+                sprite_name = BACKGROUND_NPC_SPRITES.get(self.name, 'generic_npc')  # Fallback to original
                 print(f"   🔍 Looking for '{sprite_name}' asset for '{self.name}'...")
                 
-                generic_npc_image = self.asset_loader.get_image(sprite_name)
-                print(f"   📦 {sprite_name} asset found: {generic_npc_image is not None}")
+                # Scaled sprites are shared by every NPC using this asset
+                generic_npc_sprite = self.asset_loader.get_sprite(sprite_name, size)
+                print(f"   📦 {sprite_name} asset found: {generic_npc_sprite is not None}")
                 
-                if generic_npc_image:
-                    print(f"   📏 Original asset size: {generic_npc_image.get_size()}")
-                    # Create base sprite
-                    self.sprite = pygame.transform.scale(generic_npc_image, (size, size))
+                if generic_npc_sprite:
+                    self.sprite = generic_npc_sprite
                     print(f"   ✅ Scaled to: {self.sprite.get_size()}")
                     # Create direction sprites - mirror for left movement
                     self.direction_sprites = [
                         self.sprite,  # Down (0)
-                        pygame.transform.flip(self.sprite, True, False),  # Left (1) - mirrored
+                        self.asset_loader.get_sprite(sprite_name, size, flip_x=True),  # Left (1) - mirrored
                         self.sprite,  # Up (2)
                         self.sprite   # Right (3) - original (facing right)
                     ]
@@ -190,102 +307,15 @@ class NPC(Entity):
         
         # Try to use loaded sprite first for interactive NPCs
         if self.asset_loader:
-            # Map NPC names to sprite assets - EXPANDED MAPPING
-            sprite_mappings = {
-                # Existing NPCs with dedicated assets
-                "Master Merchant": "npc_shopkeeper",
-                "Shopkeeper": "npc_shopkeeper", 
-                "Trader": "trader",  # Use dedicated trader asset
-                "Rich Merchant": "trade_master",
-                "Market Master": "trade_master",
-                
-                "Village Elder": "elder_npc",
-                "Elder": "elder_npc",
-                
-                "Guard Captain": "guard_captain",
-                "Guard": "village_guard_sprite",  # Use the village guard sprite
-                "Commander": "guard_captain",  # Reuse guard captain
-                "Barracks Chief": "guard_captain",
-                
-                "Master Smith": "master_smith",
-                "Blacksmith": "master_smith",
-                "Tool Maker": "master_smith",  # Reuse smith for tool maker
-                "Weapon Master": "master_smith",
-                
-                "Innkeeper": "innkeeper",
-                "Inn Master": "innkeeper",
-                "Lodge Keeper": "innkeeper",  # Reuse innkeeper
-                
-                "High Priest": "high_priest",
-                "Archbishop": "high_priest",  # Reuse priest
-                "Forest Priest": "high_priest",
-                
-                "Mine Foreman": "mine_foreman",
-                "Ore Master": "mine_foreman",  # Reuse mine foreman
-                "Veteran Miner": "mine_foreman",
-                
-                "Harbor Master": "harbor_master",
-                "Dock Master": "harbor_master",  # Reuse harbor master
-                "Fisherman": "master_fisher",
-                "Old Fisherman": "master_fisher",
-                "Fish Merchant": "master_fisher",
-                "Net Weaver": "master_fisher",
-                "Smoke Master": "master_fisher",
-                "Sailor": "master_fisher",
-                
-                "Caravan Master": "caravan_master",
-                "Desert Guide": "caravan_master",  # Reuse caravan master
-                "Desert Nomad": "caravan_master",
-                "Oasis Keeper": "caravan_master",
-                
-                "Forest Ranger": "forest_ranger",
-                "Scout Leader": "forest_ranger",  # Reuse ranger
-                "Hunter": "forest_ranger",
-                "Tree Keeper": "forest_ranger",
-                
-                "Master Herbalist": "master_herbalist",
-                "Herb Gatherer": "master_herbalist",  # Reuse herbalist
-                "Forest Druid": "master_herbalist",
-                "Swamp Alchemist": "master_herbalist",
-                
-                "Mysterious Wizard": "mysterious_wizard",
-                "Court Wizard": "mysterious_wizard",  # Reuse wizard
-                
-                "Old Hermit": "old_hermit",
-                "Swamp Dweller": "old_hermit",  # Reuse hermit
-                "Villager": "old_hermit",
-                
-                "Stable Master": "stable_master",
-                
-                # NPCs that need new assets (will use fallback generation)
-                "Mayor": "mayor",  # NEW ASSET NEEDED
-                "Noble": "noble",  # NEW ASSET NEEDED
-                "Banker": "banker",  # NEW ASSET NEEDED
-                "Librarian": "librarian",  # NEW ASSET NEEDED
-                "Guild Master": "guild_master",  # NEW ASSET NEEDED
-                "Barkeeper": "barkeeper",  # NEW ASSET NEEDED
-                "Craftsman": "craftsman",  # NEW ASSET NEEDED
-                "Master Woodcutter": "master_woodcutter",  # NEW ASSET NEEDED
-                "Miller": "miller",  # NEW ASSET NEEDED
-                "Boat Builder": "boat_builder",  # NEW ASSET NEEDED
-                "Swamp Witch": "swamp_witch",  # NEW ASSET NEEDED
-                "Fur Trader": "fur_trader",  # NEW ASSET NEEDED
-                "Ice Keeper": "ice_keeper",  # NEW ASSET NEEDED
-                "Water Keeper": "water_keeper",  # NEW ASSET NEEDED
-                "Mushroom Farmer": "mushroom_farmer",  # NEW ASSET NEEDED
-                "Assayer": "assayer",  # NEW ASSET NEEDED
-            }
-            
-            sprite_name = sprite_mappings.get(self.name)
+            sprite_name = NPC_SPRITES.get(self.name)
             if sprite_name:
-                npc_image = self.asset_loader.get_image(sprite_name)
-                if npc_image:
-                    # Create base sprite
-                    self.sprite = pygame.transform.scale(npc_image, (size, size))
+                npc_sprite = self.asset_loader.get_sprite(sprite_name, size)
+                if npc_sprite:
+                    self.sprite = npc_sprite
                     # Create direction sprites - mirror for left movement
                     self.direction_sprites = [
                         self.sprite,  # Down (0)
-                        pygame.transform.flip(self.sprite, True, False),  # Left (1) - mirrored
+                        self.asset_loader.get_sprite(sprite_name, size, flip_x=True),  # Left (1) - mirrored
                         self.sprite,  # Up (2)
                         self.sprite   # Right (3) - original (facing right)
                     ]
@@ -11,6 +11,11 @@ from .save_system import SaveSystem
 from .core.assets import AssetLoader
 from .settings import Settings
 from .core.game_log import GameLog
+from .systems.npc_conversations import dispatch_conversation_events, get_conversation_pipeline
+from .systems.session_pool import get_session_pool, goose_available
+from .systems.response_cache import get_response_cache
+from .systems.command_bus import CommandBus, CommandMirror
+from .systems.state_snapshot import SnapshotPublisher
 
 # Try to import MCP server, but don't fail if dependencies are missing
 try:
@@ -61,10 +66,21 @@ class Game:
         # Set window icon now that asset loader is ready
         self.update_window_icon()
         
+        # MCP tool calls are queued here and run on the game loop
+        self.command_bus = CommandBus(CommandMirror() if self.settings.get("mcp_debug_mirror") else None)
+        # MCP queries read game state from snapshots published every few frames
+        self.snapshots = SnapshotPublisher(self.settings.get("mcp_snapshot_interval"))
+        
         # Initialize MCP server
         self.mcp_server = None
         self.start_mcp_server()
         
+        # Size the shared Goose session pool for AI NPCs
+        get_session_pool().configure(self.settings.get("ai_session_pool_size"),
+                                     self.settings.get("ai_session_idle_timeout"))
+        get_response_cache().configure(ttl=self.settings.get("ai_response_cache_ttl"),
+                                       max_entries=self.settings.get("ai_response_cache_size"))
+        
         # Initialize game components
         self.menu = MainMenu(self)
         self.player = None
@@ -116,6 +132,12 @@ class Game:
         if seed:
             level_name += f" (Seed: {seed})"
         
+        # Tiles and entities keep the images they're built with, so hand over any still decoding
+        self.asset_loader.finish_loading()
+        
+        # Release the previous world's generation workers and region files
+        self.close_level()
+        
         # Create level first to get optimal spawn location
         self.current_level = Level(
             level_name, 
@@ -155,6 +177,8 @@ class Game:
         if seed:
             self.game_log.add_message(f"World seed: {seed}", "system")
         self.game_log.add_message(f"You find yourself near a settlement...", "story")
+        
+        self.prewarm_ai_sessions()
     
 
     
@@ -162,6 +186,9 @@ class Game:
         """Load a saved game with procedural world support"""
         game_data = self.save_system.load_game(save_name)
         if game_data:
+            self.asset_loader.finish_loading()
+            self.close_level()
+            
             # Create player from saved data
             self.player = Player.from_save_data(game_data["player"], self.asset_loader, self.game_log)
             
@@ -210,9 +237,35 @@ class Game:
                 self.quest_manager.load_save_data(game_data["quests"])
             
             self.state = Game.STATE_PLAYING
+            self.prewarm_ai_sessions()
             return True
         return False
     
+    def close_level(self):
+        """Stop the current world's chunk generation workers and close its region files"""
+        level = self.current_level
+        if level is not None and getattr(level, 'is_infinite_world', False) and hasattr(level, 'chunk_manager'):
+            level.chunk_manager.close()
+        self.current_level = None
+    
+    def prewarm_ai_sessions(self, radius: float = 20):
+        """Start Goose sessions for the AI NPCs nearest the player so the first chat doesn't wait"""
+        if not self.player or not self.current_level or not goose_available():
+            return
+        
+        nearby = []
+        for npc in getattr(self.current_level, 'npcs', []):
+            if not hasattr(npc, 'prewarm_session'):
+                continue
+            distance = ((npc.x - self.player.x) ** 2 + (npc.y - self.player.y) ** 2) ** 0.5
+            if distance <= radius:
+                nearby.append((distance, npc))
+        nearby.sort(key=lambda item: item[0])
+        
+        starters = [starter for starter in (npc.prewarm_session() for _, npc in nearby) if starter]
+        if starters and get_session_pool().prewarm(starters):
+            print(f"🔧 Pre-warming Goose sessions for up to {len(starters)} nearby AI NPCs")
+    
     def save_game(self, save_name):
         """Save the current game with procedural world support"""
         if self.player and self.current_level:
@@ -455,7 +508,7 @@ class Game:
                 self._update_chunk_with_current_entities(current_chunk, chunk_x, chunk_y)
                 
                 # Save the updated chunk
-                current_chunk.save_to_file(chunk_manager.world_dir)
+                chunk_manager.save_chunk(current_chunk)
                 self.game_log.add_message(f"  💾 Saved current entity states to chunk", "system")
                 
                 # Remove from memory to force reload
@@ -466,7 +519,10 @@ class Game:
             reloaded_chunk = chunk_manager.get_chunk(chunk_x, chunk_y)
             self.game_log.add_message(f"  🔄 Reloaded chunk with {len(reloaded_chunk.entities)} entities", "system")
             
-            # Update entities from the reloaded chunk
+            # Rebuild this chunk's live entities from the reloaded chunk
+            residency = getattr(self.current_level, 'entity_residency', None)
+            if residency:
+                residency.invalidate_chunk(chunk_x, chunk_y)
             self.current_level.update_entities_from_chunks()
             
             # Report new entity counts
@@ -573,11 +629,19 @@ class Game:
         # Update game log
         self.game_log.update()
         
+        # Run MCP tool calls that arrived since the last frame
+        if self.command_bus.drain():
+            self.snapshots.mark_dirty()
+        
         if self.state == Game.STATE_MENU:
             self.menu.update()
         elif self.state == Game.STATE_PLAYING:
             self.current_level.update()
             
+            # Deliver NPC replies that arrived since the last frame
+            dispatch_conversation_events()
+            get_session_pool().reap_idle()
+            
             # Update quest system
             if hasattr(self, 'quest_manager'):
                 # Connect quest manager to player for quest progress tracking
@@ -591,6 +655,10 @@ class Game:
             self.menu.update()
         elif self.state == Game.STATE_GAME_OVER:
             self.menu.update()
+        
+        # Publish the frame's state for MCP queries
+        if self.snapshots.update(self) and self.command_bus.mirror and self.snapshots.published % 60 == 1:
+            self.command_bus.mirror.write_json("game_snapshot.json", self.snapshots.latest().to_dict())
     
     def game_over(self):
         """Handle player death"""
@@ -666,7 +734,15 @@ class Game:
                 self.clock.tick(60)  # 60 FPS
         finally:
             # Cleanup on exit
+            self.close_level()
             self.stop_mcp_server()
+            self.command_bus.close()
+            if self.command_bus.mirror:
+                self.command_bus.mirror.close()
+            pipeline = get_conversation_pipeline(create=False)
+            if pipeline:
+                pipeline.shutdown()
+            get_session_pool().shutdown()
     
     def start_mcp_server(self):
         """Start the MCP server for AI NPC communication"""
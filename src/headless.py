@@ -0,0 +1,433 @@
+"""
+Headless Simulation Module
+
+Runs the level simulation at a fixed timestep with no display and a
+scripted player controller, and profiles it per subsystem. Used to measure
+AI, collision and chunk-streaming throughput separately from rendering.
+"""
+
+import os
+import gc
+import sys
+import time
+import random
+import tempfile
+import tracemalloc
+from contextlib import contextmanager, redirect_stdout
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pygame
+
+from .core.game_log import GameLog
+
+# Every tick is one frame of the 60 FPS game loop
+TICK_RATE = 60
+
+# Level methods timed by the probes, grouped by what they measure
+PROBED_METHODS = {
+    "collision": ("check_collision", "has_line_of_sight"),
+    "pathfinding": ("find_path", "find_tile_path", "find_tile_route"),
+    "streaming": ("update_entities_from_chunks",)
+}
+
+
+class ScriptedKeys:
+    """Key state indexed like pygame.key.get_pressed()"""
+
+    def __init__(self, pressed=()):
+        self.pressed = set(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+
+class HeadlessGame:
+    """Stand-in for Game holding what the level and entities read from it"""
+
+    def __init__(self, asset_loader, settings=None):
+        self.asset_loader = asset_loader
+        self.settings = settings
+        self.game_log = GameLog()
+        self.player = None
+        self.current_level = None
+
+
+class PlayerController:
+    """
+    Stubbed player input
+
+    Supplies the key state for each tick instead of the keyboard, and
+    issues click-to-move orders the way the mouse would.
+    """
+
+    def __init__(self):
+        self.held_keys: Dict[int, int] = {}  # Key -> last tick it is held
+
+    def press(self, tick, keys, duration=1):
+        """Hold keys for a number of ticks starting at this one"""
+        for key in keys:
+            self.held_keys[key] = tick + duration - 1
+
+    def keys_for(self, tick) -> ScriptedKeys:
+        """Key state for a tick"""
+        return ScriptedKeys(key for key, until in self.held_keys.items() if until >= tick)
+
+    def walk_to(self, level, tile_x, tile_y):
+        """Pathfind the player to a tile like a mouse click on empty ground"""
+        movement = level.player.movement_system
+        movement.movement_mode = "mouse"
+        movement._move_to_tile(tile_x, tile_y, level)
+
+    def is_idle(self, level):
+        """Check if the player has nowhere left to walk"""
+        movement = level.player.movement_system
+        return not level.player.moving and movement.path_index >= len(movement.path)
+
+
+class Scenario:
+    """
+    Scripted player actions keyed by tick
+
+    Actions are called with the runner when their tick comes up, and
+    repeating actions on every tick. Tiles are given relative to the
+    player's spawn so a scenario works for any seed.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.actions: Dict[int, List[Callable]] = {}
+        self.repeating: List[Callable] = []
+
+    def at(self, tick, action):
+        """Run an action at a tick"""
+        self.actions.setdefault(tick, []).append(action)
+        return self
+
+    def every_tick(self, action):
+        """Run an action on every tick"""
+        self.repeating.append(action)
+        return self
+
+    def walk(self, tick, dx, dy):
+        """Walk to a tile offset from spawn"""
+        def action(runner):
+            spawn_x, spawn_y = runner.spawn
+            runner.controller.walk_to(runner.level, spawn_x + dx, spawn_y + dy)
+        return self.at(tick, action)
+
+    def patrol(self, waypoints):
+        """Walk to spawn offsets in turn, moving on when the player arrives or gets stuck"""
+        next_index = [0]
+
+        def action(runner):
+            if runner.controller.is_idle(runner.level):
+                dx, dy = waypoints[next_index[0] % len(waypoints)]
+                next_index[0] += 1
+                spawn_x, spawn_y = runner.spawn
+                runner.controller.walk_to(runner.level, spawn_x + dx, spawn_y + dy)
+        return self.every_tick(action)
+
+    def press(self, tick, keys, duration=1):
+        """Hold keys for a number of ticks"""
+        return self.at(tick, lambda runner: runner.controller.press(tick, keys, duration))
+
+    def run_actions(self, runner, tick):
+        for action in self.repeating:
+            action(runner)
+        for action in self.actions.get(tick, ()):
+            action(runner)
+
+
+def idle_scenario(ticks):
+    """The player stands still while the world around them updates"""
+    return Scenario("idle")
+
+
+def wasd_scenario(ticks):
+    """The player walks around a small square with the movement keys"""
+    scenario = Scenario("wasd")
+    scenario.at(0, lambda runner: setattr(runner.level.player.movement_system, 'movement_mode', "wasd"))
+    leg = max(1, ticks // 4)
+    for index, key in enumerate((pygame.K_d, pygame.K_s, pygame.K_a, pygame.K_w)):
+        scenario.press(index * leg, (key,), leg)
+    return scenario
+
+
+def explore_scenario(ticks):
+    """The player walks long legs away from spawn, streaming chunks in and out"""
+    return Scenario("explore").patrol([(80, 0), (80, 80), (0, 80), (0, 0)])
+
+
+SCENARIOS = {
+    "idle": idle_scenario,
+    "wasd": wasd_scenario,
+    "explore": explore_scenario
+}
+
+
+class SubsystemStats:
+    """Accumulated cost of one subsystem or probed method"""
+
+    def __init__(self, name):
+        self.name = name
+        self.calls = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.blocks = 0  # Net allocated memory blocks
+        self.peak_bytes = 0  # Largest traced allocation peak of a single call
+
+    def add(self, seconds, blocks=0, peak_bytes=0):
+        self.calls += 1
+        self.seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.blocks += blocks
+        self.peak_bytes = max(self.peak_bytes, peak_bytes)
+
+
+class SimulationReport:
+    """Throughput and per-subsystem cost of a headless run"""
+
+    def __init__(self, seed, scenario_name, ticks, seconds, subsystems, probes, gc_collections, player_tiles,
+                 sprite_cache=None):
+        self.seed = seed
+        self.scenario_name = scenario_name
+        self.ticks = ticks
+        self.seconds = seconds
+        self.subsystems: Dict[str, SubsystemStats] = subsystems
+        self.probes: Dict[str, SubsystemStats] = probes
+        self.gc_collections = gc_collections
+        self.player_tiles = player_tiles  # Player tile at the end of every tick
+        self.sprite_cache = sprite_cache or {}  # AssetLoader.sprite_cache_stats() after the run
+
+    @property
+    def ticks_per_second(self):
+        return self.ticks / self.seconds if self.seconds > 0 else float('inf')
+
+    def to_dict(self):
+        """Report as plain data for CI logs"""
+        def stats_dict(stats):
+            return {
+                name: {
+                    'calls': entry.calls,
+                    'ms_per_tick': entry.seconds * 1000 / max(1, self.ticks),
+                    'max_ms': entry.max_seconds * 1000,
+                    'blocks_per_tick': entry.blocks / max(1, self.ticks),
+                    'peak_bytes': entry.peak_bytes
+                }
+                for name, entry in stats.items()
+            }
+
+        return {
+            'seed': self.seed,
+            'scenario': self.scenario_name,
+            'ticks': self.ticks,
+            'seconds': self.seconds,
+            'ticks_per_second': self.ticks_per_second,
+            'gc_collections': self.gc_collections,
+            'subsystems': stats_dict(self.subsystems),
+            'probes': stats_dict(self.probes),
+            'sprite_cache': self.sprite_cache
+        }
+
+    def format(self):
+        """Human readable report"""
+        lines = [
+            f"Seed {self.seed}, scenario '{self.scenario_name}': {self.ticks} ticks in {self.seconds:.2f}s "
+            f"({self.ticks_per_second:.1f} ticks/sec, {self.ticks_per_second / TICK_RATE:.1f}x real time)",
+            f"  GC collections by generation: {self.gc_collections}",
+            f"  {'subsystem':<46}{'ms/tick':>9}{'max ms':>9}{'calls':>9}{'blocks/tick':>13}{'peak KB':>9}"
+        ]
+        for title, stats in (("", self.subsystems), ("probe: ", self.probes)):
+            for name, entry in stats.items():
+                if not entry.calls:
+                    continue
+                lines.append(
+                    f"  {title + name:<46}{entry.seconds * 1000 / max(1, self.ticks):9.3f}"
+                    f"{entry.max_seconds * 1000:9.2f}{entry.calls:9d}"
+                    f"{entry.blocks / max(1, self.ticks):13.1f}{entry.peak_bytes / 1024:9.1f}"
+                )
+        if self.sprite_cache:
+            cache = self.sprite_cache
+            lines.append(
+                f"  Sprite cache: {cache['hit_rate']:.1%} hits ({cache['hits']}/{cache['hits'] + cache['misses']}), "
+                f"{cache['entries']} sprites, {cache['bytes'] / 1024:.1f} KB"
+            )
+        return "\n".join(lines)
+
+
+class HeadlessRunner:
+    """
+    Drives a seeded level at a fixed timestep without a display
+
+    Each tick runs the level's update steps exactly as Game.update does,
+    with the key state coming from a PlayerController instead of the
+    keyboard, and as fast as the simulation allows rather than at 60 FPS.
+    """
+
+    def __init__(self, seed, asset_loader=None, save_dir=None, trace_memory=False, quiet=False):
+        """
+        Create the runner
+
+        Args:
+            seed: World seed, also used to seed gameplay randomness
+            asset_loader: Asset loader to share between runs (created if None)
+            save_dir: Directory for world saves (a temporary one if None)
+            trace_memory: Record per-call allocation peaks with tracemalloc (slower)
+            quiet: Discard the game's console output while generating and simulating
+        """
+        self.seed = seed
+        self.asset_loader = asset_loader
+        self.trace_memory = trace_memory
+        self.quiet = quiet
+        self.controller = PlayerController()
+        self.game = None
+        self.level = None
+        self.spawn = None
+        self.tick_count = 0
+        self.probe_stats: Dict[str, SubsystemStats] = {}
+
+        self._temp_dir = None
+        if save_dir is None:
+            self._temp_dir = tempfile.TemporaryDirectory(prefix="headless_")
+            save_dir = self._temp_dir.name
+        self.save_dir = save_dir
+
+    @contextmanager
+    def _quiet(self):
+        """Discard console output if the runner is quiet"""
+        if self.quiet:
+            with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+                yield
+        else:
+            yield
+
+    @contextmanager
+    def _in_save_dir(self):
+        """Chunks are saved relative to the working directory"""
+        original_cwd = os.getcwd()
+        os.chdir(self.save_dir)
+        try:
+            with self._quiet():
+                yield
+        finally:
+            os.chdir(original_cwd)
+
+    def setup(self):
+        """Generate the world and place the player at its spawn"""
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+        pygame.init()
+
+        from .core.assets import AssetLoader
+        from .level import Level
+        from .player import Player
+
+        if self.asset_loader is None:
+            # Assets are found relative to the working directory
+            with self._quiet():
+                self.asset_loader = AssetLoader()
+
+        random.seed(self.seed)
+        self.game = HeadlessGame(self.asset_loader)
+        with self._in_save_dir():
+            self.level = Level(f"Headless World (Seed: {self.seed})", None, self.asset_loader, self.game, seed=self.seed)
+            self.spawn = self.level.procedural_info['player_spawn']
+            player = Player(self.spawn[0], self.spawn[1], self.asset_loader, self.game.game_log)
+        player.game = self.game
+        self.level.player = player
+        self.game.player = player
+        self.game.current_level = self.level
+        self.game.hud = self.level.hud
+        self.level.hud.player = player
+
+        self._install_probes()
+        return self.level
+
+    def _install_probes(self):
+        """Wrap probed level methods so every call is counted and timed"""
+        for group, names in PROBED_METHODS.items():
+            for name in names:
+                method = getattr(self.level, name, None)
+                if method is None:
+                    continue
+                stats = self.probe_stats.setdefault(f"{group}.{name}", SubsystemStats(f"{group}.{name}"))
+                setattr(self.level, name, self._timed(method, stats))
+
+    @staticmethod
+    def _timed(method, stats):
+        def probe(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                stats.add(time.perf_counter() - start)
+        return probe
+
+    def run(self, ticks, scenario: Optional[Scenario] = None) -> SimulationReport:
+        """
+        Run the simulation for a number of ticks
+
+        Args:
+            ticks: Number of fixed timestep ticks to simulate
+            scenario: Scripted player actions (the player idles if None)
+
+        Returns:
+            SimulationReport for the run
+        """
+        if self.level is None:
+            self.setup()
+        scenario = scenario or idle_scenario(ticks)
+
+        for stats in self.probe_stats.values():
+            stats.__init__(stats.name)
+        subsystems: Dict[str, SubsystemStats] = {}
+        player_tiles: List[Tuple[int, int]] = []
+
+        random.seed(self.seed)
+        gc_before = [entry['collections'] for entry in gc.get_stats()]
+        if self.trace_memory:
+            tracemalloc.start()
+
+        def measure(name, step):
+            stats = subsystems.get(name)
+            if stats is None:
+                stats = subsystems[name] = SubsystemStats(name)
+            if self.trace_memory:
+                tracemalloc.reset_peak()
+                traced_before = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            blocks_before = sys.getallocatedblocks()
+            step()
+            blocks = sys.getallocatedblocks() - blocks_before - 1  # Less the blocks_before int itself
+            seconds = time.perf_counter() - start
+            peak_bytes = tracemalloc.get_traced_memory()[1] - traced_before if self.trace_memory else 0
+            stats.add(seconds, blocks, peak_bytes)
+            return seconds
+
+        elapsed = 0.0
+        try:
+            with self._in_save_dir():
+                for tick in range(ticks):
+                    elapsed += measure("scenario", lambda: scenario.run_actions(self, tick))
+                    for name, step in self.level.get_update_steps(self.controller.keys_for(tick)):
+                        elapsed += measure(name, step)
+
+                    self.tick_count += 1
+                    player_tiles.append((self.level.player.tile_x, self.level.player.tile_y))
+        finally:
+            if self.trace_memory:
+                tracemalloc.stop()
+
+        gc_collections = [entry['collections'] - before for entry, before in zip(gc.get_stats(), gc_before)]
+        sprite_cache = self.asset_loader.sprite_cache_stats() if hasattr(self.asset_loader, 'sprite_cache_stats') else None
+        return SimulationReport(self.seed, scenario.name, ticks, elapsed, subsystems,
+                                dict(self.probe_stats), gc_collections, player_tiles, sprite_cache)
+
+    def close(self):
+        """Save and release the world, and remove a temporary save directory"""
+        if self.level is not None and hasattr(self.level, 'chunk_manager'):
+            with self._in_save_dir():
+                self.level.chunk_manager.close()
+        if self._temp_dir is not None:
+            self._temp_dir.cleanup()
+            self._temp_dir = None
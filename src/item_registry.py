@@ -262,12 +262,12 @@ class ItemRegistry:
         
         # Check if sprite exists
         sprite_key = item_data.get("sprite_key")
-        if sprite_key and sprite_key in self.asset_loader.images:
+        if sprite_key and self.asset_loader.has_image(sprite_key):
             return True
         
         # Check alternative sprite naming
         alt_sprite_key = item_name.lower().replace(" ", "_")
-        if alt_sprite_key in self.asset_loader.images:
+        if self.asset_loader.has_image(alt_sprite_key):
             item_data["sprite_key"] = alt_sprite_key
             return True
         
@@ -93,21 +93,52 @@ class Level(
         if hasattr(self, 'create_tile_sprites'):
             self.create_tile_sprites()
     
-    def update(self):
-        """Main update loop - coordinates all subsystems"""
+    def update(self, keys=None):
+        """
+        Main update loop - coordinates all subsystems
+        
+        Args:
+            keys: Key state for player input (defaults to the keyboard)
+        """
+        for _, step in self.get_update_steps(keys):
+            step()
+    
+    def get_update_steps(self, keys=None):
+        """
+        Subsystem updates in the order a frame runs them
+        
+        Args:
+            keys: Key state for player input (defaults to the keyboard)
+            
+        Returns:
+            List of (subsystem name, update callable)
+        """
+        if keys is None:
+            keys = pygame.key.get_pressed()
+        
+        steps = []
+        
         # Update chunks around player for procedural worlds
         if hasattr(self, 'update_chunks_around_player'):
-            self.update_chunks_around_player()
+            steps.append(("chunks", self.update_chunks_around_player))
         
         # Handle player input
-        keys = pygame.key.get_pressed()
-        self.player.handle_input(keys, self)  # Pass level to handle_input
+        steps.append(("input", lambda: self.player.handle_input(keys, self)))  # Pass level to handle_input
+        
+        # Re-bucket entities that moved last frame
+        steps.append(("spatial_index", lambda: self.get_spatial_index().refresh()))
         
         # Update player
-        self.player.update(self)
+        steps.append(("player", lambda: self.player.update(self)))
         
-        # Update all entities (enemies, NPCs, items)
-        self.update_entities()
+        # Update all entities (enemies, NPCs, items, furniture)
+        steps += [
+            ("enemies", self.update_enemies),
+            ("npcs", self.update_npcs),
+            ("items", self.update_items),
+            ("furniture", self.update_furniture)
+        ]
+        return steps
 
 
 # For backward compatibility, export Level as the main class
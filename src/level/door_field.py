@@ -0,0 +1,239 @@
+"""
+Per-chunk door proximity field for collision and path smoothing
+"""
+
+from typing import Dict, Optional, Set, Tuple
+
+from ..world.chunk import Chunk
+from ..world.building_registry import TILE_DOOR, WALL_TILES
+
+# Flag bits stored per tile
+NEAR_DOOR = 1     # A door in the 3x3 tiles around this one
+DOOR_AREA = 2     # The closest door within 2 tiles is at most 1.5 tiles away
+DOUBLE_DOOR = 4   # That door has another door beside it
+VERTICAL = 8      # That door is vertical (horizontal otherwise)
+
+# Squared distance stored for tiles without a door within 2 tiles
+NO_DOOR = 255
+
+# Doors affect tiles up to 2 away; their orientation depends on the tile beyond
+DOOR_RADIUS = 2
+ORIENTATION_REACH = DOOR_RADIUS + 1
+
+
+class ChunkDoorField:
+    """Door flags and closest-door squared distance for one chunk, indexed by local_y * size + local_x"""
+
+    def __init__(self, chunk: Chunk, missing: Set[Tuple[int, int]]):
+        size = chunk.CHUNK_SIZE
+        self.chunk = chunk
+        self.size = size
+        self.flags = bytearray(size * size)
+        self.distance = bytearray([NO_DOOR]) * (size * size)
+        # Neighbouring chunks that weren't loaded when the field was built
+        self.missing = missing
+
+
+class DoorField:
+    """
+    Cached door proximity for loaded chunks
+
+    Answers the questions DoorPathfinder.analyze_door_context and
+    is_direct_path_clear used to answer with a scan of the surrounding tiles -
+    is there a door nearby, is this a door area, a double door, which way does
+    the door face - with one array lookup. Fields are built the first time a
+    loaded chunk is queried and rebuilt when the chunk is reloaded or a
+    neighbour that wasn't loaded yet arrives; ChunkManager.set_tile edits
+    recompute only the tiles around the edit.
+    """
+
+    def __init__(self, chunk_manager):
+        """
+        Initialize door field
+
+        Args:
+            chunk_manager: ChunkManager providing loaded chunks
+        """
+        self.chunk_manager = chunk_manager
+        self.size = Chunk.CHUNK_SIZE
+        self.fields: Dict[Tuple[int, int], ChunkDoorField] = {}
+
+        chunk_manager.tile_listeners.append(self)
+
+    def detach(self):
+        """Stop listening for tile changes"""
+        if self in self.chunk_manager.tile_listeners:
+            self.chunk_manager.tile_listeners.remove(self)
+
+    def get_field(self, chunk_x: int, chunk_y: int) -> Optional[ChunkDoorField]:
+        """
+        Get the field for a loaded chunk, building it if needed
+
+        Args:
+            chunk_x: Chunk X coordinate
+            chunk_y: Chunk Y coordinate
+
+        Returns:
+            The field, or None if the chunk isn't loaded (chunks are never loaded here)
+        """
+        key = (chunk_x, chunk_y)
+        loaded = self.chunk_manager.loaded_chunks
+        chunk = loaded.get(key)
+        field = self.fields.get(key)
+        if chunk is None:
+            if field is not None:
+                del self.fields[key]
+            return None
+        if (field is None or field.chunk is not chunk or
+                (field.missing and any(neighbour in loaded for neighbour in field.missing))):
+            field = self.fields[key] = self.build_field(chunk)
+        return field
+
+    def lookup(self, x: int, y: int) -> Tuple[int, int]:
+        """
+        Door flags and closest-door squared distance at a world tile
+
+        Args:
+            x: World tile X
+            y: World tile Y
+
+        Returns:
+            (flags, squared distance), or (0, NO_DOOR) if the chunk isn't loaded
+        """
+        chunk_x, local_x = divmod(x, self.size)
+        chunk_y, local_y = divmod(y, self.size)
+        field = self.get_field(chunk_x, chunk_y)
+        if field is None:
+            return 0, NO_DOOR
+        index = local_y * self.size + local_x
+        return field.flags[index], field.distance[index]
+
+    def flags_at(self, x: int, y: int) -> int:
+        """Door flags at a world tile (0 if the chunk isn't loaded)"""
+        return self.lookup(x, y)[0]
+
+    def build_field(self, chunk: Chunk) -> ChunkDoorField:
+        """Compute door proximity for every tile of a chunk"""
+        size = self.size
+        loaded = self.chunk_manager.loaded_chunks
+        missing = {
+            (chunk.chunk_x + dx, chunk.chunk_y + dy)
+            for dx in (-1, 0, 1) for dy in (-1, 0, 1)
+            if (dx or dy) and (chunk.chunk_x + dx, chunk.chunk_y + dy) not in loaded
+        }
+        field = ChunkDoorField(chunk, missing)
+
+        base_x = chunk.chunk_x * size
+        base_y = chunk.chunk_y * size
+        self._recompute(field, base_x, base_y, base_x + size - 1, base_y + size - 1)
+        return field
+
+    def tile_changed(self, world_x: int, world_y: int, tile_type: int):
+        """ChunkManager listener: recompute the tiles an edit can affect"""
+        reach = ORIENTATION_REACH
+        for field in self._fields_near(world_x, world_y, reach):
+            self._recompute(field, world_x - reach, world_y - reach, world_x + reach, world_y + reach)
+
+    def _fields_near(self, x: int, y: int, reach: int):
+        """Built fields with tiles within reach of a world tile"""
+        size = self.size
+        keys = {
+            ((x + dx) // size, (y + dy) // size)
+            for dx in (-reach, reach) for dy in (-reach, reach)
+        }
+        return [self.fields[key] for key in keys if key in self.fields]
+
+    def _tile_at(self, x: int, y: int) -> Optional[int]:
+        """Tile at world coordinates from loaded chunks only"""
+        chunk_x, local_x = divmod(x, self.size)
+        chunk_y, local_y = divmod(y, self.size)
+        chunk = self.chunk_manager.loaded_chunks.get((chunk_x, chunk_y))
+        if chunk is None or not chunk.tiles:
+            return None
+        return chunk.tiles[local_y][local_x]
+
+    def _doors_in_rect(self, min_x: int, min_y: int, max_x: int, max_y: int) -> Set[Tuple[int, int]]:
+        """World positions of door tiles in a rectangle of loaded chunks"""
+        size = self.size
+        loaded = self.chunk_manager.loaded_chunks
+        doors = set()
+        for chunk_y in range(min_y // size, max_y // size + 1):
+            for chunk_x in range(min_x // size, max_x // size + 1):
+                chunk = loaded.get((chunk_x, chunk_y))
+                if chunk is None or not chunk.tiles:
+                    continue
+                base_x = chunk_x * size
+                base_y = chunk_y * size
+                start_x = max(min_x, base_x) - base_x
+                end_x = min(max_x, base_x + size - 1) - base_x + 1
+                for y in range(max(min_y, base_y), min(max_y, base_y + size - 1) + 1):
+                    row = chunk.tiles[y - base_y][start_x:end_x]
+                    if TILE_DOOR not in row:
+                        continue
+                    for offset, tile in enumerate(row):
+                        if tile == TILE_DOOR:
+                            doors.add((base_x + start_x + offset, y))
+        return doors
+
+    def _recompute(self, field: ChunkDoorField, min_x: int, min_y: int, max_x: int, max_y: int):
+        """Recompute a field's tiles within a world rectangle"""
+        size = self.size
+        base_x = field.chunk.chunk_x * size
+        base_y = field.chunk.chunk_y * size
+        min_x, min_y = max(min_x, base_x), max(min_y, base_y)
+        max_x, max_y = min(max_x, base_x + size - 1), min(max_y, base_y + size - 1)
+        if min_x > max_x or min_y > max_y:
+            return
+
+        radius = DOOR_RADIUS
+        doors = self._doors_in_rect(min_x - radius, min_y - radius, max_x + radius, max_y + radius)
+
+        # Clear the rectangle, then fill in the tiles each door can reach
+        for y in range(min_y, max_y + 1):
+            start = (y - base_y) * size + (min_x - base_x)
+            length = max_x - min_x + 1
+            field.flags[start:start + length] = bytes(length)
+            field.distance[start:start + length] = bytes([NO_DOOR]) * length
+
+        affected = {
+            (x, y)
+            for door_x, door_y in doors
+            for y in range(max(door_y - radius, min_y), min(door_y + radius, max_y) + 1)
+            for x in range(max(door_x - radius, min_x), min(door_x + radius, max_x) + 1)
+        }
+        for x, y in affected:
+            index = (y - base_y) * size + (x - base_x)
+            field.flags[index], field.distance[index] = self._evaluate(x, y, doors)
+
+    def _evaluate(self, x: int, y: int, doors: Set[Tuple[int, int]]) -> Tuple[int, int]:
+        """Flags and squared distance for one tile, the way analyze_door_context scans for them"""
+        radius = DOOR_RADIUS
+        flags = 0
+        closest = None
+        closest_distance = NO_DOOR
+        for dy in range(-radius, radius + 1):
+            for dx in range(-radius, radius + 1):
+                if (x + dx, y + dy) not in doors:
+                    continue
+                if -1 <= dx <= 1 and -1 <= dy <= 1:
+                    flags |= NEAR_DOOR
+                distance = dx * dx + dy * dy
+                if distance < closest_distance:
+                    closest = (x + dx, y + dy)
+                    closest_distance = distance
+
+        # 1.5 tiles or closer - squared distances 0, 1 and 2
+        if closest is not None and closest_distance <= 2:
+            flags |= DOOR_AREA
+            door_x, door_y = closest
+            if any((door_x + dx, door_y + dy) in doors for dx, dy in ((-1, 0), (1, 0), (0, -1), (0, 1))):
+                flags |= DOUBLE_DOOR
+            if self._is_vertical(door_x, door_y):
+                flags |= VERTICAL
+        return flags, closest_distance
+
+    def _is_vertical(self, door_x: int, door_y: int) -> bool:
+        """Same rule as DoorPathfinder.get_door_orientation"""
+        north_south = sum(self._tile_at(door_x, door_y + dy) in WALL_TILES for dy in (-1, 1))
+        east_west = sum(self._tile_at(door_x + dx, door_y) in WALL_TILES for dx in (-1, 1))
+        return north_south < east_west
@@ -12,9 +12,18 @@ except ImportError:
 class EntityManagerMixin:
     """Mixin class for entity management functionality"""
     
+    # Simulation timestep - every update is one 60 FPS frame
+    tick_dt = 1 / 60
+    
     def update_entities(self):
         """Update all entities in the level"""
-        # Update enemies
+        self.update_enemies()
+        self.update_npcs()
+        self.update_items()
+        self.update_furniture()
+    
+    def update_enemies(self):
+        """Update enemy AI, combat music state and deaths"""
         for enemy in self.enemies[:]:
             enemy.update(self, self.player)
             
@@ -40,18 +49,21 @@ class EntityManagerMixin:
         
         # Handle combat music transitions
         self._handle_combat_music()
-        
-        # Update NPCs
+    
+    def update_npcs(self):
+        """Update NPCs"""
         for npc in self.npcs:
             npc.update(self)
-        
-        # Update items
+    
+    def update_items(self):
+        """Update items"""
         for item in self.items:
             item.update(self)
-        
-        # Update furniture
+    
+    def update_furniture(self):
+        """Update furniture and player proximity"""
         for furniture in getattr(self, 'furniture', []):
-            furniture.update(1/60)  # Assuming 60 FPS
+            furniture.update(self.tick_dt)
             # Check for player interaction
             if hasattr(furniture, 'check_player_proximity'):
                 furniture.check_player_proximity(self.player)
@@ -68,23 +80,27 @@ class EntityManagerMixin:
             quest_manager.update_quest_progress("kill", enemy.name)
             quest_manager.update_quest_progress("kill", "any")  # For generic kill quests
         
-        # Remove enemy from chunk data if this is a chunked level
-        if hasattr(self, 'chunk_manager'):
-            # Try to use entity_id first, fall back to generating one from position and name
-            entity_id = getattr(enemy, 'entity_id', None)
-            if not entity_id:
-                entity_id = f"{enemy.name}_{int(enemy.x)}_{int(enemy.y)}"
-            
-            self.chunk_manager.remove_entity_from_chunks(entity_id, enemy.x, enemy.y)
+        # Enemies streamed in from chunks are removed through residency, which drops them
+        # from their chunk's data too, so they stay dead when the chunk is admitted again
+        residency = getattr(self, 'entity_residency', None)
+        if residency is None or not residency.remove_entity(enemy):
+            # Remove enemy from chunk data if this is a chunked level
+            if hasattr(self, 'chunk_manager'):
+                # Try to use entity_id first, fall back to generating one from position and name
+                entity_id = getattr(enemy, 'entity_id', None)
+                if not entity_id:
+                    entity_id = f"{enemy.name}_{int(enemy.x)}_{int(enemy.y)}"
+                
+                self.chunk_manager.remove_entity_from_chunks(entity_id, enemy.x, enemy.y)
+                
+                # Force immediate sync to prevent race conditions
+                if hasattr(self, 'sync_entities_to_chunks'):
+                    try:
+                        self.sync_entities_to_chunks()
+                    except Exception as e:
+                        print(f"Warning: Failed to sync entities after enemy death: {e}")
             
-            # Force immediate sync to prevent race conditions
-            if hasattr(self, 'sync_entities_to_chunks'):
-                try:
-                    self.sync_entities_to_chunks()
-                except Exception as e:
-                    print(f"Warning: Failed to sync entities after enemy death: {e}")
-        
-        self.enemies.remove(enemy)
+            self.enemies.remove(enemy)
         self.player.gain_experience(enemy.experience)
         
         # Generate loot drops
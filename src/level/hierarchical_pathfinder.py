@@ -0,0 +1,479 @@
+"""
+Hierarchical pathfinding over cached cluster portal graphs
+"""
+
+import heapq
+import math
+from typing import Dict, List, Optional, Tuple
+
+Tile = Tuple[int, int]
+
+# Cluster edge length in tiles - chunks are split into 4x4 clusters
+CLUSTER_SIZE = 16
+
+# Border openings wider than this get a portal at each end instead of one in the middle
+MAX_ENTRANCE_WIDTH = 6
+
+# Abstract nodes expanded before a search gives up
+MAX_ABSTRACT_EXPANSIONS = 5000
+
+# Tiles refined ahead of the entity each time a route is extended
+REFINE_AHEAD = 24
+
+# Cluster graphs kept before the cache is dropped and rebuilt on demand
+MAX_CACHED_CLUSTERS = 4096
+
+# Same step costs as find_tile_path
+DIAGONAL_COST = 1.414
+NEIGHBOR_STEPS = (
+    (1, 0, 1.0), (-1, 0, 1.0), (0, 1, 1.0), (0, -1, 1.0),
+    (1, 1, DIAGONAL_COST), (-1, 1, DIAGONAL_COST), (1, -1, DIAGONAL_COST), (-1, -1, DIAGONAL_COST)
+)
+
+
+def octile_distance(x1: int, y1: int, x2: int, y2: int) -> float:
+    """Shortest 8-directional walking distance on an open grid"""
+    dx = abs(x1 - x2)
+    dy = abs(y1 - y2)
+    return max(dx, dy) + (DIAGONAL_COST - 1.0) * min(dx, dy)
+
+
+class ClusterGraph:
+    """Portals of one cluster and the cached walking distances between them"""
+
+    def __init__(self, key: Tuple[int, int], token: Tuple, cells: Optional[bytearray]):
+        self.key = key
+        # Plane states the graph was built from, compared before every reuse
+        self.token = token
+        # Walkability indexed by local_y * CLUSTER_SIZE + local_x, or None if every tile is open
+        self.cells = cells
+        # Portal tile -> tiles across the border it connects to
+        self.links: Dict[Tile, List[Tile]] = {}
+        # Portal tile -> {other portal: walking distance inside the cluster}
+        self.distances: Dict[Tile, Dict[Tile, float]] = {}
+
+    @property
+    def portals(self) -> List[Tile]:
+        return list(self.links)
+
+
+class HierarchicalPathfinder:
+    """
+    HPA* pathfinding for chunk-based worlds
+
+    The world is split into square clusters. Each cluster graph records the
+    portals where walkable tiles meet across its borders and the walking
+    distances between those portals inside the cluster. Long searches run A*
+    over the portals only, and the resulting waypoints are turned into tiles
+    one segment at a time with a search confined to a single cluster.
+
+    Graphs are built lazily from the navigation grid's chunk planes and
+    remember which plane state they came from, so chunk loads, unloads, tile
+    edits and blocking objects rebuild the affected clusters on their next
+    use. Tiles in chunks that aren't loaded count as open.
+    """
+
+    def __init__(self, nav_grid, cluster_size: int = CLUSTER_SIZE):
+        """
+        Initialize hierarchical pathfinder
+
+        Args:
+            nav_grid: NavigationGrid providing per-chunk walkability
+            cluster_size: Cluster edge length in tiles, must divide the chunk size
+        """
+        if nav_grid.size % cluster_size:
+            raise ValueError(f"Cluster size {cluster_size} does not divide chunk size {nav_grid.size}")
+        self.nav_grid = nav_grid
+        self.cluster_size = cluster_size
+        self.clusters: Dict[Tuple[int, int], ClusterGraph] = {}
+
+    def find_route(self, start: Tile, goal: Tile) -> Optional["HierarchicalRoute"]:
+        """
+        Plan a route between two tiles
+
+        Args:
+            start: Start tile
+            goal: Walkable goal tile
+
+        Returns:
+            Route to refine as the entity moves, or None if the goal is unreachable
+        """
+        waypoints = self.find_abstract_path(start, goal)
+        if waypoints is None:
+            return None
+        return HierarchicalRoute(self, waypoints)
+
+    def find_abstract_path(self, start: Tile, goal: Tile,
+                           max_expansions: int = MAX_ABSTRACT_EXPANSIONS) -> Optional[List[Tile]]:
+        """
+        Search the portal graph between two tiles
+
+        Args:
+            start: Start tile
+            goal: Goal tile
+            max_expansions: Abstract nodes expanded before giving up
+
+        Returns:
+            Waypoints from start to goal, each consecutive pair within one
+            cluster or across one border, or None if no route was found
+        """
+        self.nav_grid.begin_search()
+        if len(self.clusters) > MAX_CACHED_CLUSTERS:
+            self.clusters.clear()
+
+        if start == goal:
+            return [start]
+
+        start_cluster = self.get_cluster(*self.cluster_of(*start))
+        goal_cluster = self.get_cluster(*self.cluster_of(*goal))
+
+        # Edges out of the start and into the goal depend on the exact tiles, so they aren't cached
+        start_edges = self._entry_distances(start_cluster, start, goal)
+        goal_edges = self._entry_distances(goal_cluster, goal)
+
+        goal_x, goal_y = goal
+        open_set = [(octile_distance(start[0], start[1], goal_x, goal_y), 0.0, start)]
+        g_score = {start: 0.0}
+        came_from = {}
+        closed = set()
+        expansions = 0
+
+        while open_set and expansions < max_expansions:
+            _, distance, node = heapq.heappop(open_set)
+            if node in closed:
+                continue
+            if node == goal:
+                waypoints = [node]
+                while node in came_from:
+                    node = came_from[node]
+                    waypoints.append(node)
+                waypoints.reverse()
+                return waypoints
+
+            closed.add(node)
+            expansions += 1
+
+            cluster = self.get_cluster(*self.cluster_of(*node))
+            if node == start:
+                edges = list(start_edges.items())
+            else:
+                edges = list(cluster.distances.get(node, {}).items())
+                if cluster.key == goal_cluster.key and node in goal_edges:
+                    edges.append((goal, goal_edges[node]))
+            edges.extend((tile, 1.0) for tile in cluster.links.get(node, ()))
+
+            for next_node, cost in edges:
+                if next_node in closed:
+                    continue
+                tentative = distance + cost
+                if tentative < g_score.get(next_node, math.inf):
+                    g_score[next_node] = tentative
+                    came_from[next_node] = node
+                    estimate = tentative + octile_distance(next_node[0], next_node[1], goal_x, goal_y)
+                    heapq.heappush(open_set, (estimate, tentative, next_node))
+
+        return None
+
+    def refine_segment(self, start: Tile, end: Tile) -> Optional[List[Tile]]:
+        """
+        Turn one pair of consecutive waypoints into tiles
+
+        Args:
+            start: Waypoint the entity is at
+            end: Next waypoint
+
+        Returns:
+            Tiles after start up to and including end, or None if the
+            segment is no longer walkable
+        """
+        start_key = self.cluster_of(*start)
+        end_key = self.cluster_of(*end)
+        if start_key != end_key:
+            # Border crossing between two portals
+            if max(abs(start[0] - end[0]), abs(start[1] - end[1])) == 1 and self.nav_grid.is_walkable(*end):
+                return [end]
+            return None
+        return self._local_path(self.get_cluster(*start_key), start, end)
+
+    def cluster_of(self, x: int, y: int) -> Tuple[int, int]:
+        """Cluster key containing a world tile"""
+        return (x // self.cluster_size, y // self.cluster_size)
+
+    def get_cluster(self, cluster_x: int, cluster_y: int) -> ClusterGraph:
+        """
+        Get a cluster graph, rebuilding it if the planes under it changed
+
+        Args:
+            cluster_x: Cluster X coordinate
+            cluster_y: Cluster Y coordinate
+
+        Returns:
+            The current cluster graph
+        """
+        key = (cluster_x, cluster_y)
+        token = self._cluster_token(cluster_x, cluster_y)
+        cluster = self.clusters.get(key)
+        if cluster is None or cluster.token != token:
+            cluster = self.clusters[key] = self.build_cluster(cluster_x, cluster_y, token)
+        return cluster
+
+    def build_cluster(self, cluster_x: int, cluster_y: int, token: Tuple = None) -> ClusterGraph:
+        """Find a cluster's portals and the distances between them"""
+        size = self.cluster_size
+        cells = self._cluster_cells(cluster_x, cluster_y)
+        cluster = ClusterGraph((cluster_x, cluster_y), token, cells)
+
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            neighbor_cells = self._cluster_cells(cluster_x + dx, cluster_y + dy)
+            for inside, outside in self._border_portals(cluster_x, cluster_y, cells, neighbor_cells, dx, dy):
+                cluster.links.setdefault(inside, []).append(outside)
+
+        base_x = cluster_x * size
+        base_y = cluster_y * size
+        portals = cluster.portals
+        for portal in portals:
+            if cells is None:
+                cluster.distances[portal] = {
+                    other: octile_distance(portal[0], portal[1], other[0], other[1])
+                    for other in portals if other != portal
+                }
+                continue
+            distances = self._local_distances(cells, portal[0] - base_x, portal[1] - base_y)
+            cluster.distances[portal] = {
+                other: distances[(other[1] - base_y) * size + other[0] - base_x]
+                for other in portals
+                if other != portal and distances[(other[1] - base_y) * size + other[0] - base_x] < math.inf
+            }
+        return cluster
+
+    def _cluster_token(self, cluster_x: int, cluster_y: int) -> Tuple:
+        """Identity and version of the planes a cluster and its border neighbors read"""
+        size = self.cluster_size
+        chunk_size = self.nav_grid.size
+        chunk_keys = []
+        for dx, dy in ((0, 0), (1, 0), (-1, 0), (0, 1), (0, -1)):
+            chunk_key = (((cluster_x + dx) * size) // chunk_size, ((cluster_y + dy) * size) // chunk_size)
+            if chunk_key not in chunk_keys:
+                chunk_keys.append(chunk_key)
+
+        token = []
+        for chunk_x, chunk_y in chunk_keys:
+            plane = self.nav_grid.get_plane(chunk_x, chunk_y)
+            token.append(None if plane is None else (plane, plane.version))
+        return tuple(token)
+
+    def _cluster_cells(self, cluster_x: int, cluster_y: int) -> Optional[bytearray]:
+        """Walkability of a cluster's tiles, or None if every tile is open"""
+        size = self.cluster_size
+        chunk_size = self.nav_grid.size
+        chunk_x, local_x = divmod(cluster_x * size, chunk_size)
+        chunk_y, local_y = divmod(cluster_y * size, chunk_size)
+        plane = self.nav_grid.get_plane(chunk_x, chunk_y)
+        if plane is None:
+            return None  # Unloaded chunks count as open
+
+        walkable = plane.walkable
+        cells = bytearray()
+        for row in range(local_y, local_y + size):
+            start = row * chunk_size + local_x
+            cells += walkable[start:start + size]
+        return None if cells.count(0) == 0 else cells
+
+    def _border_portals(self, cluster_x: int, cluster_y: int, cells: Optional[bytearray],
+                        neighbor_cells: Optional[bytearray], dx: int, dy: int) -> List[Tuple[Tile, Tile]]:
+        """
+        Portal pairs on one side of a cluster
+
+        Both clusters sharing a border scan it in the same order and pick
+        the same tiles, so their portals always pair up.
+
+        Returns:
+            (tile inside the cluster, tile across the border) pairs
+        """
+        size = self.cluster_size
+        last = size - 1
+        base_x = cluster_x * size
+        base_y = cluster_y * size
+
+        portals = []
+        run = []
+        for i in range(size + 1):
+            is_open = False
+            if i < size:
+                if dx:
+                    inside = (last if dx > 0 else 0, i)
+                    outside = (0 if dx > 0 else last, i)
+                else:
+                    inside = (i, last if dy > 0 else 0)
+                    outside = (i, 0 if dy > 0 else last)
+                is_open = (
+                    (cells is None or cells[inside[1] * size + inside[0]]) and
+                    (neighbor_cells is None or neighbor_cells[outside[1] * size + outside[0]])
+                )
+            if is_open:
+                run.append((
+                    (base_x + inside[0], base_y + inside[1]),
+                    (base_x + dx * size + outside[0], base_y + dy * size + outside[1])
+                ))
+            elif run:
+                if len(run) > MAX_ENTRANCE_WIDTH:
+                    portals.extend((run[0], run[-1]))
+                else:
+                    portals.append(run[len(run) // 2])
+                run = []
+        return portals
+
+    def _entry_distances(self, cluster: ClusterGraph, tile: Tile, extra: Tile = None) -> Dict[Tile, float]:
+        """Walking distances from a tile to its cluster's portals (and extra, if in the same cluster)"""
+        targets = cluster.portals
+        if extra is not None and self.cluster_of(*extra) == cluster.key:
+            targets.append(extra)
+
+        if cluster.cells is None:
+            return {
+                target: octile_distance(tile[0], tile[1], target[0], target[1])
+                for target in targets if target != tile
+            }
+
+        size = self.cluster_size
+        base_x, base_y = cluster.key[0] * size, cluster.key[1] * size
+        distances = self._local_distances(cluster.cells, tile[0] - base_x, tile[1] - base_y)
+        result = {}
+        for target in targets:
+            distance = distances[(target[1] - base_y) * size + target[0] - base_x]
+            if target != tile and distance < math.inf:
+                result[target] = distance
+        return result
+
+    def _local_distances(self, cells: bytearray, local_x: int, local_y: int) -> List[float]:
+        """Dijkstra distances from one tile to every tile of a cluster"""
+        size = self.cluster_size
+        distances = [math.inf] * (size * size)
+        source = local_y * size + local_x
+        distances[source] = 0.0
+        heap = [(0.0, source)]
+
+        while heap:
+            distance, index = heapq.heappop(heap)
+            if distance > distances[index]:
+                continue
+            y, x = divmod(index, size)
+            for dx, dy, step in NEIGHBOR_STEPS:
+                next_x = x + dx
+                next_y = y + dy
+                if 0 <= next_x < size and 0 <= next_y < size:
+                    next_index = next_y * size + next_x
+                    if cells[next_index]:
+                        next_distance = distance + step
+                        if next_distance < distances[next_index]:
+                            distances[next_index] = next_distance
+                            heapq.heappush(heap, (next_distance, next_index))
+        return distances
+
+    def _local_path(self, cluster: ClusterGraph, start: Tile, end: Tile) -> Optional[List[Tile]]:
+        """A* between two tiles of one cluster, staying inside it"""
+        if cluster.cells is None:
+            # Open cluster - diagonal steps first, then straight
+            path = []
+            x, y = start
+            while (x, y) != end:
+                x += (end[0] > x) - (end[0] < x)
+                y += (end[1] > y) - (end[1] < y)
+                path.append((x, y))
+            return path
+
+        size = self.cluster_size
+        cells = cluster.cells
+        base_x, base_y = cluster.key[0] * size, cluster.key[1] * size
+        end_x, end_y = end[0] - base_x, end[1] - base_y
+        source = (start[1] - base_y) * size + start[0] - base_x
+        target = end_y * size + end_x
+        if not cells[target]:
+            return None
+
+        g_score = {source: 0.0}
+        came_from = {}
+        open_set = [(0.0, 0.0, source)]
+        while open_set:
+            _, distance, index = heapq.heappop(open_set)
+            if index == target:
+                path = []
+                while index in came_from:
+                    y, x = divmod(index, size)
+                    path.append((base_x + x, base_y + y))
+                    index = came_from[index]
+                path.reverse()
+                return path
+            if distance > g_score[index]:
+                continue
+            y, x = divmod(index, size)
+            for dx, dy, step in NEIGHBOR_STEPS:
+                next_x = x + dx
+                next_y = y + dy
+                if 0 <= next_x < size and 0 <= next_y < size:
+                    next_index = next_y * size + next_x
+                    if not cells[next_index]:
+                        continue
+                    tentative = distance + step
+                    if tentative < g_score.get(next_index, math.inf):
+                        g_score[next_index] = tentative
+                        came_from[next_index] = index
+                        estimate = tentative + octile_distance(next_x, next_y, end_x, end_y)
+                        heapq.heappush(open_set, (estimate, tentative, next_index))
+        return None
+
+
+class HierarchicalRoute:
+    """
+    Abstract waypoints from a hierarchical search, refined into tiles on demand
+
+    Only the segments just ahead of the entity are refined, so chunks that
+    load while it walks are taken into account. If a segment turns out to
+    be blocked the route is replanned from that waypoint.
+    """
+
+    def __init__(self, pathfinder: HierarchicalPathfinder, waypoints: List[Tile]):
+        self.pathfinder = pathfinder
+        self.waypoints = waypoints
+        # Index of the first waypoint not yet refined into tiles
+        self.next_index = 1
+
+    @property
+    def goal(self) -> Tile:
+        return self.waypoints[-1]
+
+    @property
+    def finished(self) -> bool:
+        return self.next_index >= len(self.waypoints)
+
+    def refine(self, min_tiles: Optional[int] = REFINE_AHEAD) -> List[Tile]:
+        """
+        Refine the next segments into tiles
+
+        Args:
+            min_tiles: Keep refining segments until at least this many tiles
+                are produced, or None to refine the whole remaining route
+
+        Returns:
+            Tiles continuing from the last refined waypoint, empty if the
+            route is finished or the goal became unreachable
+        """
+        self.pathfinder.nav_grid.begin_search()
+        tiles = []
+        replanned = False
+        while not self.finished and (min_tiles is None or len(tiles) < min_tiles):
+            start = self.waypoints[self.next_index - 1]
+            segment = self.pathfinder.refine_segment(start, self.waypoints[self.next_index])
+            if segment is None:
+                # The world changed since planning - replan once from here
+                waypoints = None if replanned else self.pathfinder.find_abstract_path(start, self.goal)
+                if waypoints is None:
+                    self.next_index = len(self.waypoints)
+                    return tiles
+                self.waypoints = waypoints
+                self.next_index = 1
+                replanned = True
+                continue
+            tiles.extend(segment)
+            self.next_index += 1
+        return tiles
@@ -3,11 +3,34 @@ Collision detection and physics functionality
 """
 
 import math
+from .spatial_hash import SpatialHash
+from .door_field import DoorField, NEAR_DOOR
 
 
 class CollisionMixin:
     """Mixin class for collision detection functionality"""
     
+    def get_spatial_index(self):
+        """Get the level's entity spatial hash, creating it on first use"""
+        index = getattr(self, 'spatial_index', None)
+        if index is None:
+            index = self.spatial_index = SpatialHash(self)
+        return index
+    
+    def get_door_field(self):
+        """Get the cached door proximity field for chunk-based worlds, creating it on first use"""
+        chunk_manager = getattr(self, 'chunk_manager', None)
+        if chunk_manager is None:
+            return None
+        
+        door_field = getattr(self, 'door_field', None)
+        if door_field is None or door_field.chunk_manager is not chunk_manager:
+            # The world was regenerated - stop the old field listening to the old world
+            if door_field is not None:
+                door_field.detach()
+            door_field = self.door_field = DoorField(chunk_manager)
+        return door_field
+    
     def check_collision(self, x, y, size=0.4, exclude_entity=None):
         """Check collision with level geometry and entities - improved precision with enhanced door handling"""
         # For chunk-based procedural worlds, use different collision logic
@@ -67,39 +90,29 @@ class CollisionMixin:
         if door_context['is_door_area']:
             return False
         
-        # Check collision with objects using circular collision (only when not in door areas)
-        for obj in self.objects:
-            if obj.blocks_movement and obj != exclude_entity:
-                dist_x = x - obj.x
-                dist_y = y - obj.y
-                distance = math.sqrt(dist_x * dist_x + dist_y * dist_y)
-                
-                # Use circular collision for objects
-                collision_distance = size + 0.35  # Slightly tighter collision
-                if distance < collision_distance:
-                    return True
-        
-        # Check collision with chests using circular collision
-        for chest in self.chests:
-            if chest.blocks_movement and chest != exclude_entity:
-                dist_x = x - chest.x
-                dist_y = y - chest.y
-                distance = math.sqrt(dist_x * dist_x + dist_y * dist_y)
-                
-                # Use circular collision for chests
-                collision_distance = size + 0.35  # Same as objects
-                if distance < collision_distance:
-                    return True
-        
-        # Check collision with furniture using rectangular collision
-        if hasattr(self, 'furniture'):
-            for furniture in self.furniture:
-                if furniture.blocks_movement and furniture != exclude_entity:
-                    # Check if position overlaps with furniture bounds
-                    furniture_left = furniture.x - 0.5
-                    furniture_right = furniture.x + furniture.width - 0.5
-                    furniture_top = furniture.y - 0.5
-                    furniture_bottom = furniture.y + furniture.height - 0.5
+        # Only entities in nearby cells can collide (largest reach is size + 0.4)
+        for category, entity in self.get_spatial_index().query(x, y, size + 0.4):
+            if entity == exclude_entity:
+                continue
+            
+            if category == 'objects' or category == 'chests':
+                # Use circular collision for objects and chests
+                if entity.blocks_movement:
+                    dist_x = x - entity.x
+                    dist_y = y - entity.y
+                    distance = math.sqrt(dist_x * dist_x + dist_y * dist_y)
+                    
+                    collision_distance = size + 0.35  # Slightly tighter collision
+                    if distance < collision_distance:
+                        return True
+            
+            elif category == 'furniture':
+                # Check if position overlaps with furniture bounds
+                if entity.blocks_movement:
+                    furniture_left = entity.x - 0.5
+                    furniture_right = entity.x + entity.width - 0.5
+                    furniture_top = entity.y - 0.5
+                    furniture_bottom = entity.y + entity.height - 0.5
                     
                     # Check if entity bounds overlap with furniture bounds
                     entity_left = x - size
@@ -110,28 +123,14 @@ class CollisionMixin:
                     if (entity_right > furniture_left and entity_left < furniture_right and
                         entity_bottom > furniture_top and entity_top < furniture_bottom):
                         return True
-        
-        # Check collision with NPCs using circular collision
-        for npc in self.npcs:
-            if npc != exclude_entity:
-                dist_x = x - npc.x
-                dist_y = y - npc.y
-                distance = math.sqrt(dist_x * dist_x + dist_y * dist_y)
-                
-                # NPCs have collision
-                collision_distance = size + 0.4
-                if distance < collision_distance:
-                    return True
-        
-        # Check collision with enemies (prevent stacking)
-        for enemy in self.enemies:
-            if enemy != exclude_entity:
-                dist_x = x - enemy.x
-                dist_y = y - enemy.y
+            
+            else:
+                dist_x = x - entity.x
+                dist_y = y - entity.y
                 distance = math.sqrt(dist_x * dist_x + dist_y * dist_y)
                 
-                # Enemies should not overlap too much
-                collision_distance = size + 0.3
+                # NPCs have collision, enemies should not overlap too much
+                collision_distance = size + (0.4 if category == 'npcs' else 0.3)
                 if distance < collision_distance:
                     return True
         
@@ -178,7 +177,7 @@ class CollisionMixin:
         center_x = x + 0.5
         center_y = y + 0.5
         
-        for obj in self.objects:
+        for obj in self.get_spatial_index().query_list(center_x, center_y, entity_size + 0.4, 'objects'):
             if obj.blocks_movement:
                 dist_x = center_x - obj.x
                 dist_y = center_y - obj.y
@@ -221,7 +220,7 @@ class CollisionMixin:
         center_x = x + 0.5
         center_y = y + 0.5
         
-        for obj in self.objects:
+        for obj in self.get_spatial_index().query_list(center_x, center_y, entity_size + 0.2, 'objects'):
             if obj.blocks_movement:
                 dist_x = center_x - obj.x
                 dist_y = center_y - obj.y
@@ -252,6 +251,9 @@ class CollisionMixin:
         step_x = dx / distance
         step_y = dy / distance
         
+        # Chunk-based worlds look door proximity up in the cached door field
+        door_field = self.get_door_field()
+        
         # Check points along the path
         steps = int(distance * 4)  # Check every 0.25 units
         for i in range(1, steps + 1):
@@ -263,7 +265,9 @@ class CollisionMixin:
             tile_y = int(check_y)
             is_near_door = False
             
-            if 0 <= tile_x < self.width and 0 <= tile_y < self.height:
+            if door_field is not None:
+                is_near_door = bool(door_field.flags_at(tile_x, tile_y) & NEAR_DOOR)
+            elif 0 <= tile_x < self.width and 0 <= tile_y < self.height:
                 # Check current tile and adjacent tiles for doors
                 for dx_check in [-1, 0, 1]:
                     for dy_check in [-1, 0, 1]:
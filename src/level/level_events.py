@@ -28,12 +28,9 @@ class EventHandlingMixin:
                         if hasattr(npc, 'chat_window') and npc.chat_window == self.player.current_ai_chat:
                             print(f"🔧 [EventHandling] Found NPC {npc.name}, sending message to AI")
                             npc.chat_window.add_message("Player", message)
-                            # Get AI response
+                            # Get AI response - it arrives in a later frame
                             if npc.game_context:
-                                context = npc.game_context.get_context()
-                                ai_response = npc.ai_integration.send_message(message, context)
-                                npc.chat_window.add_message(npc.name, ai_response)
-                                print(f"🔧 [EventHandling] AI responded: '{ai_response}'")
+                                npc.request_ai_reply(message)
                             break
                 return  # AI chat consumed the event
         
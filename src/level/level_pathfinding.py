@@ -5,11 +5,77 @@ Pathfinding and navigation system
 import heapq
 import math
 import random
+from .navigation_grid import NavigationGrid
+from .hierarchical_pathfinder import HierarchicalPathfinder
 
 
 class PathfindingMixin:
     """Mixin class for pathfinding functionality"""
     
+    # Targets further than this (in tiles, either axis) use hierarchical pathfinding in chunk-based worlds
+    tile_path_range = 16
+    
+    def get_navigation_grid(self):
+        """Get the cached walkability/cost grid for chunk-based worlds, creating it on first use"""
+        chunk_manager = getattr(self, 'chunk_manager', None)
+        if chunk_manager is None:
+            return None
+        
+        nav_grid = getattr(self, 'navigation_grid', None)
+        if nav_grid is None or nav_grid.chunk_manager is not chunk_manager:
+            # The world was regenerated - stop the old grid listening to the old world
+            if nav_grid is not None:
+                nav_grid.detach()
+            nav_grid = self.navigation_grid = NavigationGrid(self, chunk_manager)
+        return nav_grid
+    
+    def get_hierarchical_pathfinder(self):
+        """Get the cluster-graph pathfinder for chunk-based worlds, creating it on first use"""
+        nav_grid = self.get_navigation_grid()
+        if nav_grid is None:
+            return None
+        
+        pathfinder = getattr(self, 'hierarchical_pathfinder', None)
+        if pathfinder is None or pathfinder.nav_grid is not nav_grid:
+            pathfinder = self.hierarchical_pathfinder = HierarchicalPathfinder(nav_grid)
+        return pathfinder
+    
+    def find_tile_route(self, start_tile_x, start_tile_y, target_tile_x, target_tile_y):
+        """
+        Plan a long-distance route with hierarchical pathfinding
+        
+        The route is refined into tiles a few segments at a time with
+        route.refine(), so only the part near the entity is computed up front.
+        
+        Args:
+            start_tile_x: Start tile X
+            start_tile_y: Start tile Y
+            target_tile_x: Target tile X
+            target_tile_y: Target tile Y
+            
+        Returns:
+            HierarchicalRoute, or None if the target can't be reached or the
+            world isn't chunk-based
+        """
+        if not (hasattr(self, 'is_infinite_world') and self.is_infinite_world):
+            return None
+        pathfinder = self.get_hierarchical_pathfinder()
+        if pathfinder is None:
+            return None
+        
+        # Same target adjustment as find_tile_path - accept a walkable neighbor
+        target_tile_x, target_tile_y = self.find_nearest_walkable(target_tile_x, target_tile_y, max_radius=1)
+        if target_tile_x is None:
+            return None
+        
+        return pathfinder.find_route((start_tile_x, start_tile_y), (target_tile_x, target_tile_y))
+    
+    def is_long_range_target(self, start_tile_x, start_tile_y, target_tile_x, target_tile_y):
+        """Check if a target should be reached with find_tile_route rather than a full tile search"""
+        if not (hasattr(self, 'is_infinite_world') and self.is_infinite_world):
+            return False
+        return max(abs(target_tile_x - start_tile_x), abs(target_tile_y - start_tile_y)) > self.tile_path_range
+    
     def find_path(self, start_x, start_y, end_x, end_y, entity_size=0.4):
         """Find a path using multi-resolution pathfinding with corner smoothing"""
         # Phase 1: Coarse pathfinding on tile grid
@@ -43,7 +109,11 @@ class PathfindingMixin:
             max_search_distance = 50  # tiles
             if (abs(end_grid_x - start_grid_x) > max_search_distance or 
                 abs(end_grid_y - start_grid_y) > max_search_distance):
-                return []  # Too far for pathfinding
+                # Too far for a tile search - plan over cluster portals instead
+                route = self.find_tile_route(start_grid_x, start_grid_y, end_grid_x, end_grid_y)
+                if route is None:
+                    return []
+                return [self.calculate_sub_tile_position(x, y, entity_size) for x, y in route.refine(None)]
         else:
             # Check if start and end are valid for traditional worlds
             if not (0 <= start_grid_x < self.width and 0 <= start_grid_y < self.height):
@@ -51,6 +121,13 @@ class PathfindingMixin:
             if not (0 <= end_grid_x < self.width and 0 <= end_grid_y < self.height):
                 return []
         
+        # Chunk-based worlds read walkability and cost from cached per-chunk planes
+        nav_grid = None
+        if hasattr(self, 'is_infinite_world') and self.is_infinite_world:
+            nav_grid = self.get_navigation_grid()
+            if nav_grid is not None:
+                nav_grid.begin_search()
+        
         # Check if end position is walkable
         if not self.is_position_walkable_for_pathfinding(end_grid_x, end_grid_y, entity_size):
             end_grid_x, end_grid_y = self.find_nearest_walkable(end_grid_x, end_grid_y, entity_size)
@@ -124,25 +201,32 @@ class PathfindingMixin:
                     if not (0 <= next_x < self.width and 0 <= next_y < self.height):
                         continue
                 
-                # Check if position is walkable
-                if not self.is_position_walkable_for_pathfinding(next_x, next_y, entity_size):
-                    continue
-                
                 # Calculate movement cost
                 is_diagonal = abs(next_x - current_x) == 1 and abs(next_y - current_y) == 1
                 base_cost = 1.414 if is_diagonal else 1.0
                 
-                # Get walkability score
-                walkability_score = self.get_walkability_score(next_x, next_y)
-                influence_penalty = (1.0 - walkability_score) * 2.0
-                move_cost = base_cost * (1.0 + influence_penalty)
-                
-                # Favor doors and open areas
-                next_tile = self.get_tile(next_x, next_y)
-                if next_tile == getattr(self, 'TILE_DOOR', 5):
-                    move_cost *= 0.1  # 90% cost reduction for doors
-                elif walkability_score > 0.9:
-                    move_cost *= 0.8  # Prefer open areas
+                if nav_grid is not None:
+                    # Precomputed cost already includes object influence and door discounts
+                    cost_factor = nav_grid.cost_at(next_x, next_y)
+                    if cost_factor is None:
+                        continue
+                    move_cost = base_cost * cost_factor
+                else:
+                    # Check if position is walkable
+                    if not self.is_position_walkable_for_pathfinding(next_x, next_y, entity_size):
+                        continue
+                    
+                    # Get walkability score
+                    walkability_score = self.get_walkability_score(next_x, next_y)
+                    influence_penalty = (1.0 - walkability_score) * 2.0
+                    move_cost = base_cost * (1.0 + influence_penalty)
+                    
+                    # Favor doors and open areas
+                    next_tile = self.get_tile(next_x, next_y)
+                    if next_tile == getattr(self, 'TILE_DOOR', 5):
+                        move_cost *= 0.1  # 90% cost reduction for doors
+                    elif walkability_score > 0.9:
+                        move_cost *= 0.8  # Prefer open areas
                 
                 tentative_g_score = g_score.get((current_x, current_y), float('inf')) + move_cost
                 
@@ -159,7 +243,10 @@ class PathfindingMixin:
         """Check if a position is walkable for pathfinding - works with both chunk and traditional worlds"""
         # For chunk-based worlds, use chunk-based walkability checking
         if hasattr(self, 'is_infinite_world') and self.is_infinite_world:
-            if hasattr(self, 'is_position_walkable_chunk'):
+            nav_grid = self.get_navigation_grid()
+            if nav_grid is not None:
+                return nav_grid.is_walkable(x, y)
+            elif hasattr(self, 'is_position_walkable_chunk'):
                 return self.is_position_walkable_chunk(x, y)
             else:
                 # Fallback: check if we can get a tile and if it's walkable
@@ -180,7 +267,7 @@ class PathfindingMixin:
             center_x = x + 0.5
             center_y = y + 0.5
             
-            for obj in self.objects:
+            for obj in self.get_spatial_index().query_list(center_x, center_y, entity_size + 0.4, 'objects'):
                 if obj.blocks_movement:
                     dist_x = center_x - obj.x
                     dist_y = center_y - obj.y
@@ -248,7 +335,7 @@ class PathfindingMixin:
         score = 1.0
         
         # Penalize positions close to obstacles
-        for obj in self.objects:
+        for obj in self.get_spatial_index().query_list(x, y, 1.0, 'objects'):
             if obj.blocks_movement:
                 distance = math.sqrt((x - obj.x)**2 + (y - obj.y)**2)
                 if distance < 1.0:
@@ -559,6 +646,11 @@ class PathfindingMixin:
         if start_tile_x == target_tile_x and start_tile_y == target_tile_y:
             return []
         
+        # Distant targets in chunk-based worlds are out of reach of the capped search below
+        if self.is_long_range_target(start_tile_x, start_tile_y, target_tile_x, target_tile_y):
+            route = self.find_tile_route(start_tile_x, start_tile_y, target_tile_x, target_tile_y)
+            return route.refine(None) if route else []
+        
         # Check if target is walkable
         if not self.is_tile_walkable(target_tile_x, target_tile_y):
             # Try to find a nearby walkable tile
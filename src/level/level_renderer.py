@@ -4,11 +4,19 @@ Level rendering functionality
 
 import pygame
 try:
-    from ..core.isometric import sort_by_depth
     from ..roof_renderer import RoofRenderer
+    from ..world.building_registry import building_bounds
+    from .terrain_cache import TerrainCache, BLOCK_SIZE
+    from .render_list import RenderList
 except ImportError:
-    from src.core.isometric import sort_by_depth
     from src.roof_renderer import RoofRenderer
+    from src.world.building_registry import building_bounds
+    from src.level.terrain_cache import TerrainCache, BLOCK_SIZE
+    from src.level.render_list import RenderList
+
+
+# Pixels around the view in which entities are still drawn - sprites are centred on their tile
+ENTITY_CULL_MARGIN = 256
 
 
 class LevelRendererMixin:
@@ -26,8 +34,10 @@ class LevelRendererMixin:
         # Update camera
         self.update_camera(screen_width, game_area_height)
         
-        # Create game area surface
-        game_surface = pygame.Surface((screen_width, game_area_height))
+        # Game area surface, reused from frame to frame until the screen size changes
+        game_surface = getattr(self, '_game_surface', None)
+        if game_surface is None or game_surface.get_size() != (screen_width, game_area_height):
+            game_surface = self._game_surface = pygame.Surface((screen_width, game_area_height))
         game_surface.fill((0, 0, 0))
         
         # OPTIMIZATION: Cache player building detection for this frame
@@ -53,17 +63,20 @@ class LevelRendererMixin:
             self._update_building_states(player_x, player_y)
             self._update_entity_visibility_cache()  # Cache entity visibility too
             self._update_tile_visibility_cache(start_x, end_x, start_y, end_y)  # Cache tile visibility too
-            self._update_entity_sorting_cache()  # Cache entity sorting too
             self._last_player_pos = (player_x, player_y)
         
         # Render tiles in proper isometric order (back to front)
         # This ensures proper depth sorting for buildings
-        for y in range(start_y, end_y):
-            for x in range(start_x, end_x):
-                self.render_tile_at_position(game_surface, x, y)
+        terrain_cache = self.get_terrain_cache()
+        if terrain_cache is not None:
+            self.render_cached_terrain(game_surface, terrain_cache, start_x, end_x, start_y, end_y)
+        else:
+            for y in range(start_y, end_y):
+                for x in range(start_x, end_x):
+                    self.render_tile_at_position(game_surface, x, y)
         
-        # Use cached sorted entities instead of sorting every frame
-        sorted_entities = self._get_cached_sorted_entities()
+        # Entities on screen in depth order - only the ones that moved are re-sorted
+        sorted_entities = self.get_visible_entities(screen_width, game_area_height)
         
         # Render entities to game surface using cached visibility
         for entity in sorted_entities:
@@ -101,6 +114,92 @@ class LevelRendererMixin:
             self.player.current_shop.set_player_items(self.player.inventory.items)
             self.player.current_shop.render(screen)
     
+    def get_terrain_cache(self):
+        """Get the cached ground layer for chunk-based worlds, creating it on first use"""
+        chunk_manager = getattr(self, 'chunk_manager', None)
+        if chunk_manager is None or getattr(self, 'heightmap', None):
+            return None  # Raised tiles are drawn one by one
+        
+        terrain_cache = getattr(self, 'terrain_cache', None)
+        if terrain_cache is None or terrain_cache.chunk_manager is not chunk_manager:
+            # The world was regenerated - stop the old cache listening to the old world
+            if terrain_cache is not None:
+                terrain_cache.detach()
+            terrain_cache = self.terrain_cache = TerrainCache(chunk_manager, self)
+        return terrain_cache
+    
+    def render_cached_terrain(self, surface, terrain_cache, start_x, end_x, start_y, end_y):
+        """Blit the cached ground of the visible blocks, then draw building tiles and the tiles in front of them"""
+        surface_rect = surface.get_rect()
+        margin_x, margin_y = self.tile_width * 2, self.tile_height * 4  # Sprites reach past their tile
+        live_tiles = []
+        
+        for block_y in range(start_y // BLOCK_SIZE, (end_y - 1) // BLOCK_SIZE + 1):
+            for block_x in range(start_x // BLOCK_SIZE, (end_x - 1) // BLOCK_SIZE + 1):
+                # Skip blocks whose diamond is off screen before rendering them
+                origin_x, origin_y = block_x * BLOCK_SIZE, block_y * BLOCK_SIZE
+                left, _ = self.iso_renderer.world_to_screen(origin_x, origin_y + BLOCK_SIZE, self.camera_x, self.camera_y)
+                right, _ = self.iso_renderer.world_to_screen(origin_x + BLOCK_SIZE, origin_y, self.camera_x, self.camera_y)
+                _, top = self.iso_renderer.world_to_screen(origin_x, origin_y, self.camera_x, self.camera_y)
+                _, bottom = self.iso_renderer.world_to_screen(origin_x + BLOCK_SIZE, origin_y + BLOCK_SIZE, self.camera_x, self.camera_y)
+                if (right + margin_x < 0 or left - margin_x > surface_rect.width or
+                        bottom + margin_y < 0 or top - margin_y > surface_rect.height):
+                    continue
+                
+                block = terrain_cache.get_block(block_x, block_y)
+                tiles_x = range(max(start_x, origin_x), min(end_x, origin_x + BLOCK_SIZE))
+                tiles_y = range(max(start_y, origin_y), min(end_y, origin_y + BLOCK_SIZE))
+                if block is None:
+                    # Chunk still generating - draw its placeholder ground tile by tile
+                    for y in tiles_y:
+                        for x in tiles_x:
+                            self.render_tile_at_position(surface, x, y)
+                    continue
+                
+                if block.surface is not None:
+                    position = terrain_cache.screen_position(block_x, block_y, block, self.camera_x, self.camera_y)
+                    surface.blit(block.surface, position)
+                live_tiles.extend((x, y) for x, y in block.live if x in tiles_x and y in tiles_y)
+        
+        # Per-frame tiles go back to front across blocks, as the tile-by-tile loop draws them
+        live_tiles.sort(key=lambda tile: (tile[1], tile[0]))
+        for x, y in live_tiles:
+            self.render_tile_at_position(surface, x, y)
+    
+    def get_render_list(self):
+        """Get the level's depth-sorted entity list, creating it on first use"""
+        render_list = getattr(self, 'render_list', None)
+        if render_list is None:
+            render_list = self.render_list = RenderList(self)
+        return render_list
+    
+    def get_visible_entities(self, view_width, view_height):
+        """Entities within the camera view (plus a margin for their sprites), back to front"""
+        render_list = self.get_render_list()
+        render_list.refresh()
+        
+        # The view in isometric space is a band of x + y (rows) and x - y (columns)
+        half_width = self.iso_renderer.half_tile_width
+        half_height = self.iso_renderer.half_tile_height
+        margin = ENTITY_CULL_MARGIN
+        return render_list.visible(
+            (self.camera_y - margin) / half_height, (self.camera_y + view_height + margin) / half_height,
+            (self.camera_x - margin) / half_width, (self.camera_x + view_width + margin) / half_width
+        )
+    
+    def get_floor_sprite(self, tile_type):
+        """Floor sprite drawn for a tile - walls and doors stand on brick and stone"""
+        if hasattr(self, 'wall_renderer') and self.wall_renderer.is_wall_tile(tile_type):
+            # Render appropriate floor tile underneath walls
+            if tile_type == self.TILE_DOOR:
+                return self.tile_sprites.get(self.TILE_STONE)  # Stone under doors
+            return self.tile_sprites.get(self.TILE_BRICK)  # Brick under walls (interior)
+        if tile_type == self.TILE_DOOR:
+            # Render stone floor under doors
+            return self.tile_sprites.get(self.TILE_STONE)
+        # Normal floor tiles - use .get() to avoid KeyError
+        return self.tile_sprites.get(tile_type)
+    
     def render_tile_at_position(self, surface, x, y):
         """Render a single tile with improved roof rendering system"""
         # Use get_tile method if available (for chunk-based worlds), otherwise fall back to tiles array
@@ -137,19 +236,7 @@ class LevelRendererMixin:
             should_render_roof = not self._get_cached_tile_visibility(x, y)
         
         # ALWAYS render floor tile first (even under walls)
-        floor_sprite = None
-        if hasattr(self, 'wall_renderer') and self.wall_renderer.is_wall_tile(tile_type):
-            # Render appropriate floor tile underneath walls
-            if tile_type == self.TILE_DOOR:
-                floor_sprite = self.tile_sprites.get(self.TILE_STONE)  # Stone under doors
-            else:
-                floor_sprite = self.tile_sprites.get(self.TILE_BRICK)  # Brick under walls (interior)
-        elif tile_type == self.TILE_DOOR:
-            # Render stone floor under doors
-            floor_sprite = self.tile_sprites.get(self.TILE_STONE)
-        else:
-            # Normal floor tiles - use .get() to avoid KeyError
-            floor_sprite = self.tile_sprites.get(tile_type)
+        floor_sprite = self.get_floor_sprite(tile_type)
         
         if floor_sprite:
             floor_rect = floor_sprite.get_rect()
@@ -282,6 +369,10 @@ class LevelRendererMixin:
     
     def get_building_bounds_at(self, x, y):
         """Get building bounds for a specific position (optimized version)"""
+        # Chunked worlds record their buildings at generation time
+        if hasattr(self, 'chunk_manager'):
+            return self._get_building_bounds(x, y)
+        
         # Check if the position is a building tile
         if hasattr(self, 'get_tile'):
             tile_type = self.get_tile(x, y)
@@ -482,12 +573,8 @@ class LevelRendererMixin:
     
     def _get_buildings_near_player(self, player_x, player_y):
         """
-        Memoized building detection: cache building bounds to avoid repeated flood fills
+        Find the buildings the player is next to, from the generation-time building records
         """
-        # Initialize building cache if not exists
-        if not hasattr(self, '_building_cache'):
-            self._building_cache = {}  # Maps tile positions to building bounds
-        
         buildings_to_flatten = set()
         
         # Check immediate area around player
@@ -510,10 +597,10 @@ class LevelRendererMixin:
                 if self.is_simple_building_tile(tile_type):
                     distance = max(abs(player_x - check_x), abs(player_y - check_y))
                     if distance <= 1:  # Player within 1 tile
-                        # Get or compute building bounds for this tile
-                        building_bounds = self._get_cached_building_bounds(check_x, check_y)
-                        if building_bounds:
-                            buildings_to_flatten.add(building_bounds)
+                        # Look up the building this tile belongs to
+                        bounds = self._get_building_bounds(check_x, check_y)
+                        if bounds:
+                            buildings_to_flatten.add(bounds)
         
         return buildings_to_flatten
         
@@ -530,88 +617,22 @@ class LevelRendererMixin:
         buildings_to_flatten = self._get_buildings_near_player(player_x, player_y)
         
         # Only update states that have changed
-        # First, unflatten buildings that are no longer in range
-        for building_bounds in list(self._building_states.keys()):
-            if self._building_states[building_bounds] and building_bounds not in buildings_to_flatten:
-                self._building_states[building_bounds] = False
+        # First, unflatten buildings that are no longer in range (dropping them keeps the dict small)
+        for bounds in list(self._building_states.keys()):
+            if bounds not in buildings_to_flatten:
+                del self._building_states[bounds]
         
         # Then, flatten buildings that are now in range
-        for building_bounds in buildings_to_flatten:
-            if not self._building_states.get(building_bounds, False):
-                self._building_states[building_bounds] = True
-    
-    def _get_cached_building_bounds(self, tile_x, tile_y):
-        """
-        Get building bounds with caching to avoid repeated flood fills
-        """
-        cache_key = (tile_x, tile_y)
-        
-        # Check if we already computed bounds for this tile
-        if cache_key in self._building_cache:
-            return self._building_cache[cache_key]
-        
-        # Compute building bounds using flood fill
-        building_bounds = self._compute_building_bounds(tile_x, tile_y)
-        
-        # Cache the result for ALL tiles in this building
-        if building_bounds:
-            min_x, min_y, max_x, max_y, building_tiles = building_bounds
-            bounds_tuple = (min_x, min_y, max_x, max_y)
-            
-            # Cache bounds for every tile in this building
-            for bx, by in building_tiles:
-                self._building_cache[(bx, by)] = bounds_tuple
-            
-            return bounds_tuple
-        else:
-            # Cache negative result
-            self._building_cache[cache_key] = None
-            return None
+        for bounds in buildings_to_flatten:
+            self._building_states[bounds] = True
     
-    def _compute_building_bounds(self, tile_x, tile_y):
+    def _get_building_bounds(self, tile_x, tile_y):
         """
-        Compute building bounds using flood fill (only called once per building)
+        Get the footprint of the building covering a tile from the chunk's building records
         """
-        visited = set()
-        building_tiles = set()
-        to_visit = [(tile_x, tile_y)]
-        
-        # Limit search to prevent performance issues
-        max_iterations = 200
-        iterations = 0
-        
-        while to_visit and iterations < max_iterations:
-            iterations += 1
-            curr_x, curr_y = to_visit.pop()
-            if (curr_x, curr_y) in visited:
-                continue
-            visited.add((curr_x, curr_y))
-            
-            # Get tile type
-            if hasattr(self, 'get_tile'):
-                tile_type = self.get_tile(curr_x, curr_y)
-            else:
-                if not (0 <= curr_y < len(self.tiles) and 0 <= curr_x < len(self.tiles[0])):
-                    continue
-                tile_type = self.tiles[curr_y][curr_x]
-            
-            if self.is_simple_building_tile(tile_type):
-                building_tiles.add((curr_x, curr_y))
-                # Check adjacent tiles (4-directional only for performance)
-                for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                    nx, ny = curr_x + dx, curr_y + dy
-                    if (nx, ny) not in visited:
-                        to_visit.append((nx, ny))
-        
-        if building_tiles:
-            min_x = min(x for x, y in building_tiles)
-            max_x = max(x for x, y in building_tiles)
-            min_y = min(y for x, y in building_tiles)
-            max_y = max(y for x, y in building_tiles)
-            return (min_x, min_y, max_x, max_y, building_tiles)
-        
+        if hasattr(self, 'get_building_at'):
+            return building_bounds(self.get_building_at(tile_x, tile_y))
         return None
-
     
     def is_simple_building_tile(self, tile_type):
         """Fast building tile check without expensive operations"""
@@ -630,20 +651,12 @@ class LevelRendererMixin:
         if not hasattr(self, '_building_states'):
             return False
         
-        # Get cached building bounds for this tile
-        if not hasattr(self, '_building_cache'):
-            return False
-            
-        cache_key = (tile_x, tile_y)
-        if cache_key not in self._building_cache:
-            return False
-            
-        building_bounds = self._building_cache[cache_key]
-        if not building_bounds:
+        bounds = self._get_building_bounds(tile_x, tile_y)
+        if not bounds:
             return False
         
         # Check cached building state
-        return self._building_states.get(building_bounds, False)
+        return self._building_states.get(bounds, False)
     
     def _update_entity_visibility_cache(self):
         """
@@ -717,7 +730,7 @@ class LevelRendererMixin:
         self._tile_visibility_cache.clear()
         
         # Use already-computed building states instead of expensive per-tile checks
-        if not hasattr(self, '_building_states') or not hasattr(self, '_building_cache'):
+        if not hasattr(self, '_building_states'):
             return  # No building data available
         
         # Cache visibility for all visible building tiles
@@ -739,17 +752,9 @@ class LevelRendererMixin:
                 if self.is_simple_building_tile(tile_type):
                     tile_key = (x, y)
                     
-                    # Fast lookup using already-cached building bounds and states
-                    cache_key = (x, y)
-                    if cache_key in self._building_cache:
-                        building_bounds = self._building_cache[cache_key]
-                        if building_bounds:
-                            is_visible = self._building_states.get(building_bounds, False)
-                            self._tile_visibility_cache[tile_key] = is_visible
-                        else:
-                            self._tile_visibility_cache[tile_key] = False
-                    else:
-                        self._tile_visibility_cache[tile_key] = False
+                    # Fast lookup using the building records and already-computed states
+                    bounds = self._get_building_bounds(x, y)
+                    self._tile_visibility_cache[tile_key] = self._building_states.get(bounds, False) if bounds else False
     
     def _get_cached_tile_visibility(self, tile_x, tile_y):
         """
@@ -761,39 +766,3 @@ class LevelRendererMixin:
         
         # Fallback to expensive check if cache not ready
         return self._is_player_near_building_tile(tile_x, tile_y)
-    
-    def _update_entity_sorting_cache(self):
-        """
-        Cache sorted entities to avoid expensive sorting every frame
-        """
-        # Collect all entities for depth sorting
-        all_entities = []
-        all_entities.append(self.player)
-        all_entities.extend(getattr(self, 'enemies', []))
-        all_entities.extend(getattr(self, 'npcs', []))
-        all_entities.extend(getattr(self, 'items', []))
-        all_entities.extend(getattr(self, 'objects', []))
-        all_entities.extend(getattr(self, 'chests', []))
-        all_entities.extend(getattr(self, 'furniture', []))
-        
-        # Sort entities by depth and cache the result
-        self._cached_sorted_entities = sort_by_depth(all_entities)
-    
-    def _get_cached_sorted_entities(self):
-        """
-        Get cached sorted entities, falling back to immediate sorting if cache not ready
-        """
-        if hasattr(self, '_cached_sorted_entities'):
-            return self._cached_sorted_entities
-        
-        # Fallback: collect and sort immediately (should rarely happen)
-        all_entities = []
-        all_entities.append(self.player)
-        all_entities.extend(getattr(self, 'enemies', []))
-        all_entities.extend(getattr(self, 'npcs', []))
-        all_entities.extend(getattr(self, 'items', []))
-        all_entities.extend(getattr(self, 'objects', []))
-        all_entities.extend(getattr(self, 'chests', []))
-        all_entities.extend(getattr(self, 'furniture', []))
-        
-        return sort_by_depth(all_entities)
\ No newline at end of file
@@ -0,0 +1,300 @@
+"""
+Per-chunk walkability and movement cost planes for pathfinding
+"""
+
+import math
+from array import array
+from typing import Dict, Optional, Tuple
+
+from ..world.chunk import Chunk
+
+# Tiles entities can walk on: GRASS, DIRT, STONE, DOOR, BRICK, SAND, SNOW, FOREST_FLOOR, SWAMP
+WALKABLE_TILES = {0, 1, 2, 5, 13, 16, 17, 18, 19}
+TILE_DOOR = 5
+
+# Blocking objects influence tiles within this distance of the tile center
+OBJECT_INFLUENCE_RADIUS = 1.5
+
+# Cost factor for tiles in chunks that aren't loaded (walkability score 0.8)
+UNLOADED_COST = 1.4
+
+
+def walkability_score(tile: int, influence: float = 0.0) -> float:
+    """
+    Walkability score of a tile (0 = blocked, 1 = free)
+
+    Args:
+        tile: Tile type
+        influence: Strongest blocking-object influence on the tile (0-1)
+
+    Returns:
+        Score used to derive the movement cost
+    """
+    if tile == TILE_DOOR:
+        score = 1.0  # Doors are fully walkable
+    elif tile in (0, 1, 16, 17, 18, 19):
+        score = 0.9  # Common walkable tiles
+    elif tile in (2, 13):
+        score = 0.8  # Stone, brick
+    else:
+        score = 0.1
+
+    # Same object thresholds as the template world's walkable grid
+    if influence > 0.8:
+        return 0.0
+    if influence > 0.4:
+        return min(score, 0.3)
+    return score
+
+
+def movement_cost(tile: int, influence: float = 0.0) -> float:
+    """
+    Cost multiplier for entering a tile, or 0.0 if it can't be entered
+
+    Args:
+        tile: Tile type
+        influence: Strongest blocking-object influence on the tile (0-1)
+
+    Returns:
+        Factor applied to the straight or diagonal step cost
+    """
+    if tile not in WALKABLE_TILES:
+        return 0.0
+    score = walkability_score(tile, influence)
+    if score <= 0.0:
+        return 0.0
+
+    cost = 1.0 + (1.0 - score) * 2.0
+    if tile == TILE_DOOR:
+        cost *= 0.1  # 90% cost reduction for doors
+    elif score > 0.9:
+        cost *= 0.8  # Prefer open areas
+    return cost
+
+
+class ChunkNavPlane:
+    """Walkability, cost and object influence for one chunk, indexed by local_y * size + local_x"""
+
+    def __init__(self, chunk: Chunk):
+        size = chunk.CHUNK_SIZE
+        self.chunk = chunk
+        self.size = size
+        self.walkable = bytearray(size * size)
+        self.cost = array('d', bytes(8 * size * size))
+        self.influence = array('d', bytes(8 * size * size))
+        # Bumped on every tile update so derived caches can tell the plane changed
+        self.version = 0
+
+    def recompute(self, index: int):
+        """Recompute one tile from its tile type and influence"""
+        self.version += 1
+        tile = self.chunk.tiles[index // self.size][index % self.size]
+        cost = movement_cost(tile, self.influence[index])
+        self.cost[index] = cost
+        self.walkable[index] = 1 if cost > 0.0 else 0
+
+
+class NavigationGrid:
+    """
+    Cached walkability and movement cost for loaded chunks
+
+    Planes are built the first time pathfinding touches a chunk and kept until
+    the chunk is unloaded or reloaded. Tile edits (ChunkManager.set_tile) and
+    blocking objects entering or leaving the level's spatial hash update only
+    the tiles they affect.
+    """
+
+    def __init__(self, level, chunk_manager):
+        """
+        Initialize navigation grid
+
+        Args:
+            level: Level providing objects through its spatial hash
+            chunk_manager: ChunkManager providing loaded chunks
+        """
+        self.level = level
+        self.chunk_manager = chunk_manager
+        self.size = Chunk.CHUNK_SIZE
+        self.planes: Dict[Tuple[int, int], ChunkNavPlane] = {}
+
+        self._last_key = None
+        self._last_plane = None
+
+        chunk_manager.tile_listeners.append(self)
+        self.spatial_index = level.get_spatial_index()
+        self.spatial_index.listeners.append(self)
+
+    def detach(self):
+        """Stop listening for tile and entity changes"""
+        if self in self.chunk_manager.tile_listeners:
+            self.chunk_manager.tile_listeners.remove(self)
+        if self in self.spatial_index.listeners:
+            self.spatial_index.listeners.remove(self)
+
+    def begin_search(self):
+        """Bring the grid up to date before a path search"""
+        self.spatial_index.ensure_current()
+
+        # Drop planes for chunks that were unloaded or reloaded since they were built
+        loaded = self.chunk_manager.loaded_chunks
+        stale = [key for key, plane in self.planes.items() if loaded.get(key) is not plane.chunk]
+        for key in stale:
+            del self.planes[key]
+        if stale:
+            self._last_key = None
+            self._last_plane = None
+
+    def get_plane(self, chunk_x: int, chunk_y: int) -> Optional[ChunkNavPlane]:
+        """
+        Get the plane for a loaded chunk, building it if needed
+
+        Args:
+            chunk_x: Chunk X coordinate
+            chunk_y: Chunk Y coordinate
+
+        Returns:
+            The plane, or None if the chunk isn't loaded (chunks are never loaded here)
+        """
+        key = (chunk_x, chunk_y)
+        chunk = self.chunk_manager.loaded_chunks.get(key)
+        plane = self.planes.get(key)
+        if chunk is None:
+            if plane is not None:
+                del self.planes[key]
+            return None
+        if plane is None or plane.chunk is not chunk:
+            plane = self.planes[key] = self.build_plane(chunk)
+        return plane
+
+    def build_plane(self, chunk: Chunk) -> ChunkNavPlane:
+        """Compute walkability and cost for every tile of a chunk"""
+        plane = ChunkNavPlane(chunk)
+        size = self.size
+        base_x = chunk.chunk_x * size
+        base_y = chunk.chunk_y * size
+
+        # Object influence first, stamped around each nearby blocking object
+        half = size / 2
+        reach = half + OBJECT_INFLUENCE_RADIUS
+        for category, obj in self.spatial_index.query(base_x + half, base_y + half, reach * math.sqrt(2), ('objects',)):
+            if obj.blocks_movement:
+                self._stamp_object(plane, obj)
+
+        # Tile costs through a per-type table, then the influenced tiles individually
+        cost_table = {}
+        index = 0
+        walkable = plane.walkable
+        cost = plane.cost
+        influence = plane.influence
+        for row in chunk.tiles:
+            for tile in row:
+                if influence[index] > 0.0:
+                    plane.recompute(index)
+                else:
+                    tile_cost = cost_table.get(tile)
+                    if tile_cost is None:
+                        tile_cost = cost_table[tile] = movement_cost(tile)
+                    cost[index] = tile_cost
+                    walkable[index] = 1 if tile_cost > 0.0 else 0
+                index += 1
+        return plane
+
+    def cost_at(self, x: int, y: int) -> Optional[float]:
+        """
+        Movement cost factor for entering a tile
+
+        Args:
+            x: World tile X
+            y: World tile Y
+
+        Returns:
+            Cost factor, or None if the tile is blocked
+        """
+        chunk_x, local_x = divmod(x, self.size)
+        chunk_y, local_y = divmod(y, self.size)
+        key = (chunk_x, chunk_y)
+        if key == self._last_key:
+            plane = self._last_plane
+        else:
+            plane = self.get_plane(chunk_x, chunk_y)
+            self._last_key = key
+            self._last_plane = plane
+
+        if plane is None:
+            return UNLOADED_COST
+        index = local_y * self.size + local_x
+        if not plane.walkable[index]:
+            return None
+        return plane.cost[index]
+
+    def is_walkable(self, x: int, y: int) -> bool:
+        """Check if a world tile can be entered"""
+        return self.cost_at(x, y) is not None
+
+    def tile_changed(self, world_x: int, world_y: int, tile_type: int):
+        """ChunkManager listener: recompute a single edited tile"""
+        chunk_x, local_x = divmod(world_x, self.size)
+        chunk_y, local_y = divmod(world_y, self.size)
+        plane = self.planes.get((chunk_x, chunk_y))
+        if plane is not None:
+            plane.recompute(local_y * self.size + local_x)
+
+    def entity_added(self, category: str, entity):
+        """Spatial hash listener: apply a new blocking object's influence"""
+        if category != 'objects' or not getattr(entity, 'blocks_movement', False):
+            return
+        for plane in self._planes_near(entity.x, entity.y):
+            self._stamp_object(plane, entity, recompute=True)
+
+    def entity_removed(self, category: str, entity):
+        """Spatial hash listener: recompute influence around a removed object"""
+        if category != 'objects' or not getattr(entity, 'blocks_movement', False):
+            return
+        radius = OBJECT_INFLUENCE_RADIUS
+        for plane in self._planes_near(entity.x, entity.y):
+            for index, center_x, center_y in self._tiles_near(plane, entity.x, entity.y):
+                strongest = 0.0
+                for _, other in self.spatial_index.query(center_x, center_y, radius, ('objects',)):
+                    if other is entity or not other.blocks_movement:
+                        continue
+                    distance = math.sqrt((center_x - other.x) ** 2 + (center_y - other.y) ** 2)
+                    if distance < radius:
+                        strongest = max(strongest, 1.0 - distance / radius)
+                plane.influence[index] = strongest
+                plane.recompute(index)
+
+    def _planes_near(self, x: float, y: float):
+        """Built planes whose tiles an object at (x, y) can influence"""
+        radius = OBJECT_INFLUENCE_RADIUS
+        keys = {
+            (math.floor(px / self.size), math.floor(py / self.size))
+            for px in (x - radius, x + radius) for py in (y - radius, y + radius)
+        }
+        return [self.planes[key] for key in keys if key in self.planes]
+
+    def _tiles_near(self, plane: ChunkNavPlane, x: float, y: float):
+        """(index, center_x, center_y) for the plane's tiles within influence range of a point"""
+        size = self.size
+        base_x = plane.chunk.chunk_x * size
+        base_y = plane.chunk.chunk_y * size
+        radius = OBJECT_INFLUENCE_RADIUS
+        min_x = max(math.floor(x - radius - 0.5), base_x)
+        max_x = min(math.floor(x + radius - 0.5) + 1, base_x + size - 1)
+        min_y = max(math.floor(y - radius - 0.5), base_y)
+        max_y = min(math.floor(y + radius - 0.5) + 1, base_y + size - 1)
+        for tile_y in range(min_y, max_y + 1):
+            for tile_x in range(min_x, max_x + 1):
+                yield (tile_y - base_y) * size + (tile_x - base_x), tile_x + 0.5, tile_y + 0.5
+
+    def _stamp_object(self, plane: ChunkNavPlane, obj, recompute: bool = False):
+        """Raise the influence of tiles around a blocking object"""
+        radius = OBJECT_INFLUENCE_RADIUS
+        for index, center_x, center_y in self._tiles_near(plane, obj.x, obj.y):
+            distance = math.sqrt((center_x - obj.x) ** 2 + (center_y - obj.y) ** 2)
+            if distance >= radius:
+                continue
+            influence = 1.0 - distance / radius
+            if influence > plane.influence[index]:
+                plane.influence[index] = influence
+                if recompute:
+                    plane.recompute(index)
@@ -5,6 +5,7 @@ Adds chunk-based procedural world generation capability to the refactored Level
 
 import random
 from ..world.chunk_manager import ChunkManager
+from ..world.entity_residency import EntityResidencyManager
 
 
 class ProceduralGenerationMixin:
@@ -13,6 +14,9 @@ class ProceduralGenerationMixin:
     Integrates with the existing mixin-based Level architecture
     """
     
+    # Entities are kept live for chunks within this radius of the player (5x5 chunks)
+    entity_load_radius = 2
+    
     def generate_procedural_level(self, seed=None):
         """
         Generate a procedural level with pre-generated chunks around spawn
@@ -27,7 +31,10 @@ class ProceduralGenerationMixin:
         
         # Initialize chunk manager for this world
         world_name = f"procedural_{seed}"
-        self.chunk_manager = ChunkManager(seed, world_name, self.asset_loader)
+        settings = getattr(getattr(self, 'game', None), 'settings', None)
+        async_generation = bool(settings and settings.get("async_chunk_generation"))
+        self.chunk_manager = ChunkManager(seed, world_name, self.asset_loader,
+                                          async_generation=async_generation)
         
         # Set up world dimensions
         self.width = 1000  # Large but finite for compatibility
@@ -84,6 +91,13 @@ class ProceduralGenerationMixin:
         # Track settlements found during generation
         settlements_found = []
         
+        # In async mode this generates the whole spawn area in parallel up front
+        self.chunk_manager.wait_for_chunks([
+            (chunk_x, chunk_y)
+            for chunk_y in range(spawn_chunk_y - generation_radius, spawn_chunk_y + generation_radius + 1)
+            for chunk_x in range(spawn_chunk_x - generation_radius, spawn_chunk_x + generation_radius + 1)
+        ])
+        
         for chunk_y in range(spawn_chunk_y - generation_radius, spawn_chunk_y + generation_radius + 1):
             for chunk_x in range(spawn_chunk_x - generation_radius, spawn_chunk_x + generation_radius + 1):
                 print(f"Generating chunk ({chunk_x}, {chunk_y}) - {generated_chunks + 1}/{total_chunks}")
@@ -229,72 +243,19 @@ class ProceduralGenerationMixin:
         return center_x, center_y
     
     def load_entities_from_pregenerated_chunks(self, spawn_x, spawn_y):
-        """Load entities from chunks around player spawn - limited initial load"""
+        """Load entities from the chunks around player spawn and start tracking residency"""
         print("Loading entities from chunks around spawn...")
         
         # Convert spawn coordinates to chunk coordinates
         spawn_chunk_x, spawn_chunk_y = self.chunk_manager.world_to_chunk_coords(spawn_x, spawn_y)
         print(f"Spawn at ({spawn_x}, {spawn_y}) = chunk ({spawn_chunk_x}, {spawn_chunk_y})")
         
-        load_radius = 1  # Only load 3x3 chunks around spawn initially
-        
-        entity_counts = {'npcs': 0, 'enemies': 0, 'objects': 0, 'chests': 0, 'items': 0, 'furniture': 0}
+        self.entity_residency = EntityResidencyManager(
+            self, self.chunk_manager, self.create_entity_from_data, radius=self.entity_load_radius
+        )
+        self.entity_residency.update(spawn_x, spawn_y, blocking=True)
         
-        for chunk_y in range(spawn_chunk_y - load_radius, spawn_chunk_y + load_radius + 1):
-            for chunk_x in range(spawn_chunk_x - load_radius, spawn_chunk_x + load_radius + 1):
-                chunk = self.chunk_manager.get_chunk(chunk_x, chunk_y)
-                if chunk:
-                    chunk_world_x = chunk.chunk_x * chunk.CHUNK_SIZE
-                    chunk_world_y = chunk.chunk_y * chunk.CHUNK_SIZE
-                    
-                    for entity_data in chunk.entities:
-                        # Convert entity data to world coordinates
-                        world_x = entity_data['x'] + chunk_world_x
-                        world_y = entity_data['y'] + chunk_world_y
-                        
-                        if entity_data['type'] == 'npc':
-                            # Create and add NPC
-                            npc_obj = self.create_npc_from_data(entity_data, world_x, world_y)
-                            if npc_obj:
-                                self.npcs.append(npc_obj)
-                                print(f"  Loaded NPC: {entity_data.get('name', 'Unknown')} at ({world_x}, {world_y})")
-                            entity_counts['npcs'] += 1
-                            
-                        elif entity_data['type'] == 'enemy':
-                            # Create and add Enemy
-                            enemy_obj = self.create_enemy_from_data(entity_data, world_x, world_y)
-                            if enemy_obj:
-                                self.enemies.append(enemy_obj)
-                            entity_counts['enemies'] += 1
-                            
-                        elif entity_data['type'] == 'object':
-                            # Create and add Object
-                            obj = self.create_object_from_data(entity_data, world_x, world_y)
-                            if obj:
-                                self.objects.append(obj)
-                            entity_counts['objects'] += 1
-                            
-                        elif entity_data['type'] == 'chest':
-                            # TODO: Implement chest creation when needed
-                            entity_counts['chests'] += 1
-                            
-                        elif entity_data['type'] == 'item':
-                            # TODO: Implement item creation when needed
-                            entity_counts['items'] += 1
-                            
-                        elif entity_data['type'] == 'furniture':
-                            # Create and add Furniture
-                            furniture_obj = self.create_furniture_from_data(entity_data, world_x, world_y)
-                            if furniture_obj:
-                                self.furniture.append(furniture_obj)
-                                print(f"  Loaded Furniture: {entity_data.get('furniture_type', 'Unknown')} at ({world_x}, {world_y})")
-                            entity_counts['furniture'] += 1
-        
-        print(f"Loaded entities from {(load_radius * 2 + 1) ** 2} chunks around spawn:")
-        for entity_type, count in entity_counts.items():
-            print(f"  {entity_type}: {count}")
-        
-        print(f"Actually created entities:")
+        print(f"Loaded entities from {len(self.entity_residency.resident_chunks)} chunks around spawn:")
         print(f"  NPCs: {len(self.npcs)}")
         print(f"  Enemies: {len(self.enemies)}")
         print(f"  Objects: {len(self.objects)}")
@@ -323,116 +284,49 @@ class ProceduralGenerationMixin:
             # since we already have a good area loaded
             self.chunk_manager.update_loaded_chunks(self.player.x, self.player.y)
             
-            # Only update entities occasionally to avoid performance issues
-            if not hasattr(self, 'entity_update_counter'):
-                self.entity_update_counter = 0
-            
-            self.entity_update_counter += 1
-            
-            # Update entities every 300 frames (roughly once per 5 seconds at 60 FPS) - less aggressive
-            if self.entity_update_counter >= 300:
-                self.entity_update_counter = 0
-                # Only update if player has moved significantly
-                if not hasattr(self, 'last_entity_update_pos'):
-                    self.last_entity_update_pos = (self.player.x, self.player.y)
-                    self.update_entities_from_chunks()
-                else:
-                    last_x, last_y = self.last_entity_update_pos
-                    distance_moved = ((self.player.x - last_x) ** 2 + (self.player.y - last_y) ** 2) ** 0.5
-                    if distance_moved > 32:  # Only update if player moved more than half a chunk
-                        self.last_entity_update_pos = (self.player.x, self.player.y)
-                        self.update_entities_from_chunks()
+            # Residency only does work when the player crosses a chunk boundary
+            self.update_entities_from_chunks()
     
     def update_entities_from_chunks(self):
-        """Update entity lists from currently loaded chunks around player"""
+        """Add entities for chunks entering the radius around the player and drop those leaving it"""
         if not hasattr(self, 'chunk_manager'):
             return
         
-        print("Updating entities from chunks...")
-        
-        # Get player chunk coordinates
-        player_chunk_x, player_chunk_y = self.chunk_manager.world_to_chunk_coords(self.player.x, self.player.y)
-        print(f"Player at chunk ({player_chunk_x}, {player_chunk_y}), world pos ({self.player.x:.1f}, {self.player.y:.1f})")
-        
-        # Only load entities from chunks within a reasonable radius
-        entity_load_radius = 2  # Load entities from 5x5 chunks around player
-        
-        # Store current entity counts before clearing
-        old_counts = {
-            'npcs': len(self.npcs),
-            'enemies': len(self.enemies), 
-            'objects': len(self.objects),
-            'furniture': len(self.furniture)
-        }
+        residency = getattr(self, 'entity_residency', None)
+        if residency is None:
+            residency = self.entity_residency = EntityResidencyManager(
+                self, self.chunk_manager, self.create_entity_from_data, radius=self.entity_load_radius
+            )
         
-        # Clear current entity lists
-        self.npcs.clear()
-        self.enemies.clear()
-        self.objects.clear()
-        self.items.clear()
-        self.chests.clear()
-        self.furniture.clear()
-        
-        # Load entities from chunks around player
-        total_entities_found = 0
-        for chunk_y in range(player_chunk_y - entity_load_radius, player_chunk_y + entity_load_radius + 1):
-            for chunk_x in range(player_chunk_x - entity_load_radius, player_chunk_x + entity_load_radius + 1):
-                chunk = self.chunk_manager.get_chunk(chunk_x, chunk_y)
-                if chunk:
-                    chunk_world_x = chunk.chunk_x * chunk.CHUNK_SIZE
-                    chunk_world_y = chunk.chunk_y * chunk.CHUNK_SIZE
-                    
-                    chunk_entities = len(chunk.entities)
-                    total_entities_found += chunk_entities
-                    if chunk_entities > 0:
-                        print(f"  Chunk ({chunk_x}, {chunk_y}) has {chunk_entities} entities")
-                    
-                    for entity_data in chunk.entities:
-                        # Convert entity data to world coordinates
-                        world_x = entity_data['x'] + chunk_world_x
-                        world_y = entity_data['y'] + chunk_world_y
-                        
-                        # Only load entities that are reasonably close to the player
-                        distance_to_player = ((world_x - self.player.x) ** 2 + (world_y - self.player.y) ** 2) ** 0.5
-                        if distance_to_player > entity_load_radius * 64 * 1.5:  # 1.5x chunk radius in world units
-                            continue
-                        
-                        if entity_data['type'] == 'npc':
-                            # Create NPC object
-                            npc_obj = self.create_npc_from_data(entity_data, world_x, world_y)
-                            if npc_obj:
-                                self.npcs.append(npc_obj)
-                                print(f"    Loaded NPC: {entity_data.get('name', 'Unknown')} at ({world_x:.1f}, {world_y:.1f})")
-                                
-                        elif entity_data['type'] == 'enemy':
-                            # Create Enemy object
-                            enemy_obj = self.create_enemy_from_data(entity_data, world_x, world_y)
-                            if enemy_obj:
-                                self.enemies.append(enemy_obj)
-                                
-                        elif entity_data['type'] == 'object':
-                            # Create Object
-                            obj = self.create_object_from_data(entity_data, world_x, world_y)
-                            if obj:
-                                self.objects.append(obj)
-                                
-                        elif entity_data['type'] == 'furniture':
-                            # Create Furniture object
-                            furniture_obj = self.create_furniture_from_data(entity_data, world_x, world_y)
-                            if furniture_obj:
-                                self.furniture.append(furniture_obj)
-        
-        new_counts = {
-            'npcs': len(self.npcs),
-            'enemies': len(self.enemies), 
-            'objects': len(self.objects),
-            'furniture': len(self.furniture)
-        }
+        if residency.update(self.player.x, self.player.y):
+            player_chunk_x, player_chunk_y = residency.center
+            print(f"Entity residency updated around chunk ({player_chunk_x}, {player_chunk_y}): "
+                  f"NPCs={len(self.npcs)}, Enemies={len(self.enemies)}, "
+                  f"Objects={len(self.objects)}, Furniture={len(self.furniture)}")
+    
+    def create_entity_from_data(self, entity_data, world_x, world_y):
+        """
+        Create the game object for a chunk entity
         
-        print(f"Entity update complete:")
-        print(f"  Total entities found in chunks: {total_entities_found}")
-        for entity_type in ['npcs', 'enemies', 'objects', 'furniture']:
-            print(f"  {entity_type}: {old_counts[entity_type]} -> {new_counts[entity_type]}")
+        Args:
+            entity_data: Entity dictionary from the chunk
+            world_x: World X position
+            world_y: World Y position
+            
+        Returns:
+            Game object, or None for unsupported types or failures
+        """
+        entity_type = entity_data.get('type')
+        if entity_type == 'npc':
+            return self.create_npc_from_data(entity_data, world_x, world_y)
+        elif entity_type == 'enemy':
+            return self.create_enemy_from_data(entity_data, world_x, world_y)
+        elif entity_type == 'object':
+            return self.create_object_from_data(entity_data, world_x, world_y)
+        elif entity_type == 'furniture':
+            return self.create_furniture_from_data(entity_data, world_x, world_y)
+        # World generation doesn't place chests or items in chunks - loot drops only live in self.items
+        return None
     
     def create_npc_from_data(self, entity_data, world_x, world_y):
         """Create AI-powered NPC object from entity data"""
@@ -648,11 +542,11 @@ class ProceduralGenerationMixin:
                 if tile is None:
                     # If tile is None (unloaded chunk), try to load the chunk
                     chunk_x, chunk_y = self.chunk_manager.world_to_chunk_coords(x, y)
-                    chunk = self.chunk_manager.get_chunk(chunk_x, chunk_y)
+                    chunk = self.chunk_manager.get_chunk(chunk_x, chunk_y, blocking=False)
                     if chunk:
                         tile = self.chunk_manager.get_tile(int(x), int(y))
                     
-                    # If still None, default to grass (walkable)
+                    # If still None (or still generating), default to grass
                     if tile is None:
                         return self.TILE_GRASS
                 
@@ -662,6 +556,18 @@ class ProceduralGenerationMixin:
                 return self.TILE_GRASS  # Default to grass
         return self.TILE_GRASS  # Default to grass
     
+    def get_building_at(self, x, y):
+        """Get the generation-time building record covering world coordinates, or None"""
+        if hasattr(self, 'chunk_manager'):
+            return self.chunk_manager.get_building_at(int(x), int(y))
+        return None
+    
+    def get_buildings_near(self, x, y, radius):
+        """Get building records within radius tiles of world coordinates"""
+        if hasattr(self, 'chunk_manager'):
+            return self.chunk_manager.get_buildings_near(int(x), int(y), radius)
+        return []
+    
     def get_biome(self, x, y):
         """Get biome at world coordinates using chunk system"""
         if hasattr(self, 'chunk_manager'):
@@ -700,7 +606,11 @@ class ProceduralGenerationMixin:
             # Preload chunks in a small radius around the position
             for dx in [-1, 0, 1]:
                 for dy in [-1, 0, 1]:
-                    self.chunk_manager.get_chunk(chunk_x + dx, chunk_y + dy)
+                    self.chunk_manager.get_chunk(chunk_x + dx, chunk_y + dy, blocking=False)
+            
+            # Terrain that is still being generated blocks movement until it arrives
+            if self.chunk_manager.is_chunk_pending(chunk_x, chunk_y):
+                return True
         
         # Get tile at position using chunk system
         tile = self.get_tile(x, y)
@@ -714,63 +624,24 @@ class ProceduralGenerationMixin:
         if tile not in walkable_tiles:
             return True  # Collision with non-walkable tile
         
-        # Check collision with entities (simplified for now)
-        half_size = size * 0.7
-        
-        # Check collision with objects
-        for obj in self.objects:
-            if obj.blocks_movement and obj != exclude_entity:
-                dist_x = x - obj.x
-                dist_y = y - obj.y
-                distance = math.sqrt(dist_x * dist_x + dist_y * dist_y)
-                
-                collision_distance = size + 0.35
-                if distance < collision_distance:
-                    return True
-        
-        # Check collision with chests
-        for chest in self.chests:
-            if chest.blocks_movement and chest != exclude_entity:
-                dist_x = x - chest.x
-                dist_y = y - chest.y
-                distance = math.sqrt(dist_x * dist_x + dist_y * dist_y)
-                
+        # Check collision with entities in nearby cells (circular for all types)
+        for category, entity in self.get_spatial_index().query(x, y, size + 0.4):
+            if entity == exclude_entity:
+                continue
+            if category in ('objects', 'chests', 'furniture'):
+                if not entity.blocks_movement:
+                    continue
                 collision_distance = size + 0.35
-                if distance < collision_distance:
-                    return True
-        
-        # Check collision with NPCs
-        for npc in self.npcs:
-            if npc != exclude_entity:
-                dist_x = x - npc.x
-                dist_y = y - npc.y
-                distance = math.sqrt(dist_x * dist_x + dist_y * dist_y)
-                
+            elif category == 'npcs':
                 collision_distance = size + 0.4
-                if distance < collision_distance:
-                    return True
-        
-        # Check collision with enemies
-        for enemy in self.enemies:
-            if enemy != exclude_entity:
-                dist_x = x - enemy.x
-                dist_y = y - enemy.y
-                distance = math.sqrt(dist_x * dist_x + dist_y * dist_y)
-                
+            else:
                 collision_distance = size + 0.3
-                if distance < collision_distance:
-                    return True
-        
-        # Check collision with furniture
-        for furniture in getattr(self, 'furniture', []):
-            if furniture.blocks_movement and furniture != exclude_entity:
-                dist_x = x - furniture.x
-                dist_y = y - furniture.y
-                distance = math.sqrt(dist_x * dist_x + dist_y * dist_y)
-                
-                collision_distance = size + 0.35
-                if distance < collision_distance:
-                    return True
+            
+            dist_x = x - entity.x
+            dist_y = y - entity.y
+            distance = math.sqrt(dist_x * dist_x + dist_y * dist_y)
+            if distance < collision_distance:
+                return True
         
         return False
     
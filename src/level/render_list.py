@@ -0,0 +1,202 @@
+"""
+Depth-sorted list of level entities for the isometric renderer
+"""
+
+import math
+from bisect import bisect_left, bisect_right, insort
+from typing import Dict, List, Tuple
+
+from ..core.isometric import depth_bias
+
+# Level entity lists drawn by the renderer, after the player
+RENDER_CATEGORIES = ('enemies', 'npcs', 'items', 'objects', 'chests', 'furniture')
+
+# Lists whose entities walk around - the rest only move when they are added or removed
+MOVING_CATEGORIES = ('enemies', 'npcs')
+
+
+class RenderList:
+    """
+    Keeps level entities sorted by isometric depth (x + y) between frames
+
+    Entities sit in buckets of one unit of depth, each kept sorted with
+    bisect, and the occupied bucket depths are kept sorted too. refresh(),
+    called once per frame, checks the player and the moving lists and
+    re-inserts only the entities whose depth changed, so a moving enemy
+    costs a removal and an insertion instead of a sort of the whole level.
+    Entities at the same depth keep the order they were first seen in
+    (player, enemies, npcs, items, objects, chests, furniture), as the
+    stable sort did. Membership follows the level's entity lists: each list
+    is compared with a copy taken at the last reconcile (an identity
+    comparison, cheap next to sorting), so appends, removals, replacements
+    and in-place swaps like EntityResidencyManager's all trigger a full
+    reconcile. Code that moves an entity from one of the other lists calls
+    update() for it.
+    """
+
+    def __init__(self, owner, categories: Tuple[str, ...] = RENDER_CATEGORIES,
+                 moving: Tuple[str, ...] = MOVING_CATEGORIES):
+        """
+        Initialize render list
+
+        Args:
+            owner: Object holding the player and entity lists (usually the level)
+            categories: Names of the owner's entity lists to draw
+            moving: Those of the lists whose entities are checked for movement every refresh
+        """
+        self.owner = owner
+        self.categories = categories
+        self.moving = moving
+
+        # floor(depth) -> sorted [(depth, order, entity)]
+        self.buckets: Dict[int, List[Tuple[float, int, object]]] = {}
+        # Sorted keys of non-empty buckets
+        self.bucket_depths: List[int] = []
+        # id(entity) -> (depth, order, entity, bias)
+        self.entries: Dict[int, Tuple[float, int, object, float]] = {}
+        self._next_order = 0
+        # Player and a copy of each entity list as of the last reconcile
+        self._player = None
+        self._snapshots: Dict[str, Tuple[object, List[object]]] = {}
+
+        # Metrics
+        self.reinserted = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def refresh(self):
+        """Re-sort moving entities whose depth changed, reconciling membership if the lists changed"""
+        if self._membership_changed():
+            self.reconcile()
+            return
+
+        entries = self.entries
+        player = getattr(self.owner, 'player', None)
+        movers = [player] if player is not None else []
+        for category in self.moving:
+            movers.extend(getattr(self.owner, category, ()))
+        for entity in movers:
+            entry = entries.get(id(entity))
+            if entry is None:
+                self.insert(entity)  # Swapped into a list without changing its length
+            elif entry[0] != entity.x + entity.y + entry[3]:
+                self.update(entity)
+
+    def reconcile(self):
+        """Bring membership and every entity's depth in line with the owner's lists"""
+        self._take_snapshots()
+        entries = self.entries
+        seen = set()
+        for entity in self._owner_entities():
+            key = id(entity)
+            if key in seen:
+                continue
+            seen.add(key)
+            entry = entries.get(key)
+            if entry is None:
+                self.insert(entity)
+            elif entry[0] != entity.x + entity.y + entry[3]:
+                self.update(entity)
+
+        if len(seen) != len(entries):
+            for key in [key for key in entries if key not in seen]:
+                self.remove(entries[key][2])
+
+    def insert(self, entity):
+        """Add an entity at its current depth"""
+        bias = depth_bias(entity)
+        depth = entity.x + entity.y + bias
+        order = self._next_order
+        self._next_order += 1
+        self.entries[id(entity)] = (depth, order, entity, bias)
+        self._place(depth, order, entity)
+
+    def remove(self, entity):
+        """Take an entity out of the list"""
+        entry = self.entries.pop(id(entity), None)
+        if entry is not None:
+            self._unplace(entry[0], entry[1])
+
+    def update(self, entity):
+        """Move an entity to the place for its current depth"""
+        entry = self.entries.get(id(entity))
+        if entry is None:
+            return
+        old_depth, order, _, bias = entry
+        depth = entity.x + entity.y + bias
+        if depth == old_depth:
+            return
+        self._unplace(old_depth, order)
+        self.entries[id(entity)] = (depth, order, entity, bias)
+        self._place(depth, order, entity)
+        self.reinserted += 1
+
+    def visible(self, min_depth: float, max_depth: float, min_column: float, max_column: float) -> List[object]:
+        """
+        Entities inside a view, back to front
+
+        Args:
+            min_depth: Smallest x + y to include
+            max_depth: Largest x + y to include
+            min_column: Smallest x - y to include
+            max_column: Largest x - y to include
+
+        Returns:
+            Entities in drawing order
+        """
+        result = []
+        buckets = self.buckets
+        depths = self.bucket_depths
+        # Bucket k holds depths from k up to k + 1
+        start = bisect_right(depths, min_depth - 1)
+        end = bisect_right(depths, max_depth)
+        for bucket_depth in depths[start:end]:
+            for depth, _, entity in buckets[bucket_depth]:
+                if min_depth <= depth <= max_depth and min_column <= entity.x - entity.y <= max_column:
+                    result.append(entity)
+        return result
+
+    def _place(self, depth: float, order: int, entity):
+        bucket_depth = math.floor(depth)
+        bucket = self.buckets.get(bucket_depth)
+        if bucket is None:
+            bucket = self.buckets[bucket_depth] = []
+            insort(self.bucket_depths, bucket_depth)
+        insort(bucket, (depth, order, entity))
+
+    def _unplace(self, depth: float, order: int):
+        bucket_depth = math.floor(depth)
+        bucket = self.buckets[bucket_depth]
+        del bucket[bisect_left(bucket, (depth, order))]
+        if not bucket:
+            del self.buckets[bucket_depth]
+            del self.bucket_depths[bisect_left(self.bucket_depths, bucket_depth)]
+
+    def _owner_entities(self):
+        """The player, then every entity in the owner's lists"""
+        player = getattr(self.owner, 'player', None)
+        if player is not None:
+            yield player
+        for category in self.categories:
+            yield from getattr(self.owner, category, ())
+
+    def _take_snapshots(self):
+        """Remember the player and the contents of each list to detect membership changes"""
+        self._player = getattr(self.owner, 'player', None)
+        for category in self.categories:
+            entities = getattr(self.owner, category, None)
+            self._snapshots[category] = (entities, list(entities) if entities is not None else [])
+
+    def _membership_changed(self) -> bool:
+        """Whether the player, any list, or any list's contents changed since the last reconcile"""
+        if getattr(self.owner, 'player', None) is not self._player:
+            return True
+        snapshots = self._snapshots
+        for category in self.categories:
+            entities = getattr(self.owner, category, None)
+            snapshot = snapshots.get(category)
+            # List equality compares identical items by identity first, so this stays in C
+            if snapshot is None or snapshot[0] is not entities or (entities is not None and snapshot[1] != entities):
+                return True
+        return False
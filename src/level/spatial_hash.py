@@ -0,0 +1,172 @@
+"""
+Uniform grid spatial hash for level entities
+"""
+
+import math
+from typing import Dict, Iterator, List, Tuple
+
+# Level entity lists indexed by the spatial hash
+ENTITY_CATEGORIES = ('objects', 'chests', 'furniture', 'npcs', 'enemies')
+
+
+class SpatialHash:
+    """
+    Buckets level entities into grid cells so queries only touch nearby cells
+
+    Entities keep moving by assigning x/y directly, so the hash re-buckets
+    movers in refresh() (called once per frame) and queries look one extra
+    cell around the requested area to cover movement since the last refresh.
+    Membership follows the level's entity lists: appends, removals and list
+    replacements are picked up before the next query. Listeners with
+    entity_added(category, entity) and entity_removed(category, entity)
+    methods are told whenever an entity enters, leaves or changes cells.
+    """
+
+    def __init__(self, owner, cell_size: float = 1.0, categories: Tuple[str, ...] = ENTITY_CATEGORIES):
+        """
+        Initialize spatial hash
+
+        Args:
+            owner: Object holding the entity lists (usually the level)
+            cell_size: Cell edge length in tiles
+            categories: Names of the owner's entity lists to index
+        """
+        self.owner = owner
+        self.cell_size = cell_size
+        self.categories = categories
+
+        # cell -> {id(entity): (category, entity)}
+        self.cells: Dict[Tuple[int, int], Dict[int, Tuple[str, object]]] = {}
+        # id(entity) -> (category, entity, (min_cx, min_cy, max_cx, max_cy))
+        self.entries: Dict[int, Tuple[str, object, Tuple[int, int, int, int]]] = {}
+        self._signature = None
+        
+        self.listeners: List[object] = []
+
+    def refresh(self):
+        """Re-bucket moved entities and reconcile membership with the owner's lists"""
+        # Set first so listeners can query while the refresh is in progress
+        self._signature = self._membership_signature()
+        
+        seen = set()
+        for category in self.categories:
+            for entity in getattr(self.owner, category, ()):
+                key = id(entity)
+                seen.add(key)
+                entry = self.entries.get(key)
+                if entry is None:
+                    self.insert(category, entity)
+                elif entry[2] != self._footprint(category, entity):
+                    self.update(entity)
+
+        for key in [key for key in self.entries if key not in seen]:
+            self.remove(self.entries[key][1])
+
+    def ensure_current(self):
+        """Refresh if the owner's lists gained, lost or replaced entities"""
+        if self._signature != self._membership_signature():
+            self.refresh()
+
+    def insert(self, category: str, entity):
+        """Add an entity to the cells it covers"""
+        footprint = self._footprint(category, entity)
+        self.entries[id(entity)] = (category, entity, footprint)
+        for cell in self._cells_in(footprint):
+            self.cells.setdefault(cell, {})[id(entity)] = (category, entity)
+        for listener in self.listeners:
+            listener.entity_added(category, entity)
+
+    def remove(self, entity):
+        """Remove an entity from the hash"""
+        entry = self.entries.pop(id(entity), None)
+        if entry is None:
+            return
+        for cell in self._cells_in(entry[2]):
+            bucket = self.cells.get(cell)
+            if bucket is not None:
+                bucket.pop(id(entity), None)
+                if not bucket:
+                    del self.cells[cell]
+        for listener in self.listeners:
+            listener.entity_removed(entry[0], entity)
+
+    def update(self, entity):
+        """Move an entity to the cells for its current position"""
+        entry = self.entries.get(id(entity))
+        if entry is None:
+            return
+        category = entry[0]
+        if entry[2] != self._footprint(category, entity):
+            self.remove(entity)
+            self.insert(category, entity)
+
+    def query(self, x: float, y: float, radius: float,
+              categories: Tuple[str, ...] = None) -> Iterator[Tuple[str, object]]:
+        """
+        Yield entities whose cells fall within radius of a point
+
+        The result is a superset of the entities in range - callers still do
+        their exact distance or overlap test.
+
+        Args:
+            x: World X position
+            y: World Y position
+            radius: Search radius in tiles
+            categories: Restrict results to these entity lists
+
+        Returns:
+            Iterator of (category, entity) pairs
+        """
+        self.ensure_current()
+
+        cell_size = self.cell_size
+        min_cx = math.floor((x - radius) / cell_size) - 1
+        max_cx = math.floor((x + radius) / cell_size) + 1
+        min_cy = math.floor((y - radius) / cell_size) - 1
+        max_cy = math.floor((y + radius) / cell_size) + 1
+
+        cells = self.cells
+        seen = set()
+        for cy in range(min_cy, max_cy + 1):
+            for cx in range(min_cx, max_cx + 1):
+                bucket = cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for key, (category, entity) in bucket.items():
+                    if key in seen or (categories is not None and category not in categories):
+                        continue
+                    seen.add(key)
+                    yield category, entity
+
+    def query_list(self, x: float, y: float, radius: float, category: str) -> List[object]:
+        """Entities of one category near a point"""
+        return [entity for _, entity in self.query(x, y, radius, (category,))]
+
+    def _footprint(self, category: str, entity) -> Tuple[int, int, int, int]:
+        """Cell range covered by an entity - furniture spans its width and height"""
+        cell_size = self.cell_size
+        if category == 'furniture':
+            min_cx = math.floor((entity.x - 0.5) / cell_size)
+            min_cy = math.floor((entity.y - 0.5) / cell_size)
+            max_cx = math.floor((entity.x + getattr(entity, 'width', 1) - 0.5) / cell_size)
+            max_cy = math.floor((entity.y + getattr(entity, 'height', 1) - 0.5) / cell_size)
+            return (min_cx, min_cy, max_cx, max_cy)
+        cx = math.floor(entity.x / cell_size)
+        cy = math.floor(entity.y / cell_size)
+        return (cx, cy, cx, cy)
+
+    @staticmethod
+    def _cells_in(footprint: Tuple[int, int, int, int]) -> Iterator[Tuple[int, int]]:
+        min_cx, min_cy, max_cx, max_cy = footprint
+        for cy in range(min_cy, max_cy + 1):
+            for cx in range(min_cx, max_cx + 1):
+                yield (cx, cy)
+
+    def _membership_signature(self) -> Tuple:
+        """Identity and length of each indexed list, to detect membership changes"""
+        signature = []
+        for category in self.categories:
+            entities = getattr(self.owner, category, None)
+            signature.append(id(entities))
+            signature.append(len(entities) if entities is not None else 0)
+        return tuple(signature)
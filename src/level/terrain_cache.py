@@ -0,0 +1,182 @@
+"""
+Pre-rendered ground layer for the isometric renderer
+"""
+
+from collections import OrderedDict
+from typing import List, Optional, Set, Tuple
+
+import pygame
+
+from ..world.chunk import Chunk
+
+# Tiles per block side - a chunk is split into (CHUNK_SIZE / BLOCK_SIZE)^2 blocks
+BLOCK_SIZE = 8
+
+# Most block surfaces kept (a block is about 512x256 pixels, 0.5MB)
+MAX_BLOCKS = 96
+
+# Tiles drawn after a tile whose sprite can overlap it: building overlays only
+# reach into these neighbours, so a floor there is drawn per frame on top of them
+FRONT_NEIGHBOURS = ((1, 0), (-1, 1), (0, 1), (1, 1))
+
+
+class TerrainBlock:
+    """The ground of BLOCK_SIZE x BLOCK_SIZE tiles rendered onto one surface"""
+
+    def __init__(self, chunk: Chunk, surface: Optional[pygame.Surface], offset: Tuple[int, int],
+                 live: List[Tuple[int, int]], missing: Set[Tuple[int, int]]):
+        self.chunk = chunk
+        self.surface = surface
+        # Top-left of the surface relative to the screen position of the block's first tile
+        self.offset = offset
+        # World tiles left out of the surface and drawn every frame, in drawing order
+        self.live = live
+        # Neighbouring chunks that weren't loaded when the block was rendered
+        self.missing = missing
+
+
+class TerrainCache:
+    """
+    Cached ground surfaces for loaded chunks
+
+    Rendering the view tile by tile looks every tile up through the chunk
+    manager and blits its floor sprite, every frame, although the ground
+    almost never changes. The cache renders the floors of each block of
+    tiles once and the renderer blits a handful of block surfaces instead.
+    Building tiles and the tiles in front of them are left out of the
+    surfaces: their look depends on where the player is, so the renderer
+    still draws them per tile, in the same order as before (only where their
+    floor sprites overlap a cached neighbour's edge do they now end up on
+    top). Blocks are rebuilt when their chunk is reloaded, a neighbour that
+    wasn't loaded yet arrives or the tile sprites change, and
+    ChunkManager.set_tile edits drop the blocks they touch.
+    """
+
+    def __init__(self, chunk_manager, level, max_blocks: int = MAX_BLOCKS):
+        """
+        Initialize terrain cache
+
+        Args:
+            chunk_manager: ChunkManager providing loaded chunks
+            level: Level providing the tile sprites and building tile checks
+            max_blocks: Most block surfaces kept, least recently drawn dropped first
+        """
+        self.chunk_manager = chunk_manager
+        self.level = level
+        self.max_blocks = max_blocks
+        self.size = Chunk.CHUNK_SIZE
+        self.blocks: "OrderedDict[Tuple[int, int], TerrainBlock]" = OrderedDict()
+        self.sprites = None
+
+        # Metrics
+        self.built = 0
+        self.invalidated = 0
+
+        chunk_manager.tile_listeners.append(self)
+
+    def detach(self):
+        """Stop listening for tile changes"""
+        if self in self.chunk_manager.tile_listeners:
+            self.chunk_manager.tile_listeners.remove(self)
+
+    def get_block(self, block_x: int, block_y: int) -> Optional[TerrainBlock]:
+        """
+        Get a block of a loaded chunk, rendering it if needed
+
+        Args:
+            block_x: Block X coordinate (world tile X // BLOCK_SIZE)
+            block_y: Block Y coordinate
+
+        Returns:
+            The block, or None if its chunk isn't loaded (chunks are never loaded here)
+        """
+        if self.sprites is not self.level.tile_sprites:
+            # New sprites - every block was drawn with the old ones
+            self.blocks.clear()
+            self.sprites = self.level.tile_sprites
+
+        key = (block_x, block_y)
+        loaded = self.chunk_manager.loaded_chunks
+        chunk = loaded.get(((block_x * BLOCK_SIZE) // self.size, (block_y * BLOCK_SIZE) // self.size))
+        block = self.blocks.get(key)
+        if chunk is None or not chunk.tiles:
+            if block is not None:
+                del self.blocks[key]
+            return None
+        if (block is None or block.chunk is not chunk or
+                (block.missing and any(neighbour in loaded for neighbour in block.missing))):
+            block = self.blocks[key] = self.build_block(block_x, block_y, chunk)
+            self.built += 1
+            while len(self.blocks) > self.max_blocks:
+                self.blocks.popitem(last=False)
+        else:
+            self.blocks.move_to_end(key)
+        return block
+
+    def screen_position(self, block_x: int, block_y: int, block: TerrainBlock,
+                        camera_x: float, camera_y: float) -> Tuple[int, int]:
+        """Where the block's surface goes on screen - rounded the way tile rects are"""
+        anchor = pygame.Rect(0, 0, 1, 1)
+        anchor.center = self.level.iso_renderer.world_to_screen(block_x * BLOCK_SIZE, block_y * BLOCK_SIZE, camera_x, camera_y)
+        return anchor.x + block.offset[0], anchor.y + block.offset[1]
+
+    def build_block(self, block_x: int, block_y: int, chunk: Chunk) -> TerrainBlock:
+        """Render the floors of a block's static tiles and list the ones drawn per frame"""
+        level = self.level
+        iso_renderer = level.iso_renderer
+        origin_x, origin_y = block_x * BLOCK_SIZE, block_y * BLOCK_SIZE
+        origin_iso = iso_renderer.cart_to_iso(origin_x, origin_y)
+        missing = set()
+
+        floors = []
+        live = []
+        for y in range(origin_y, origin_y + BLOCK_SIZE):
+            for x in range(origin_x, origin_x + BLOCK_SIZE):
+                tile_type = self._tile_at(x, y, missing)
+                if self._is_live(x, y, tile_type, missing):
+                    live.append((x, y))
+                    continue
+                sprite = level.get_floor_sprite(tile_type)
+                if sprite:
+                    iso_x, iso_y = iso_renderer.cart_to_iso(x, y)
+                    rect = sprite.get_rect()
+                    rect.center = (iso_x - origin_iso[0], iso_y - origin_iso[1])
+                    floors.append((sprite, rect))
+
+        if not floors:
+            return TerrainBlock(chunk, None, (0, 0), live, missing)
+
+        bounds = floors[0][1].unionall([rect for _, rect in floors[1:]])
+        surface = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        for sprite, rect in floors:
+            surface.blit(sprite, rect.move(-bounds.x, -bounds.y))
+        return TerrainBlock(chunk, surface, bounds.topleft, live, missing)
+
+    def tile_changed(self, world_x: int, world_y: int, tile_type: int):
+        """ChunkManager listener: drop the blocks showing the tile or the tiles in front of it"""
+        keys = {(world_x // BLOCK_SIZE, world_y // BLOCK_SIZE)}
+        keys.update(((world_x + dx) // BLOCK_SIZE, (world_y + dy) // BLOCK_SIZE) for dx, dy in FRONT_NEIGHBOURS)
+        for key in keys:
+            if self.blocks.pop(key, None) is not None:
+                self.invalidated += 1
+
+    def _is_live(self, x: int, y: int, tile_type: int, missing: Set[Tuple[int, int]]) -> bool:
+        """Whether a tile is drawn per frame: a building tile, or in front of one"""
+        level = self.level
+        if level.is_simple_building_tile(tile_type):
+            return True
+        for dx, dy in FRONT_NEIGHBOURS:
+            behind = self._tile_at(x - dx, y - dy, missing)
+            if behind is not None and level.is_simple_building_tile(behind):
+                return True
+        return False
+
+    def _tile_at(self, x: int, y: int, missing: Set[Tuple[int, int]]) -> Optional[int]:
+        """Tile at world coordinates from loaded chunks only, noting chunks that aren't loaded"""
+        chunk_x, local_x = divmod(x, self.size)
+        chunk_y, local_y = divmod(y, self.size)
+        chunk = self.chunk_manager.loaded_chunks.get((chunk_x, chunk_y))
+        if chunk is None or not chunk.tiles:
+            missing.add((chunk_x, chunk_y))
+            return None
+        return chunk.tiles[local_y][local_x]
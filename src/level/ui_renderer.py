@@ -5,6 +5,39 @@ UI rendering functionality (bottom panel, XP bar, etc.)
 import pygame
 import math
 
+try:
+    from ..ui.retained_panel import RetainedPanel
+except ImportError:
+    from src.ui.retained_panel import RetainedPanel
+
+# Bottom panel layout
+UI_PANEL_HEIGHT = 150
+EQUIPMENT_X = 280
+SLOT_SIZE = 80
+SLOT_Y = 30
+ARMOR_X = EQUIPMENT_X + SLOT_SIZE + 30
+INVENTORY_BUTTON_X = ARMOR_X + SLOT_SIZE + 20
+
+
+def fit_text(font, text, max_width):
+    """
+    Shorten text with an ellipsis until it fits a width
+    
+    Args:
+        font: Font the text is drawn in
+        text: Text to fit
+        max_width: Widest the text may be, in pixels
+        
+    Returns:
+        The text, or as much of it as fits followed by "..."
+    """
+    if font.size(text)[0] <= max_width:
+        return text
+    truncated_text = text
+    while font.size(truncated_text + "...")[0] > max_width and len(truncated_text) > 0:
+        truncated_text = truncated_text[:-1]
+    return truncated_text + "..."
+
 
 class UIRendererMixin:
     """Mixin class for UI rendering functionality"""
@@ -14,35 +47,71 @@ class UIRendererMixin:
         screen_width = screen.get_width()
         screen_height = screen.get_height()
         
-        # Create UI panel at bottom
-        ui_height = 150
-        ui_panel = pygame.Surface((screen_width, ui_height))
-        ui_panel.fill((40, 40, 40))  # Dark gray background
+        # UI panel at bottom, kept between frames - only widgets whose values changed are redrawn
+        ui_height = UI_PANEL_HEIGHT
+        panel = getattr(self, '_ui_panel', None)
+        if panel is None or panel.size != (screen_width, ui_height):
+            panel = self._ui_panel = RetainedPanel((screen_width, ui_height), (40, 40, 40), (100, 100, 100))
+        
+        # Store button rect for click detection (adjust for screen position)
+        inv_button_x = INVENTORY_BUTTON_X
+        self.inventory_button_rect = pygame.Rect(inv_button_x, screen_height - ui_height + 20, 100, 40)
         
-        # Draw border
-        pygame.draw.rect(ui_panel, (100, 100, 100), (0, 0, screen_width, ui_height), 2)
+        # Right side - Game log integrated into HUD
+        log_x = inv_button_x + 120  # Start after inventory button
+        log_width = screen_width - log_x - 20  # Use remaining width with margin
+        log_height = ui_height - 20  # Use most of the UI height
+        log_rect = pygame.Rect(log_x, 10, log_width, log_height)
         
-        # Left side - Player stats with circular health/stamina bars
-        font = pygame.font.Font(None, 24)
-        small_font = pygame.font.Font(None, 20)
+        player = self.player
+        weapon = player.equipped_weapon
+        armor = player.equipped_armor
+        panel.update((
+            # Left side - Player stats with circular health/stamina bars
+            ("stats", pygame.Rect(2, 2, EQUIPMENT_X - 4, ui_height - 4),
+             (player.health, player.max_health, player.stamina, player.max_stamina, player.level, player.gold),
+             self.render_player_stats),
+            # Center-left - Equipment display
+            ("weapon", pygame.Rect(EQUIPMENT_X, 2, ARMOR_X - EQUIPMENT_X, ui_height - 4),
+             (weapon, weapon.name, getattr(weapon, 'sprite', None)) if weapon else None,
+             self.render_weapon_slot),
+            ("armor", pygame.Rect(ARMOR_X, 2, inv_button_x - ARMOR_X, ui_height - 4),
+             (armor, armor.name, getattr(armor, 'sprite', None)) if armor else None,
+             self.render_armor_slot),
+            ("inventory", pygame.Rect(inv_button_x, 20, 100, 40), None, self.render_inventory_button),
+            ("log", log_rect, self.get_game_log_state(log_height, screen_height),
+             lambda surface: self.render_game_log_panel(surface, log_rect))
+        ))
+        
+        # Blit the entire UI panel to screen
+        screen.blit(panel.surface, (0, screen_height - ui_height))
+    
+    def render_player_stats(self, surface):
+        """Render the circular health and stamina bars with the player's level and gold"""
+        assets = self.asset_loader
+        small_font = assets.get_font(20)
         
         # Render circular health and stamina bars
-        self.render_circular_bars(ui_panel, 20, 30)
+        self.render_circular_bars(surface, 20, 30)
         
         # Player level and gold (moved to top right of circles area)
         stats_x = 160
         level_text = f"Level {self.player.level}"
         gold_text = f"Gold: {self.player.gold}"
         
-        level_surface = small_font.render(level_text, True, (255, 215, 0))  # Gold color for level
-        gold_surface = small_font.render(gold_text, True, (255, 215, 0))   # Gold color for gold
-        ui_panel.blit(level_surface, (stats_x, 15))
-        ui_panel.blit(gold_surface, (stats_x, 35))
-        
-        # Center-left - Equipment display
-        equipment_x = 280
-        slot_size = 80
-        slot_y = 30
+        level_surface = assets.render_text(small_font, level_text, (255, 215, 0))  # Gold color for level
+        gold_surface = assets.render_text(small_font, gold_text, (255, 215, 0))   # Gold color for gold
+        surface.blit(level_surface, (stats_x, 15))
+        surface.blit(gold_surface, (stats_x, 35))
+    
+    def render_weapon_slot(self, ui_panel):
+        """Render the equipped weapon slot with its label and name"""
+        assets = self.asset_loader
+        font = assets.get_font(24)
+        small_font = assets.get_font(20)
+        equipment_x = EQUIPMENT_X
+        slot_size = SLOT_SIZE
+        slot_y = SLOT_Y
         
         # Current weapon display
         weapon_rect = pygame.Rect(equipment_x, slot_y, slot_size, slot_size)
@@ -50,7 +119,7 @@ class UIRendererMixin:
         pygame.draw.rect(ui_panel, (100, 100, 100), weapon_rect, 2)
         
         # Weapon label above slot
-        weapon_text = font.render("Weapon", True, (255, 255, 255))
+        weapon_text = assets.render_text(font, "Weapon", (255, 255, 255))
         ui_panel.blit(weapon_text, (equipment_x, slot_y - 25))
         
         if self.player.equipped_weapon:
@@ -65,21 +134,29 @@ class UIRendererMixin:
                 pygame.draw.rect(ui_panel, (192, 192, 192), (equipment_x + 20, slot_y + 15, slot_size - 40, slot_size - 20))
             
             # Weapon name below slot
-            weapon_name = small_font.render(self.player.equipped_weapon.name[:12], True, (255, 255, 255))
+            weapon_name = assets.render_text(small_font, self.player.equipped_weapon.name[:12], (255, 255, 255))
             ui_panel.blit(weapon_name, (equipment_x, slot_y + slot_size + 5))
         else:
-            no_weapon = small_font.render("No Weapon", True, (150, 150, 150))
+            no_weapon = assets.render_text(small_font, "No Weapon", (150, 150, 150))
             no_weapon_rect = no_weapon.get_rect(center=weapon_rect.center)
             ui_panel.blit(no_weapon, no_weapon_rect)
+    
+    def render_armor_slot(self, ui_panel):
+        """Render the equipped armor slot with its label and name"""
+        assets = self.asset_loader
+        font = assets.get_font(24)
+        small_font = assets.get_font(20)
+        armor_x = ARMOR_X
+        slot_size = SLOT_SIZE
+        slot_y = SLOT_Y
         
         # Current armor display
-        armor_x = equipment_x + slot_size + 30
         armor_rect = pygame.Rect(armor_x, slot_y, slot_size, slot_size)
         pygame.draw.rect(ui_panel, (60, 60, 60), armor_rect)
         pygame.draw.rect(ui_panel, (100, 100, 100), armor_rect, 2)
         
         # Armor label above slot
-        armor_text = font.render("Armor", True, (255, 255, 255))
+        armor_text = assets.render_text(font, "Armor", (255, 255, 255))
         ui_panel.blit(armor_text, (armor_x, slot_y - 25))
         
         if self.player.equipped_armor:
@@ -94,41 +171,30 @@ class UIRendererMixin:
                 pygame.draw.ellipse(ui_panel, (139, 69, 19), (armor_x + 20, slot_y + 15, slot_size - 40, slot_size - 20))
             
             # Armor name below slot
-            armor_name = small_font.render(self.player.equipped_armor.name[:12], True, (255, 255, 255))
+            armor_name = assets.render_text(small_font, self.player.equipped_armor.name[:12], (255, 255, 255))
             ui_panel.blit(armor_name, (armor_x, slot_y + slot_size + 5))
         else:
-            no_armor = small_font.render("No Armor", True, (150, 150, 150))
+            no_armor = assets.render_text(small_font, "No Armor", (150, 150, 150))
             no_armor_rect = no_armor.get_rect(center=armor_rect.center)
             ui_panel.blit(no_armor, no_armor_rect)
-        
-        # Inventory button
-        inv_button_x = armor_x + slot_size + 20
-        inv_button = pygame.Rect(inv_button_x, 20, 100, 40)
+    
+    def render_inventory_button(self, ui_panel):
+        """Render the inventory button"""
+        inv_button = pygame.Rect(INVENTORY_BUTTON_X, 20, 100, 40)
         pygame.draw.rect(ui_panel, (80, 80, 80), inv_button)
         pygame.draw.rect(ui_panel, (120, 120, 120), inv_button, 2)
         
-        inv_text = font.render("Inventory", True, (255, 255, 255))
+        inv_text = self.asset_loader.render_text(self.asset_loader.get_font(24), "Inventory", (255, 255, 255))
         text_rect = inv_text.get_rect(center=inv_button.center)
         ui_panel.blit(inv_text, text_rect)
-        
-        # Store button rect for click detection (adjust for screen position)
-        self.inventory_button_rect = pygame.Rect(inv_button_x, screen_height - ui_height + 20, 100, 40)
-        
-        # Right side - Game log integrated into HUD
-        log_x = inv_button_x + 120  # Start after inventory button
-        log_width = screen_width - log_x - 20  # Use remaining width with margin
-        log_height = ui_height - 20  # Use most of the UI height
-        
-        # Draw game log background
-        log_rect = pygame.Rect(log_x, 10, log_width, log_height)
+    
+    def render_game_log_panel(self, ui_panel, log_rect):
+        """Render the game log's background and messages"""
         pygame.draw.rect(ui_panel, (50, 50, 50), log_rect)
         pygame.draw.rect(ui_panel, (100, 100, 100), log_rect, 2)
         
         # Render game log content within the HUD
-        self.render_game_log_in_hud(ui_panel, log_x, 10, log_width, log_height)
-        
-        # Blit the entire UI panel to screen
-        screen.blit(ui_panel, (0, screen_height - ui_height))
+        self.render_game_log_in_hud(ui_panel, log_rect.x, log_rect.y, log_rect.width, log_rect.height)
     
     def render_circular_bars(self, surface, x, y):
         """Render circular health and stamina bars"""
@@ -160,13 +226,14 @@ class UIRendererMixin:
         
         # Health text - show current/max format
         health_text = f"{self.player.health}/{self.player.max_health}"
-        font = pygame.font.Font(None, 18)  # Smaller font to fit the text
-        text_surface = font.render(health_text, True, (255, 255, 255))
+        assets = self.asset_loader
+        font = assets.get_font(18)  # Smaller font to fit the text
+        text_surface = assets.render_text(font, health_text, (255, 255, 255))
         text_rect = text_surface.get_rect(center=health_center)
         surface.blit(text_surface, text_rect)
         
         # Health label
-        health_label = font.render("Health", True, (255, 255, 255))
+        health_label = assets.render_text(font, "Health", (255, 255, 255))
         surface.blit(health_label, (x, y + radius * 2 + 10))
         
         # Stamina circle (blue) - using stamina instead of mana
@@ -193,12 +260,12 @@ class UIRendererMixin:
         
         # Stamina text - show current/max format
         stamina_text = f"{self.player.stamina}/{self.player.max_stamina}"
-        text_surface = font.render(stamina_text, True, (255, 255, 255))
+        text_surface = assets.render_text(font, stamina_text, (255, 255, 255))
         text_rect = text_surface.get_rect(center=stamina_center)
         surface.blit(text_surface, text_rect)
         
         # Stamina label
-        stamina_label = font.render("Stamina", True, (255, 255, 255))
+        stamina_label = assets.render_text(font, "Stamina", (255, 255, 255))
         surface.blit(stamina_label, (x + radius * 2, y + radius * 2 + 10))
     
     def render_xp_bar(self, screen):
@@ -211,12 +278,28 @@ class UIRendererMixin:
         bar_x = 20
         bar_y = 10
         
+        # The bar is drawn on its own surface, again only when the XP changes
+        panel = getattr(self, '_xp_bar_panel', None)
+        if panel is None or panel.size != (bar_width, bar_height):
+            panel = self._xp_bar_panel = RetainedPanel((bar_width, bar_height), (40, 40, 40))
+        panel.update((
+            ("xp", pygame.Rect(0, 0, bar_width, bar_height), (self.player.experience, self.player.experience_to_next),
+             self.draw_xp_bar),
+        ))
+        screen.blit(panel.surface, (bar_x, bar_y))
+    
+    def draw_xp_bar(self, surface):
+        """Draw the experience bar filling a surface"""
+        bar_width, bar_height = surface.get_size()
+        bar_x = 0
+        bar_y = 0
+        
         # Calculate XP percentage
         xp_percentage = self.player.experience / self.player.experience_to_next
         
         # Draw background
-        pygame.draw.rect(screen, (40, 40, 40), (bar_x, bar_y, bar_width, bar_height))
-        pygame.draw.rect(screen, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height), 2)
+        pygame.draw.rect(surface, (40, 40, 40), (bar_x, bar_y, bar_width, bar_height))
+        pygame.draw.rect(surface, (100, 100, 100), (bar_x, bar_y, bar_width, bar_height), 2)
         
         # Draw XP fill
         if xp_percentage > 0:
@@ -229,35 +312,68 @@ class UIRendererMixin:
                     int(215 * intensity * 0.8),
                     int(0 * intensity * 0.8)
                 )
-                pygame.draw.line(screen, color, (bar_x + i, bar_y + 2), (bar_x + i, bar_y + bar_height - 2))
+                pygame.draw.line(surface, color, (bar_x + i, bar_y + 2), (bar_x + i, bar_y + bar_height - 2))
         
         # Draw XP text
-        font = pygame.font.Font(None, 18)
+        font = self.asset_loader.get_font(18)
         xp_text = f"XP: {self.player.experience}/{self.player.experience_to_next}"
-        text_surface = font.render(xp_text, True, (255, 255, 255))
+        text_surface = self.asset_loader.render_text(font, xp_text, (255, 255, 255))
         text_rect = text_surface.get_rect(center=(bar_x + bar_width//2, bar_y + bar_height//2))
-        screen.blit(text_surface, text_rect)
+        surface.blit(text_surface, text_rect)
+    
+    def get_hud_game_log(self):
+        """The game log shown in the bottom panel, or None"""
+        if hasattr(self.player, 'game_log') and self.player.game_log:
+            return self.player.game_log
+        elif hasattr(self, 'game') and hasattr(self.game, 'game_log'):
+            return self.game.game_log
+        return None
+    
+    def get_game_log_state(self, log_height, screen_height):
+        """
+        What the game log in the bottom panel shows, to tell when it needs redrawing
+        
+        Args:
+            log_height: Height of the log area
+            screen_height: Screen height (the scroll arrows' click rects depend on it)
+            
+        Returns:
+            Comparable tuple of the scroll state and the text, type and alpha of each line on show
+        """
+        game_log = self.get_hud_game_log()
+        if not game_log:
+            return None
+        visible_messages = min(6, (log_height - 25) // 20)
+        faded = game_log.scroll_offset == 0
+        lines = tuple((message["text"], message["type"], message["alpha"] if faded else 255)
+                      for message in self.get_shown_log_messages(game_log, visible_messages))
+        return (screen_height, game_log.scroll_offset, len(game_log.messages), lines)
+    
+    def get_shown_log_messages(self, game_log, visible_messages):
+        """The messages on show at the log's scroll position, oldest first"""
+        if len(game_log.messages) <= visible_messages:
+            return game_log.messages
+        start_index = len(game_log.messages) - visible_messages - game_log.scroll_offset
+        end_index = len(game_log.messages) - game_log.scroll_offset
+        return game_log.messages[start_index:end_index]
     
     def render_game_log_in_hud(self, ui_panel, log_x, log_y, log_width, log_height):
         """Render game log content within the HUD panel"""
         # Get the game log
-        game_log = None
-        if hasattr(self.player, 'game_log') and self.player.game_log:
-            game_log = self.player.game_log
-        elif hasattr(self, 'game') and hasattr(self.game, 'game_log'):
-            game_log = self.game.game_log
+        game_log = self.get_hud_game_log()
         
         if not game_log:
             return
         
         # Draw title
-        font = pygame.font.Font(None, 20)
-        small_font = pygame.font.Font(None, 16)
+        assets = self.asset_loader
+        font = assets.get_font(20)
+        small_font = assets.get_font(16)
         
         title_text = "Game Log"
         if game_log.scroll_offset > 0:
             title_text += f" (↑{game_log.scroll_offset})"
-        title_surface = small_font.render(title_text, True, (200, 200, 200))
+        title_surface = assets.render_text(small_font, title_text, (200, 200, 200))
         ui_panel.blit(title_surface, (log_x + 5, log_y + 2))
         
         # Calculate visible messages
@@ -304,32 +420,22 @@ class UIRendererMixin:
             game_log.scroll_down_rect = None
         
         # Calculate which messages to show
-        if len(game_log.messages) <= visible_messages:
-            messages_to_show = game_log.messages
-        else:
-            start_index = len(game_log.messages) - visible_messages - game_log.scroll_offset
-            end_index = len(game_log.messages) - game_log.scroll_offset
-            messages_to_show = game_log.messages[start_index:end_index]
+        messages_to_show = self.get_shown_log_messages(game_log, visible_messages)
+        
+        # Truncate long messages - once per message, kept with it until the log width changes
+        max_width = log_width - 30 if len(game_log.messages) > visible_messages else log_width - 10
         
         # Draw messages
         for i, message in enumerate(messages_to_show):
             y_pos = log_y + 18 + (i * message_height)
             color = game_log.colors.get(message["type"], game_log.colors["default"])
             
-            # Apply alpha for fading
-            if message["alpha"] < 255 and game_log.scroll_offset == 0:
-                color = (*color, message["alpha"])
-                text_surface = font.render(message["text"], True, color)
-                text_surface.set_alpha(message["alpha"])
-            else:
-                text_surface = font.render(message["text"], True, color)
+            fitted = message.get("fitted")
+            if fitted is None or fitted[0] != max_width:
+                fitted = message["fitted"] = (max_width, fit_text(font, message["text"], max_width))
             
-            # Truncate long messages
-            max_width = log_width - 30 if len(game_log.messages) > visible_messages else log_width - 10
-            if text_surface.get_width() > max_width:
-                truncated_text = message["text"]
-                while font.size(truncated_text + "...")[0] > max_width and len(truncated_text) > 0:
-                    truncated_text = truncated_text[:-1]
-                text_surface = font.render(truncated_text + "...", True, color)
+            # Apply alpha for fading
+            alpha = message["alpha"] if game_log.scroll_offset == 0 else 255
+            text_surface = assets.render_text(font, fitted[1], color, alpha)
             
             ui_panel.blit(text_surface, (log_x + 5, y_pos))
\ No newline at end of file
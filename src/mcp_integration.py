@@ -3,26 +3,57 @@ MCP Integration for RPG Game
 Handles communication between the game and the MCP server
 """
 
-import json
-import os
 import time
+from concurrent.futures import Future
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 
+from .systems.command_bus import CommandBus, CommandMirror
+
 class MCPActionHandler:
     """Handles MCP actions from AI NPCs"""
     
-    def __init__(self, game_instance=None):
+    def __init__(self, game_instance=None, command_bus: Optional[CommandBus] = None,
+                 mirror: Optional[CommandMirror] = None):
+        """
+        Initialize the handler
+        
+        Args:
+            game_instance: Game whose player and level actions apply to
+            command_bus: Bus the game loop drains (defaults to the game's, or a new one)
+            mirror: Debug mirror for the state files below (None to skip writing them)
+        """
         self.game = game_instance
-        self.actions_queue_file = Path("mcp_actions_queue.json")
+        self.command_bus = command_bus or getattr(game_instance, 'command_bus', None) or CommandBus()
+        self.mirror = mirror
         self.game_state_file = Path("game_state.json")
         self.world_data_file = Path("world_data.json")
+    
+    def submit_action(self, action_data: Dict[str, Any], player=None, level=None) -> Future:
+        """
+        Queue an action to run on the main thread - safe to call from any thread
         
-        # Track processed actions to avoid duplicates
-        self.processed_actions = set()
+        Args:
+            action_data: {"action_type", "parameters", "npc_id"}
+            player: Player to act on (defaults to the game's player when the action runs)
+            level: Level to act on (defaults to the game's level when the action runs)
+            
+        Returns:
+            Future that resolves to whether the action was processed
+        """
+        return self.command_bus.submit(action_data.get('action_type', 'action'),
+                                       self._run_action, action_data, player, level)
     
-    def update_world_data(self, player=None, level=None, npcs=None):
-        """Update world data file for MCP server"""
+    def _run_action(self, action_data: Dict[str, Any], player=None, level=None) -> bool:
+        """Run a submitted action against the game's current player and level"""
+        return self._process_action(
+            action_data,
+            player or getattr(self.game, 'player', None),
+            level or getattr(self.game, 'current_level', None)
+        )
+    
+    def update_world_data(self, player=None, level=None, npcs=None) -> Optional[Dict[str, Any]]:
+        """Collect world data for MCP, mirrored to world_data.json when debugging"""
         try:
             world_data = {
                 "timestamp": time.time(),
@@ -36,17 +67,19 @@ class MCPActionHandler:
                 "relationships": self._get_relationships(player)
             }
             
-            with open(self.world_data_file, 'w') as f:
-                json.dump(world_data, f, indent=2)
+            if self.mirror:
+                self.mirror.write_json(str(self.world_data_file), world_data)
+            return world_data
                 
         except Exception as e:
             print(f"Error updating world data: {e}")
+            return None
     
-    def update_game_state(self, player=None):
-        """Update game state file for MCP server"""
+    def update_game_state(self, player=None) -> Optional[Dict[str, Any]]:
+        """Collect game state for MCP, mirrored to game_state.json when debugging"""
         try:
             if not player:
-                return
+                return None
                 
             player_data = {
                 "name": getattr(player, 'name', 'Player'),
@@ -66,48 +99,20 @@ class MCPActionHandler:
                 "player": player_data
             }
             
-            with open(self.game_state_file, 'w') as f:
-                json.dump(game_state, f, indent=2)
+            if self.mirror:
+                self.mirror.write_json(str(self.game_state_file), game_state)
+            return game_state
                 
         except Exception as e:
             print(f"Error updating game state: {e}")
+            return None
     
-    def process_pending_actions(self, player=None, level=None):
-        """Process pending MCP actions"""
-        if not self.actions_queue_file.exists():
-            return
-        
-        try:
-            with open(self.actions_queue_file, 'r') as f:
-                actions = json.load(f)
-            
-            processed_any = False
-            remaining_actions = []
-            
-            for action_data in actions:
-                action_id = f"{action_data.get('timestamp', 0)}_{action_data.get('action_type', '')}"
-                
-                if action_id in self.processed_actions:
-                    continue
-                
-                if self._process_action(action_data, player, level):
-                    self.processed_actions.add(action_id)
-                    processed_any = True
-                    print(f"✅ Processed MCP action: {action_data.get('action_type')}")
-                else:
-                    # Keep unprocessed actions for retry
-                    remaining_actions.append(action_data)
-            
-            # Update actions file with remaining actions
-            if processed_any:
-                with open(self.actions_queue_file, 'w') as f:
-                    json.dump(remaining_actions, f, indent=2)
-                    
-        except Exception as e:
-            print(f"Error processing MCP actions: {e}")
+    def process_pending_actions(self, player=None, level=None) -> int:
+        """Run queued actions - the game loop does this each frame by draining the command bus"""
+        return self.command_bus.drain()
     
     def _process_action(self, action_data: Dict[str, Any], player=None, level=None) -> bool:
-        """Process a single MCP action"""
+        """Process a single MCP action (on the main thread)"""
         action_type = action_data.get('action_type')
         parameters = action_data.get('parameters', {})
         npc_id = action_data.get('npc_id')
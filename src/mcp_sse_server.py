@@ -14,6 +14,8 @@ import uuid
 import random
 from typing import Dict, Any, Optional, List
 
+from .systems.state_snapshot import GameSnapshot, capture_snapshot, player_info, world_info
+
 try:
     from fastapi import FastAPI, HTTPException, Request
     from fastapi.responses import StreamingResponse
@@ -34,6 +36,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Tools answered from the published game snapshot on the server thread
+SNAPSHOT_TOOLS = ("get_player_info", "get_world_info")
+
 class MCPSSEServer:
     """MCP-compliant SSE server for the RPG game"""
     
@@ -49,6 +54,12 @@ class MCPSSEServer:
         self.server_thread = None
         self.server_info = None
         
+        # Tool calls run on the game loop, which drains this bus every frame
+        self.command_bus = getattr(game_instance, 'command_bus', None)
+        self.tool_timeout = 10.0
+        # Read-only tools use the snapshot the game loop publishes instead
+        self.snapshots = getattr(game_instance, 'snapshots', None)
+        
         # Initialize item registry for asset-aware quest generation
         self.item_registry = None
         self._initialize_item_registry()
@@ -359,69 +370,73 @@ class MCPSSEServer:
             }
     
     async def _call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute a tool call"""
+        """Execute a tool call on the game's main thread and wait for the result"""
         logger.info(f"Calling tool: {tool_name} with args: {arguments}")
         
+        if tool_name in SNAPSHOT_TOOLS and self.snapshots is not None:
+            return self._run_tool(tool_name, arguments)
+        
+        if tool_name == "give_item" and self.snapshots is not None:
+            # Turn away requests the game would refuse without waiting for a frame
+            refusal = self._check_give_item(self.snapshots.latest(), arguments)
+            if refusal:
+                return refusal
+        
+        if self.command_bus is None:
+            return self._run_tool(tool_name, arguments)
+        
+        future = self.command_bus.submit(tool_name, self._run_tool, tool_name, arguments)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), self.tool_timeout)
+        except asyncio.TimeoutError:
+            future.cancel()
+            return {"error": f"Game did not run {tool_name} in time", "success": False}
+    
+    def _run_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a tool - touches game objects, so only call on the main thread"""
         if tool_name == "get_player_info":
-            return await self._get_player_info()
+            return self._get_player_info()
         elif tool_name == "open_shop":
-            return await self._open_shop(arguments.get("shop_type", "general"))
+            return self._open_shop(arguments.get("shop_type", "general"))
         elif tool_name == "give_item":
-            return await self._give_item(arguments["item_name"], arguments.get("quantity", 1))
+            return self._give_item(arguments["item_name"], arguments.get("quantity", 1))
         elif tool_name == "create_quest":
-            return await self._create_quest(arguments)
+            return self._create_quest(arguments)
         elif tool_name == "get_world_info":
-            return await self._get_world_info()
+            return self._get_world_info()
         elif tool_name == "send_message":
-            return await self._send_message(arguments["message"], arguments.get("type", "info"))
+            return self._send_message(arguments["message"], arguments.get("type", "info"))
         else:
             raise ValueError(f"Tool {tool_name} not implemented")
     
-    # Tool implementation methods (same as before)
-    async def _get_player_info(self) -> Dict[str, Any]:
-        """Get player information"""
-        if not hasattr(self.game, 'player') or self.game.player is None:
+    def _snapshot(self) -> GameSnapshot:
+        """Latest published game snapshot (captured now if the game doesn't publish them)"""
+        if self.snapshots is not None:
+            return self.snapshots.latest()
+        return capture_snapshot(self.game)
+    
+    @staticmethod
+    def _check_give_item(snapshot: GameSnapshot, arguments: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Refusal for a give_item call the snapshot shows can't succeed, or None"""
+        item_name = arguments.get("item_name")
+        quantity = arguments.get("quantity", 1)
+        if not snapshot.has_player:
             return {"error": "Player not available", "success": False}
-        
-        player = self.game.player
-        
-        # Get inventory count safely
-        inventory_count = 0
-        if hasattr(player, 'inventory'):
-            if hasattr(player.inventory, 'items'):
-                inventory_count = len(player.inventory.items)
-            elif hasattr(player.inventory, '__len__'):
-                inventory_count = len(player.inventory)
-        
-        # Get equipped items safely
-        equipped_items = {}
-        if hasattr(player, 'equipped_weapon') and player.equipped_weapon:
-            equipped_items['weapon'] = player.equipped_weapon.name
-        if hasattr(player, 'equipped_armor') and player.equipped_armor:
-            equipped_items['armor'] = player.equipped_armor.name
-        
-        return {
-            "success": True,
-            "player": {
-                "health": getattr(player, 'health', 100),
-                "max_health": getattr(player, 'max_health', 100),
-                "level": getattr(player, 'level', 1),
-                "experience": getattr(player, 'experience', 0),
-                "gold": getattr(player, 'gold', 0),
-                "attack_damage": getattr(player, 'attack_damage', 25),
-                "defense": getattr(player, 'defense', 5),
-                "stamina": getattr(player, 'stamina', 50),
-                "max_stamina": getattr(player, 'max_stamina', 50),
-                "position": {
-                    "x": getattr(player, 'x', 0),
-                    "y": getattr(player, 'y', 0)
-                },
-                "inventory_count": inventory_count,
-                "equipped_items": equipped_items
+        if snapshot.inventory_space < quantity:
+            return {
+                "success": False,
+                "error": "Player inventory is full",
+                "item_name": item_name,
+                "quantity": quantity
             }
-        }
+        return None
     
-    async def _open_shop(self, shop_type: str) -> Dict[str, Any]:
+    # Tool implementation methods (same as before)
+    def _get_player_info(self) -> Dict[str, Any]:
+        """Get player information"""
+        return player_info(self._snapshot())
+    
+    def _open_shop(self, shop_type: str) -> Dict[str, Any]:
         """Open shop interface"""
         print(f"🛒 [MCP] open_shop called with type: {shop_type}")
         
@@ -461,7 +476,7 @@ class MCPSSEServer:
                 "ui_opened": False
             }
     
-    async def _give_item(self, item_name: str, quantity: int) -> Dict[str, Any]:
+    def _give_item(self, item_name: str, quantity: int) -> Dict[str, Any]:
         """Give item to player"""
         if not hasattr(self.game, 'player') or self.game.player is None:
             return {"error": "Player not available", "success": False}
@@ -579,7 +594,7 @@ class MCPSSEServer:
         # Default to consumable if not found
         return item_map.get(item_name.lower(), {"type": "consumable", "effect": {"health": 10}, "value": 10})
     
-    async def _create_quest(self, quest_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _create_quest(self, quest_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new quest with dynamic spawning support"""
         import re  # Import re module at the top of the function
         
@@ -889,21 +904,11 @@ class MCPSSEServer:
         else:
             return "Health Potion"  # Safe fallback
     
-    async def _get_world_info(self) -> Dict[str, Any]:
+    def _get_world_info(self) -> Dict[str, Any]:
         """Get world information"""
-        return {
-            "success": True,
-            "world": {
-                "current_level": "Town Square",
-                "time_of_day": "Day",
-                "weather": "Clear",
-                "nearby_npcs": [],
-                "nearby_items": [],
-                "available_actions": ["move", "interact", "inventory"]
-            }
-        }
+        return world_info(self._snapshot())
     
-    async def _send_message(self, message: str, msg_type: str) -> Dict[str, Any]:
+    def _send_message(self, message: str, msg_type: str) -> Dict[str, Any]:
         """Send message to game log"""
         if hasattr(self.game, 'game_log') and self.game.game_log:
             self.game.game_log.add_message(message)
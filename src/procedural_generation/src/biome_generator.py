@@ -5,7 +5,15 @@ Handles the creation of biome maps using noise functions
 
 import random
 import math
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Sequence
+
+# NumPy is optional - without it the pure Python backend is used
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 
 
 class BiomeGenerator:
@@ -47,7 +55,13 @@ class BiomeGenerator:
         }
     }
     
-    def __init__(self, width: int, height: int, seed: int = None):
+    # Biome ids used by the array backend, in noise threshold order
+    BIOME_IDS = ('DESERT', 'PLAINS', 'FOREST', 'SWAMP', 'SNOW')
+    BIOME_THRESHOLDS = (0.12, 0.32, 0.52, 0.72)
+    SECONDARY_CHANCE = 0.15
+    WATER_TILE = 3
+    
+    def __init__(self, width: int, height: int, seed: int = None, backend: str = None):
         """
         Initialize biome generator
         
@@ -55,13 +69,26 @@ class BiomeGenerator:
             width: World width in tiles
             height: World height in tiles
             seed: Random seed for deterministic generation
+            backend: 'numpy' or 'python'; defaults to numpy when it is installed
         """
         self.width = width
         self.height = height
-        self.seed = seed or random.randint(0, 1000000)
+        self.seed = seed if seed is not None else random.randint(0, 1000000)
+        
+        if backend is None:
+            backend = 'numpy' if NUMPY_AVAILABLE else 'python'
+        if backend == 'numpy' and not NUMPY_AVAILABLE:
+            raise ImportError("The numpy biome backend requires numpy to be installed")
+        if backend not in ('numpy', 'python'):
+            raise ValueError(f"Unknown biome backend: {backend}")
+        self.backend = backend
         
         # Initialize random with seed
-        random.seed(self.seed)
+        self.rng = random.Random(self.seed)
+        
+        # Biome id array behind the last list-of-lists map, so generate_tiles can skip re-encoding
+        self._last_biome_map = None
+        self._last_biome_ids = None
         
         print(f"BiomeGenerator initialized with seed: {self.seed}")
     
@@ -72,6 +99,14 @@ class BiomeGenerator:
         Returns:
             2D list of biome names
         """
+        if self.backend == 'numpy':
+            biome_ids = self.generate_biome_ids()
+            names = self.BIOME_IDS
+            biome_map = [[names[biome_id] for biome_id in row] for row in biome_ids.tolist()]
+            self._last_biome_map = biome_map
+            self._last_biome_ids = biome_ids
+            return biome_map
+        
         biome_map = []
         
         for y in range(self.height):
@@ -144,6 +179,13 @@ class BiomeGenerator:
         Returns:
             2D list of tile type integers
         """
+        if self.backend == 'numpy':
+            if biome_map is self._last_biome_map:
+                biome_ids = self._last_biome_ids
+            else:
+                biome_ids = self.encode_biome_map(biome_map)
+            return self.generate_tile_ids(biome_ids).tolist()
+        
         tiles = []
         
         for y in range(self.height):
@@ -156,11 +198,11 @@ class BiomeGenerator:
                 tile_type = biome_config['primary']
                 
                 # Add some variation with secondary tiles
-                if random.random() < 0.15:  # 15% chance for secondary
+                if self.rng.random() < 0.15:  # 15% chance for secondary
                     tile_type = biome_config['secondary']
                 
                 # Add water features
-                if random.random() < biome_config['water_chance']:
+                if self.rng.random() < biome_config['water_chance']:
                     tile_type = 3  # TILE_WATER
                 
                 row.append(tile_type)
@@ -172,6 +214,61 @@ class BiomeGenerator:
         
         return tiles
     
+    def generate_biome_ids(self) -> "np.ndarray":
+        """
+        Generate the biome map as a uint8 array of indices into BIOME_IDS
+        
+        Returns:
+            Array of shape (height, width)
+        """
+        return generate_biome_id_batch([self.seed], self.width, self.height)[0]
+    
+    def generate_tile_ids(self, biome_ids: "np.ndarray") -> "np.ndarray":
+        """
+        Generate the tile grid for a biome id array
+        
+        Draws come from a numpy Generator whose MT19937 state is copied from
+        self.rng and copied back afterwards, so the result is identical to the
+        Python backend and later draws from self.rng continue the same stream.
+        
+        Args:
+            biome_ids: uint8 array of indices into BIOME_IDS
+            
+        Returns:
+            uint8 array of tile types with the same shape
+        """
+        bit_generator = np.random.MT19937()
+        state = self.rng.getstate()
+        bit_generator.state = {
+            'bit_generator': 'MT19937',
+            'state': {'key': np.array(state[1][:-1], dtype=np.uint32), 'pos': state[1][-1]}
+        }
+        generator = np.random.Generator(bit_generator)
+        
+        # Two draws per tile in row-major order: secondary first, then water
+        draws = generator.random(biome_ids.shape + (2,))
+        
+        mt_state = bit_generator.state['state']
+        self.rng.setstate((state[0], tuple(int(k) for k in mt_state['key']) + (int(mt_state['pos']),), state[2]))
+        
+        primary, secondary, water_chance = _biome_lookup_tables()
+        tiles = np.where(draws[..., 0] < self.SECONDARY_CHANCE, secondary[biome_ids], primary[biome_ids])
+        tiles[draws[..., 1] < water_chance[biome_ids]] = self.WATER_TILE
+        return tiles
+    
+    def encode_biome_map(self, biome_map: List[List[str]]) -> "np.ndarray":
+        """
+        Convert a list-of-lists biome map into a uint8 biome id array
+        
+        Args:
+            biome_map: 2D list of biome names
+            
+        Returns:
+            uint8 array of indices into BIOME_IDS
+        """
+        index = {name: i for i, name in enumerate(self.BIOME_IDS)}
+        return np.array([[index[biome] for biome in row] for row in biome_map], dtype=np.uint8)
+    
     def get_biome_stats(self, biome_map: List[List[str]]) -> Dict[str, int]:
         """
         Get statistics about biome distribution
@@ -190,3 +287,48 @@ class BiomeGenerator:
                 biome_counts[biome] += 1
         
         return biome_counts
+
+
+def generate_biome_id_batch(seeds: Sequence[int], width: int, height: int) -> "np.ndarray":
+    """
+    Compute biome ids for several chunks at once
+    
+    Evaluates the same noise as BiomeGenerator.simple_noise over a
+    (len(seeds), height, width) grid and thresholds it into BIOME_IDS indices.
+    
+    Args:
+        seeds: One biome seed per chunk
+        width: Chunk width in tiles
+        height: Chunk height in tiles
+        
+    Returns:
+        uint8 array of shape (len(seeds), height, width)
+    """
+    seed = np.asarray(seeds, dtype=np.float64).reshape(-1, 1, 1)
+    x = np.arange(width, dtype=np.float64).reshape(1, 1, -1)
+    y = np.arange(height, dtype=np.float64).reshape(1, -1, 1)
+    
+    # Same terms and evaluation order as simple_noise so results match exactly
+    large_scale = (np.sin(x * 0.05 + seed * 0.001) + np.cos(y * 0.05 + seed * 0.002)) / 2.0
+    medium_scale = (np.sin(x * 0.1 + y * 0.1 + seed * 0.003) + np.cos(x * 0.08 - y * 0.12 + seed * 0.004)) / 2.0
+    small_scale = (np.sin(x * 0.2 + seed * 0.005) + np.cos(y * 0.2 + seed * 0.006)) / 2.0
+    combined = (large_scale * 0.6 + medium_scale * 0.3 + small_scale * 0.1)
+    noise = (combined + 1) / 2
+    
+    return np.digitize(noise, BiomeGenerator.BIOME_THRESHOLDS).astype(np.uint8)
+
+
+_LOOKUP_TABLES = None
+
+
+def _biome_lookup_tables():
+    """Primary tile, secondary tile and water chance per biome id"""
+    global _LOOKUP_TABLES
+    if _LOOKUP_TABLES is None:
+        configs = [BiomeGenerator.BIOME_TILES[name] for name in BiomeGenerator.BIOME_IDS]
+        _LOOKUP_TABLES = (
+            np.array([config['primary'] for config in configs], dtype=np.uint8),
+            np.array([config['secondary'] for config in configs], dtype=np.uint8),
+            np.array([config['water_chance'] for config in configs], dtype=np.float64)
+        )
+    return _LOOKUP_TABLES
@@ -5,7 +5,28 @@ Improved spawning logic with collision detection and terrain validation
 
 import random
 import math
-from typing import List, Dict, Tuple, Optional, Any
+from typing import List, Dict, Tuple, Optional, Any, NamedTuple
+from .seeding import derive_seed
+
+# Radius _is_area_overcrowded checks, kept as running counts by mark_position_occupied
+CROWDING_RADIUS = 3
+
+
+class SpawnRecord(NamedTuple):
+    """
+    An entity to create once its chunk is resident
+    
+    Plain data, so planning a chunk's spawns needs no pygame and the plan can
+    be pickled back from a worker process.
+    """
+    kind: str  # 'enemy' or 'object'
+    name: str
+    x: int
+    y: int
+    health: int = 0
+    damage: int = 0
+    experience: int = 0
+    weapon: Optional[str] = None  # Set for ranged enemies
 
 
 class EnhancedEntitySpawner:
@@ -139,13 +160,18 @@ class EnhancedEntitySpawner:
         """
         self.width = width
         self.height = height
-        self.seed = seed or random.randint(0, 1000000)
+        self.seed = seed if seed is not None else random.randint(0, 1000000)
         
         # Initialize random with seed
-        random.seed(self.seed)
+        self.rng = random.Random(self.seed)
         
         # Track occupied positions for collision detection
         self.occupied_positions = set()  # Set of (x, y) tuples
+        self.crowding = {}  # (x, y) -> occupied positions within CROWDING_RADIUS
+        
+        # Summed-area table of walls for the tiles being planned, so wall checks don't scan
+        self._wall_tiles = None
+        self._wall_sums = None
         
         print(f"EnhancedEntitySpawner initialized with seed: {self.seed}")
     
@@ -225,8 +251,32 @@ class EnhancedEntitySpawner:
         
         return True
     
+    def _index_walls(self, tiles: Optional[List[List[int]]]):
+        """Build the wall summed-area table for tiles (None to drop it)"""
+        self._wall_tiles = tiles
+        self._wall_sums = None
+        if tiles is None:
+            return
+        blocking = (self.TILE_WALL, self.TILE_DOOR)
+        sums = [[0] * (self.width + 1) for _ in range(self.height + 1)]
+        for y in range(self.height):
+            row, above, below = tiles[y], sums[y], sums[y + 1]
+            running = 0
+            for x in range(self.width):
+                running += row[x] in blocking
+                below[x + 1] = above[x + 1] + running
+        self._wall_sums = sums
+    
     def _has_nearby_walls(self, x: int, y: int, tiles: List[List[int]], radius: int = 1) -> bool:
         """Check if there are walls within a certain radius"""
+        if tiles is self._wall_tiles and self._wall_sums is not None:
+            x0, y0 = max(x - radius, 0), max(y - radius, 0)
+            x1, y1 = min(x + radius, self.width - 1) + 1, min(y + radius, self.height - 1) + 1
+            if x0 >= x1 or y0 >= y1:
+                return False
+            sums = self._wall_sums
+            return sums[y1][x1] - sums[y0][x1] - sums[y1][x0] + sums[y0][x0] > 0
+        
         for dy in range(-radius, radius + 1):
             for dx in range(-radius, radius + 1):
                 check_x, check_y = x + dx, y + dy
@@ -253,8 +303,13 @@ class EnhancedEntitySpawner:
         # If more than 75% of surrounding tiles are walls, consider it surrounded
         return wall_count > (total_positions * 0.75)
     
-    def _is_area_overcrowded(self, x: int, y: int, radius: int = 3) -> bool:
+    def _is_area_overcrowded(self, x: int, y: int, radius: int = CROWDING_RADIUS) -> bool:
         """Check if area has too many entities already"""
+        if radius == CROWDING_RADIUS:
+            total_positions = (max(0, min(x + radius, self.width - 1) - max(x - radius, 0) + 1) *
+                               max(0, min(y + radius, self.height - 1) - max(y - radius, 0) + 1))
+            return self.crowding.get((x, y), 0) > (total_positions * 0.2)
+        
         entity_count = 0
         total_positions = 0
         
@@ -271,7 +326,12 @@ class EnhancedEntitySpawner:
     
     def mark_position_occupied(self, x: int, y: int):
         """Mark a position as occupied"""
+        if (x, y) in self.occupied_positions:
+            return
         self.occupied_positions.add((x, y))
+        for check_y in range(y - CROWDING_RADIUS, y + CROWDING_RADIUS + 1):
+            for check_x in range(x - CROWDING_RADIUS, x + CROWDING_RADIUS + 1):
+                self.crowding[(check_x, check_y)] = self.crowding.get((check_x, check_y), 0) + 1
     
     def spawn_enemies(self, tiles: List[List[int]], biome_map: List[List[str]], 
                      settlement_safe_zones: List[Tuple[int, int, int]], 
@@ -279,6 +339,18 @@ class EnhancedEntitySpawner:
         """
         Spawn enemies with tier-based difficulty scaling and biome modifiers
         """
+        return [self.create_entity(record, asset_loader)
+                for record in self.plan_enemies(tiles, biome_map, settlement_safe_zones)]
+    
+    def plan_enemies(self, tiles: List[List[int]], biome_map: List[List[str]], 
+                     settlement_safe_zones: List[Tuple[int, int, int]]) -> List[SpawnRecord]:
+        """
+        Choose enemy spawns with tier-based difficulty scaling and biome modifiers
+        
+        Returns:
+            Spawn records - no entities are created
+        """
+        self._index_walls(tiles)
         enemies = []
         
         # Calculate enemy density with improved scaling
@@ -298,8 +370,8 @@ class EnhancedEntitySpawner:
             attempts += 1
             
             # Random position
-            x = random.randint(5, self.width - 6)
-            y = random.randint(5, self.height - 6)
+            x = self.rng.randint(5, self.width - 6)
+            y = self.rng.randint(5, self.height - 6)
             
             # Check if position is in safe zone
             if self._is_in_safe_zone(x, y, settlement_safe_zones):
@@ -343,7 +415,7 @@ class EnhancedEntitySpawner:
                 continue
             
             # Choose random enemy from tier
-            base_enemy_config = random.choice(enemy_types)
+            base_enemy_config = self.rng.choice(enemy_types)
             
             # Apply biome difficulty modifier
             difficulty_modifier = biome_config.get('difficulty_modifier', 1.0)
@@ -361,42 +433,11 @@ class EnhancedEntitySpawner:
             if base_enemy_config.get('weapon'):
                 enemy_config['weapon'] = base_enemy_config['weapon']
             
-            # Import Enemy and RangedEnemy classes
-            try:
-                from ...entities import Enemy, RangedEnemy
-            except ImportError:
-                try:
-                    import sys
-                    import os
-                    sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-                    from entities import Enemy, RangedEnemy
-                except ImportError:
-                    class MockEnemy:
-                        def __init__(self, *args, **kwargs):
-                            self.x = args[0] if args else 0
-                            self.y = args[1] if len(args) > 1 else 0
-                            self.name = args[2] if len(args) > 2 else "Enemy"
-                        def update(self, level):
-                            pass
-                    Enemy = MockEnemy
-                    RangedEnemy = MockEnemy
-            
-            # Create appropriate enemy type
-            if enemy_config.get('type') == 'ranged':
-                weapon_type = enemy_config.get('weapon', 'bow')
-                enemy = RangedEnemy(x, y, enemy_config['name'],
-                                  health=enemy_config['health'],
-                                  damage=enemy_config['damage'],
-                                  experience=enemy_config['experience'],
-                                  asset_loader=asset_loader,
-                                  weapon_type=weapon_type)
-            else:
-                enemy = Enemy(x, y, enemy_config['name'],
-                             health=enemy_config['health'],
-                             damage=enemy_config['damage'],
-                             experience=enemy_config['experience'],
-                             asset_loader=asset_loader)
-            
+            enemy = SpawnRecord('enemy', enemy_config['name'], x, y,
+                                health=enemy_config['health'],
+                                damage=enemy_config['damage'],
+                                experience=enemy_config['experience'],
+                                weapon=enemy_config.get('weapon', 'bow') if enemy_config['type'] == 'ranged' else None)
             enemies.append(enemy)
             
             # Mark position as occupied
@@ -431,6 +472,7 @@ class EnhancedEntitySpawner:
               f"Intermediate={tier_counts['Intermediate']}, Advanced={tier_counts['Advanced']}")
         print(f"   🌍 Biomes: {biome_counts}")
         
+        self._index_walls(None)
         return enemies
     
     def spawn_objects(self, tiles: List[List[int]], biome_map: List[List[str]], 
@@ -439,6 +481,18 @@ class EnhancedEntitySpawner:
         """
         Spawn environmental objects with enhanced terrain validation
         """
+        return [self.create_entity(record, asset_loader)
+                for record in self.plan_objects(tiles, biome_map, settlement_safe_zones)]
+    
+    def plan_objects(self, tiles: List[List[int]], biome_map: List[List[str]], 
+                     settlement_safe_zones: List[Tuple[int, int, int]]) -> List[SpawnRecord]:
+        """
+        Choose environmental object spawns with enhanced terrain validation
+        
+        Returns:
+            Spawn records - no entities are created
+        """
+        self._index_walls(tiles)
         objects = []
         
         for y in range(1, self.height - 1):
@@ -484,40 +538,54 @@ class EnhancedEntitySpawner:
                         spawn_chance = 0.05  # Reduced from 0.12 - Dense swamp coverage
                         object_variants = ["dead_tree", "swamp_log", "swamp_mushroom"]
                 
-                if random.random() < spawn_chance and object_variants:
-                    # Import Entity class
-                    try:
-                        from ...entities import Entity
-                    except ImportError:
-                        try:
-                            import sys
-                            import os
-                            sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-                            from entities import Entity
-                        except ImportError:
-                            class MockEntity:
-                                def __init__(self, *args, **kwargs):
-                                    self.x = args[0] if args else 0
-                                    self.y = args[1] if len(args) > 1 else 0
-                                    self.name = args[2] if len(args) > 2 else "Object"
-                                def update(self, level):
-                                    pass
-                            Entity = MockEntity
-                    
+                if self.rng.random() < spawn_chance and object_variants:
                     # Choose random variant from biome-appropriate options
-                    chosen_variant = random.choice(object_variants)
-                    
-                        
-                    # Create object with biome-specific sprite
-                    obj = Entity(x, y, chosen_variant, entity_type="object", 
-                               blocks_movement=True, asset_loader=asset_loader)
+                    chosen_variant = self.rng.choice(object_variants)
+                    obj = SpawnRecord('object', chosen_variant, x, y)
                     objects.append(obj)
                     
                     # Mark position as occupied
                     self.mark_position_occupied(x, y)
         
+        self._index_walls(None)
         return objects
     
+    @staticmethod
+    def create_entity(record: SpawnRecord, asset_loader: Any) -> Any:
+        """
+        Create the game object for a spawn record
+        
+        Args:
+            record: Planned spawn
+            asset_loader: Asset loader for the entity's sprite
+            
+        Returns:
+            Enemy, RangedEnemy or Entity
+        """
+        try:
+            from ...entities import Entity, Enemy, RangedEnemy
+        except ImportError:
+            import sys
+            import os
+            sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
+            from entities import Entity, Enemy, RangedEnemy
+        
+        if record.kind == 'object':
+            return Entity(record.x, record.y, record.name, entity_type="object",
+                          blocks_movement=True, asset_loader=asset_loader)
+        if record.weapon:
+            return RangedEnemy(record.x, record.y, record.name,
+                               health=record.health,
+                               damage=record.damage,
+                               experience=record.experience,
+                               asset_loader=asset_loader,
+                               weapon_type=record.weapon)
+        return Enemy(record.x, record.y, record.name,
+                     health=record.health,
+                     damage=record.damage,
+                     experience=record.experience,
+                     asset_loader=asset_loader)
+    
     def spawn_chests(self, tiles: List[List[int]], biome_map: List[List[str]], 
                     settlement_safe_zones: List[Tuple[int, int, int]], 
                     asset_loader: Any) -> List[Any]:
@@ -528,8 +596,8 @@ class EnhancedEntitySpawner:
         target_chests = 15
         
         for _ in range(target_chests * 5):  # More attempts for better placement
-            x = random.randint(10, self.width - 11)
-            y = random.randint(10, self.height - 11)
+            x = self.rng.randint(10, self.width - 11)
+            y = self.rng.randint(10, self.height - 11)
             
             # Don't spawn in safe zones
             if self._is_in_safe_zone(x, y, settlement_safe_zones):
@@ -626,7 +694,7 @@ class EnhancedEntitySpawner:
                 # Try to find a courtyard or open area within the settlement
                 for attempt in range(20):  # Multiple attempts to find good spot
                     # Try spawning near buildings but not inside them
-                    building = random.choice(buildings)
+                    building = self.rng.choice(buildings)
                     
                     # Spawn near the building entrance or courtyard
                     spawn_options = [
@@ -636,8 +704,8 @@ class EnhancedEntitySpawner:
                         (building['x'] - 3, building['y'] + building['height'] // 2),
                         (building['x'] + building['width'] + 3, building['y'] + building['height'] // 2),
                         # Near settlement center but offset
-                        (closest_settlement['center_x'] + random.randint(-8, 8), 
-                         closest_settlement['center_y'] + random.randint(-8, 8))
+                        (closest_settlement['center_x'] + self.rng.randint(-8, 8), 
+                         closest_settlement['center_y'] + self.rng.randint(-8, 8))
                     ]
                     
                     for spawn_x, spawn_y in spawn_options:
@@ -656,8 +724,8 @@ class EnhancedEntitySpawner:
             center_y = closest_settlement['center_y']
             
             # Spawn at the edge of the safe zone (radius ~25-30 tiles from center)
-            angle = random.uniform(0, 2 * math.pi)
-            spawn_radius = random.uniform(20, 30)  # Between 20-30 tiles from center
+            angle = self.rng.uniform(0, 2 * math.pi)
+            spawn_radius = self.rng.uniform(20, 30)  # Between 20-30 tiles from center
             
             spawn_x = int(center_x + spawn_radius * math.cos(angle))
             spawn_y = int(center_y + spawn_radius * math.sin(angle))
@@ -790,8 +858,8 @@ class EnhancedEntitySpawner:
             
             # Find suitable location in the specified biome
             for attempt in range(100):
-                x = random.randint(20, self.width - 21)
-                y = random.randint(20, self.height - 21)
+                x = self.rng.randint(20, self.width - 21)
+                y = self.rng.randint(20, self.height - 21)
                 
                 # Check biome
                 if biome_map[y][x] != boss_biome:
@@ -939,7 +1007,7 @@ class EnhancedEntitySpawner:
         """Create appropriate AI-powered NPC based on name"""
         try:
             # Generate unique ID for this specific NPC instance
-            unique_id = f"{npc_name.lower().replace(' ', '_')}_{x}_{y}_{hash((npc_name, x, y)) % 10000}"
+            unique_id = f"{npc_name.lower().replace(' ', '_')}_{x}_{y}_{derive_seed(npc_name, x, y) % 10000}"
             
             # Map NPC names to their AI classes
             ai_npc_mappings = {
@@ -27,10 +27,10 @@ class ProceduralWorldGenerator:
         """
         self.width = width
         self.height = height
-        self.seed = seed or random.randint(0, 1000000)
+        self.seed = seed if seed is not None else random.randint(0, 1000000)
         
         # Initialize random with seed
-        random.seed(self.seed)
+        self.rng = random.Random(self.seed)
         
         # Initialize subsystem generators
         self.biome_generator = BiomeGenerator(width, height, self.seed)
@@ -3,7 +3,6 @@ Simplified procedural map generation for Goose RPG
 Generates 4 biomes (Desert, Forest, Plains, Snow) with template-based settlements
 """
 
-import pygame
 import random
 import math
 from typing import Dict, List, Tuple, Optional
@@ -108,10 +107,10 @@ class ProceduralGenerator:
     def __init__(self, width, height, seed=None):
         self.width = width
         self.height = height
-        self.seed = seed or random.randint(0, 1000000)
+        self.seed = seed if seed is not None else random.randint(0, 1000000)
         
         # Initialize random with seed
-        random.seed(self.seed)
+        self.rng = random.Random(self.seed)
         
         # Generate biome map
         self.biome_map = self.generate_biome_map()
@@ -189,11 +188,11 @@ class ProceduralGenerator:
                 tile_type = biome_config['primary']
                 
                 # Add some variation with secondary tiles
-                if random.random() < 0.15:  # 15% chance for secondary
+                if self.rng.random() < 0.15:  # 15% chance for secondary
                     tile_type = biome_config['secondary']
                 
                 # Add water features
-                if random.random() < biome_config['water_chance']:
+                if self.rng.random() < biome_config['water_chance']:
                     tile_type = 3  # TILE_WATER
                 
                 row.append(tile_type)
@@ -227,8 +226,8 @@ class ProceduralGenerator:
         
         # Strategy 1: Strict placement (no water tolerance)
         for _ in range(max_attempts // 2):
-            x = random.randint(10, self.width - settlement_width - 10)
-            y = random.randint(10, self.height - settlement_height - 10)
+            x = self.rng.randint(10, self.width - settlement_width - 10)
+            y = self.rng.randint(10, self.height - settlement_height - 10)
             
             # Check if biome is suitable
             center_biome = self.biome_map[y + settlement_height // 2][x + settlement_width // 2]
@@ -248,8 +247,8 @@ class ProceduralGenerator:
         
         # Strategy 2: Relaxed placement (allow some water)
         for _ in range(max_attempts // 2):
-            x = random.randint(10, self.width - settlement_width - 10)
-            y = random.randint(10, self.height - settlement_height - 10)
+            x = self.rng.randint(10, self.width - settlement_width - 10)
+            y = self.rng.randint(10, self.height - settlement_height - 10)
             
             # Check if biome is suitable
             center_biome = self.biome_map[y + settlement_height // 2][x + settlement_width // 2]
@@ -325,8 +324,8 @@ class ProceduralGenerator:
             for attempt in range(50):  # Increased from 20
                 # Random position within settlement bounds with better margins
                 margin = 1  # Reduced margin
-                bx = start_x + margin + random.randint(0, settlement_width - building_width - margin * 2)
-                by = start_y + margin + random.randint(0, settlement_height - building_height - margin * 2)
+                bx = start_x + margin + self.rng.randint(0, settlement_width - building_width - margin * 2)
+                by = start_y + margin + self.rng.randint(0, settlement_height - building_height - margin * 2)
                 
                 # Check if building would overlap with center square (with smaller margin)
                 if self.building_overlaps_area_relaxed(bx, by, building_width, building_height, 
@@ -382,7 +381,7 @@ class ProceduralGenerator:
             if 0 <= x < self.width:
                 # Top wall
                 if start_y >= 0 and start_y < self.height:
-                    if random.random() < 0.2:  # 20% chance for windows
+                    if self.rng.random() < 0.2:  # 20% chance for windows
                         tiles[start_y][x] = 14  # TILE_WALL_WINDOW_HORIZONTAL
                     else:
                         tiles[start_y][x] = 10  # TILE_WALL_HORIZONTAL
@@ -390,7 +389,7 @@ class ProceduralGenerator:
                 # Bottom wall (will be overridden by doors)
                 bottom_y = start_y + height - 1
                 if 0 <= bottom_y < self.height:
-                    if random.random() < 0.2:  # 20% chance for windows
+                    if self.rng.random() < 0.2:  # 20% chance for windows
                         tiles[bottom_y][x] = 14  # TILE_WALL_WINDOW_HORIZONTAL
                     else:
                         tiles[bottom_y][x] = 10  # TILE_WALL_HORIZONTAL
@@ -400,7 +399,7 @@ class ProceduralGenerator:
             if 0 <= y < self.height:
                 # Left wall
                 if start_x >= 0 and start_x < self.width:
-                    if random.random() < 0.15:  # 15% chance for windows
+                    if self.rng.random() < 0.15:  # 15% chance for windows
                         tiles[y][start_x] = 15  # TILE_WALL_WINDOW_VERTICAL
                     else:
                         tiles[y][start_x] = 11  # TILE_WALL_VERTICAL
@@ -408,7 +407,7 @@ class ProceduralGenerator:
                 # Right wall
                 right_x = start_x + width - 1
                 if 0 <= right_x < self.width:
-                    if random.random() < 0.15:  # 15% chance for windows
+                    if self.rng.random() < 0.15:  # 15% chance for windows
                         tiles[y][right_x] = 15  # TILE_WALL_WINDOW_VERTICAL
                     else:
                         tiles[y][right_x] = 11  # TILE_WALL_VERTICAL
@@ -522,8 +521,8 @@ class ProceduralGenerator:
             attempts += 1
             
             # Random position
-            x = random.randint(5, self.width - 6)
-            y = random.randint(5, self.height - 6)
+            x = self.rng.randint(5, self.width - 6)
+            y = self.rng.randint(5, self.height - 6)
             
             # Check if position is in safe zone
             if self.is_in_safe_zone(x, y):
@@ -540,7 +539,7 @@ class ProceduralGenerator:
             if not enemy_types:
                 continue
             
-            enemy_config = random.choice(enemy_types)
+            enemy_config = self.rng.choice(enemy_types)
             enemy = Enemy(x, y, enemy_config['name'],
                          health=enemy_config['health'],
                          damage=enemy_config['damage'],
@@ -560,8 +559,8 @@ class ProceduralGenerator:
             
             # Find suitable location in the specified biome
             for attempt in range(100):
-                x = random.randint(20, self.width - 21)
-                y = random.randint(20, self.height - 21)
+                x = self.rng.randint(20, self.width - 21)
+                y = self.rng.randint(20, self.height - 21)
                 
                 # Check biome
                 if self.biome_map[y][x] != boss_biome:
@@ -620,9 +619,9 @@ class ProceduralGenerator:
                     object_type = "Rock"
                 elif biome == 'SNOW':
                     spawn_chance = 0.1  # Frozen trees and rocks
-                    object_type = random.choice(["Tree", "Rock"])
+                    object_type = self.rng.choice(["Tree", "Rock"])
                 
-                if random.random() < spawn_chance:
+                if self.rng.random() < spawn_chance:
                     obj = Entity(x, y, object_type, entity_type="object", 
                                blocks_movement=True, asset_loader=asset_loader)
                     objects.append(obj)
@@ -638,8 +637,8 @@ class ProceduralGenerator:
         target_chests = 15
         
         for _ in range(target_chests * 3):  # Try 3x as many times as target
-            x = random.randint(10, self.width - 11)
-            y = random.randint(10, self.height - 11)
+            x = self.rng.randint(10, self.width - 11)
+            y = self.rng.randint(10, self.height - 11)
             
             # Check terrain
             if tiles[y][x] != 0:  # Only on grass
@@ -0,0 +1,32 @@
+"""
+Stable seed derivation for procedural generation
+
+Python's built-in hash() is salted per process for strings (PYTHONHASHSEED),
+so seeds derived from it differ between runs and worker processes. These
+helpers mix seed components with BLAKE2 instead, giving the same value in
+every process and independent of generation order.
+"""
+
+import hashlib
+import random
+
+SEED_BITS = 31  # Keep derived seeds in the range the generators already expect
+
+
+def derive_seed(*parts) -> int:
+    """
+    Derive a stable seed from any number of components
+
+    Args:
+        parts: Seed components - ints, strings, floats or tuples of those
+
+    Returns:
+        Non-negative seed below 2**SEED_BITS
+    """
+    digest = hashlib.blake2b(repr(parts).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little') % (2 ** SEED_BITS)
+
+
+def make_rng(*parts) -> random.Random:
+    """Create a private random generator seeded from the given components"""
+    return random.Random(derive_seed(*parts))
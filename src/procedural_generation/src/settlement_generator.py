@@ -92,10 +92,10 @@ class SettlementGenerator:
         """
         self.width = width
         self.height = height
-        self.seed = seed or random.randint(0, 1000000)
+        self.seed = seed if seed is not None else random.randint(0, 1000000)
         
         # Initialize random with seed
-        random.seed(self.seed)
+        self.rng = random.Random(self.seed)
         
         # Track placed objects for collision
         self.occupied_areas = []  # List of (x, y, width, height) rectangles
@@ -180,8 +180,8 @@ class SettlementGenerator:
         
         # Strategy 1: Strict placement (no water tolerance)
         for _ in range(max_attempts // 2):
-            x = random.randint(10, self.width - settlement_width - 10)
-            y = random.randint(10, self.height - settlement_height - 10)
+            x = self.rng.randint(10, self.width - settlement_width - 10)
+            y = self.rng.randint(10, self.height - settlement_height - 10)
             
             # Check if biome is suitable
             center_biome = biome_map[y + settlement_height // 2][x + settlement_width // 2]
@@ -201,8 +201,8 @@ class SettlementGenerator:
         
         # Strategy 2: Relaxed placement (allow some water)
         for _ in range(max_attempts // 2):
-            x = random.randint(10, self.width - settlement_width - 10)
-            y = random.randint(10, self.height - settlement_height - 10)
+            x = self.rng.randint(10, self.width - settlement_width - 10)
+            y = self.rng.randint(10, self.height - settlement_height - 10)
             
             # Check if biome is suitable
             center_biome = biome_map[y + settlement_height // 2][x + settlement_width // 2]
@@ -322,8 +322,8 @@ class SettlementGenerator:
                     print(f"        Building too large for settlement! Skipping...")
                     break
                 
-                bx = start_x + margin + random.randint(0, max_x)
-                by = start_y + margin + random.randint(0, max_y)
+                bx = start_x + margin + self.rng.randint(0, max_x)
+                by = start_y + margin + self.rng.randint(0, max_y)
                 
                 # Check if building would overlap with center square (with smaller margin)
                 if self.building_overlaps_area_relaxed(bx, by, building_width, building_height, 
@@ -414,13 +414,13 @@ class SettlementGenerator:
                     # Then set edge walls (horizontal/vertical)
                     elif is_top_edge or is_bottom_edge:
                         # Horizontal walls (top and bottom edges)
-                        if random.random() < 0.2:  # 20% chance for windows
+                        if self.rng.random() < 0.2:  # 20% chance for windows
                             tiles[y][x] = 14  # TILE_WALL_WINDOW_HORIZONTAL
                         else:
                             tiles[y][x] = 10  # TILE_WALL_HORIZONTAL
                     elif is_left_edge or is_right_edge:
                         # Vertical walls (left and right edges)
-                        if random.random() < 0.15:  # 15% chance for windows
+                        if self.rng.random() < 0.15:  # 15% chance for windows
                             tiles[y][x] = 15  # TILE_WALL_WINDOW_VERTICAL
                         else:
                             tiles[y][x] = 11  # TILE_WALL_VERTICAL
@@ -447,7 +447,7 @@ class SettlementGenerator:
         door_weights = [0.35, 0.2, 0.2, 0.25]  # Bottom slightly favored, but all sides possible
         
         # Choose a random side for the door
-        chosen_side = random.choices(door_sides, weights=door_weights)[0]
+        chosen_side = self.rng.choices(door_sides, weights=door_weights)[0]
         
         # Place door based on chosen side
         if chosen_side == 'bottom':
@@ -815,8 +815,8 @@ class SettlementGenerator:
         if settlement_name == 'TRADING_POST':
             # Add some stone markers around the trading post
             for _ in range(3):
-                x = start_x + random.randint(2, width - 3)
-                y = start_y + random.randint(2, height - 3)
+                x = start_x + self.rng.randint(2, width - 3)
+                y = start_y + self.rng.randint(2, height - 3)
                 if (0 <= x < self.width and 0 <= y < self.height and 
                     not self._is_building_tile(tiles[y][x])):
                     tiles[y][x] = 2  # TILE_STONE
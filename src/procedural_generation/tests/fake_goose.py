@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Fake goose executable for AI NPC tests
+
+Point GOOSE_BIN at "python fake_goose.py" and NPCs talk to this instead of a
+real model. It prints goose's startup banner, then answers each line with a
+short reply, one line at a time, and repeats back any "[Game state: ...]"
+prefix it was sent. Some messages change its behaviour:
+- "hang": never answers
+- "crash": exits without answering
+- "exit": ends the session like goose does
+
+Environment:
+    FAKE_GOOSE_LINE_DELAY: Seconds between reply lines (default 0.05)
+    FAKE_GOOSE_STARTUP_DELAY: Seconds before the banner (default 0)
+"""
+
+import os
+import sys
+import time
+
+
+def say(text=""):
+    """Print a line straight away"""
+    print(text, flush=True)
+
+
+def main():
+    """Run the fake session"""
+    line_delay = float(os.environ.get("FAKE_GOOSE_LINE_DELAY", "0.05"))
+    time.sleep(float(os.environ.get("FAKE_GOOSE_STARTUP_DELAY", "0")))
+
+    args = sys.argv[1:]
+    name = args[args.index("--name") + 1] if "--name" in args else "npc"
+    say(f"starting session | provider: fake model: {os.environ.get('GOOSE_MODEL', 'fake')}")
+    say(f"    session id: {name}")
+    say("Goose is running! Enter your instructions, or try asking what goose can do.")
+    say()
+
+    for line in sys.stdin:
+        message = line.strip()
+        if message == "exit":
+            say("Closing session.")
+            return 0
+        if message.endswith("hang"):
+            while True:
+                time.sleep(1)
+        if message.endswith("crash"):
+            return 3
+
+        state = ""
+        if message.startswith("[Game state: ") and "] " in message:
+            state, message = message[len("[Game state: "):].split("] ", 1)
+
+        reply = [
+            "Well met, traveler.",
+            f"You said: {message}.",
+            "The road ahead is long but bright.",
+        ]
+        if state:
+            reply.append(f"I see that {state}.")
+        for reply_line in reply:
+            time.sleep(line_delay)
+            say(reply_line)
+        say()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
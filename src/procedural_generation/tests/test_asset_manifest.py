@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Tests for the asset manifest and lazy asset loading
+"""
+
+import sys
+import os
+import wave
+import tempfile
+import threading
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+import pygame
+
+# Bind the game modules to the real pygame before test_phase4_integration swaps in its mock
+from src.core.asset_manifest import AssetManifest, BackgroundLoader
+from src.core.assets import AssetLoader
+
+
+def save_png(path, size, color):
+    """Write a solid colour PNG"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    image = pygame.Surface(size)
+    image.fill(color)
+    pygame.image.save(image, path)
+
+
+def save_wav(path):
+    """Write a short silent WAV"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with wave.open(path, 'wb') as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(22050)
+        f.writeframes(b"\x00\x00" * 2205)
+
+
+def test_manifest_only_rehashes_changed_files():
+    """The manifest records size, checksum and image size, and only rehashes files that changed"""
+    print("Testing asset manifest...")
+
+    with tempfile.TemporaryDirectory() as root:
+        save_png(os.path.join(root, "images", "tile.png"), (64, 32), (0, 200, 0))
+        with open(os.path.join(root, "notes.txt"), 'w') as f:
+            f.write("not an image")
+        files = ["images/tile.png", "notes.txt", "missing.png"]
+
+        manifest = AssetManifest.load(root, files)
+        assert manifest.rehashed == 2 and "missing.png" not in manifest
+        assert manifest.image_size("images/tile.png") == (64, 32)
+        assert manifest.image_size("notes.txt") is None
+        assert manifest.total_bytes() == sum(os.path.getsize(os.path.join(root, path)) for path in files[:2])
+        checksum = manifest.checksum("images/tile.png")
+
+        # Nothing changed - a fresh start only stats the files
+        assert AssetManifest.load(root, files).rehashed == 0
+
+        # Touched but identical, then really changed
+        os.utime(os.path.join(root, "notes.txt"), ns=(1, 1))
+        save_png(os.path.join(root, "images", "tile.png"), (16, 16), (200, 0, 0))
+        manifest = AssetManifest.load(root, files)
+        assert manifest.rehashed == 2
+        assert manifest.image_size("images/tile.png") == (16, 16)
+        assert manifest.checksum("images/tile.png") != checksum
+
+        os.remove(os.path.join(root, "notes.txt"))
+        assert "notes.txt" not in AssetManifest.load(root, files)
+        assert "notes.txt" not in AssetManifest.load(root)
+    print("✅ Manifest tracks files and only rehashes changed ones")
+
+
+def test_background_loader_priorities():
+    """Urgent jobs jump the warm-up queue, each key runs once and errors come back as values"""
+    print("Testing background loader...")
+
+    loader = BackgroundLoader("test-loader")
+    started, gate = threading.Event(), threading.Event()
+    ran = []
+
+    def job(key):
+        def run():
+            if key == "gate":
+                started.set()
+                gate.wait(5)
+            if key == "broken":
+                raise ValueError("bad file")
+            ran.append(key)
+            return key.upper()
+        return run
+
+    loader.submit("gate", job("gate"))
+    assert started.wait(5)  # The worker is busy until the gate opens
+    for key in ("a", "b", "c", "broken"):
+        loader.submit(key, job(key))
+    loader.submit("c", job("c"), urgent=True)
+    loader.submit("a", job("a"))  # Already queued
+    assert loader.take("c") == (False, None)
+    gate.set()
+    assert loader.wait(5)
+
+    assert ran == ["gate", "c", "a", "b"]
+    assert loader.take("c") == (True, "C")
+    assert isinstance(loader.take("broken")[1], ValueError)
+    loader.submit("c", job("c"))  # Already taken - not run again
+    assert loader.wait(5) and ran.count("c") == 1 and loader.pending() == 0
+    loader.close()
+    print("✅ Jobs run once, urgent ones first")
+
+
+def test_lazy_asset_loader():
+    """Lazy mode preloads the menu assets and hands out placeholders until images are decoded"""
+    print("Testing lazy asset loading...")
+
+    pygame.init()
+    pygame.display.set_mode((64, 64))
+    with tempfile.TemporaryDirectory() as temp_dir:
+        images = os.path.join(temp_dir, "assets", "images")
+        save_png(os.path.join(images, "ui", "goose_rpg_icon.png"), (48, 48), (255, 255, 0))
+        save_png(os.path.join(images, "environment", "grass_tile.png"), (64, 32), (0, 200, 0))
+        save_png(os.path.join(images, "buildings", "wall_texture.png"), (32, 64), (90, 90, 90))
+        sounds = os.path.join(temp_dir, "assets", "sounds")
+        for filename in ("ui/menu_select.wav", "ui/coin_pickup_1.wav", "creatures/dragon_growl_1.wav"):
+            save_wav(os.path.join(sounds, filename))
+
+        original_dir = os.getcwd()
+        os.chdir(temp_dir)
+        gate = threading.Event()
+        decode = AssetLoader._decode_job
+        AssetLoader._decode_job = staticmethod(lambda path: lambda: (gate.wait(5), decode(path)())[1])
+        try:
+            loader = AssetLoader({"lazy_asset_loading": True})
+        finally:
+            AssetLoader._decode_job = staticmethod(decode)
+            os.chdir(original_dir)
+
+        try:
+            # Menu assets are there straight away, the rest are waiting on the worker
+            assert loader.images["goose_rpg_icon"].get_size() == (48, 48)
+            assert loader.has_image("grass_tile") and "grass_tile" not in loader.images
+            assert not loader.has_image("no_such_image")
+            assert loader.manifest.image_size("images/environment/grass_tile.png") == (64, 32)
+
+            placeholder = loader.get_image("grass_tile")
+            assert placeholder is loader.get_image("grass_tile") is loader.get_placeholder("grass_tile")
+            assert loader.get_sprite("grass_tile", 16).get_size() == (16, 16)
+            assert not loader.sprite_cache  # Placeholders are never cached
+
+            audio = loader.audio_manager
+            assert audio.play_sound("ui", "menu_select")
+            assert not audio.play_sound("ui", "coin_pickup")  # Silent until decoded
+
+            gate.set()
+            pending = len(loader.pending_images)
+            assert pending >= 4 and loader.finish_loading(5) == pending and not loader.pending_images
+            grass = loader.get_image("grass_tile")
+            assert grass is not placeholder and grass.get_size() == (64, 32)
+            assert loader.get_sprite("grass_tile", 16) is loader.get_sprite("grass_tile", 16)
+
+            # Names sharing a file share the decoded surface
+            assert loader.images["wall_tile"] is loader.images["wall_texture"] is loader.images["wall_corner_tl"]
+
+            # finish_loading waited for the sounds too
+            assert audio.play_sound("ui", "coin_pickup") and ("ui", "coin_pickup") not in audio.pending_sounds
+            assert audio.play_sound("creatures", "dragon_growl") and audio.play_sound("creatures", "orc_attack")
+            assert audio.sounds["creatures"]["dragon_growl"][0] is audio.sounds["creatures"]["orc_attack"][0]
+        finally:
+            gate.set()
+            loader.background.close()
+    print("✅ Lazy loader swaps placeholders for decoded images")
+
+
+def main():
+    """Run all asset manifest tests"""
+    tests = [test_manifest_only_rehashes_changed_files, test_background_loader_priorities, test_lazy_asset_loader]
+
+    for test in tests:
+        test()
+
+    print("\n🎉 All asset manifest tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Tests for background chunk generation in worker processes
+"""
+
+import sys
+import os
+import tempfile
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from src.world.chunk_manager import ChunkManager
+
+
+def test_pending_chunks_do_not_block():
+    """Non-blocking lookups return a pending result until the worker finishes"""
+    print("Testing non-blocking chunk requests...")
+
+    original_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.chdir(temp_dir)
+        try:
+            manager = ChunkManager(4242, "async_test", async_generation=True, max_workers=2)
+
+            assert manager.get_chunk(0, 0, blocking=False) is None
+            assert manager.is_chunk_pending(0, 0)
+            assert manager.get_tile(5, 5) is None
+
+            chunks = manager.wait_for_chunks([(0, 0), (1, 0)])
+            assert set(chunks) == {(0, 0), (1, 0)}
+            assert not manager.is_chunk_pending(0, 0)
+            assert manager.get_tile(5, 5) is not None
+            assert chunks[(1, 0)].is_generated
+
+            # Installed chunks were saved, so a fresh manager loads them from disk
+            manager.close()
+            reloaded = ChunkManager(4242, "async_test")
+            assert reloaded.load_chunk(1, 0).to_dict() == chunks[(1, 0)].to_dict()
+            reloaded.close()
+        finally:
+            os.chdir(original_cwd)
+    print("✅ Pending chunks returned None and were installed on completion")
+
+
+def test_load_ring_prioritised_by_heading():
+    """Queued chunks are ordered by distance, favouring the player's heading"""
+    print("Testing generation queue prioritisation...")
+
+    original_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.chdir(temp_dir)
+        try:
+            manager = ChunkManager(4242, "priority_test", async_generation=True, max_workers=1)
+            manager.max_in_flight = 0  # Keep everything queued so the order can be inspected
+
+            manager.update_loaded_chunks(32, 32)
+            manager.update_loaded_chunks(40, 32)  # Moving east
+
+            queue = manager.generation_queue
+            assert queue[0] == (0, 0)
+            assert queue.index((1, 0)) < queue.index((-1, 0))
+            assert queue.index((2, 0)) < queue.index((-2, 0))
+            assert len(queue) == (manager.load_radius * 2 + 1) ** 2
+            manager.close()
+        finally:
+            os.chdir(original_cwd)
+    print("✅ Load ring queued nearest chunks first, ahead of the player")
+
+
+def main():
+    """Run all async generation tests"""
+    tests = [test_pending_chunks_do_not_block, test_load_ring_prioritised_by_heading]
+
+    for test in tests:
+        test()
+
+    print("\n🎉 All async chunk generation tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Tests for the generation-time building registry stored in chunks
+"""
+
+import sys
+import os
+import io
+import contextlib
+import struct
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from src.world.chunk import Chunk, CHUNK_HEADER, CHUNK_HEADER_V1
+from src.world.building_registry import TILE_DOOR, TILE_BRICK, building_bounds
+from src.world.world_generator import WorldGenerator
+
+WORLD_SEED = 12345
+SETTLEMENT_CHUNK = (1, -1)  # Has a settlement with this seed
+
+
+def generate_chunk(chunk_x, chunk_y):
+    """Generate a chunk without the generator's progress output"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return WorldGenerator(WORLD_SEED).generate_chunk(chunk_x, chunk_y)
+
+
+def world_tile(chunk, world_x, world_y):
+    """Read a chunk tile by world coordinates"""
+    start_x, start_y, _, _ = chunk.get_world_bounds()
+    return chunk.tiles[world_y - start_y][world_x - start_x]
+
+
+def test_generation_records_buildings():
+    """Placed buildings are recorded with their footprint, doors and interior"""
+    print("Testing buildings recorded at generation time...")
+
+    chunk = generate_chunk(*SETTLEMENT_CHUNK)
+    assert chunk.buildings, "Settlement chunk should record its buildings"
+    start_x, start_y, _, _ = chunk.get_world_bounds()
+
+    for building in chunk.buildings:
+        min_x, min_y, max_x, max_y = building['bounds']
+        assert building['doors'], f"{building['id']} has no doors"
+        for door_x, door_y, orientation in building['doors']:
+            assert world_tile(chunk, door_x, door_y) == TILE_DOOR
+            assert orientation in ("horizontal", "vertical")
+            assert chunk.get_building_at(door_x - start_x, door_y - start_y) is building
+
+        interior = building['interior']
+        assert interior and min_x <= interior[0] <= interior[2] <= max_x
+        assert min_y <= interior[1] <= interior[3] <= max_y
+        assert any(world_tile(chunk, x, interior[1]) == TILE_BRICK for x in range(interior[0], interior[2] + 1))
+        assert building_bounds(building) == (min_x, min_y, max_x, max_y)
+
+    assert chunk.get_building_at(-1, -1) is None
+    print(f"✅ Recorded {len(chunk.buildings)} buildings with doors and interiors")
+
+
+def test_binary_round_trip_keeps_buildings():
+    """Building records survive the binary chunk format"""
+    print("Testing building records in binary chunks...")
+
+    chunk = generate_chunk(*SETTLEMENT_CHUNK)
+    loaded = Chunk(0, 0, 0)
+    loaded.from_bytes(chunk.to_bytes())
+    assert loaded.buildings == chunk.buildings
+
+    door_x, door_y, _ = chunk.buildings[0]['doors'][0]
+    start_x, start_y, _, _ = loaded.get_world_bounds()
+    assert loaded.get_building_at(door_x - start_x, door_y - start_y)['id'] == chunk.buildings[0]['id']
+    print("✅ Binary round trip keeps building records")
+
+
+def test_old_chunks_rebuild_buildings():
+    """Chunks saved before the registry get their buildings rebuilt from tiles"""
+    print("Testing registry fallback for v1 chunks...")
+
+    chunk = generate_chunk(*SETTLEMENT_CHUNK)
+    payload = chunk.to_bytes()
+
+    # Rewrite the payload as a version 1 chunk, without the buildings section
+    fields = list(CHUNK_HEADER.unpack_from(payload, 0))
+    building_len = fields.pop()
+    fields[1] = 1
+    v1_payload = CHUNK_HEADER_V1.pack(*fields) + payload[CHUNK_HEADER.size:len(payload) - building_len]
+
+    loaded = Chunk(0, 0, 0)
+    loaded.from_bytes(v1_payload)
+    assert loaded.tiles == chunk.tiles
+    assert len(loaded.buildings) == len(chunk.buildings)
+
+    recorded = sorted(tuple(map(tuple, building['doors'])) for building in chunk.buildings)
+    rebuilt = sorted(tuple(map(tuple, building['doors'])) for building in loaded.buildings)
+    assert recorded == rebuilt
+
+    # Legacy JSON chunks rebuild them the same way
+    data = chunk.to_dict()
+    del data['buildings']
+    from_json = Chunk(0, 0, 0)
+    from_json.from_dict(data)
+    assert [b['bounds'] for b in from_json.buildings] == [b['bounds'] for b in loaded.buildings]
+    print("✅ Old chunks rebuild their building records")
+
+
+def test_unknown_version_rejected():
+    """Unknown chunk versions are still rejected"""
+    print("Testing unknown chunk version...")
+
+    payload = bytearray(generate_chunk(0, 0).to_bytes())
+    struct.pack_into('<H', payload, 4, 99)
+    try:
+        Chunk(0, 0, 0).from_bytes(bytes(payload))
+    except ValueError:
+        print("✅ Unknown chunk version rejected")
+        return
+    assert False, "Version 99 chunk should not load"
+
+
+def main():
+    """Run all building registry tests"""
+    tests = [test_generation_records_buildings, test_binary_round_trip_keeps_buildings,
+             test_old_chunks_rebuild_buildings, test_unknown_version_rejected]
+
+    for test in tests:
+        test()
+
+    print("\n🎉 All building registry tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
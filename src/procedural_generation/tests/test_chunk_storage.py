@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Tests for the binary chunk storage format
+"""
+
+import sys
+import os
+import json
+import mmap
+import tempfile
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from src.world.chunk import Chunk
+
+
+def make_chunk(chunk_x=3, chunk_y=-2):
+    """Build a small, fully populated chunk without running world generation"""
+    chunk = Chunk(chunk_x, chunk_y, 12345)
+    size = Chunk.CHUNK_SIZE
+    biomes = ['PLAINS', 'FOREST', 'DESERT', 'SNOW', 'SWAMP']
+    chunk.tiles = [[(x * 7 + y) % 20 for x in range(size)] for y in range(size)]
+    chunk.biomes = [[biomes[(x // 8 + y // 8) % len(biomes)] for x in range(size)] for y in range(size)]
+    chunk.entities = [
+        {'type': 'enemy', 'name': 'Goblin', 'x': 4, 'y': 5.5, 'health': 30, 'id': 'Goblin_4_5'},
+        {'type': 'npc', 'name': 'Mayor', 'x': 10, 'y': 11, 'dialog': ['Welcome!'], 'id': 'npc_mayor_3_-2'}
+    ]
+    chunk.is_generated = True
+    chunk.is_loaded = True
+    return chunk
+
+
+def test_binary_round_trip():
+    """Binary save and load should reproduce the chunk exactly"""
+    print("Testing binary chunk round trip...")
+
+    chunk = make_chunk()
+    with tempfile.TemporaryDirectory() as world_dir:
+        chunk.save_to_file(world_dir)
+        assert os.path.exists(chunk.get_filename(world_dir))
+
+        loaded = Chunk(chunk.chunk_x, chunk.chunk_y, 0)
+        assert loaded.load_from_file(world_dir)
+
+    assert loaded.to_dict() == chunk.to_dict()
+    assert loaded.is_loaded
+    print("✅ Binary round trip preserved tiles, biomes and entities")
+
+
+def test_planes_readable_from_mmap():
+    """Tile and biome planes should be usable straight from a memory map"""
+    print("Testing memory-mapped plane access...")
+
+    chunk = make_chunk()
+    with tempfile.TemporaryDirectory() as world_dir:
+        chunk.save_to_file(world_dir)
+        with open(chunk.get_filename(world_dir), 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                header, tile_plane, biome_plane, palette = Chunk.read_planes(mapped)
+                size = header['size']
+
+                assert size == Chunk.CHUNK_SIZE
+                assert tile_plane[5 * size + 9] == chunk.tiles[5][9]
+                assert palette[biome_plane[40 * size + 17]] == chunk.biomes[40][17]
+
+                tile_plane.release()
+                biome_plane.release()
+    print("✅ Planes read without decoding the entity section")
+
+
+def test_legacy_json_still_loads():
+    """Worlds saved as JSON should load and be migrated on the next save"""
+    print("Testing legacy JSON chunk loading...")
+
+    chunk = make_chunk()
+    with tempfile.TemporaryDirectory() as world_dir:
+        legacy_filename = chunk.get_legacy_filename(world_dir)
+        with open(legacy_filename, 'w') as f:
+            json.dump(chunk.to_dict(), f, separators=(',', ':'))
+
+        loaded = Chunk(chunk.chunk_x, chunk.chunk_y, 0)
+        assert loaded.load_from_file(world_dir)
+        assert loaded.to_dict() == chunk.to_dict()
+
+        loaded.save_to_file(world_dir)
+        assert os.path.exists(loaded.get_filename(world_dir))
+        assert not os.path.exists(legacy_filename)
+    print("✅ Legacy chunk loaded and migrated to the binary format")
+
+
+def test_damaged_chunk_file_fails_cleanly():
+    """Truncated or foreign chunk files fail the load instead of raising"""
+    print("Testing damaged chunk files...")
+
+    with tempfile.TemporaryDirectory() as world_dir:
+        empty = Chunk(0, 0, 1)
+        empty.save_to_file(world_dir)
+        filename = empty.get_filename(world_dir)
+        with open(filename, 'rb') as f:
+            empty_bytes = f.read()
+
+        chunk = make_chunk(0, 0)
+        chunk.save_to_file(world_dir)
+        with open(filename, 'rb') as f:
+            data = f.read()
+
+        damaged = [empty_bytes[:40], empty_bytes[:10], data[:len(data) // 2], data[:-1],
+                   b'XXXX' + data[4:], b'{"not": "a chunk"}']
+        for contents in damaged:
+            with open(filename, 'wb') as f:
+                f.write(contents)
+            assert not Chunk(0, 0, 0).load_from_file(world_dir), contents[:12]
+
+        # A JSON copy from an older save is still used when the binary file is damaged
+        with open(empty.get_legacy_filename(world_dir), 'w') as f:
+            json.dump(chunk.to_dict(), f)
+        loaded = Chunk(0, 0, 0)
+        assert loaded.load_from_file(world_dir) and loaded.to_dict() == chunk.to_dict()
+    print(f"✅ {len(damaged)} damaged files rejected without an exception")
+
+
+def main():
+    """Run all chunk storage tests"""
+    tests = [test_binary_round_trip, test_planes_readable_from_mmap, test_legacy_json_still_loads,
+             test_damaged_chunk_file_fails_cleanly]
+
+    for test in tests:
+        test()
+
+    print("\n🎉 All chunk storage tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Tests for the MCP command bus and its debug mirror
+"""
+
+import sys
+import os
+import json
+import asyncio
+import tempfile
+import threading
+from types import SimpleNamespace
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from src.systems.command_bus import CommandBus, CommandMirror
+from src.mcp_integration import MCPActionHandler
+
+
+def test_commands_run_on_draining_thread():
+    """Commands from many threads run in order on the thread that drains the bus"""
+    print("Testing command bus threading...")
+
+    bus = CommandBus()
+    ran = []
+
+    def record(source, index):
+        ran.append((threading.current_thread(), source, index))
+        return index * 2
+
+    futures = {}
+
+    def submit_all(source):
+        futures[source] = [bus.submit("record", record, source, index) for index in range(50)]
+
+    threads = [threading.Thread(target=submit_all, args=(source,)) for source in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not ran  # Nothing runs until the game loop drains
+    assert bus.drain() == 200
+    assert all(thread is threading.current_thread() for thread, _, _ in ran)
+    for source in range(4):
+        assert [index for _, s, index in ran if s == source] == list(range(50))
+        assert [future.result(0) for future in futures[source]] == [index * 2 for index in range(50)]
+    assert bus.processed == 200 and bus.pending() == 0
+    print("✅ Commands run in order on the main thread with results in their futures")
+
+
+def test_failures_and_cancellation():
+    """Exceptions reach the caller, cancelled commands are skipped and close cancels the rest"""
+    print("Testing command bus errors and cancellation...")
+
+    bus = CommandBus()
+    ran = []
+
+    def fail():
+        raise ValueError("no such item")
+
+    failed = bus.submit("fail", fail)
+    cancelled = bus.submit("cancelled", ran.append, "cancelled")
+    cancelled.cancel()
+
+    # Commands queued while draining wait for the next frame
+    later = []
+    bus.submit("chain", lambda: later.append(bus.submit("later", ran.append, "later")))
+
+    assert bus.drain() == 3
+    assert isinstance(failed.exception(0), ValueError)
+    assert ran == [] and bus.failed == 1 and bus.pending() == 1
+    assert bus.drain(max_commands=1) == 1
+    assert ran == ["later"]
+
+    queued = bus.submit("queued", ran.append, "queued")
+    bus.close()
+    assert queued.cancelled()
+    assert isinstance(bus.submit("closed", ran.append, "closed").exception(0), RuntimeError)
+    assert ran == ["later"]
+    print("✅ Errors propagate and cancelled commands never run")
+
+
+def test_async_caller_awaits_result():
+    """An asyncio server thread can await a command run by the game loop"""
+    print("Testing awaiting commands from asyncio...")
+
+    bus = CommandBus()
+    results = []
+
+    async def call_tool():
+        future = bus.submit("get_player_info", lambda: {"success": True, "thread": threading.current_thread()})
+        return await asyncio.wait_for(asyncio.wrap_future(future), 5.0)
+
+    server = threading.Thread(target=lambda: results.append(asyncio.run(call_tool())))
+    server.start()
+    while server.is_alive():
+        bus.drain()
+        server.join(0.01)
+
+    assert results[0]["success"]
+    assert results[0]["thread"] is threading.current_thread()
+    print("✅ Async callers get results back through the future")
+
+
+def test_action_handler_and_debug_mirror():
+    """MCP actions go over the bus and the mirror writes files in the background"""
+    print("Testing MCP action handler with the debug mirror...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        original_dir = os.getcwd()
+        os.chdir(temp_dir)
+        try:
+            mirror = CommandMirror()
+            bus = CommandBus(mirror)
+            player = SimpleNamespace(inventory=[], level=3, hp=40, max_hp=100)
+            game = SimpleNamespace(command_bus=bus, player=player, current_level=None)
+            handler = MCPActionHandler(game, mirror=mirror)
+            assert handler.command_bus is bus
+
+            future = handler.submit_action({"action_type": "give_item", "npc_id": "merchant_1",
+                                            "parameters": {"item_name": "Health Potion", "quantity": 2}})
+            assert not future.done()
+            assert handler.process_pending_actions() == 1
+            assert future.result(0) is True
+            assert player.inventory_items[0]["name"] == "Health Potion"
+
+            state = handler.update_game_state(player)
+            assert state["player"]["level"] == 3
+            assert mirror.flush()
+
+            with open("mcp_commands.jsonl") as f:
+                records = [json.loads(line) for line in f]
+            assert records[0]["command"] == "give_item" and records[0]["result"] is True
+            with open("game_state.json") as f:
+                assert json.load(f)["player"]["hp"] == 40
+            mirror.close()
+
+            # Without a mirror nothing is written
+            os.remove("game_state.json")
+            MCPActionHandler(game).update_game_state(player)
+            assert not os.path.exists("game_state.json")
+        finally:
+            os.chdir(original_dir)
+    print("✅ Actions run through the bus and debug files are mirrored asynchronously")
+
+
+def main():
+    """Run all command bus tests"""
+    tests = [test_commands_run_on_draining_thread, test_failures_and_cancellation,
+             test_async_caller_awaits_result, test_action_handler_and_debug_mirror]
+
+    for test in tests:
+        test()
+
+    print("\n🎉 All command bus tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
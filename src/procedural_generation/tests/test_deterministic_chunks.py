@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Golden-output test for deterministic chunk generation
+
+Chunks must be byte-identical for the same world seed regardless of the
+process (and its PYTHONHASHSEED) or the order chunks are generated in.
+"""
+
+import sys
+import os
+import json
+import subprocess
+
+# Add the project root to the path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.procedural_generation.src.seeding import derive_seed
+
+WORLD_SEED = 12345
+
+# (1, -1) and (-3, -4) hold settlements, so the building template path is covered too
+CHUNK_KEYS = [(0, 0), (1, 0), (1, -1), (-3, -4), (2, 3), (5, -4)]
+
+# Digests of chunk.to_bytes() for WORLD_SEED - update only for intentional generation changes
+GOLDEN_DIGESTS = {
+    "0,0": "b4ffde4c2b005606",
+    "1,0": "fbb887fa7a3aa126",
+    "1,-1": "0a49d78e9599a5d5",
+    "-3,-4": "dfecba410ceeda9c",
+    "2,3": "aa90fbd2ccf3ba00",
+    "5,-4": "7776df27d3e5a55f",
+}
+
+GENERATE_SCRIPT = """
+import hashlib, json, sys
+from src.world.world_generator import WorldGenerator
+keys = json.loads(sys.argv[1])
+generator = WorldGenerator(int(sys.argv[2]))
+digests = {}
+for chunk_x, chunk_y in keys:
+    payload = generator.generate_chunk(chunk_x, chunk_y).to_bytes()
+    digests[f"{chunk_x},{chunk_y}"] = hashlib.blake2b(payload, digest_size=8).hexdigest()
+sys.stderr.write(json.dumps(digests))
+"""
+
+
+def generate_digests(keys, hash_seed):
+    """Generate chunks in a fresh interpreter and return their digests"""
+    env = dict(os.environ, PYTHONHASHSEED=str(hash_seed), SDL_VIDEODRIVER="dummy", SDL_AUDIODRIVER="dummy")
+    result = subprocess.run(
+        [sys.executable, "-c", GENERATE_SCRIPT, json.dumps(keys), str(WORLD_SEED)],
+        cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stderr.strip().splitlines()[-1])
+
+
+def test_derive_seed_is_stable():
+    """Derived seeds don't depend on Python's salted hash"""
+    print("Testing stable seed derivation...")
+
+    assert derive_seed(WORLD_SEED, 0, 0) == derive_seed(WORLD_SEED, 0, 0)
+    assert derive_seed(WORLD_SEED, 0, 1) != derive_seed(WORLD_SEED, 1, 0)
+    assert derive_seed(WORLD_SEED, 1, 1, "VILLAGE") != derive_seed(WORLD_SEED, 1, 1, "TOWN")
+    assert 0 <= derive_seed("any", -5, 3.5) < 2 ** 31
+    print("✅ Seed derivation is stable")
+
+
+def test_chunks_identical_across_processes_and_order():
+    """Same seed gives byte-identical chunks in any process and generation order"""
+    print("Testing chunk determinism across processes...")
+
+    forward = generate_digests(CHUNK_KEYS, hash_seed=1)
+    backward = generate_digests(CHUNK_KEYS[::-1], hash_seed=2)
+    assert forward == backward
+
+    for key, digest in GOLDEN_DIGESTS.items():
+        assert forward[key] == digest, f"Chunk {key} changed: {forward[key]}"
+    print("✅ Chunks are byte-identical across processes and generation order")
+
+
+def main():
+    """Run all determinism tests"""
+    tests = [test_derive_seed_is_stable, test_chunks_identical_across_processes_and_order]
+
+    for test in tests:
+        test()
+
+    print("\n🎉 All determinism tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Tests for the cached per-chunk door proximity field
+"""
+
+import sys
+import os
+import tempfile
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from src.world.chunk import Chunk
+from src.world.chunk_manager import ChunkManager
+from src.world.building_registry import WALL_TILES
+from src.level.level_collision import CollisionMixin
+from src.level.door_field import NEAR_DOOR, DOOR_AREA, DOUBLE_DOOR, VERTICAL
+from src.door_pathfinder import DoorPathfinder
+
+SIZE = Chunk.CHUNK_SIZE
+
+
+class Walls:
+    """Wall renderer stand-in"""
+
+    def is_wall_tile(self, tile_type):
+        return tile_type in WALL_TILES
+
+
+class ScanLevel:
+    """Level without a door field - DoorPathfinder scans tiles"""
+
+    TILE_DOOR = 5
+
+    def __init__(self, chunk_manager):
+        self.chunk_manager = chunk_manager
+        self.width = self.height = SIZE * 2
+        self.wall_renderer = Walls()
+
+    def get_tile(self, x, y):
+        return self.chunk_manager.get_tile(x, y)
+
+
+class FieldLevel(CollisionMixin, ScanLevel):
+    """Chunk-based level that reads the door field"""
+
+
+def make_world(temp_dir):
+    """Two loaded grass chunks with a building wall crossing the chunk border"""
+    manager = ChunkManager(5, "door_test")
+    for chunk_x in (0, 1):
+        chunk = Chunk(chunk_x, 0, 5)
+        chunk.tiles = [[0] * SIZE for _ in range(SIZE)]
+        chunk.biomes = [['PLAINS'] * SIZE for _ in range(SIZE)]
+        chunk.is_generated = chunk.is_loaded = True
+        manager.loaded_chunks[(chunk_x, 0)] = chunk
+
+    left, right = manager.loaded_chunks[(0, 0)].tiles, manager.loaded_chunks[(1, 0)].tiles
+    # Horizontal wall along y=10 from x=55 to x=72 with a double door at 62-63
+    # and a single door at 65 just across the border
+    for x in range(55, 73):
+        (left if x < SIZE else right)[10][x % SIZE] = 10
+    left[10][62] = left[10][63] = 5
+    right[10][65 - SIZE] = 5
+    # Vertical wall along x=20 with a door at y=30
+    for y in range(25, 36):
+        left[y][20] = 11
+    left[30][20] = 5
+    # Wall along y=20 with a door on the first tile of the right chunk
+    for x in range(60, 69):
+        (left if x < SIZE else right)[20][x % SIZE] = 10
+    right[20][0] = 5
+    return manager
+
+
+def in_temp_dir(test):
+    """Run a test with a temporary working directory for world saves"""
+    def wrapper():
+        original_cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.chdir(temp_dir)
+            try:
+                test(temp_dir)
+            finally:
+                os.chdir(original_cwd)
+    wrapper.__name__ = test.__name__
+    wrapper.__doc__ = test.__doc__
+    return wrapper
+
+
+@in_temp_dir
+def test_field_matches_tile_scan(temp_dir):
+    """Field lookups give the same door context as the 5x5 tile scan"""
+    print("Testing door field against the tile scan...")
+
+    manager = make_world(temp_dir)
+    scanner = DoorPathfinder(ScanLevel(manager))
+    field_level = FieldLevel(manager)
+    lookup = DoorPathfinder(field_level)
+
+    checked = 0
+    for y in list(range(6, 24)) + list(range(26, 35)):
+        for x in list(range(14, 26)) + list(range(52, 76)):
+            expected = scanner.analyze_door_context(x, y, x + 0.5, y + 0.5)
+            assert lookup.analyze_door_context(x, y, x + 0.5, y + 0.5) == expected, (x, y)
+            checked += 1
+
+    field = field_level.get_door_field()
+    assert field.flags_at(63, 10) & DOUBLE_DOOR
+    assert field.flags_at(65, 11) & DOOR_AREA and not field.flags_at(65, 11) & DOUBLE_DOOR
+    assert field.flags_at(63, 11) & VERTICAL  # Walls east and west
+    assert not field.flags_at(21, 30) & VERTICAL  # Walls north and south
+    assert field.flags_at(40, 40) == 0
+    print(f"✅ Door field matches the tile scan on {checked} tiles")
+
+
+@in_temp_dir
+def test_set_tile_updates_field(temp_dir):
+    """Tile edits update the tiles around them"""
+    print("Testing door field updates...")
+
+    manager = make_world(temp_dir)
+    level = FieldLevel(manager)
+    field = level.get_door_field()
+    assert not field.flags_at(40, 40) & NEAR_DOOR
+
+    manager.set_tile(40, 41, 5)
+    assert field.flags_at(40, 40) & NEAR_DOOR
+    assert field.flags_at(40, 40) & DOOR_AREA
+
+    manager.set_tile(40, 41, 0)
+    assert field.flags_at(40, 40) == 0
+
+    # Walls beside a door turn it around
+    manager.set_tile(39, 41, 11)
+    manager.set_tile(41, 41, 11)
+    manager.set_tile(40, 41, 5)
+    assert field.flags_at(40, 42) & VERTICAL
+    print("✅ set_tile keeps the door field current")
+
+
+@in_temp_dir
+def test_neighbour_load_rebuilds_edge(temp_dir):
+    """A field built before its neighbour loaded picks up the neighbour's doors"""
+    print("Testing door field across late-loading chunks...")
+
+    manager = make_world(temp_dir)
+    right = manager.loaded_chunks.pop((1, 0))
+    level = FieldLevel(manager)
+    field = level.get_door_field()
+    assert field.flags_at(63, 21) == 0  # The door at x=64 isn't visible yet
+    assert field.flags_at(66, 10) == 0  # Chunk not loaded
+
+    manager.loaded_chunks[(1, 0)] = right
+    assert field.flags_at(66, 10) & NEAR_DOOR
+    assert field.flags_at(63, 21) == NEAR_DOOR | DOOR_AREA | VERTICAL
+    print("✅ Loading a neighbour refreshes the edge of the field")
+
+
+def test_direct_path_near_doors():
+    """is_direct_path_clear still treats door surroundings leniently"""
+    print("Testing direct paths through doors...")
+
+    @in_temp_dir
+    def check(temp_dir):
+        manager = make_world(temp_dir)
+        level = FieldLevel(manager)
+        sizes = []
+        level.check_collision = lambda x, y, size=0.4, exclude_entity=None: sizes.append(size) or False
+        assert level.is_direct_path_clear(62.5, 8.5, 62.5, 12.5, 0.4)
+        assert min(sizes) < 0.4 and max(sizes) == 0.4
+    check()
+    print("✅ Door leniency applies along direct paths")
+
+
+def main():
+    """Run all door field tests"""
+    tests = [test_field_matches_tile_scan, test_set_tile_updates_field,
+             test_neighbour_load_rebuilds_edge, test_direct_path_near_doors]
+
+    for test in tests:
+        test()
+
+    print("\n🎉 All door field tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
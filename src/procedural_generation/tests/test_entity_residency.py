@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental entity residency around the player
+"""
+
+import sys
+import os
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from src.world.chunk import Chunk
+from src.world.entity_residency import EntityResidencyManager
+
+
+class FakeChunkManager:
+    """Serves chunks with one enemy and one object each, counting loads"""
+
+    def __init__(self):
+        self.chunks = {}
+        self.pending = set()
+        self.saved = []
+
+    def world_to_chunk_coords(self, world_x, world_y):
+        return int(world_x // Chunk.CHUNK_SIZE), int(world_y // Chunk.CHUNK_SIZE)
+
+    def get_chunk(self, chunk_x, chunk_y, blocking=True):
+        key = (chunk_x, chunk_y)
+        if key in self.pending and not blocking:
+            return None
+        if key not in self.chunks:
+            chunk = Chunk(chunk_x, chunk_y, 1)
+            chunk.entities = [
+                {'type': 'enemy', 'name': 'Goblin', 'x': 5, 'y': 5, 'id': f'goblin_{chunk_x}_{chunk_y}'},
+                {'type': 'object', 'name': 'Tree', 'x': 9, 'y': 9}
+            ]
+            self.chunks[key] = chunk
+        return self.chunks[key]
+
+    def save_chunk(self, chunk):
+        self.saved.append((chunk.chunk_x, chunk.chunk_y))
+
+
+class FakeLevel:
+    """Level with entity lists and a counting entity factory"""
+
+    def __init__(self):
+        self.npcs, self.enemies, self.objects = [], [], []
+        self.items, self.chests, self.furniture = [], [], []
+        self.created = 0
+
+    def create_entity(self, entity_data, world_x, world_y):
+        self.created += 1
+        return {'name': entity_data['name'], 'x': world_x, 'y': world_y, 'health': 30}
+
+
+def make_residency():
+    level = FakeLevel()
+    chunk_manager = FakeChunkManager()
+    residency = EntityResidencyManager(level, chunk_manager, level.create_entity, radius=1)
+    return level, chunk_manager, residency
+
+
+def test_moves_within_chunk_are_free():
+    """Moving inside a chunk should not recreate anything"""
+    print("Testing moves within a chunk...")
+
+    level, _, residency = make_residency()
+    assert residency.update(32, 32)
+    assert len(level.enemies) == 9 and len(level.objects) == 9
+    created = level.created
+
+    for step in range(20):
+        assert not residency.update(32 + step, 32 + step * 0.5)
+    assert level.created == created
+    print("✅ No entities recreated while staying in one chunk")
+
+
+def test_boundary_crossing_is_incremental():
+    """Crossing a chunk boundary only touches the entering and leaving columns"""
+    print("Testing chunk boundary crossing...")
+
+    level, _, residency = make_residency()
+    residency.update(32, 32)
+    goblin = next(enemy for enemy in level.enemies if enemy['x'] == 5 and enemy['y'] == 5)
+    goblin['health'] = 3
+    created = level.created
+    enemies_list = level.enemies
+
+    assert residency.update(64 + 10, 32)
+    assert level.created - created == 6  # one new column of 3 chunks, two entities each
+    assert len(level.enemies) == 9
+    assert level.enemies is enemies_list
+    assert goblin in level.enemies and goblin['health'] == 3
+
+    # Moving far enough evicts the goblin's chunk
+    residency.update(64 * 2 + 10, 32)
+    assert goblin not in level.enemies
+    assert (0, 0) not in residency.resident_chunks
+    print("✅ Live entities kept, only entering chunks instantiated")
+
+
+def test_pending_chunks_fill_in_later():
+    """Chunks still generating are admitted on a later update"""
+    print("Testing pending chunk admission...")
+
+    level, chunk_manager, residency = make_residency()
+    chunk_manager.pending.add((1, 1))
+    residency.update(32, 32)
+    assert (1, 1) in residency.pending_chunks
+    assert len(level.enemies) == 8
+
+    chunk_manager.pending.clear()
+    assert residency.update(33, 33)
+    assert len(level.enemies) == 9 and not residency.pending_chunks
+
+    # Invalidating rebuilds just that chunk
+    created = level.created
+    residency.invalidate_chunk(0, 0)
+    residency.update(33, 33)
+    assert level.created - created == 2
+    print("✅ Pending and invalidated chunks admitted on the next update")
+
+
+def test_removed_entity_stays_gone():
+    """An entity removed through residency isn't recreated when its chunk comes back"""
+    print("Testing entity removal...")
+
+    level, chunk_manager, residency = make_residency()
+    removed = []
+
+    class Listener:
+        def entity_added(self, list_name, entity):
+            pass
+
+        def entity_removed(self, list_name, entity):
+            removed.append((list_name, entity))
+
+    residency.listeners.append(Listener())
+    residency.update(32, 32)
+    goblin = next(enemy for enemy in level.enemies if enemy['x'] == 5 and enemy['y'] == 5)
+    assert residency.remove_entity(goblin)
+    assert goblin not in level.enemies and removed == [('enemies', goblin)]
+    assert chunk_manager.saved == [(0, 0)]
+    assert not residency.remove_entity(goblin)
+
+    # Leave and come back - the chunk is admitted again without its goblin
+    residency.update(64 * 3 + 10, 32)
+    residency.update(32, 32)
+    assert len(level.enemies) == 8 and len(level.objects) == 9
+    assert not any(enemy['x'] == 5 and enemy['y'] == 5 for enemy in level.enemies)
+    print("✅ Removed entity not brought back by re-admission")
+
+
+def main():
+    """Run all entity residency tests"""
+    tests = [test_moves_within_chunk_are_free, test_boundary_crossing_is_incremental,
+             test_pending_chunks_fill_in_later, test_removed_entity_stays_gone]
+
+    for test in tests:
+        test()
+
+    print("\n🎉 All entity residency tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Tests for the spawn records chunk generation plans entities with
+"""
+
+import sys
+import os
+import random
+import pickle
+import subprocess
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add the project root to the path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, PROJECT_ROOT)
+
+# Bind the game modules to the real pygame before test_phase4_integration swaps in its mock
+from src.entities import Entity, Enemy, RangedEnemy
+from src.procedural_generation.src.biome_generator import BiomeGenerator
+from src.procedural_generation.src.enhanced_entity_spawner import EnhancedEntitySpawner, SpawnRecord, CROWDING_RADIUS
+from src.procedural_generation.src.seeding import derive_seed
+
+SIZE = 64
+
+
+def chunk_terrain(chunk_x=0, chunk_y=0):
+    """Seed, tiles and biomes of a chunk"""
+    seed = derive_seed(12345, chunk_x, chunk_y)
+    biome_gen = BiomeGenerator(SIZE, SIZE, seed)
+    biomes = biome_gen.generate_biome_map()
+    return seed, biome_gen.generate_tiles(biomes), biomes
+
+
+def test_plans_are_plain_data():
+    """Planning gives picklable records, and generating a chunk never imports pygame"""
+    print("Testing spawn plans...")
+
+    seed, tiles, biomes = chunk_terrain()
+    spawner = EnhancedEntitySpawner(SIZE, SIZE, seed)
+    plan = spawner.plan_objects(tiles, biomes, []) + spawner.plan_enemies(tiles, biomes, [])
+    assert plan and all(isinstance(record, SpawnRecord) for record in plan)
+    assert {record.kind for record in plan} == {'object', 'enemy'}
+    assert all(record.weapon is None for record in plan if record.kind == 'object')
+    assert pickle.loads(pickle.dumps(plan)) == plan
+
+    # Same seed, same plan
+    again = EnhancedEntitySpawner(SIZE, SIZE, seed)
+    assert again.plan_objects(tiles, biomes, []) + again.plan_enemies(tiles, biomes, []) == plan
+
+    script = ("import sys\n"
+              "from src.world.world_generator import WorldGenerator\n"
+              "WorldGenerator(12345).generate_chunk(0, 0)\n"
+              "sys.stderr.write(str('pygame' in sys.modules))\n")
+    result = subprocess.run([sys.executable, "-c", script], cwd=PROJECT_ROOT,
+                            capture_output=True, text=True, check=True)
+    assert result.stderr.strip().splitlines()[-1] == "False"
+    print(f"✅ {len(plan)} spawns planned without pygame")
+
+
+def test_records_become_entities():
+    """Resident entities are built from records with the planned stats"""
+    print("Testing entities from spawn records...")
+
+    tree = EnhancedEntitySpawner.create_entity(SpawnRecord('object', 'oak_tree', 5, 6), None)
+    goblin = EnhancedEntitySpawner.create_entity(SpawnRecord('enemy', 'Forest Goblin', 7, 8, 25, 6, 15), None)
+    archer = EnhancedEntitySpawner.create_entity(SpawnRecord('enemy', 'Goblin Archer', 9, 10, 55, 15, 45, 'bow'), None)
+
+    assert type(tree) is Entity and (tree.name, tree.x, tree.y) == ('oak_tree', 5, 6) and tree.blocks_movement
+    assert type(goblin) is Enemy and (goblin.health, goblin.damage, goblin.experience) == (25, 6, 15)
+    assert isinstance(archer, RangedEnemy) and archer.weapon_type == 'bow' and archer.health == 55
+    print("✅ Records turn into the same entities the spawner used to build")
+
+
+def test_fast_placement_checks_match_scans():
+    """Summed-area wall checks and crowding counts agree with scanning the neighbourhood"""
+    print("Testing placement checks...")
+
+    rng = random.Random(7)
+    spawner = EnhancedEntitySpawner(SIZE, SIZE, 7)
+    tiles = [[rng.choice([0, 0, 0, 1, spawner.TILE_WALL, spawner.TILE_DOOR]) for _ in range(SIZE)] for _ in range(SIZE)]
+    for _ in range(300):
+        spawner.mark_position_occupied(rng.randrange(SIZE), rng.randrange(SIZE))
+
+    spawner._index_walls(tiles)
+    indexed = [[spawner._has_nearby_walls(x, y, tiles, radius) for radius in (1, 2)] for y in range(SIZE) for x in range(SIZE)]
+    crowded = [spawner._is_area_overcrowded(x, y) for y in range(SIZE) for x in range(SIZE)]
+    spawner._index_walls(None)
+    scanned = [[spawner._has_nearby_walls(x, y, tiles, radius) for radius in (1, 2)] for y in range(SIZE) for x in range(SIZE)]
+    assert indexed == scanned
+
+    def scan_crowding(x, y):
+        positions = [(x + dx, y + dy) for dy in range(-CROWDING_RADIUS, CROWDING_RADIUS + 1)
+                     for dx in range(-CROWDING_RADIUS, CROWDING_RADIUS + 1)
+                     if 0 <= x + dx < SIZE and 0 <= y + dy < SIZE]
+        return sum(position in spawner.occupied_positions for position in positions) > len(positions) * 0.2
+
+    assert crowded == [scan_crowding(x, y) for y in range(SIZE) for x in range(SIZE)]
+    assert any(crowded) and not all(crowded)
+    print("✅ Fast placement checks match the neighbourhood scans")
+
+
+def main():
+    """Run all spawn plan tests"""
+    tests = [test_plans_are_plain_data, test_records_become_entities, test_fast_placement_checks_match_scans]
+
+    for test in tests:
+        test()
+
+    print("\n🎉 All spawn plan tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
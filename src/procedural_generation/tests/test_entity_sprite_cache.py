@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared sprite cache entities get their scaled sprites from
+"""
+
+import sys
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add the project root to the path
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, project_root)
+
+import pygame
+
+# Bind the game modules to the real pygame before test_phase4_integration swaps in its mock
+from src.core.assets import AssetLoader
+from src.entities.enemy import Enemy, ENEMY_SPRITES
+from src.entities.item import Item
+from src.entities.npc import NPC, NPC_SPRITES
+
+
+_loader = None
+
+
+def make_loader():
+    """The game's asset loader (loaded once - it's slow) with an empty sprite cache"""
+    global _loader
+    if _loader is None:
+        pygame.init()
+        original_cwd = os.getcwd()
+        os.chdir(project_root)  # Assets are loaded relative to the working directory
+        try:
+            _loader = AssetLoader()
+        finally:
+            os.chdir(original_cwd)
+    _loader.clear_sprite_cache()
+    _loader.sprite_cache_size = 512
+    _loader.sprite_cache_hits = _loader.sprite_cache_misses = 0
+    return _loader
+
+
+def striped_image():
+    """Image whose left half is red and right half is blue, so mirroring shows"""
+    image = pygame.Surface((64, 32), pygame.SRCALPHA)
+    image.fill((255, 0, 0))
+    image.fill((0, 0, 255), pygame.Rect(32, 0, 32, 32))
+    return image
+
+
+def test_sprites_scaled_once_and_shared():
+    """The same name, size and flip always returns the same Surface"""
+    print("Testing sprite cache lookups...")
+
+    loader = make_loader()
+    loader.images["test_stripes"] = striped_image()
+
+    sprite = loader.get_sprite("test_stripes", 16)
+    assert sprite.get_size() == (16, 16)
+    assert loader.get_sprite("test_stripes", (16, 16)) is sprite
+    assert loader.get_sprite("test_stripes", 24) is not sprite
+
+    mirrored = loader.get_sprite("test_stripes", 16, flip_x=True)
+    assert mirrored is loader.get_sprite("test_stripes", 16, flip_x=True)
+    assert sprite.get_at((0, 0))[:3] == (255, 0, 0) and mirrored.get_at((0, 0))[:3] == (0, 0, 255)
+
+    assert loader.get_sprite("no_such_image", 16) is None
+    stats = loader.sprite_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (3, 3, 3)
+    assert stats["bytes"] == 16 * 16 * 4 * 2 + 24 * 24 * 4
+    print(f"✅ Sprites are shared ({stats['hit_rate']:.0%} hit rate, {stats['bytes']} bytes)")
+
+
+def test_cache_is_bounded():
+    """The least recently used sprites go when the cache is full, and their bytes with them"""
+    print("Testing sprite cache eviction...")
+
+    loader = make_loader()
+    loader.images["test_stripes"] = striped_image()
+    loader.sprite_cache_size = 2
+
+    small = loader.get_sprite("test_stripes", 8)
+    loader.get_sprite("test_stripes", 16)
+    assert loader.get_sprite("test_stripes", 8) is small  # 16 is now least recently used
+    loader.get_sprite("test_stripes", 32)
+
+    assert list(loader.sprite_cache) == [("test_stripes", 8, 8, False), ("test_stripes", 32, 32, False)]
+    assert loader.sprite_cache_bytes == (8 * 8 + 32 * 32) * 4
+    loader.clear_sprite_cache()
+    assert loader.sprite_cache_stats()["bytes"] == 0 and not loader.sprite_cache
+    print("✅ Cache stays within its limit")
+
+
+def test_entities_share_sprites():
+    """Entities of the same kind reuse one scaled sprite instead of scaling their own"""
+    print("Testing entities use the sprite cache...")
+
+    loader = make_loader()
+    enemy_name = next(name for name, asset in ENEMY_SPRITES.items() if asset in loader.images)
+    npc_name = next(name for name, asset in NPC_SPRITES.items() if asset in loader.images)
+
+    first, second = Enemy(5, 5, enemy_name, asset_loader=loader), Enemy(6, 5, enemy_name, asset_loader=loader)
+    assert first.sprite is second.sprite
+    assert first.direction_sprites[3] is second.direction_sprites[3]
+
+    merchant, other = NPC(5, 5, npc_name, asset_loader=loader), NPC(6, 6, npc_name, asset_loader=loader)
+    assert merchant.sprite is other.sprite and merchant.direction_sprites[1] is other.direction_sprites[1]
+
+    potion, another = Item(1, 1, "Health Potion", asset_loader=loader), Item(2, 2, "Health Potion", asset_loader=loader)
+    assert potion.sprite is another.sprite and potion.value == 25
+
+    stats = loader.sprite_cache_stats()
+    assert stats["misses"] == 5 and stats["hits"] >= 5
+    print(f"✅ Entities share sprites ({stats['hit_rate']:.0%} hit rate)")
+
+
+def main():
+    """Run all sprite cache tests"""
+    tests = [test_sprites_scaled_once_and_shared, test_cache_is_bounded, test_entities_share_sprites]
+
+    for test in tests:
+        test()
+
+    print("\n🎉 All sprite cache tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tests that the game releases a world's chunk workers and region files when it's replaced
+"""
+
+import sys
+import os
+import contextlib
+import io
+import tempfile
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add the project root to the path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, PROJECT_ROOT)
+
+import pygame
+
+# Bind the game modules, and those new_game imports late, to the real pygame before
+# test_phase4_integration swaps in its mock
+from src.core.assets import AssetLoader
+from src.core.game_log import GameLog
+from src.game import Game
+from src.quest_system import QuestManager
+from src.ui.quest_log import QuestLog
+from src.settings import Settings
+
+
+def make_game():
+    """A Game with just the systems new_game needs - no window, menus or MCP server"""
+    pygame.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((64, 64))
+    original_dir = os.getcwd()
+    os.chdir(PROJECT_ROOT)
+    try:
+        asset_loader = AssetLoader()
+    finally:
+        os.chdir(original_dir)
+
+    game = Game.__new__(Game)
+    game.settings = Settings()
+    game.settings.set("async_chunk_generation", True)
+    game.asset_loader = asset_loader
+    game.game_log = GameLog()
+    game.player = None
+    game.current_level = None
+    return game
+
+
+def test_new_game_closes_previous_world():
+    """Starting a second world shuts down the first one's worker pool and region files"""
+    print("Testing world shutdown on new game...")
+
+    original_dir = os.getcwd()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.chdir(temp_dir)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                game = make_game()
+                game.new_game(seed=1234)
+                first = game.current_level.chunk_manager
+                assert first.async_generation
+                first.wait_for_chunks([(5, 5)])  # Make sure the pool is running
+                assert first._executor is not None and first.regions
+
+                game.new_game(seed=5678)
+            second = game.current_level.chunk_manager
+            assert second is not first
+            assert first._executor is None and not first.regions
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                game.close_level()
+            assert game.current_level is None and second._executor is None and not second.regions
+        finally:
+            os.chdir(original_dir)
+    print("✅ The replaced world's workers and region files were released")
+
+
+def main():
+    """Run all game world lifecycle tests"""
+    tests = [test_new_game_closes_previous_world]
+
+    for test in tests:
+        test()
+
+    print("\n🎉 All game world lifecycle tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Tests for hierarchical pathfinding over cluster portal graphs
+"""
+
+import sys
+import os
+import tempfile
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from src.world.chunk import Chunk
+from src.world.chunk_manager import ChunkManager
+from src.level.level_collision import CollisionMixin
+from src.level.level_pathfinding import PathfindingMixin
+from src.level.hierarchical_pathfinder import HierarchicalPathfinder
+
+WALL_X = 90
+
+
+class GridLevel(CollisionMixin, PathfindingMixin):
+    """Just enough level for the navigation grid and hierarchical pathfinder"""
+
+    def __init__(self, chunk_manager):
+        self.chunk_manager = chunk_manager
+        self.is_infinite_world = True
+        self.objects, self.chests, self.furniture, self.npcs, self.enemies = [], [], [], [], []
+
+
+def make_world(gap_y):
+    """3x3 loaded chunks of grass split by a wall column with a single gap"""
+    manager = ChunkManager(5, "hpa_test")
+    for chunk_y in (-1, 0, 1):
+        for chunk_x in (0, 1, 2):
+            chunk = Chunk(chunk_x, chunk_y, 5)
+            chunk.tiles = [[0] * Chunk.CHUNK_SIZE for _ in range(Chunk.CHUNK_SIZE)]
+            chunk.biomes = [['PLAINS'] * Chunk.CHUNK_SIZE for _ in range(Chunk.CHUNK_SIZE)]
+            chunk.is_generated = chunk.is_loaded = True
+            manager.loaded_chunks[(chunk_x, chunk_y)] = chunk
+
+    wall_chunk_x, local_x = divmod(WALL_X, Chunk.CHUNK_SIZE)
+    for world_y in range(-Chunk.CHUNK_SIZE, 2 * Chunk.CHUNK_SIZE):
+        if world_y != gap_y:
+            chunk_y, local_y = divmod(world_y, Chunk.CHUNK_SIZE)
+            manager.loaded_chunks[(wall_chunk_x, chunk_y)].tiles[local_y][local_x] = 4
+    return manager
+
+
+def in_temp_dir(test):
+    """Run a test with a temporary working directory for world saves"""
+    def wrapper():
+        original_cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.chdir(temp_dir)
+            try:
+                test()
+            finally:
+                os.chdir(original_cwd)
+    wrapper.__name__ = test.__name__
+    wrapper.__doc__ = test.__doc__
+    return wrapper
+
+
+def assert_walkable_steps(level, start, path):
+    """Every step moves to an adjacent, walkable tile"""
+    previous = start
+    for tile in path:
+        assert max(abs(tile[0] - previous[0]), abs(tile[1] - previous[1])) == 1, (previous, tile)
+        assert level.is_tile_walkable(*tile), tile
+        previous = tile
+
+
+@in_temp_dir
+def test_long_path_through_gap():
+    """Targets beyond the tile search range are reached through the wall gap"""
+    print("Testing hierarchical path through a wall gap...")
+
+    manager = make_world(gap_y=40)
+    level = GridLevel(manager)
+
+    start, goal = (5, 10), (150, 10)
+    path = level.find_tile_path(*start, *goal)
+    assert path and path[-1] == goal
+    assert (WALL_X, 40) in path
+    assert_walkable_steps(level, start, path)
+
+    # Coarse paths used to give up beyond 50 tiles
+    level.calculate_sub_tile_position = lambda x, y, size: (x + 0.5, y + 0.5)
+    coarse = level.find_coarse_path(5.5, 10.5, 150.5, 10.5)
+    assert coarse and coarse[-1] == (150.5, 10.5)
+    manager.close()
+    print("✅ Long path found through the gap")
+
+
+@in_temp_dir
+def test_route_refines_incrementally():
+    """Routes only refine the segments just ahead of the entity"""
+    print("Testing incremental route refinement...")
+
+    manager = make_world(gap_y=40)
+    level = GridLevel(manager)
+
+    start, goal = (5, 10), (150, 10)
+    route = level.find_tile_route(*start, *goal)
+    assert route is not None and route.goal == goal
+
+    walked = []
+    first = route.refine(8)
+    assert first and not route.finished and len(first) < 80
+    walked.extend(first)
+    while not route.finished:
+        walked.extend(route.refine(8))
+    assert walked[-1] == goal
+    assert_walkable_steps(level, start, walked)
+    manager.close()
+    print("✅ Route refined a few segments at a time")
+
+
+@in_temp_dir
+def test_clusters_refresh_on_tile_change():
+    """Editing tiles rebuilds the cached cluster graphs that read them"""
+    print("Testing cluster graph invalidation...")
+
+    manager = make_world(gap_y=40)
+    level = GridLevel(manager)
+    pathfinder = level.get_hierarchical_pathfinder()
+    assert isinstance(pathfinder, HierarchicalPathfinder)
+
+    start, goal = (5, 10), (150, 10)
+    assert (WALL_X, 40) in level.find_tile_path(*start, *goal)
+    cluster = pathfinder.get_cluster(*pathfinder.cluster_of(WALL_X, 40))
+    assert pathfinder.get_cluster(*pathfinder.cluster_of(WALL_X, 40)) is cluster  # Reused while unchanged
+
+    # Close the gap and open another one further down
+    manager.set_tile(WALL_X, 40, 4)
+    manager.set_tile(WALL_X, 70, 0)
+    assert pathfinder.get_cluster(*pathfinder.cluster_of(WALL_X, 40)) is not cluster
+
+    path = level.find_tile_path(*start, *goal)
+    assert path and path[-1] == goal
+    assert (WALL_X, 40) not in path and (WALL_X, 70) in path
+    assert_walkable_steps(level, start, path)
+
+    # With no gap left the route goes around the wall through chunks that aren't loaded
+    manager.set_tile(WALL_X, 70, 4)
+    path = level.find_tile_path(*start, *goal)
+    assert path and path[-1] == goal
+    assert any(y < -Chunk.CHUNK_SIZE or y >= 2 * Chunk.CHUNK_SIZE for _, y in path)
+    manager.close()
+    print("✅ Cluster graphs rebuilt after tile edits")
+
+
+def main():
+    """Run all hierarchical pathfinding tests"""
+    tests = [test_long_path_through_gap, test_route_refines_incrementally, test_clusters_refresh_on_tile_change]
+
+    for test in tests:
+        test()
+
+    print("\n🎉 All hierarchical pathfinding tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
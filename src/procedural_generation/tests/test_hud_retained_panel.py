@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Tests for the retained bottom panel, XP bar and HUD
+"""
+
+import sys
+import os
+import contextlib
+import io
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add the project root to the path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, PROJECT_ROOT)
+
+import pygame
+
+# Bind the game modules to the real pygame before test_phase4_integration swaps in its mock
+from src.core.assets import AssetLoader
+from src.core.game_log import GameLog
+from src.level.ui_renderer import UIRendererMixin
+from src.ui.hud import HUD
+from src.ui.retained_panel import RetainedPanel
+
+SCREEN = (1280, 720)
+
+_loader = None
+
+
+def get_loader():
+    """One real asset loader for the module"""
+    global _loader
+    pygame.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((64, 64))
+    if _loader is None:
+        original_dir = os.getcwd()
+        os.chdir(PROJECT_ROOT)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                _loader = AssetLoader()
+        finally:
+            os.chdir(original_dir)
+    return _loader
+
+
+class Equipment:
+    """Equipped item stand-in"""
+
+    def __init__(self, name):
+        self.name = name
+        self.sprite = None
+
+
+class Player:
+    """The player values the UI shows"""
+
+    def __init__(self, game_log):
+        self.game_log = game_log
+        self.health, self.max_health = 87, 100
+        self.stamina, self.max_stamina = 40, 100
+        self.level, self.gold = 4, 1320
+        self.experience, self.experience_to_next = 340, 500
+        self.equipped_weapon = Equipment("Iron Longsword")
+        self.equipped_armor = None
+
+
+class PanelOwner(UIRendererMixin):
+    """What render_ui needs from a level"""
+
+    def __init__(self, asset_loader, player=None):
+        self.asset_loader = asset_loader
+        if player is None:
+            with contextlib.redirect_stdout(io.StringIO()):
+                game_log = GameLog()
+                for index in range(8):
+                    game_log.add_message(f"Message {index}", "combat")
+            player = Player(game_log)
+        self.player = player
+
+    def frame(self):
+        """The UI over a blank screen, as pixels"""
+        screen = pygame.Surface(SCREEN)
+        self.render_xp_bar(screen)
+        self.render_ui(screen)
+        return pygame.image.tobytes(screen, 'RGB')
+
+
+def drawn_from_scratch(owner):
+    """The UI for the same player drawn by a renderer with no retained panels"""
+    return PanelOwner(owner.asset_loader, owner.player).frame()
+
+
+def test_widgets_redrawn_when_values_change():
+    """Only widgets whose values changed, and those they overlap, are drawn again"""
+    print("Testing retained panel widgets...")
+
+    pygame.init()
+    calls = []
+
+    def box(name, color, rect):
+        def draw(surface):
+            calls.append(name)
+            surface.fill(color, rect.inflate(10, 10))  # Spills over - clipped to the rect
+        return draw
+
+    def widgets(values):
+        rects = {"a": pygame.Rect(10, 10, 20, 20), "b": pygame.Rect(25, 25, 20, 20), "c": pygame.Rect(60, 10, 20, 20)}
+        return [(name, rects[name], values[name], box(name, (40 * (i + 1), 0, values[name]), rects[name]))
+                for i, name in enumerate(sorted(values))]
+
+    def fresh(values):
+        panel = RetainedPanel((100, 60), (5, 5, 5), (90, 90, 90))
+        panel.update(widgets(values))
+        return pygame.image.tobytes(panel.surface, 'RGB')
+
+    panel = RetainedPanel((100, 60), (5, 5, 5), (90, 90, 90))
+    values = {"a": 1, "b": 1, "c": 1}
+    assert len(panel.update(widgets(values))) == 3 and calls == ["a", "b", "c"]
+    calls.clear()
+    assert panel.update(widgets(values)) == [] and calls == []
+
+    # b overlaps a, so a is drawn again underneath it; c is left alone
+    values["b"] = 200
+    panel.update(widgets(values))
+    assert calls == ["a", "b"]
+    assert pygame.image.tobytes(panel.surface, 'RGB') == fresh(values)
+
+    # A widget that's gone leaves background behind
+    calls.clear()
+    del values["c"]
+    panel.update(widgets(values))
+    assert calls == [] and pygame.image.tobytes(panel.surface, 'RGB') == fresh(values)
+    assert panel.surface.get_at((70, 20))[:3] == (5, 5, 5)
+    print(f"✅ {panel.redraws} widget redraws")
+
+
+def test_idle_panel_draws_nothing():
+    """With nothing changing the bottom panel and XP bar keep their surfaces and draw nothing"""
+    print("Testing the idle bottom panel...")
+
+    owner = PanelOwner(get_loader())
+    first = owner.frame()
+    panel, xp_bar = owner._ui_panel, owner._xp_bar_panel
+    redraws = panel.redraws + xp_bar.redraws
+    misses = owner.asset_loader.text_cache_misses
+
+    for _ in range(5):
+        assert owner.frame() == first
+    assert owner._ui_panel is panel and owner._xp_bar_panel is xp_bar
+    assert panel.redraws + xp_bar.redraws == redraws and not panel.dirty_rects
+    assert owner.asset_loader.text_cache_misses == misses
+    print("✅ Idle frames reuse the panels untouched")
+
+
+def test_changed_values_match_full_redraw():
+    """Each bound value redraws its own widget, and the result matches drawing the UI from scratch"""
+    print("Testing bottom panel updates...")
+
+    owner = PanelOwner(get_loader())
+    player = owner.player
+    game_log = player.game_log
+    owner.frame()
+    panel = owner._ui_panel
+
+    def change(expected, update):
+        update()
+        before = dict(panel.drawn)
+        frame = owner.frame()
+        redrawn = {name for name in panel.drawn if panel.drawn[name] is not before.get(name)}
+        assert redrawn == expected, (expected, redrawn)
+        assert frame == drawn_from_scratch(owner), expected
+
+    change({"stats"}, lambda: setattr(player, 'health', 12))
+    change({"stats"}, lambda: setattr(player, 'gold', player.gold + 25))
+    change({"weapon"}, lambda: setattr(player, 'equipped_weapon', None))
+    change({"armor"}, lambda: setattr(player, 'equipped_armor', Equipment("Leather Armor")))
+    with contextlib.redirect_stdout(io.StringIO()):
+        change({"log"}, lambda: game_log.add_message("A goblin appears", "combat"))
+    change({"log"}, lambda: game_log.messages[-5].update(alpha=90))
+    change({"log"}, game_log.scroll_up)
+    change(set(), lambda: game_log.messages[0].update(alpha=40))  # Scrolled out of view
+
+    # The XP bar has its own surface
+    xp_redraws = owner._xp_bar_panel.redraws
+    player.experience += 60
+    assert owner.frame() == drawn_from_scratch(owner)
+    assert owner._xp_bar_panel.redraws == xp_redraws + 1
+    print("✅ Changed widgets redrawn to match a full redraw")
+
+
+def test_hud_panel_retained():
+    """HUD.render keeps its panel and redraws only when the player's values change"""
+    print("Testing the HUD panel...")
+
+    loader = get_loader()
+    player = PanelOwner(loader).player
+
+    class Game:
+        asset_loader = loader
+        current_level = None
+
+    Game.player = player
+
+    hud = HUD(Game())
+    screen = pygame.Surface(SCREEN)
+    hud.render(screen)
+    panel = hud.panel
+    redraws = panel.redraws
+    hud.render(screen)
+    assert hud.panel is panel and panel.redraws == redraws
+
+    player.stamina = 75
+    hud.render(screen)
+    assert panel.redraws > redraws
+    expected = pygame.Surface(SCREEN)
+    HUD(Game()).render(expected)
+    assert pygame.image.tobytes(screen, 'RGB') == pygame.image.tobytes(expected, 'RGB')
+    print("✅ HUD panel retained")
+
+
+def main():
+    """Run all retained panel tests"""
+    tests = [test_widgets_redrawn_when_values_change, test_idle_panel_draws_nothing,
+             test_changed_values_match_full_redraw, test_hud_panel_retained]
+
+    for test in tests:
+        test()
+
+    print("\n🎉 All retained panel tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
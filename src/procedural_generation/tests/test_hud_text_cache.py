@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared UI fonts and the text surface cache
+"""
+
+import sys
+import os
+import contextlib
+import io
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add the project root to the path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, PROJECT_ROOT)
+
+import pygame
+
+# Bind the game modules to the real pygame before test_phase4_integration swaps in its mock
+from src.core.assets import AssetLoader
+from src.core.game_log import GameLog
+from src.level.ui_renderer import UIRendererMixin, fit_text
+from src.ui.hud import HUD
+
+LONG_LINE = "The goblin hits you for 4 damage and then runs off into the trees to the north"
+
+_loader = None
+
+
+def get_loader():
+    """One real asset loader for the module, with a fresh text cache for each test"""
+    global _loader
+    pygame.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((64, 64))
+    if _loader is None:
+        original_dir = os.getcwd()
+        os.chdir(PROJECT_ROOT)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                _loader = AssetLoader()
+        finally:
+            os.chdir(original_dir)
+    _loader.clear_text_cache()
+    _loader.text_cache_size = 256
+    _loader.text_cache_hits = _loader.text_cache_misses = 0
+    return _loader
+
+
+class Equipment:
+    """Equipped item stand-in"""
+
+    def __init__(self, name):
+        self.name = name
+        self.sprite = None
+
+
+class Player:
+    """The player values the UI shows"""
+
+    def __init__(self, game_log):
+        self.game_log = game_log
+        self.health, self.max_health = 87, 100
+        self.stamina, self.max_stamina = 40, 100
+        self.level, self.gold = 4, 1320
+        self.experience, self.experience_to_next = 340, 500
+        self.equipped_weapon = Equipment("Iron Longsword of Embers")
+        self.equipped_armor = None
+
+
+class PanelOwner(UIRendererMixin):
+    """What render_ui needs from a level"""
+
+    def __init__(self, asset_loader):
+        self.asset_loader = asset_loader
+        with contextlib.redirect_stdout(io.StringIO()):
+            game_log = GameLog()
+            for index in range(10):
+                game_log.add_message(LONG_LINE if index % 2 else f"Message {index}", "combat")
+        self.player = Player(game_log)
+
+
+def test_fonts_and_text_are_shared():
+    """Sized fonts are created once and identical text is rendered once"""
+    print("Testing shared fonts and text surfaces...")
+
+    loader = get_loader()
+    font = loader.get_font(18)
+    assert loader.get_font(18) is font and loader.get_font(20) is not font
+    assert loader.get_font("large") is loader.fonts["large"]
+
+    label = loader.render_text(font, "Health", (255, 255, 255))
+    assert loader.render_text(font, "Health", (255, 255, 255)) is label
+    assert loader.render_text(font, "Health", (255, 255, 255, 128)) is label  # Colour alpha never mattered
+    assert pygame.image.tobytes(label, 'RGBA') == pygame.image.tobytes(font.render("Health", True, (255, 255, 255)), 'RGBA')
+
+    # Faded text is a copy - the opaque surface others were given keeps its alpha
+    faded = loader.render_text(font, "Health", (255, 255, 255), 100)
+    assert faded is not label and faded.get_alpha() == 100 and label.get_alpha() == 255
+
+    loader.text_cache_size = 3
+    for text in ("a", "b", "c"):
+        loader.render_text(font, text, (255, 255, 255))
+    assert len(loader.text_cache) == 3 and (font, "Health", (255, 255, 255), 255) not in loader.text_cache
+    stats = loader.text_cache_stats()
+    assert stats["hits"] == 3 and stats["misses"] == 5  # The faded copy came from the cached label
+    print(f"✅ Fonts and text shared, hit rate {stats['hit_rate']:.0%}")
+
+
+def test_panel_renders_without_new_fonts():
+    """After the first frame the panel builds no fonts and renders no text it already has"""
+    print("Testing the bottom panel's steady state...")
+
+    loader = get_loader()
+    owner = PanelOwner(loader)
+    screen = pygame.Surface((1280, 720))
+    owner.render_xp_bar(screen)
+    owner.render_ui(screen)
+    first_frame = pygame.image.tobytes(screen, 'RGB')
+    misses = loader.text_cache_misses
+
+    created = []
+    original_font = pygame.font.Font
+
+    def counting_font(*args):
+        created.append(args)
+        return original_font(*args)
+
+    pygame.font.Font = counting_font
+    try:
+        screen.fill((0, 0, 0))
+        owner.render_xp_bar(screen)
+        owner.render_ui(screen)
+    finally:
+        pygame.font.Font = original_font
+
+    assert not created and loader.text_cache_misses == misses
+    assert pygame.image.tobytes(screen, 'RGB') == first_frame
+
+    # A changed value renders just that text
+    owner.player.gold += 5
+    owner.render_ui(screen)
+    assert loader.text_cache_misses == misses + 1
+    print(f"✅ {loader.text_cache_stats()['entries']} text surfaces reused frame after frame")
+
+
+def test_log_lines_fitted_once():
+    """Long log lines are truncated once per message and again only when the log's width changes"""
+    print("Testing game log truncation...")
+
+    loader = get_loader()
+    owner = PanelOwner(loader)
+    font = loader.get_font(20)
+    messages = owner.player.game_log.messages
+    panel = pygame.Surface((1280, 150))
+
+    calls = []
+
+    def counting_fit(font, text, max_width):
+        calls.append(text)
+        return fit_text(font, text, max_width)
+
+    import src.level.ui_renderer as ui_renderer
+    ui_renderer.fit_text = counting_fit
+    try:
+        for _ in range(5):
+            owner.render_game_log_in_hud(panel, 600, 10, 300, 130)
+        assert len(calls) == 5  # The messages on show, once each
+        fitted = messages[-1]["fitted"]
+        assert fitted[1].endswith("...") and font.size(fitted[1])[0] <= fitted[0]
+        assert fit_text(font, "Message 1", fitted[0]) == "Message 1"
+
+        owner.render_game_log_in_hud(panel, 600, 10, 500, 130)
+        assert len(calls) == 10
+    finally:
+        ui_renderer.fit_text = fit_text
+    print("✅ Each log line fitted once")
+
+
+def test_hud_uses_shared_fonts():
+    """The HUD takes its fonts from the asset loader and draws its indicators from cached text"""
+    print("Testing HUD fonts...")
+
+    loader = get_loader()
+
+    class Game:
+        asset_loader = loader
+        player = PanelOwner(loader).player
+        current_level = type("Level", (), {"chunk_manager": object()})()
+
+    hud = HUD(Game())
+    assert hud.small_font is loader.get_font(20)
+    surface = pygame.Surface((1280, 150))
+    hud.render_debug_keys_indicator(surface, 1280)
+    misses = loader.text_cache_misses
+    hud.render_debug_keys_indicator(surface, 1280)
+    assert loader.text_cache_misses == misses and loader.text_cache_hits >= 2
+    print("✅ HUD indicators reuse their text")
+
+
+def main():
+    """Run all text cache tests"""
+    tests = [test_fonts_and_text_are_shared, test_panel_renders_without_new_fonts,
+             test_log_lines_fitted_once, test_hud_uses_shared_fonts]
+
+    for test in tests:
+        test()
+
+    print("\n🎉 All text cache tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Tests for the cached terrain layer of the isometric renderer
+"""
+
+import sys
+import os
+import random
+import tempfile
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+import pygame
+
+# Bind the game modules to the real pygame before test_phase4_integration swaps in its mock
+from src.core.isometric import IsometricRenderer
+from src.level.level_base import LevelBase
+from src.level.level_renderer import LevelRendererMixin
+from src.level.terrain_cache import BLOCK_SIZE
+from src.world.building_registry import WALL_TILES
+from src.world.chunk import Chunk
+from src.world.chunk_manager import ChunkManager
+
+SIZE = Chunk.CHUNK_SIZE
+VIEW = (1024, 618)
+
+
+class Assets:
+    """Asset loader without images - the renderer falls back to flat colours"""
+
+    def get_image(self, name):
+        return None
+
+
+class Walls:
+    """Wall renderer stand-in drawing a block taller than its tile"""
+
+    def is_wall_tile(self, tile_type):
+        return tile_type in WALL_TILES
+
+    def render_flat_wall_with_roof_top(self, surface, screen_x, screen_y, tile_type, world_x, world_y):
+        pygame.draw.rect(surface, (160, 160, 170), (screen_x - 32, screen_y - 64, 64, 80))
+
+
+class TerrainLevel(LevelRendererMixin):
+    """Chunk-based level with just what the ground pass needs"""
+
+    TILE_GRASS = LevelBase.TILE_GRASS
+    TILE_STONE = LevelBase.TILE_STONE
+    TILE_WATER = LevelBase.TILE_WATER
+    TILE_DOOR = LevelBase.TILE_DOOR
+    TILE_BRICK = LevelBase.TILE_BRICK
+
+    tile_width = 64
+    tile_height = 32
+
+    def __init__(self, chunk_manager):
+        self.chunk_manager = chunk_manager
+        self.asset_loader = Assets()
+        self.iso_renderer = IsometricRenderer(self.tile_width, self.tile_height)
+        self.wall_renderer = Walls()
+        self.camera_x = self.camera_y = 0
+        self.use_sprites(self.iso_renderer.create_diamond_tile)
+
+    def use_sprites(self, make_tile):
+        """Build the floor sprites with make_tile(color)"""
+        self.tile_sprites = {
+            tile_type: make_tile(color)
+            for tile_type, color in ((self.TILE_GRASS, (50, 150, 50)), (self.TILE_STONE, (150, 150, 150)),
+                                     (self.TILE_WATER, (50, 100, 200)), (self.TILE_BRICK, (150, 80, 60)))
+        }
+
+    def get_tile(self, x, y):
+        # Chunks outside the test world count as still generating
+        chunk = self.chunk_manager.loaded_chunks.get((x // SIZE, y // SIZE))
+        return chunk.tiles[y % SIZE][x % SIZE] if chunk else self.TILE_GRASS
+
+    def look_at(self, x, y):
+        """Centre the camera on a tile"""
+        self.camera_x, self.camera_y = self.iso_renderer.cart_to_iso(x, y)
+        self.camera_x -= VIEW[0] // 2
+        self.camera_y -= VIEW[1] // 2
+
+
+def make_world():
+    """Two loaded chunks of mixed ground with a house across the chunk border"""
+    rng = random.Random(3)
+    manager = ChunkManager(5, "terrain_test")
+    for chunk_x in (0, 1):
+        chunk = Chunk(chunk_x, 0, 5)
+        chunk.tiles = [[rng.choice((0, 0, 0, 2, 3)) for _ in range(SIZE)] for _ in range(SIZE)]
+        chunk.biomes = [['PLAINS'] * SIZE for _ in range(SIZE)]
+        chunk.is_generated = chunk.is_loaded = True
+        manager.loaded_chunks[(chunk_x, 0)] = chunk
+
+    # House from x=60 to x=67, y=20 to y=25, with a door on its front wall
+    for y in range(20, 26):
+        for x in range(60, 68):
+            edge = y in (20, 25) or x in (60, 67)
+            tile = LevelBase.TILE_WALL if edge else LevelBase.TILE_BRICK
+            manager.loaded_chunks[(x // SIZE, 0)].tiles[y][x % SIZE] = tile
+    manager.loaded_chunks[(1, 0)].tiles[25][1] = LevelBase.TILE_DOOR
+    return manager
+
+
+def inset_diamond(color):
+    """Floor sprite that stays inside its tile - neighbouring floors never share pixels"""
+    surface = pygame.Surface((64, 32), pygame.SRCALPHA)
+    pygame.draw.polygon(surface, color, [(32, 2), (60, 16), (32, 29), (4, 16)])
+    return surface
+
+
+def render_ground(level, cached):
+    """Ground pass over the renderer's tile range around the camera centre"""
+    surface = pygame.Surface(VIEW)
+    center_x, center_y = level.iso_renderer.screen_to_world(VIEW[0] // 2, VIEW[1] // 2, level.camera_x, level.camera_y)
+    start_x, end_x = int(center_x) - 20, int(center_x) + 20
+    start_y, end_y = int(center_y) - 46, int(center_y) + 46
+    if cached:
+        level.render_cached_terrain(surface, level.get_terrain_cache(), start_x, end_x, start_y, end_y)
+    else:
+        for y in range(start_y, end_y):
+            for x in range(start_x, end_x):
+                level.render_tile_at_position(surface, x, y)
+    return pygame.image.tobytes(surface, 'RGB')
+
+
+def in_temp_dir(test):
+    """Run a test with the world saved in a temporary directory and a display set up"""
+    def wrapper():
+        pygame.init()
+        if pygame.display.get_surface() is None:
+            pygame.display.set_mode((64, 64))
+        original_dir = os.getcwd()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.chdir(temp_dir)
+            try:
+                test()
+            finally:
+                os.chdir(original_dir)
+    wrapper.__name__ = test.__name__
+    wrapper.__doc__ = test.__doc__
+    return wrapper
+
+
+@in_temp_dir
+def test_cached_ground_matches_tile_by_tile():
+    """Blitting cached blocks draws the same pixels as rendering every tile"""
+    print("Testing cached ground against tile-by-tile rendering...")
+
+    # Open ground, with the overlapping bordered diamonds the game falls back to
+    level = TerrainLevel(make_world())
+    level.look_at(20, 50)
+    assert render_ground(level, cached=True) == render_ground(level, cached=False)
+
+    # Around the house the walls overlap the tiles in front of them, which are drawn per frame.
+    # Floors at the edge of those tiles now cover their cached neighbours' borders, so the
+    # comparison uses floors that don't overlap
+    level.use_sprites(inset_diamond)
+    for view in ((40, 10), (64, 22), (64, 50)):
+        level.look_at(*view)
+        assert render_ground(level, cached=True) == render_ground(level, cached=False), view
+
+    cache = level.get_terrain_cache()
+    live = {tile for block in cache.blocks.values() for tile in block.live}
+    assert (60, 20) in live and (65, 23) in live  # Walls and interior floors
+    assert (68, 22) in live and (62, 26) in live  # Ground in front of the walls
+    assert (58, 22) not in live and (62, 18) not in live
+    print(f"✅ {cache.built} blocks drawn pixel for pixel like the tile loop")
+
+
+@in_temp_dir
+def test_set_tile_invalidates_blocks():
+    """Editing a tile re-renders the blocks showing it and the tiles in front of it"""
+    print("Testing terrain cache invalidation...")
+
+    manager = make_world()
+    level = TerrainLevel(manager)
+    level.use_sprites(inset_diamond)
+    level.look_at(16, 16)
+    render_ground(level, cached=True)
+    cache = level.get_terrain_cache()
+    assert cache in manager.tile_listeners
+    built = cache.built
+
+    # A wall at the corner of a block makes the tiles in front of it, in the next blocks, live
+    x, y = 2 * BLOCK_SIZE - 1, 2 * BLOCK_SIZE - 1
+    manager.set_tile(x, y, LevelBase.TILE_WALL)
+    assert cache.invalidated == 4
+    assert render_ground(level, cached=True) == render_ground(level, cached=False)
+    assert cache.built == built + 4
+    assert (x, y) in cache.get_block(1, 1).live
+    assert (x + 1, y + 1) in cache.get_block(2, 2).live and (x - 1, y + 1) in cache.get_block(1, 2).live
+
+    manager.set_tile(x, y, LevelBase.TILE_WATER)
+    assert render_ground(level, cached=True) == render_ground(level, cached=False)
+    assert not cache.get_block(2, 2).live
+
+    # A new world gets a new cache and the old one stops listening
+    level.chunk_manager = ChunkManager(6, "terrain_test_2")
+    assert level.get_terrain_cache() is not cache and cache not in manager.tile_listeners
+    print("✅ Edited blocks are re-rendered")
+
+
+@in_temp_dir
+def test_blocks_follow_loaded_chunks():
+    """Blocks of unloaded chunks are dropped, reloaded chunks re-rendered and the cache bounded"""
+    print("Testing terrain cache residency...")
+
+    manager = make_world()
+    level = TerrainLevel(manager)
+    level.use_sprites(inset_diamond)
+    cache = level.get_terrain_cache()
+    cache.max_blocks = 6
+    blocks_per_side = SIZE // BLOCK_SIZE
+
+    first = cache.get_block(0, 0)
+    assert first is cache.get_block(0, 0) and first.surface is not None
+    for block_x in range(2 * blocks_per_side):
+        cache.get_block(block_x, 1)
+    assert len(cache.blocks) == 6 and (0, 0) not in cache.blocks
+
+    # Unloaded chunk: no block, and the placeholder ground is drawn tile by tile
+    chunk = manager.loaded_chunks.pop((0, 0))
+    assert cache.get_block(blocks_per_side - 1, 1) is None
+    assert (blocks_per_side - 1, 1) not in cache.blocks
+    level.look_at(60, 10)
+    assert render_ground(level, cached=True) == render_ground(level, cached=False)
+
+    # The border block next to the missing chunk is redone once it's back
+    border = cache.get_block(blocks_per_side, 1)
+    assert (0, 0) in border.missing
+    manager.loaded_chunks[(0, 0)] = chunk
+    assert cache.get_block(blocks_per_side, 1) is not border
+
+    # New tile sprites throw every block away
+    level.tile_sprites = dict(level.tile_sprites)
+    built = cache.built
+    cache.get_block(blocks_per_side, 1)
+    assert cache.built == built + 1 and len(cache.blocks) == 1
+    print("✅ Blocks track the loaded chunks")
+
+
+def main():
+    """Run all terrain cache tests"""
+    tests = [test_cached_ground_matches_tile_by_tile, test_set_tile_invalidates_blocks, test_blocks_follow_loaded_chunks]
+
+    for test in tests:
+        test()
+
+    print("\n🎉 All terrain cache tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
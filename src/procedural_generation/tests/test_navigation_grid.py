@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Tests for the cached per-chunk walkability and cost grid
+"""
+
+import sys
+import os
+import tempfile
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from src.world.chunk import Chunk
+from src.world.chunk_manager import ChunkManager
+from src.level.level_collision import CollisionMixin
+from src.level.level_pathfinding import PathfindingMixin
+from src.level.navigation_grid import movement_cost, UNLOADED_COST
+
+
+class Tree:
+    """Blocking object stand-in"""
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.blocks_movement = True
+
+
+class GridLevel(CollisionMixin, PathfindingMixin):
+    """Just enough level for the navigation grid"""
+
+    def __init__(self, chunk_manager):
+        self.chunk_manager = chunk_manager
+        self.is_infinite_world = True
+        self.objects, self.chests, self.furniture, self.npcs, self.enemies = [], [], [], [], []
+
+
+def make_world(temp_dir):
+    """Chunk manager with two loaded chunks of grass, one brick tile and one wall"""
+    manager = ChunkManager(5, "nav_test")
+    for chunk_x in (0, 1):
+        chunk = Chunk(chunk_x, 0, 5)
+        chunk.tiles = [[0] * Chunk.CHUNK_SIZE for _ in range(Chunk.CHUNK_SIZE)]
+        chunk.biomes = [['PLAINS'] * Chunk.CHUNK_SIZE for _ in range(Chunk.CHUNK_SIZE)]
+        chunk.is_generated = chunk.is_loaded = True
+        manager.loaded_chunks[(chunk_x, 0)] = chunk
+    manager.loaded_chunks[(0, 0)].tiles[3][4] = 13
+    manager.loaded_chunks[(0, 0)].tiles[5][5] = 4
+    return manager
+
+
+def in_temp_dir(test):
+    """Run a test with a temporary working directory for world saves"""
+    def wrapper():
+        original_cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.chdir(temp_dir)
+            try:
+                test(temp_dir)
+            finally:
+                os.chdir(original_cwd)
+    wrapper.__name__ = test.__name__
+    wrapper.__doc__ = test.__doc__
+    return wrapper
+
+
+@in_temp_dir
+def test_costs_match_tile_scoring(temp_dir):
+    """Plane costs match the per-tile scoring A* used before"""
+    print("Testing navigation grid tile costs...")
+
+    manager = make_world(temp_dir)
+    level = GridLevel(manager)
+    nav = level.get_navigation_grid()
+    nav.begin_search()
+
+    assert nav.cost_at(10, 10) == movement_cost(0) == 1.0 + (1.0 - 0.9) * 2.0
+    assert nav.cost_at(4, 3) == movement_cost(13)
+    assert nav.cost_at(5, 5) is None
+    assert nav.cost_at(70, 10) == movement_cost(0)  # Second chunk
+    assert nav.cost_at(10, 70) == UNLOADED_COST  # Not loaded, and not loaded by the lookup
+    assert (0, 1) not in manager.loaded_chunks
+    manager.close()
+    print("✅ Costs read from cached planes")
+
+
+@in_temp_dir
+def test_incremental_invalidation(temp_dir):
+    """set_tile and object changes update only the affected tiles"""
+    print("Testing navigation grid invalidation...")
+
+    manager = make_world(temp_dir)
+    level = GridLevel(manager)
+    nav = level.get_navigation_grid()
+    nav.begin_search()
+    plane = nav.get_plane(0, 0)
+
+    manager.set_tile(20, 20, 5)
+    assert nav.get_plane(0, 0) is plane
+    assert abs(nav.cost_at(20, 20) - 0.1) < 1e-9  # Door discount
+    manager.set_tile(20, 21, 4)
+    assert nav.cost_at(20, 21) is None
+
+    # A tree on the chunk border restricts tiles in both chunks
+    tree = Tree(64.0, 30.0)
+    level.objects.append(tree)
+    nav.begin_search()
+    assert nav.cost_at(63, 30) == movement_cost(0, 1.0 - 0.5 ** 0.5 / 1.5) > movement_cost(0)
+    assert nav.cost_at(64, 29) > movement_cost(0)
+
+    level.objects.remove(tree)
+    nav.begin_search()
+    assert nav.cost_at(63, 30) == movement_cost(0)
+    assert nav.cost_at(64, 29) == movement_cost(0)
+    manager.close()
+    print("✅ Tile edits and object changes applied incrementally")
+
+
+@in_temp_dir
+def test_path_avoids_walls(temp_dir):
+    """A* through the grid routes around a wall line"""
+    print("Testing A* over the navigation grid...")
+
+    manager = make_world(temp_dir)
+    chunk = manager.loaded_chunks[(0, 0)]
+    for y in range(5, 15):
+        chunk.tiles[y][10] = 4
+    level = GridLevel(manager)
+    level.calculate_sub_tile_position = lambda x, y, size: (x + 0.5, y + 0.5)
+
+    path = level.find_coarse_path(6.5, 10.5, 14.5, 10.5)
+    assert path and path[-1] == (14.5, 10.5)
+    assert all(chunk.tiles[int(y)][int(x)] != 4 for x, y in path)
+    manager.close()
+    print("✅ Path found around the wall")
+
+
+def main():
+    """Run all navigation grid tests"""
+    tests = [test_costs_match_tile_scoring, test_incremental_invalidation, test_path_avoids_walls]
+
+    for test in tests:
+        test()
+
+    print("\n🎉 All navigation grid tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Tests for the non-blocking AI NPC conversation pipeline, using a fake goose
+"""
+
+import sys
+import os
+import gc
+import tempfile
+import time
+import weakref
+
+# Add the project root to the path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+sys.path.insert(0, PROJECT_ROOT)
+
+import pygame
+
+from src.entities.npc import NPC
+from src.entities.npcs.village_elder import VillageElderNPC
+from src.recipe_manager import GooseRecipeManager
+from src.systems.command_bus import CommandBus
+from src.systems.npc_conversations import ConversationEvent, ConversationPipeline, get_conversation_pipeline
+from src.systems.session_pool import get_session_pool
+from src.systems.response_cache import get_response_cache
+from src.ui.ai_chat_window import AIChatWindow
+
+FAKE_GOOSE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_goose.py")
+
+
+def with_fake_goose(test):
+    """
+    Run a test from the project root (for the recipes) with GOOSE_BIN pointing at the fake goose
+
+    test_phase4_integration installs a mock pygame in sys.modules, and the NPC
+    sprites import pygame when they're drawn, so the real module is swapped
+    back in for the test. Replies are cached in an empty temporary file.
+    """
+    def wrapper():
+        original_cwd = os.getcwd()
+        original_bin = os.environ.get("GOOSE_BIN")
+        original_pygame = sys.modules.get("pygame")
+        original_cache_path = get_response_cache().path
+        os.environ["GOOSE_BIN"] = f'"{sys.executable}" "{FAKE_GOOSE}"'
+        sys.modules["pygame"] = pygame
+        os.chdir(PROJECT_ROOT)
+        try:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                get_response_cache().configure(os.path.join(temp_dir, "cache.json"))
+                test()
+        finally:
+            get_response_cache().configure(original_cache_path)
+            os.chdir(original_cwd)
+            sys.modules["pygame"] = original_pygame
+            if original_bin is None:
+                del os.environ["GOOSE_BIN"]
+            else:
+                os.environ["GOOSE_BIN"] = original_bin
+    wrapper.__name__ = test.__name__
+    wrapper.__doc__ = test.__doc__
+    return wrapper
+
+
+def make_npc():
+    """Village Elder with a short idle threshold so fake replies finish quickly"""
+    npc = VillageElderNPC(5, 5)
+    npc.response_idle_threshold = 0.3
+    return npc
+
+
+def pump(pipeline, events, until, timeout=10.0):
+    """Dispatch events like the game loop until a condition holds"""
+    deadline = time.monotonic() + timeout
+    while not until():
+        assert time.monotonic() < deadline, f"Timed out waiting, events so far: {events}"
+        pipeline.dispatch()
+        time.sleep(0.01)
+
+
+@with_fake_goose
+def test_reply_streams_through_dispatch():
+    """Replies arrive as partial then done events, and only through dispatch()"""
+    print("Testing streamed replies...")
+
+    pipeline = ConversationPipeline()
+    npc = make_npc()
+    events = []
+    try:
+        start = time.monotonic()
+        request = pipeline.submit(npc, "Hello", on_event=events.append)
+        assert time.monotonic() - start < 0.1, "submit() should not wait for the reply"
+
+        # Nothing is delivered until the main loop dispatches
+        deadline = time.monotonic() + 10.0
+        while pipeline.pending(npc) and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert not events
+
+        pump(pipeline, events, lambda: events and events[-1].kind == ConversationEvent.DONE)
+        partials = [event.text for event in events if event.kind == ConversationEvent.PARTIAL]
+        assert len(partials) >= 2, partials
+        assert all(later.startswith(earlier) for earlier, later in zip(partials, partials[1:]))
+
+        final = events[-1].text
+        assert "You said: Hello." in final and final.startswith("Well met, traveler.")
+        assert request.response == final
+        assert get_session_pool().has_session(npc.session_key), "The session stays in the pool for the next message"
+    finally:
+        pipeline.shutdown()
+        get_session_pool().shutdown()
+    print(f"✅ Reply streamed in {len(partials)} partial events")
+
+
+@with_fake_goose
+def test_cancel_stops_reply():
+    """Cancelling an NPC ends its request and the next message gets a fresh session"""
+    print("Testing cancellation...")
+
+    pipeline = ConversationPipeline()
+    npc = make_npc()
+    events = []
+    try:
+        pipeline.submit(npc, "Hello", on_event=events.append)
+        pump(pipeline, events, lambda: events and events[-1].kind == ConversationEvent.DONE)
+
+        events.clear()
+        pipeline.submit(npc, "hang", on_event=events.append)
+        time.sleep(0.3)
+        assert pipeline.cancel(npc) == 1
+
+        pump(pipeline, events, lambda: events, timeout=5.0)
+        assert [event.kind for event in events] == [ConversationEvent.CANCELLED]
+        assert not get_session_pool().has_session(npc.session_key), "A cancelled session is discarded"
+
+        events.clear()
+        cold_starts = get_session_pool().metrics()["cold_starts"]
+        pipeline.submit(npc, "Again", on_event=events.append)
+        pump(pipeline, events, lambda: events and events[-1].kind == ConversationEvent.DONE)
+        assert "You said: Again." in events[-1].text
+        assert get_session_pool().metrics()["cold_starts"] == cold_starts + 1
+    finally:
+        pipeline.shutdown()
+        get_session_pool().shutdown()
+    print("✅ Cancelled reply dropped and the NPC recovered")
+
+
+@with_fake_goose
+def test_timeout_and_independent_npcs():
+    """A stuck NPC times out without holding up another NPC"""
+    print("Testing timeouts...")
+
+    pipeline = ConversationPipeline()
+    stuck, chatty = make_npc(), make_npc()
+    stuck_events, chatty_events = [], []
+    try:
+        start = time.monotonic()
+        pipeline.submit(stuck, "hang", on_event=stuck_events.append, timeout=1.5)
+        pipeline.submit(chatty, "Hi there", on_event=chatty_events.append)
+
+        pump(pipeline, chatty_events, lambda: chatty_events and chatty_events[-1].kind == ConversationEvent.DONE)
+        assert not stuck_events, "The stuck NPC should still be waiting"
+
+        pump(pipeline, stuck_events, lambda: stuck_events, timeout=10.0)
+        assert time.monotonic() - start < 8.0
+        assert stuck_events[-1].kind == ConversationEvent.DONE
+        assert stuck_events[-1].text == f"*{stuck.name} looks at you thoughtfully*"
+    finally:
+        pipeline.shutdown()
+        get_session_pool().shutdown()
+    print("✅ Timed out NPC answered without blocking others")
+
+
+@with_fake_goose
+def test_chat_window_shows_pending_reply():
+    """The chat window shows a pending entry that fills in and clears on close"""
+    print("Testing chat window replies...")
+
+    pygame.font.init()
+    npc = make_npc()
+    window = AIChatWindow()
+    window.npc_reference = npc
+    window.is_active = True
+    pipeline = get_conversation_pipeline()  # The one request_ai_message uses
+    try:
+        window.request_reply("Hello")
+        entry = window.chat_history[-1]
+        assert entry["pending"] and window.pending_replies == 1
+
+        pump(pipeline, [], lambda: not entry["pending"])
+        assert "You said: Hello." in entry["message"] and window.pending_replies == 0
+
+        window.request_reply("hang")
+        time.sleep(0.3)
+        window.close()
+        pump(pipeline, [], lambda: window.pending_replies == 0, timeout=5.0)
+        assert window.chat_history[-1] is entry and not window.is_active
+    finally:
+        get_session_pool().shutdown()
+    print("✅ Chat window streams replies and cancels on close")
+
+
+@with_fake_goose
+def test_opening_reply_cached_and_context_diffed():
+    """Opening replies are reused across NPCs and follow-ups only carry changed game state"""
+    print("Testing response cache and context diffing...")
+
+    class Player:
+        level, hp, max_hp, x, y = 1, 100, 100, 10, 10
+
+    player = Player()
+    first, second = make_npc(), make_npc()
+    try:
+        greeting = first.answer_ai_message("Hello", first._get_game_context(player))
+        assert "You said: Hello." in greeting
+        assert "I see that NPC ID: " in greeting and "Player HP: 100/100" in greeting
+
+        # Another elder in the same situation gets the stored reply without a session
+        player.x = 30
+        hits = get_response_cache().hits
+        assert second.answer_ai_message("hello!", second._get_game_context(player)) == greeting
+        assert not get_session_pool().has_session(second.session_key)
+        assert get_response_cache().hits == hits + 1
+
+        # Follow-ups only tell the session what changed
+        player.hp = 40
+        reply = first.answer_ai_message("Any news?", first._get_game_context(player))
+        assert "I see that Player HP: 40/100 | Player Position: (30, 10)." in reply, reply
+        reply = first.answer_ai_message("Farewell", first._get_game_context(player))
+        assert "I see" not in reply, reply
+
+        # Follow-ups aren't cached
+        assert len(get_response_cache().entries) == 1
+    finally:
+        get_session_pool().shutdown()
+    print("✅ Opening reply cached and follow-ups sent only changed state")
+
+
+@with_fake_goose
+def test_recipe_manager_discards_timed_out_session():
+    """run_recipe doesn't put a session that's still mid-reply back in the pool"""
+    print("Testing recipe manager timeouts...")
+
+    manager = GooseRecipeManager()
+    manager.response_timeout = 3.0
+    key = (manager.get_recipe("innkeeper")['file_path'], "npc_innkeeper")
+    try:
+        manager.run_recipe("innkeeper", "hang")
+        assert not get_session_pool().has_session(key), "A timed out session is discarded"
+
+        reply = manager.run_recipe("innkeeper", "Hello")
+        assert "You said: Hello." in reply, reply
+        assert get_session_pool().has_session(key), "A session that answered stays in the pool"
+    finally:
+        get_session_pool().shutdown()
+    print("✅ Timed out recipe session discarded")
+
+
+def test_idle_workers_retire():
+    """Workers stop once their NPC goes quiet, letting go of NPCs the level has dropped"""
+    print("Testing idle worker retirement...")
+
+    class EchoNPC:
+        name = "Echo"
+
+        def answer_ai_message(self, message, context="", on_partial=None, cancelled=None, timeout=None):
+            return f"Echo: {message}"
+
+    pipeline = ConversationPipeline(idle_timeout=0.2)
+    events = []
+    try:
+        # Residency re-creates evicted NPCs as new objects, each with its own worker
+        npcs = [EchoNPC() for _ in range(5)]
+        for npc in npcs:
+            pipeline.submit(npc, "Hi", on_event=events.append)
+        assert pipeline.worker_count() == 5
+        pump(pipeline, events, lambda: len(events) == 5)
+
+        dropped = weakref.ref(npcs.pop(0))
+        events.clear()  # Delivered events hold their request's NPC
+        deadline = time.monotonic() + 5.0
+        while pipeline.worker_count():
+            assert time.monotonic() < deadline, f"{pipeline.worker_count()} workers still running"
+            time.sleep(0.05)
+        gc.collect()
+        assert dropped() is None, "A retired worker keeps its NPC alive"
+
+        # The next message starts a new worker
+        pipeline.submit(npcs[0], "Again", on_event=events.append)
+        pump(pipeline, events, lambda: events)
+        assert events[-1].text == "Echo: Again" and pipeline.worker_count() == 1
+    finally:
+        pipeline.shutdown()
+    print("✅ Idle workers stopped and released their NPCs")
+
+
+def test_legacy_npc_tool_calls_served_while_waiting():
+    """A recipe-integration NPC answers on a worker, so its MCP tool calls run as the main loop drains the bus"""
+    print("Testing legacy NPC replies...")
+
+    bus = CommandBus()
+
+    class RecipeIntegration:
+        """Answers like run_recipe, making a tool call the main thread has to serve"""
+
+        def send_message(self, message, context=""):
+            gold = bus.submit("get_player_stats", lambda: 42).result(timeout=5.0)
+            return f"You have {gold} gold. You said: {message}"
+
+    class ChatWindow:
+        def __init__(self):
+            self.chat_history = []
+
+        def add_message(self, sender, message):
+            self.chat_history.append({"sender": sender, "message": message})
+
+    npc = NPC(3, 3, "Trader", auto_create_sprite=False)
+    npc.ai_integration = RecipeIntegration()
+    npc.chat_window = ChatWindow()
+    pipeline = get_conversation_pipeline()
+
+    start = time.monotonic()
+    npc.request_ai_reply("Hello")
+    assert time.monotonic() - start < 0.1, "The reply shouldn't be waited for on the main thread"
+    entry = npc.chat_window.chat_history[-1]
+    assert entry == {"sender": "Trader", "message": "..."}
+
+    deadline = time.monotonic() + 5.0
+    while entry["message"] == "...":
+        assert time.monotonic() < deadline, "The tool call was never served"
+        bus.drain()  # As the game loop does each frame
+        pipeline.dispatch()
+        time.sleep(0.01)
+    assert entry["message"] == "You have 42 gold. You said: Hello"
+    print("✅ Legacy NPC reply arrived while the main loop kept draining the bus")
+
+
+def main():
+    """Run all conversation pipeline tests"""
+    tests = [test_reply_streams_through_dispatch, test_cancel_stops_reply,
+             test_timeout_and_independent_npcs, test_chat_window_shows_pending_reply,
+             test_opening_reply_cached_and_context_diffed, test_recipe_manager_discards_timed_out_session,
+             test_idle_workers_retire, test_legacy_npc_tool_calls_served_while_waiting]
+
+    for test in tests:
+        test()
+
+    print("\n🎉 All NPC conversation tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Tests for region files packing many chunks into one file
+"""
+
+import sys
+import os
+import tempfile
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from src.world.chunk import Chunk
+from src.world.chunk_manager import ChunkManager, RegionFile
+
+
+def make_chunk(chunk_x, chunk_y, entity_count=1):
+    """Build a populated chunk without running world generation"""
+    chunk = Chunk(chunk_x, chunk_y, 777)
+    size = Chunk.CHUNK_SIZE
+    chunk.tiles = [[(x + y + chunk_x) % 20 for x in range(size)] for y in range(size)]
+    chunk.biomes = [['FOREST' if (x + chunk_y) % 3 else 'PLAINS' for x in range(size)] for y in range(size)]
+    chunk.entities = [{'type': 'object', 'name': f'Tree {i}', 'x': i, 'y': i, 'id': f'tree_{i}'}
+                      for i in range(entity_count)]
+    chunk.is_generated = True
+    chunk.is_loaded = True
+    return chunk
+
+
+def test_region_read_write_single_chunk():
+    """Chunks can be written and read individually without rewriting the region"""
+    print("Testing region single-chunk reads and writes...")
+
+    with tempfile.TemporaryDirectory() as world_dir:
+        region = RegionFile(RegionFile.get_filename(world_dir, 0, 0))
+        chunks = [make_chunk(x, y) for x in range(3) for y in range(2)]
+        for chunk in chunks:
+            region.write_chunk(chunk.chunk_x, chunk.chunk_y, chunk.to_bytes())
+
+        # Growing a chunk appends a new slot, leaving the others in place
+        grown = make_chunk(1, 1, entity_count=200)
+        offsets_before = list(region.entries)
+        region.write_chunk(1, 1, grown.to_bytes())
+        changed = [i for i, (a, b) in enumerate(zip(offsets_before, region.entries)) if a != b]
+        assert changed == [region._slot(1, 1)]
+        region.close()
+
+        # Reopen and check every chunk from the header table
+        region = RegionFile(RegionFile.get_filename(world_dir, 0, 0))
+        assert region.chunk_count() == len(chunks)
+        for chunk in chunks:
+            expected = grown if (chunk.chunk_x, chunk.chunk_y) == (1, 1) else chunk
+            loaded = Chunk(0, 0, 0)
+            loaded.from_bytes(region.read_chunk(chunk.chunk_x, chunk.chunk_y))
+            assert loaded.to_dict() == expected.to_dict()
+        assert region.read_chunk(5, 5) is None
+        region.close()
+    print("✅ Region slots read and written independently")
+
+
+def test_region_compaction():
+    """Compaction drops dead space and keeps every live chunk"""
+    print("Testing region compaction...")
+
+    with tempfile.TemporaryDirectory() as world_dir:
+        path = RegionFile.get_filename(world_dir, 0, 0)
+        region = RegionFile(path)
+        for entity_count in (1, 50, 100, 150):
+            region.write_chunk(2, 3, make_chunk(2, 3, entity_count).to_bytes())
+        region.write_chunk(4, 4, make_chunk(4, 4).to_bytes())
+
+        size_before = os.path.getsize(path)
+        assert region.waste_ratio() > 0.5
+        assert region.compact()
+        assert os.path.getsize(path) < size_before
+        assert region.waste_ratio() == 0.0
+
+        loaded = Chunk(0, 0, 0)
+        loaded.from_bytes(region.read_chunk(2, 3))
+        assert len(loaded.entities) == 150
+        assert region.chunk_count() == 2
+        region.close()
+    print("✅ Compacted region kept all live chunks")
+
+
+def test_chunk_manager_uses_regions():
+    """ChunkManager saves into regions and migrates per-chunk files"""
+    print("Testing ChunkManager region integration...")
+
+    original_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.chdir(temp_dir)
+        try:
+            manager = ChunkManager(777, "region_test")
+
+            # A chunk left over from the per-chunk file format
+            legacy = make_chunk(-1, 0)
+            legacy.save_to_file(manager.world_dir)
+
+            chunk = manager.load_chunk(-1, 0)
+            assert chunk.to_dict() == legacy.to_dict()
+            manager.save_chunk(chunk)
+            assert not os.path.exists(legacy.get_filename(manager.world_dir))
+
+            for chunk_x in range(30, 34):
+                manager.save_chunk(make_chunk(chunk_x, 0))
+
+            info = manager.get_world_info()
+            assert info['total_chunks_generated'] == 5
+            assert len(manager.regions) == 3
+            manager.close()
+        finally:
+            os.chdir(original_cwd)
+    print("✅ ChunkManager counted chunks from region headers")
+
+
+def test_corrupt_region_header():
+    """A region with a truncated header is set aside and its chunks regenerate"""
+    print("Testing corrupt region headers...")
+
+    original_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        os.chdir(temp_dir)
+        try:
+            manager = ChunkManager(777, "corrupt_test")
+            path = RegionFile.get_filename(manager.world_dir, 0, 0)
+            with open(path, 'wb') as f:
+                f.write(RegionFile.MAGIC)  # Cut off mid-header
+            try:
+                RegionFile(path)
+                assert False, "Truncated header was accepted"
+            except ValueError:
+                pass
+
+            assert manager.load_chunk(1, 1) is None
+            assert not os.path.exists(path)
+            with open(path + '.corrupt', 'rb') as f:
+                assert f.read() == RegionFile.MAGIC
+
+            # The chunk is generated again and saved to a fresh region
+            chunk = manager.get_chunk(1, 1)
+            assert chunk is not None and chunk.is_generated
+            manager.save_chunk(chunk)
+            assert manager.get_region(1, 1).path == path and manager.get_region(1, 1).has_chunk(1, 1)
+            manager.close()
+        finally:
+            os.chdir(original_cwd)
+    print("✅ Corrupt region set aside and regenerated")
+
+
+def main():
+    """Run all region file tests"""
+    tests = [test_region_read_write_single_chunk, test_region_compaction, test_chunk_manager_uses_regions,
+             test_corrupt_region_header]
+
+    for test in tests:
+        test()
+
+    print("\n🎉 All region file tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Tests for the depth-sorted entity render list
+"""
+
+import sys
+import os
+import random
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from src.core.isometric import IsometricRenderer, sort_by_depth
+from src.level.render_list import RenderList
+from src.level.level_renderer import LevelRendererMixin, ENTITY_CULL_MARGIN
+
+EVERYTHING = (float('-inf'), float('inf'), float('-inf'), float('inf'))
+
+
+class Thing:
+    """Entity stand-in with a position, type and name"""
+
+    def __init__(self, x, y, entity_type="entity", name="thing"):
+        self.x = x
+        self.y = y
+        self.entity_type = entity_type
+        self.name = name
+
+
+class Owner(LevelRendererMixin):
+    """Holds the player and entity lists like a level does"""
+
+    def __init__(self, rng, count):
+        def spot():
+            return rng.uniform(-30, 30), rng.uniform(-30, 30)
+        self.player = Thing(0.5, 0.5, "player", "Player")
+        self.enemies = [Thing(*spot(), "enemy", "Goblin") for _ in range(count)]
+        self.npcs = [Thing(*spot(), "npc", "Villager") for _ in range(count // 10)]
+        self.items = [Thing(*spot(), "item", "Coin") for _ in range(count // 10)]
+        self.objects = [Thing(*spot(), "object", rng.choice(("Oak Tree", "Stone Wall", "Rock"))) for _ in range(count)]
+        self.chests, self.furniture = [], [Thing(*spot(), "furniture", "Table")]
+        self.iso_renderer = IsometricRenderer(64, 32)
+        self.camera_x = self.camera_y = 0
+
+    def everything(self):
+        """Every entity in the order the old sort saw them"""
+        return [self.player] + self.enemies + self.npcs + self.items + self.objects + self.chests + self.furniture
+
+
+def test_order_matches_full_sort():
+    """After entities move, the list is in the order a full sort_by_depth gives"""
+    print("Testing render list order against sort_by_depth...")
+
+    rng = random.Random(11)
+    owner = Owner(rng, 400)
+    # Ties keep the list order, trees and walls go after others at their depth
+    owner.enemies[0].x, owner.enemies[0].y = 3, 4
+    owner.objects[0].x, owner.objects[0].y, owner.objects[0].name = 4, 3, "Oak Tree"
+    owner.items[0].x, owner.items[0].y = 5, 2
+    render_list = RenderList(owner)
+
+    for frame in range(50):
+        movers = rng.sample(owner.enemies + owner.npcs + [owner.player], 20)
+        for entity in movers:
+            entity.x += rng.uniform(-0.3, 0.3)
+            entity.y += rng.uniform(-0.3, 0.3)
+        render_list.refresh()
+        assert render_list.visible(*EVERYTHING) == sort_by_depth(owner.everything()), frame
+
+    assert len(render_list) == len(owner.everything())
+    assert render_list.reinserted <= 50 * 20
+    print(f"✅ Order matches a full sort over {render_list.reinserted} re-insertions")
+
+
+def test_membership_follows_lists():
+    """Appended, removed and replaced entities are picked up by refresh"""
+    print("Testing render list membership...")
+
+    rng = random.Random(5)
+    owner = Owner(rng, 50)
+    render_list = RenderList(owner)
+    render_list.refresh()
+
+    dropped = owner.enemies.pop(3)
+    owner.items.append(Thing(1.0, 2.0, "item", "Potion"))
+    owner.npcs = [Thing(7.0, 7.0, "npc", "Trader")]
+    render_list.refresh()
+    assert dropped not in render_list.visible(*EVERYTHING)
+    assert render_list.visible(*EVERYTHING) == sort_by_depth(owner.everything())
+    assert sum(map(len, render_list.buckets.values())) == len(render_list)
+    assert render_list.bucket_depths == sorted(render_list.buckets)
+
+    # Static lists aren't scanned every frame - whoever moves a tree says so
+    tree = owner.objects[0]
+    tree.x += 40
+    render_list.refresh()
+    assert render_list.visible(*EVERYTHING) != sort_by_depth(owner.everything())
+    render_list.update(tree)
+    assert render_list.visible(*EVERYTHING) == sort_by_depth(owner.everything())
+    print("✅ Membership follows the level's lists")
+
+
+def test_same_length_swaps():
+    """Entities swapped in place without changing a list's length are picked up"""
+    print("Testing render list same-length swaps...")
+
+    owner = Owner(random.Random(2), 0)
+    owner.objects[:] = [Thing(i, i, "object", "Rock") for i in range(3)]
+    render_list = RenderList(owner)
+    render_list.refresh()
+
+    # A static list replaced in place at the same length
+    evicted = list(owner.objects)
+    owner.objects[:] = [Thing(i, -i, "object", "Rock") for i in range(3)]
+    render_list.refresh()
+    shown = render_list.visible(*EVERYTHING)
+    assert not any(entity in shown for entity in evicted)
+    assert shown == sort_by_depth(owner.everything())
+
+    # Residency evicting a chunk's enemies and admitting another's in the same update
+    owner.enemies[:] = [Thing(1, 1, "enemy", "Goblin"), Thing(2, 2, "enemy", "Goblin")]
+    render_list.refresh()
+    owner.enemies[:] = [entity for entity in owner.enemies if entity.x != 1]
+    owner.enemies.append(Thing(9, 9, "enemy", "Wolf"))
+    render_list.refresh()
+    assert render_list.visible(*EVERYTHING) == sort_by_depth(owner.everything())
+    assert len(render_list) == len(owner.everything())
+    print("✅ In-place swaps reconciled")
+
+
+def test_view_culling():
+    """Only entities inside the camera's isometric bounds are returned, still in order"""
+    print("Testing render list culling...")
+
+    rng = random.Random(8)
+    owner = Owner(rng, 400)
+    owner.player.x, owner.player.y = 5.5, 5.5
+    view = (1024, 618)
+    owner.camera_x, owner.camera_y = owner.iso_renderer.cart_to_iso(5.5, 5.5)
+    owner.camera_x -= view[0] // 2
+    owner.camera_y -= view[1] // 2
+
+    shown = owner.get_visible_entities(*view)
+    assert owner.player in shown and 0 < len(shown) < len(owner.everything())
+
+    def on_screen(entity):
+        screen_x, screen_y = owner.iso_renderer.world_to_screen(entity.x, entity.y, owner.camera_x, owner.camera_y)
+        return (-ENTITY_CULL_MARGIN <= screen_x <= view[0] + ENTITY_CULL_MARGIN and
+                -ENTITY_CULL_MARGIN <= screen_y <= view[1] + ENTITY_CULL_MARGIN)
+
+    # Trees and walls sort half a tile deeper, so compare away from the edge
+    expected = [entity for entity in sort_by_depth(owner.everything()) if on_screen(entity)]
+    assert [entity for entity in shown if on_screen(entity)] == expected
+    assert len(shown) - len(expected) <= 3
+    print(f"✅ {len(shown)} of {len(owner.everything())} entities in view")
+
+
+def main():
+    """Run all render list tests"""
+    tests = [test_order_matches_full_sort, test_membership_follows_lists, test_same_length_swaps, test_view_culling]
+
+    for test in tests:
+        test()
+
+    print("\n🎉 All render list tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Tests for the AI NPC response cache and context diffing
+"""
+
+import sys
+import os
+import json
+import tempfile
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from src.systems.response_cache import ResponseCache, ContextDiff, normalize_message
+
+RECIPE = "recipes/village_elder.yaml"
+CONTEXT = "NPC ID: elder_1 | NPC Name: Village Elder | Player Level: 2 | Player HP: 80/100 | Player Position: (10, 12)"
+
+
+def test_key_ignores_volatile_details():
+    """Message wording and volatile context fields don't change the key, real differences do"""
+    print("Testing response cache keys...")
+
+    cache = ResponseCache(path=None)
+    cache.put(RECIPE, "Hello", CONTEXT, "Greetings, young one.")
+
+    assert normalize_message("  Hello   there!! ") == "hello there"
+    assert cache.get(RECIPE, "hello!", CONTEXT) == "Greetings, young one."
+    moved = CONTEXT.replace("(10, 12)", "(40, 3)").replace("elder_1", "elder_2")
+    assert cache.get(RECIPE, "Hello", moved) == "Greetings, young one."
+
+    assert cache.get(RECIPE, "Hello", CONTEXT.replace("80/100", "20/100")) is None
+    assert cache.get("recipes/healer.yaml", "Hello", CONTEXT) is None
+    assert cache.get(RECIPE, "Goodbye", CONTEXT) is None
+    assert (cache.hits, cache.misses) == (2, 3)
+    print("✅ Keys normalize messages and skip volatile fields")
+
+
+def test_ttl_and_lru_eviction():
+    """Entries expire after the TTL and the least recently used go first"""
+    print("Testing TTL and LRU eviction...")
+
+    cache = ResponseCache(path=None, ttl=60, max_entries=2)
+    cache.put(RECIPE, "one", CONTEXT, "1")
+    cache.put(RECIPE, "two", CONTEXT, "2")
+    assert cache.get(RECIPE, "one", CONTEXT) == "1"  # "two" is now least recently used
+    cache.put(RECIPE, "three", CONTEXT, "3")
+    assert cache.get(RECIPE, "two", CONTEXT) is None
+    assert cache.get(RECIPE, "one", CONTEXT) == "1"
+
+    cache.entries[ResponseCache.key(RECIPE, "three", CONTEXT)]["created"] -= 61
+    assert cache.get(RECIPE, "three", CONTEXT) is None
+    assert len(cache.entries) == 1
+    print("✅ Expired and least recently used entries are dropped")
+
+
+def test_cache_persists_across_sessions():
+    """The cache is saved to disk and reloaded, without expired entries"""
+    print("Testing response cache persistence...")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "saves", "npc_response_cache.json")
+        cache = ResponseCache(path=path, ttl=60)
+        cache.put(RECIPE, "Hello", CONTEXT, "Greetings.")
+        cache.put(RECIPE, "Old", CONTEXT, "Stale.")
+        cache.entries[ResponseCache.key(RECIPE, "Old", CONTEXT)]["created"] -= 61
+        cache.put(RECIPE, "Quest", CONTEXT, "Seek the ruins.")  # Saves the aged entry too
+
+        reloaded = ResponseCache(path=path, ttl=60)
+        assert reloaded.get(RECIPE, "hello", CONTEXT) == "Greetings."
+        assert reloaded.get(RECIPE, "Quest", CONTEXT) == "Seek the ruins."
+        assert reloaded.get(RECIPE, "Old", CONTEXT) is None
+        assert len(reloaded.entries) == 2
+
+        with open(path, 'w') as f:
+            f.write("not json")
+        assert ResponseCache(path=path).get(RECIPE, "Hello", CONTEXT) is None
+
+        # Valid JSON in the wrong shape is discarded as a whole
+        key = ResponseCache.key(RECIPE, "Hello", CONTEXT)
+        good = [key, {"response": "Greetings.", "created": 1e12}]
+        for data in ([good], {"entries": {key: good[1]}}, {"entries": [good, [key]]},
+                     {"entries": [good, ["other", {"created": 1e12}]]}, {"entries": [good, ["other", "Hi"]]},
+                     {"entries": [good, ["other", {"response": "Hi", "created": "today"}]]}):
+            with open(path, 'w') as f:
+                json.dump(data, f)
+            cache = ResponseCache(path=path)
+            assert cache.get(RECIPE, "Hello", CONTEXT) is None, data
+            cache.put(RECIPE, "Quest", CONTEXT, "Seek the ruins.")
+            assert ResponseCache(path=path).get(RECIPE, "Quest", CONTEXT) == "Seek the ruins."
+    print("✅ Cache survives a restart and ignores a corrupt file")
+
+
+def test_context_diff_sends_changes():
+    """The first message carries the whole context, follow-ups only what changed"""
+    print("Testing context diffing...")
+
+    diff = ContextDiff()
+    assert diff.changes(CONTEXT) == CONTEXT
+    diff.commit(CONTEXT)
+    assert diff.changes(CONTEXT) == ""
+
+    hurt = CONTEXT.replace("80/100", "35/100") + " | Player has 3 items in inventory"
+    assert diff.changes(hurt) == "Player HP: 35/100 | Player has 3 items in inventory"
+    diff.commit(hurt)
+
+    assert diff.changes(CONTEXT.replace(" | Player Level: 2", "")) == "Player HP: 80/100 | Player Level: none"
+    diff.reset()
+    assert diff.changes(hurt) == hurt
+    print("✅ Context diff sends only changed fields")
+
+
+def main():
+    """Run all response cache tests"""
+    tests = [test_key_ignores_volatile_details, test_ttl_and_lru_eviction,
+             test_cache_persists_across_sessions, test_context_diff_sends_changes]
+
+    for test in tests:
+        test()
+
+    print("\n🎉 All response cache tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
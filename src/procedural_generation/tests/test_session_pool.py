@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared goose session pool, using a fake goose
+"""
+
+import sys
+import os
+import threading
+import time
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from src.systems.npc_conversations import GooseSession
+from src.systems.session_pool import SessionPool
+
+FAKE_GOOSE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fake_goose.py")
+
+
+class Starter:
+    """Starts fake goose sessions and records how it was asked to"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, key):
+        def start(resume):
+            self.calls.append((key, resume))
+            session = GooseSession([sys.executable, FAKE_GOOSE])
+            return session if session.wait_until_ready(10) else None
+        return start
+
+
+def key(name):
+    """Pool key for a test NPC"""
+    return ("recipes/village_elder.yaml", name)
+
+
+def test_reuse_and_lru_eviction():
+    """Sessions are reused per key and the least recently used idle one makes room"""
+    print("Testing session reuse and LRU eviction...")
+
+    pool = SessionPool(max_sessions=2)
+    starter = Starter()
+    try:
+        first = pool.acquire(key("a"), starter(key("a")))
+        pool.release(key("a"))
+        assert pool.acquire(key("a"), starter(key("a"))) is first
+        pool.release(key("a"))
+
+        pool.acquire(key("b"), starter(key("b")))
+        pool.release(key("b"))
+        pool.acquire(key("a"), starter(key("a")))  # "a" is now the most recently used
+        pool.release(key("a"))
+
+        pool.acquire(key("c"), starter(key("c")))
+        pool.release(key("c"))
+        assert pool.has_session(key("a")) and pool.has_session(key("c"))
+        assert not pool.has_session(key("b"))
+
+        # "b" comes back by resuming its earlier session
+        pool.acquire(key("b"), starter(key("b")))
+        pool.release(key("b"))
+        assert starter.calls == [(key("a"), False), (key("b"), False), (key("c"), False), (key("b"), True)]
+
+        metrics = pool.metrics()
+        assert metrics["cold_starts"] == 4 and metrics["hits"] == 2
+        assert metrics["evictions"] == 2 and metrics["idle_sessions"] == 2
+        assert metrics["cold_start_avg_ms"] > 0
+    finally:
+        pool.shutdown()
+    print(f"✅ Reused sessions and evicted least recently used ({metrics['evictions']} evictions)")
+
+
+def test_waits_for_busy_pool():
+    """A full pool of busy sessions makes new keys wait, or time out"""
+    print("Testing waits on a busy pool...")
+
+    pool = SessionPool(max_sessions=1)
+    starter = Starter()
+    try:
+        pool.acquire(key("a"), starter(key("a")))
+        assert pool.acquire(key("b"), starter(key("b")), timeout=0.2) is None
+
+        acquired = []
+        waiter = threading.Thread(target=lambda: acquired.append(pool.acquire(key("b"), starter(key("b")))))
+        waiter.start()
+        time.sleep(0.3)
+        assert not acquired, "b should wait while a is busy"
+        pool.release(key("a"))
+        waiter.join(15)
+        assert acquired and acquired[0] is not None
+
+        metrics = pool.metrics()
+        assert metrics["acquire_timeouts"] == 1
+        assert metrics["queue_wait_max_ms"] >= 250
+        assert metrics["active_sessions"] == 1 and not pool.has_session(key("a"))
+        pool.release(key("b"))
+    finally:
+        pool.shutdown()
+    print(f"✅ Busy pool queued for {metrics['queue_wait_max_ms']:.0f}ms")
+
+
+def test_idle_sessions_expire():
+    """Sessions unused for longer than the idle timeout are closed"""
+    print("Testing idle expiry...")
+
+    pool = SessionPool(max_sessions=2, idle_timeout=60)
+    starter = Starter()
+    try:
+        session = pool.acquire(key("a"), starter(key("a")))
+        assert pool.reap_idle(time.monotonic() + 120) == 0, "Sessions in use never expire"
+        pool.release(key("a"))
+        assert pool.reap_idle() == 0
+        assert pool.reap_idle(time.monotonic() + 120) == 1
+        assert not pool.has_session(key("a"))
+
+        deadline = time.monotonic() + 10
+        while session.is_alive() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        assert not session.is_alive()
+        assert pool.metrics()["expired"] == 1
+    finally:
+        pool.shutdown()
+    print("✅ Idle sessions expire")
+
+
+def test_prewarm_fills_free_slots():
+    """Pre-warming starts sessions in the background without evicting running ones"""
+    print("Testing pre-warming...")
+
+    pool = SessionPool(max_sessions=3)
+    starter = Starter()
+    try:
+        pool.acquire(key("busy"), starter(key("busy")))
+        thread = pool.prewarm([(key(name), starter(key(name))) for name in ("near", "nearer", "far")])
+        thread.join(20)
+
+        assert pool.has_session(key("near")) and pool.has_session(key("nearer"))
+        assert not pool.has_session(key("far"))
+        assert pool.prewarm([(key("far"), starter(key("far")))]) is None, "No free slots"
+
+        # A pre-warmed session is ready straight away
+        calls = len(starter.calls)
+        assert pool.acquire(key("near"), starter(key("near"))) is not None
+        assert len(starter.calls) == calls
+        assert pool.metrics()["idle_sessions"] == 1
+        pool.release(key("near"))
+        pool.release(key("busy"))
+    finally:
+        pool.shutdown()
+    print("✅ Pre-warmed sessions fill free slots only")
+
+
+def main():
+    """Run all session pool tests"""
+    tests = [test_reuse_and_lru_eviction, test_waits_for_busy_pool,
+             test_idle_sessions_expire, test_prewarm_fills_free_slots]
+
+    for test in tests:
+        test()
+
+    print("\n🎉 All session pool tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
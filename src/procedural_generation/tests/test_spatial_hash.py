@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Tests for the entity spatial hash used by collision checks
+"""
+
+import sys
+import os
+import math
+import random
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from src.level.spatial_hash import SpatialHash
+
+
+class Thing:
+    """Entity stand-in with a position and footprint"""
+
+    def __init__(self, x, y, width=1, height=1):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+
+
+class Owner:
+    """Holds entity lists like a level does"""
+
+    def __init__(self, rng, count):
+        self.objects = [Thing(rng.uniform(0, 40), rng.uniform(0, 40)) for _ in range(count)]
+        self.enemies = [Thing(rng.uniform(0, 40), rng.uniform(0, 40)) for _ in range(count)]
+        self.npcs, self.chests = [], []
+        self.furniture = [Thing(10.2, 10.2, width=3, height=2)]
+
+
+def brute_force(owner, x, y, radius):
+    """Ids of entities within radius, by scanning every list"""
+    found = set()
+    for category in ('objects', 'enemies'):
+        for entity in getattr(owner, category):
+            if math.hypot(entity.x - x, entity.y - y) <= radius:
+                found.add(id(entity))
+    return found
+
+
+def test_query_finds_everything_in_range():
+    """Queries return a superset of entities within the radius"""
+    print("Testing spatial hash queries against brute force...")
+
+    rng = random.Random(3)
+    owner = Owner(rng, 300)
+    index = SpatialHash(owner)
+
+    for _ in range(500):
+        x, y, radius = rng.uniform(0, 40), rng.uniform(0, 40), rng.uniform(0.1, 2.0)
+        found = {id(entity) for _, entity in index.query(x, y, radius)}
+        assert brute_force(owner, x, y, radius) <= found
+
+    # Multi-cell furniture is found from its far corner and reported once
+    hits = [entity for category, entity in index.query(12.4, 11.2, 0.1) if category == 'furniture']
+    assert hits == owner.furniture
+    print("✅ Queries matched brute force")
+
+
+def test_movement_and_membership():
+    """Moved, added and removed entities are reflected in queries"""
+    print("Testing spatial hash updates...")
+
+    rng = random.Random(4)
+    owner = Owner(rng, 50)
+    index = SpatialHash(owner)
+    mover = owner.enemies[0]
+
+    # Teleport far away, then refresh as the level does each frame
+    mover.x, mover.y = 100.5, 100.5
+    index.refresh()
+    assert [entity for _, entity in index.query(100.5, 100.5, 0.5)] == [mover]
+
+    # Appends and removals are picked up before the next query
+    newcomer = Thing(200.5, 200.5)
+    owner.npcs.append(newcomer)
+    assert index.query_list(200.5, 200.5, 0.5, 'npcs') == [newcomer]
+
+    owner.enemies.remove(mover)
+    assert index.query_list(100.5, 100.5, 0.5, 'enemies') == []
+
+    # Replacing a list wholesale also counts as a membership change
+    owner.objects = []
+    assert index.query_list(20, 20, 40, 'objects') == []
+    print("✅ Movement, additions and removals tracked")
+
+
+def main():
+    """Run all spatial hash tests"""
+    tests = [test_query_finds_everything_in_range, test_movement_and_membership]
+
+    for test in tests:
+        test()
+
+    print("\n🎉 All spatial hash tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Tests for the game state snapshots MCP queries are answered from
+"""
+
+import sys
+import os
+import json
+import time
+import asyncio
+import threading
+from types import SimpleNamespace
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+from src.systems.state_snapshot import SnapshotPublisher, capture_snapshot, player_info, world_info
+from src.systems.command_bus import CommandBus
+from src.quest_system import Quest
+
+
+def make_game():
+    """Small stand-in game with a player, NPCs, a quest and two chunks"""
+    inventory = SimpleNamespace(items=[SimpleNamespace(name="Iron Sword", item_type="weapon", value=50)], max_size=20)
+    player = SimpleNamespace(x=10.0, y=10.0, health=80, max_health=100, stamina=50, gold=1, level=2,
+                             inventory=inventory, equipped_weapon=inventory.items[0], equipped_armor=None)
+    npcs = [SimpleNamespace(name="Merchant", x=12.0, y=10.0, has_shop=True),
+            SimpleNamespace(name="Elder", x=10.0, y=11.0, is_ai_enabled=True),
+            SimpleNamespace(name="Hermit", x=90.0, y=90.0)]
+    chunks = {(0, 0): SimpleNamespace(entities=[{}, {}], buildings=[{}]),
+              (1, 0): SimpleNamespace(entities=[{}], buildings=[])}
+    level = SimpleNamespace(npcs=npcs, chunk_manager=SimpleNamespace(loaded_chunks=chunks))
+    quest = Quest("wolves", "Wolf Trouble", "Thin the pack", objectives=[{"type": "kill", "target": "wolves", "count": 3}])
+    quest_manager = SimpleNamespace(active_quests={"wolves": quest})
+    return SimpleNamespace(player=player, current_level=level, quest_manager=quest_manager)
+
+
+def test_snapshot_is_immutable_copy():
+    """A snapshot holds the frame's values, can't be changed and is JSON ready once thawed"""
+    print("Testing snapshot capture...")
+
+    game = make_game()
+    snapshot = capture_snapshot(game, frame=7)
+    game.player.health = 5
+    game.player.inventory.items.append(SimpleNamespace(name="Apple"))
+
+    info = player_info(snapshot)
+    assert info["player"]["health"] == 80 and info["player"]["inventory_count"] == 1
+    assert info["player"]["equipped_items"] == {"weapon": "Iron Sword"}
+    assert info["frame"] == 7
+
+    world = world_info(snapshot)["world"]
+    assert [npc["name"] for npc in world["nearby_npcs"]] == ["Elder", "Merchant"]
+    assert world["nearby_npcs"][1]["has_shop"]
+    assert world["active_quests"][0]["objectives"] == ["Defeat 0/3 wolves"]
+    assert world["chunks"] == {"loaded": 2, "buildings": 1, "entities": 3}
+    json.dumps(snapshot.to_dict())
+
+    for change in (lambda: setattr(snapshot, "frame", 8),
+                   lambda: snapshot.player.__setitem__("health", 1),
+                   lambda: snapshot.nearby_npcs.append({})):
+        try:
+            change()
+        except (AttributeError, TypeError):
+            continue
+        raise AssertionError("snapshot was modified")
+
+    assert player_info(capture_snapshot(SimpleNamespace(player=None)))["success"] is False
+    print("✅ Snapshots are frozen copies of the frame")
+
+
+def test_publisher_interval():
+    """Snapshots go out every interval frames, or on the next frame when marked dirty"""
+    print("Testing snapshot publishing...")
+
+    game = make_game()
+    publisher = SnapshotPublisher(interval_frames=3)
+    assert not publisher.latest().has_player
+
+    published = [publisher.update(game) for _ in range(6)]
+    assert published == [True, False, True, False, False, True]  # First frame publishes straight away
+    old = publisher.latest()
+    assert old.frame == 6
+
+    game.player.gold = 99
+    publisher.mark_dirty()
+    assert publisher.update(game)
+    assert publisher.latest().player["gold"] == 99 and old.player["gold"] == 1
+    print("✅ Publisher swaps in snapshots on its interval")
+
+
+def test_concurrent_clients_load():
+    """Many clients polling tool calls see consistent frames while the loop keeps running"""
+    print("Testing many concurrent MCP clients...")
+
+    game = make_game()
+    player = game.player
+    player.stamina = player.health
+    bus = CommandBus()
+    publisher = SnapshotPublisher(interval_frames=2)
+    publisher.publish(game)
+    client_count, tasks_per_client, polls = 16, 8, 100
+    errors = []
+    reads = []
+
+    def give_gold():
+        # Same frame invariant as the loop below: one item per gold
+        player.inventory.items.append(SimpleNamespace(name="Coin"))
+        player.gold += 1
+        return True
+
+    async def poll(client):
+        last_frame = 0
+        for i in range(polls):
+            snapshot = publisher.latest()
+            info = player_info(snapshot)["player"]
+            if info["health"] != info["stamina"] or info["inventory_count"] != info["gold"]:
+                errors.append(f"client {client} saw a torn frame: {info}")
+            if snapshot.frame < last_frame:
+                errors.append(f"client {client} went back in time")
+            last_frame = snapshot.frame
+            world_info(snapshot)
+            if i % 25 == 0:
+                assert await asyncio.wait_for(asyncio.wrap_future(bus.submit("give_gold", give_gold)), 10.0)
+            await asyncio.sleep(0)
+        reads.append(polls)
+
+    def client(index):
+        async def run():
+            await asyncio.gather(*(poll(index) for _ in range(tasks_per_client)))
+        try:
+            asyncio.run(run())
+        except Exception as e:
+            errors.append(repr(e))
+
+    threads = [threading.Thread(target=client, args=(index,)) for index in range(client_count)]
+    for thread in threads:
+        thread.start()
+
+    frame_times = []
+    while any(thread.is_alive() for thread in threads):
+        started = time.perf_counter()
+        # A frame changes two fields that must agree, one at a time
+        player.health = (player.health + 1) % 100
+        player.stamina = player.health
+        if bus.drain():
+            publisher.mark_dirty()
+        publisher.update(game)
+        frame_times.append(time.perf_counter() - started)
+        time.sleep(0.001)
+    for thread in threads:
+        thread.join()
+
+    assert not errors, errors[:3]
+    assert sum(reads) == client_count * tasks_per_client * polls
+    expected_gold = 1 + client_count * tasks_per_client * (polls // 25)
+    assert player.gold == expected_gold and len(player.inventory.items) == expected_gold
+    assert bus.processed == expected_gold - 1
+    print(f"✅ {sum(reads)} reads over {len(frame_times)} frames, "
+          f"slowest frame {1000 * max(frame_times):.2f}ms, last capture {publisher.last_capture_ms:.3f}ms")
+
+
+def main():
+    """Run all snapshot tests"""
+    tests = [test_snapshot_is_immutable_copy, test_publisher_interval, test_concurrent_clients_load]
+
+    for test in tests:
+        test()
+
+    print("\n🎉 All snapshot tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Tests for the pre-rendered wall face atlas
+"""
+
+import sys
+import os
+import importlib
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+# Add the project root to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))))
+
+import src.wall_face_atlas
+import src.wall_renderer
+
+
+def with_real_pygame(test):
+    """
+    Run a test against the real pygame with a display
+
+    test_phase4_integration installs a mock pygame in sys.modules, so the
+    real module is swapped back in for the test (and the wall modules
+    reloaded if they were imported against the mock).
+    """
+    def wrapper():
+        previous = sys.modules.get('pygame')
+        if not hasattr(previous, 'Surface'):
+            # The real module is still referenced by anything that imported it before the mock
+            real = next((module.pygame for module in list(sys.modules.values())
+                         if hasattr(getattr(module, 'pygame', None), 'Surface')), None)
+            if real is not None:
+                sys.modules['pygame'] = real
+            else:
+                sys.modules.pop('pygame', None)
+        pygame = importlib.import_module('pygame')
+        try:
+            for module in (src.wall_face_atlas, src.wall_renderer):
+                if module.pygame is not pygame:
+                    importlib.reload(module)
+            pygame.init()
+            if pygame.display.get_surface() is None:
+                pygame.display.set_mode((1, 1))
+            test(pygame)
+        finally:
+            if previous is not None:
+                sys.modules['pygame'] = previous
+    wrapper.__name__ = test.__name__
+    wrapper.__doc__ = test.__doc__
+    return wrapper
+
+
+def make_texture(pygame, color, size=(32, 64)):
+    """Striped texture so scaling and masking show up in the pixels"""
+    texture = pygame.Surface(size, pygame.SRCALPHA)
+    texture.fill(color)
+    for y in range(0, size[1], 4):
+        pygame.draw.line(texture, (20, 20, 20), (0, y), (size[0], y))
+    return texture
+
+
+class Assets:
+    def __init__(self, images):
+        self.images = images
+
+    def get_image(self, name):
+        return self.images.get(name)
+
+
+class WallLevel:
+    """Level constants and a single wall tile"""
+
+    TILE_WALL = 4
+    TILE_DOOR = 5
+    TILE_WALL_CORNER_TL = 6
+    TILE_WALL_CORNER_TR = 7
+    TILE_WALL_CORNER_BL = 8
+    TILE_WALL_CORNER_BR = 9
+    TILE_WALL_HORIZONTAL = 10
+    TILE_WALL_VERTICAL = 11
+    TILE_WALL_WINDOW = 12
+    TILE_WALL_WINDOW_HORIZONTAL = 14
+    TILE_WALL_WINDOW_VERTICAL = 15
+
+    tile_width = 64
+    tile_height = 32
+    width = 10
+    height = 10
+
+    def __init__(self, images):
+        self.asset_loader = Assets(images)
+        self.tile_sprites = {}
+
+    def get_tile(self, x, y):
+        return self.TILE_WALL if (x, y) == (5, 5) else 0
+
+
+@with_real_pygame
+def test_atlas_faces_match_direct_rendering(pygame):
+    """Blitting from the atlas gives the same pixels as rendering the face"""
+    print("Testing atlas faces against direct rendering...")
+    from src.wall_face_atlas import WallFaceAtlas, face_shape, render_face, wall_face_points
+
+    wall, window, roof = make_texture(pygame, (200, 150, 100)), make_texture(pygame, (90, 140, 220)), make_texture(pygame, (150, 40, 30))
+    atlas = WallFaceAtlas(64, 32, wall, window, roof)
+    assert len(atlas.face_rects) == 10  # 5 wall faces, 4 window sides, 1 roof top
+
+    points = wall_face_points(100.0, 120.0, 64, 32)
+    cases = [(wall, direction, False, True) for direction in points]
+    cases += [(window, "north", False, True), (roof, "top", True, False)]
+    for texture, direction, rotate, border in cases:
+        expected = pygame.Surface((200, 200), pygame.SRCALPHA)
+        actual = pygame.Surface((200, 200), pygame.SRCALPHA)
+        min_x, min_y, shape = face_shape(points[direction])
+        expected.blit(render_face(texture, direction, shape, rotate, border), (min_x, min_y))
+        atlas.blit_face(actual, texture, points[direction], direction, rotate, border)
+
+        assert pygame.image.tobytes(expected, 'RGBA') == pygame.image.tobytes(actual, 'RGBA'), direction
+    assert not atlas.extra_faces  # Standard geometry never falls back
+
+    # Other shapes are rendered once and kept
+    odd_points = wall_face_points(0, 0, 64, 32, wall_height=20)["east"]
+    atlas.blit_face(pygame.Surface((100, 100), pygame.SRCALPHA), wall, odd_points, "east")
+    assert len(atlas.extra_faces) == 1
+    print("✅ Atlas faces are pixel-identical")
+
+
+@with_real_pygame
+def test_renderer_reuses_and_rebuilds_atlas(pygame):
+    """The wall renderer builds the atlas once and again only for new textures"""
+    print("Testing wall renderer atlas reuse...")
+    from src.wall_renderer import WallRenderer
+
+    images = {
+        'wall_texture': make_texture(pygame, (200, 150, 100)),
+        'wall_texture_window': make_texture(pygame, (90, 140, 220)),
+        'roof_texture': make_texture(pygame, (150, 40, 30))
+    }
+    level = WallLevel(images)
+    renderer = WallRenderer(level)
+    screen = pygame.Surface((300, 300))
+
+    renderer.render_flat_wall_with_roof_top(screen, 150, 200, level.TILE_WALL, 5, 5)
+    atlas = renderer.face_atlas
+    renderer.render_flat_wall(screen, 150, 200, level.TILE_WALL, 5, 5)
+    renderer.render_flat_wall_with_roof_top(screen, 120, 180, level.TILE_WALL_WINDOW_HORIZONTAL, 5, 5)
+    assert renderer.face_atlas is atlas and not atlas.extra_faces
+
+    images['roof_texture'] = make_texture(pygame, (60, 60, 60))
+    renderer.render_flat_wall_with_roof_top(screen, 150, 200, level.TILE_WALL, 5, 5)
+    assert renderer.face_atlas is not atlas
+    print("✅ Atlas reused across frames and rebuilt for new textures")
+
+
+def main():
+    """Run all wall face atlas tests"""
+    tests = [test_atlas_faces_match_direct_rendering, test_renderer_reuses_and_rebuilds_atlas]
+
+    for test in tests:
+        test()
+
+    print("\n🎉 All wall face atlas tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
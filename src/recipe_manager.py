@@ -4,18 +4,31 @@ Loads and manages YAML recipe files for different NPC types
 """
 
 import os
+import time
 import yaml
-import subprocess
-import tempfile
 from typing import Dict, Optional
 
+from .systems.npc_conversations import GooseSession, goose_command
+from .systems.session_pool import get_session_pool, goose_available
+from .systems.response_cache import ContextDiff, get_response_cache
+
+
+def fallback_greeting(recipe_name: str) -> str:
+    """Stock greeting used when goose gives no usable reply"""
+    return f"Greetings, traveler. I am {recipe_name.replace('_', ' ').title()}."
+
+
 class GooseRecipeManager:
     """Manages Goose recipes for different NPC types"""
     
+    # Seconds a session may take to reply before whatever arrived is used
+    response_timeout = 60.0
+    
     def __init__(self, recipes_dir: str = "recipes"):
         print(f"🔧 [RecipeManager] Initializing with recipes_dir: {recipes_dir}")
         self.recipes_dir = recipes_dir
         self.recipes = {}
+        self.context_diffs: Dict[str, ContextDiff] = {}  # Game state each recipe session has been told
         self.load_recipes()
         print(f"🔧 [RecipeManager] Initialization complete, loaded {len(self.recipes)} recipes")
     
@@ -114,104 +127,83 @@ class GooseRecipeManager:
             recipe_file = recipe_info['file_path']
             print(f"✅ [RecipeManager] Found recipe file: {recipe_file}")
             
+            # Goose's location is looked up once, not on every message
+            if not goose_available():
+                print(f"❌ [RecipeManager] Goose CLI not found in PATH")
+                return f"*{recipe_name} seems distracted - Goose CLI not available*"
+            
             # Set up environment
             env = os.environ.copy()
             env["GOOSE_MODEL"] = "goose-gpt-4-1"  # Use GPT-4.1 model
             print(f"🔧 [RecipeManager] Using model: {env.get('GOOSE_MODEL')}")
             
-            # Let's try to actually run the subprocess with detailed logging
-            print(f"🔧 [RecipeManager] Attempting to run Goose CLI subprocess...")
-            
-            # Run goose with the recipe and capture output to a file
-            import tempfile
-            import time
-            
-            with tempfile.NamedTemporaryFile(mode='w+', suffix='.txt', delete=False) as output_file:
-                output_file_path = output_file.name
+            # Each recipe keeps one interactive session in the shared pool
+            session_name = f"npc_{recipe_name}"
+            key = (recipe_file, session_name)
+            context_diff = self.context_diffs.setdefault(session_name, ContextDiff())
             
-            print(f"🔧 [RecipeManager] Created temp output file: {output_file_path}")
-            
-            # Escape quotes in the message and context for shell safety
-            safe_message = user_message.replace("'", "\\'").replace('"', '\\"')
-            safe_context = context.replace("'", "\\'").replace('"', '\\"')
-            
-            cmd_str = f"goose run --recipe '{recipe_file}' --params 'message={safe_message}' --params 'context={safe_context}' --interactive --resume --session 'npc_{recipe_name}'"
-            
-            print(f"🔧 [RecipeManager] Command to execute: {cmd_str}")
-            print(f"🔧 [RecipeManager] Working directory: {os.getcwd()}")
-            print(f"🔧 [RecipeManager] Environment GOOSE_MODEL: {env.get('GOOSE_MODEL')}")
-            
-            # Test if goose command is available
-            try:
-                test_result = subprocess.run("which goose", shell=True, capture_output=True, text=True)
-                if test_result.returncode == 0:
-                    print(f"🔧 [RecipeManager] Goose CLI found at: {test_result.stdout.strip()}")
+            def start_session(resume):
+                cmd = goose_command() + [
+                    "run", "--recipe", recipe_file,
+                    "--params", f"context={context}",
+                    "--interactive", "--name", session_name
+                ]
+                if resume:
+                    cmd.append("--resume")
                 else:
-                    print(f"❌ [RecipeManager] Goose CLI not found in PATH")
-                    return f"*{recipe_name} seems distracted - Goose CLI not available*"
-            except Exception as e:
-                print(f"❌ [RecipeManager] Error checking Goose CLI: {e}")
-                return f"*{recipe_name} seems confused*"
+                    context_diff.reset()
+                print(f"🔧 [RecipeManager] Starting session: {' '.join(cmd)}")
+                session = GooseSession(cmd, env)
+                if session.wait_until_ready(30):
+                    return session
+                session.close()
+                return None
             
-            # Run the command and capture output
-            print(f"🔧 [RecipeManager] Starting subprocess execution...")
+            pool = get_session_pool()
             start_time = time.time()
+            session = pool.acquire(key, start_session, timeout=60)
+            if session is None:
+                print(f"⏰ [RecipeManager] No session for '{recipe_name}' within 60 seconds")
+                return f"*{recipe_name} takes a long moment to consider your words*"
             
+            # Until a reply is read in time the session may be mid-answer and won't read "exit" - it's discarded
+            interrupted = True
             try:
-                result = subprocess.run(
-                    f"{cmd_str} > '{output_file_path}' 2>&1",
-                    env=env,
-                    shell=True,
-                    timeout=60  # Increased timeout significantly
-                )
-                
-                execution_time = time.time() - start_time
-                print(f"🔧 [RecipeManager] Subprocess completed in {execution_time:.2f}s with return code: {result.returncode}")
-                
-                # Read the output from the file immediately
-                try:
-                    with open(output_file_path, 'r') as f:
-                        stdout = f.read()
-                    
-                    print(f"🔧 [RecipeManager] Output file size: {len(stdout)} characters")
-                    print(f"🔧 [RecipeManager] First 200 chars of output: {stdout[:200]}")
-                    print(f"🔧 [RecipeManager] Last 200 chars of output: {stdout[-200:]}")
-                    
-                    if len(stdout) > 500:
-                        print(f"🔧 [RecipeManager] Output looks substantial, attempting to parse...")
-                        response = self._parse_goose_output(stdout)
-                        if response and len(response.strip()) > 10:
-                            print(f"✅ [RecipeManager] Successfully parsed AI response: '{response[:100]}...'")
-                            cleaned_response = self._clean_response(response, recipe_name)
-                            return cleaned_response
-                        else:
-                            print(f"⚠️  [RecipeManager] Parsed response was empty or too short")
-                    else:
-                        print(f"⚠️  [RecipeManager] Output too short, likely incomplete")
-                    
-                except Exception as e:
-                    print(f"❌ [RecipeManager] Error reading output file: {e}")
-                
-            except subprocess.TimeoutExpired:
-                print(f"⏰ [RecipeManager] Subprocess timed out after 30 seconds")
-                return f"*{recipe_name} takes a long moment to consider your words*"
-            except Exception as e:
-                print(f"❌ [RecipeManager] Subprocess execution error: {e}")
+                session.drain()
+                # Interactive goose reads one line per message, so the game state that
+                # changed since the last message goes in front of it
+                state = ' '.join(context_diff.changes(context).split())
+                sent_at = time.monotonic()
+                session.send(f"[Game state: {state}] {user_message}" if state else user_message)
+                stdout = '\n'.join(session.read_response(self.response_timeout, 1.5,
+                                                          ["Goose is running! Enter your instructions"]))
+                interrupted = time.monotonic() - sent_at >= self.response_timeout
+                if stdout:
+                    context_diff.commit(context)
+            except (OSError, ValueError) as e:
+                print(f"❌ [RecipeManager] Session error: {e}")
                 return f"*{recipe_name} seems momentarily distracted*"
-            
             finally:
-                # Clean up the temporary file
-                try:
-                    if os.path.exists(output_file_path):
-                        os.unlink(output_file_path)
-                        print(f"🔧 [RecipeManager] Cleaned up temp file: {output_file_path}")
-                except Exception as e:
-                    print(f"⚠️  [RecipeManager] Could not clean up temp file: {e}")
+                pool.release(key, discard=interrupted, exit_timeout=0.5 if interrupted else 5.0)
             
-            # If we get here, the subprocess didn't produce a usable response
-            print(f"🔧 [RecipeManager] Subprocess completed but no usable AI response found")
-            print(f"🔧 [RecipeManager] Using fallback response due to subprocess output issue")
-            fallback_response = f"Greetings, traveler. I am {recipe_name.replace('_', ' ').title()}."
+            execution_time = time.time() - start_time
+            print(f"🔧 [RecipeManager] Response read in {execution_time:.2f}s ({len(stdout)} characters)")
+            
+            if stdout:
+                response = self._parse_goose_output(stdout)
+                if response and len(response.strip()) > 10:
+                    print(f"✅ [RecipeManager] Successfully parsed AI response: '{response[:100]}...'")
+                    cleaned_response = self._clean_response(response, recipe_name)
+                    return cleaned_response
+                else:
+                    print(f"⚠️  [RecipeManager] Parsed response was empty or too short")
+            else:
+                print(f"⚠️  [RecipeManager] No output from session")
+            
+            # If we get here, the session didn't produce a usable response
+            print(f"🔧 [RecipeManager] Session replied but no usable AI response found")
+            print(f"🔧 [RecipeManager] Using fallback response due to session output issue")
+            fallback_response = fallback_greeting(recipe_name)
             print(f"✅ [RecipeManager] Fallback response: '{fallback_response}'")
             return fallback_response
             
@@ -299,7 +291,7 @@ class GooseRecipeManager:
         
         # Ensure it's not empty after cleaning
         if not response or len(response) < 5:
-            return f"Greetings, traveler. I am {recipe_name.replace('_', ' ').title()}."
+            return fallback_greeting(recipe_name)
         
         # Ensure it ends with punctuation
         if not response.endswith(('.', '!', '?')):
@@ -399,7 +391,16 @@ class RecipeBasedGooseIntegration:
             print(f"🔧 [RecipeIntegration] Calling recipe_manager.run_recipe for {self.recipe_name}")
             print(f"🔧 [RecipeIntegration] Enhanced context: '{enhanced_context[:100]}...'")
             
-            response = self.recipe_manager.run_recipe(self.recipe_name, message, enhanced_context)
+            # Opening messages in the same situation get the same reply without asking the model
+            cacheable = not self.conversation_history
+            response = get_response_cache().get(self.recipe_name, message, context) if cacheable else None
+            if response:
+                print(f"✅ [RecipeIntegration] Cached response for {self.npc_name}")
+            else:
+                response = self.recipe_manager.run_recipe(self.recipe_name, message, enhanced_context)
+                # Stand-in replies (distracted, confused, the stock greeting) aren't worth keeping
+                if cacheable and response and not response.startswith('*') and response != fallback_greeting(self.recipe_name):
+                    get_response_cache().put(self.recipe_name, message, context, response)
             
             # Store in conversation history
             self.conversation_history.append({"player": message, "npc": response})
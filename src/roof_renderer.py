@@ -17,8 +17,7 @@ class RoofRenderer:
         self.level = level_instance
         self.asset_loader = level_instance.asset_loader
         
-        # Cache for building detection
-        self.building_cache = {}
+        # Cache for building proximity detection
         self.building_perimeters = {}
         
         # Load roof texture
@@ -146,28 +145,37 @@ class RoofRenderer:
     
     def find_building_at(self, x, y):
         """Find the building that contains the given coordinates"""
-        # Check cache first
-        cache_key = (x, y)
-        if cache_key in self.building_cache:
-            return self.building_cache[cache_key]
+        # Chunked worlds record their buildings at generation time
+        if hasattr(self.level, 'get_building_at'):
+            record = self.level.get_building_at(x, y)
+            if not record:
+                return None
+            min_x, min_y, max_x, max_y = record['bounds']
+            return {
+                'id': record['id'],
+                'min_x': min_x,
+                'max_x': max_x,
+                'min_y': min_y,
+                'max_y': max_y,
+                'door_tiles': {(door_x, door_y) for door_x, door_y, _ in record['doors']}
+            }
         
         # If this is an interior tile, find the building it belongs to
         if self.is_interior_tile(x, y):
-            building = self._trace_building_from_interior(x, y)
-            self.building_cache[cache_key] = building
-            return building
+            return self._trace_building_from_interior(x, y)
         
         # If this is a wall tile, find the building it belongs to
         tile = self.get_tile_at(x, y)
         if self.is_wall_tile(tile) or tile == self.TILE_DOOR:
-            building = self._trace_building_from_wall(x, y)
-            self.building_cache[cache_key] = building
-            return building
+            return self._trace_building_from_wall(x, y)
         
         # Not part of a building
-        self.building_cache[cache_key] = None
         return None
     
+    def building_contains(self, building, x, y):
+        """Check if a tile lies within a building's footprint"""
+        return building['min_x'] <= x <= building['max_x'] and building['min_y'] <= y <= building['max_y']
+    
     def _trace_building_from_interior(self, start_x, start_y):
         """Trace a building's boundaries starting from an interior tile"""
         # Use flood fill to find all connected interior tiles
@@ -312,15 +320,15 @@ class RoofRenderer:
         if building_id in self.building_perimeters:
             return self.building_perimeters[building_id]
         
+        # The ring of tiles just outside the building's footprint
+        min_x, min_y, max_x, max_y = building_id
         perimeter = set()
-        all_building_tiles = building['interior_tiles'] | building['wall_tiles'] | building['door_tiles']
-        
-        # Find all tiles adjacent to the building
-        for x, y in all_building_tiles:
-            for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)]:
-                nx, ny = x + dx, y + dy
-                if (nx, ny) not in all_building_tiles:
-                    perimeter.add((nx, ny))
+        for x in range(min_x - 1, max_x + 2):
+            perimeter.add((x, min_y - 1))
+            perimeter.add((x, max_y + 1))
+        for y in range(min_y, max_y + 1):
+            perimeter.add((min_x - 1, y))
+            perimeter.add((max_x + 1, y))
         
         self.building_perimeters[building_id] = perimeter
         return perimeter
@@ -354,8 +362,7 @@ class RoofRenderer:
             player_tile_x = int(player_x)
             player_tile_y = int(player_y)
             
-            if ((player_tile_x, player_tile_y) in building['interior_tiles'] or
-                (player_tile_x, player_tile_y) in building['door_tiles']):
+            if self.building_contains(building, player_tile_x, player_tile_y):
                 # Player is inside this building - don't render its roof
                 return False
         
@@ -374,9 +381,7 @@ class RoofRenderer:
             return
         
         # Render roof for interior tiles, wall tiles, and door tiles (entire building)
-        if ((building_x, building_y) not in building['interior_tiles'] and
-            (building_x, building_y) not in building['wall_tiles'] and
-            (building_x, building_y) not in building['door_tiles']):
+        if not self.building_contains(building, building_x, building_y):
             return
         
         # Roof height above the ground
@@ -403,6 +408,5 @@ class RoofRenderer:
         pygame.draw.rect(surface, (255, 255, 0), roof_rect, 3)  # Yellow border
     
     def clear_cache(self):
-        """Clear the building detection cache (call when level changes)"""
-        self.building_cache.clear()
+        """Clear the building proximity cache (call when level changes)"""
         self.building_perimeters.clear()
\ No newline at end of file
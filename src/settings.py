@@ -23,8 +23,18 @@ class Settings:
             "music_volume": 0.6,
             "show_fps": False,
             "vsync": True,
+            "async_chunk_generation": True,  # Generate new chunks in worker processes
             "ai_model": "gpt-4o",  # Default AI model for NPCs
-            "ai_model_history": ["gpt-4o", "claude-3-5-sonnet", "gpt-4o-mini"]  # Previously used models
+            "ai_model_history": ["gpt-4o", "claude-3-5-sonnet", "gpt-4o-mini"],  # Previously used models
+            "ai_session_pool_size": 4,  # Most Goose sessions running at once for AI NPCs
+            "ai_session_idle_timeout": 300,  # Seconds before an unused Goose session is closed
+            "ai_response_cache_size": 256,  # Most cached NPC opening replies
+            "ai_response_cache_ttl": 86400,  # Seconds a cached NPC reply stays valid
+            "mcp_debug_mirror": False,  # Also write MCP commands and game state to JSON files
+            "mcp_snapshot_interval": 5,  # Frames between game state snapshots for MCP queries
+            "sprite_cache_size": 512,  # Most scaled entity sprites kept in memory
+            "text_cache_size": 256,  # Most rendered UI text surfaces kept in memory
+            "lazy_asset_loading": True  # Decode images and sounds in the background after the main menu is up
         }
         
         # Available resolutions
@@ -0,0 +1,197 @@
+"""
+In-process command bus for running MCP tool calls on the game's main thread.
+
+The MCP server handles requests on its own thread, but the game objects it acts
+on (player, inventory, quests, UI) belong to the game loop. Instead of touching
+them directly, the server submits a command and waits on the returned future;
+the game loop drains the bus once per frame and runs the commands between
+updates. CommandMirror optionally writes what went over the bus, and any state
+files, to disk on a background thread for debugging.
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Optional
+
+
+class Command:
+    """A function call waiting to run on the main thread"""
+
+    def __init__(self, name: str, fn: Callable, args: tuple, kwargs: Dict[str, Any]):
+        self.name = name
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.future: Future = Future()
+        self.submitted_at = time.monotonic()
+
+
+class CommandBus:
+    """
+    Queue of commands from other threads, run by the game loop
+
+    submit() may be called from any thread; drain() must only be called from
+    the main thread. The queue is a deque, whose append and popleft are atomic,
+    so neither side takes a lock.
+    """
+
+    def __init__(self, mirror: Optional["CommandMirror"] = None):
+        """
+        Initialize the bus
+
+        Args:
+            mirror: Debug mirror that records every command (None for no mirror)
+        """
+        self._commands: "deque[Command]" = deque()
+        self.mirror = mirror
+        self.closed = False
+
+        # Metrics
+        self.processed = 0
+        self.failed = 0
+        self.max_latency = 0.0
+
+    def submit(self, name: str, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Queue a call to run on the main thread
+
+        Args:
+            name: Name for logs and the debug mirror
+            fn: Function to call
+            *args, **kwargs: Arguments for fn
+
+        Returns:
+            Future for fn's return value (or exception)
+        """
+        command = Command(name, fn, args, kwargs)
+        if self.closed:
+            command.future.set_exception(RuntimeError("Command bus is closed"))
+            return command.future
+        self._commands.append(command)
+        return command.future
+
+    def pending(self) -> int:
+        """Number of commands waiting to run"""
+        return len(self._commands)
+
+    def drain(self, max_commands: Optional[int] = None) -> int:
+        """
+        Run queued commands - call once per frame on the main thread
+
+        Args:
+            max_commands: Stop after this many (None for everything queued now)
+
+        Returns:
+            Number of commands run
+        """
+        count = 0
+        # Commands submitted while draining wait for the next frame
+        limit = len(self._commands) if max_commands is None else min(max_commands, len(self._commands))
+        while count < limit:
+            try:
+                command = self._commands.popleft()
+            except IndexError:
+                break
+            count += 1
+            if not command.future.set_running_or_notify_cancel():
+                continue  # Cancelled while waiting
+
+            self.max_latency = max(self.max_latency, time.monotonic() - command.submitted_at)
+            try:
+                result = command.fn(*command.args, **command.kwargs)
+            except Exception as e:
+                self.failed += 1
+                print(f"❌ [CommandBus] {command.name} failed: {e}")
+                command.future.set_exception(e)
+                if self.mirror:
+                    self.mirror.record_command(command, error=str(e))
+                continue
+            self.processed += 1
+            command.future.set_result(result)
+            if self.mirror:
+                self.mirror.record_command(command, result=result)
+        return count
+
+    def close(self):
+        """Stop accepting commands and cancel those still queued"""
+        self.closed = True
+        while True:
+            try:
+                command = self._commands.popleft()
+            except IndexError:
+                break
+            command.future.cancel()
+
+
+class CommandMirror:
+    """Writes debug copies of bus traffic and game state files on a background thread"""
+
+    def __init__(self, log_file: str = "mcp_commands.jsonl"):
+        """
+        Initialize the mirror
+
+        Args:
+            log_file: JSON lines file that every command is appended to
+        """
+        self.log_file = log_file
+        self._writes: "queue.Queue[Optional[Callable[[], None]]]" = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="mcp-debug-mirror", daemon=True)
+        self._writer.start()
+
+    def record_command(self, command: Command, result: Any = None, error: Optional[str] = None):
+        """Queue a log line for a finished command"""
+        record = {
+            "timestamp": time.time(),
+            "command": command.name,
+            "args": command.args,
+            "kwargs": command.kwargs,
+            "latency_ms": round(1000 * (time.monotonic() - command.submitted_at), 3),
+        }
+        if error is not None:
+            record["error"] = error
+        else:
+            record["result"] = result
+        self._writes.put(lambda: self._append(self.log_file, record))
+
+    def write_json(self, path: str, data: Any):
+        """Queue a whole-file JSON write (data must not be changed afterwards)"""
+        self._writes.put(lambda: self._replace(path, data))
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait for queued writes to finish"""
+        done = threading.Event()
+        self._writes.put(done.set)
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 5.0):
+        """Finish queued writes and stop the writer"""
+        self._writes.put(None)
+        self._writer.join(timeout)
+
+    def _write_loop(self):
+        """Writer thread: run queued writes until close()"""
+        while True:
+            write = self._writes.get()
+            if write is None:
+                return
+            try:
+                write()
+            except (OSError, TypeError, ValueError) as e:
+                print(f"⚠️  [CommandMirror] Debug write failed: {e}")
+
+    @staticmethod
+    def _append(path: str, record: Dict[str, Any]):
+        with open(path, 'a') as f:
+            f.write(json.dumps(record, default=str) + "\n")
+
+    @staticmethod
+    def _replace(path: str, data: Any):
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(data, f, default=str)
+        os.replace(temp_path, path)
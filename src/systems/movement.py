@@ -24,6 +24,7 @@ class MovementSystem:
         # Pathfinding for mouse movement
         self.path = []  # List of tile coordinates to follow
         self.path_index = 0
+        self.route = None  # Long-distance route that extends the path as it is walked
         
         # Audio
         self.footstep_timer = 0
@@ -36,6 +37,7 @@ class MovementSystem:
             # Clear any existing path when switching to WASD
             self.path = []
             self.path_index = 0
+            self.route = None
         else:
             self.movement_mode = "mouse"
         
@@ -113,9 +115,11 @@ class MovementSystem:
                 # Move to next path point
                 self.path_index += 1
                 if self.path_index >= len(self.path):
-                    # Reached end of path
-                    self.path = []
+                    # Reached end of path - continue with the next refined part of a long route
+                    self.path = self.route.refine() if self.route and not self.route.finished else []
                     self.path_index = 0
+                    if not self.path:
+                        self.route = None
                 return
             
             # Check if target tile is still walkable
@@ -135,6 +139,7 @@ class MovementSystem:
                 # Path is blocked, clear it
                 self.path = []
                 self.path_index = 0
+                self.route = None
                 if self.player.game_log:
                     self.player.game_log.add_message("Path blocked!", "system")
     
@@ -323,12 +328,19 @@ class MovementSystem:
         if target_tile_x == self.player.tile_x and target_tile_y == self.player.tile_y:
             return  # Already at target
         
-        # Find path to target
-        path = level.find_tile_path(self.player.tile_x, self.player.tile_y, target_tile_x, target_tile_y)
+        # Find path to target - distant targets are refined a few segments at a time as the player walks
+        self.route = None
+        if hasattr(level, 'is_long_range_target') and level.is_long_range_target(
+                self.player.tile_x, self.player.tile_y, target_tile_x, target_tile_y):
+            self.route = level.find_tile_route(self.player.tile_x, self.player.tile_y, target_tile_x, target_tile_y)
+            path = self.route.refine() if self.route else []
+        else:
+            path = level.find_tile_path(self.player.tile_x, self.player.tile_y, target_tile_x, target_tile_y)
         if path:
             self.path = path
             self.path_index = 0
         else:
+            self.route = None
             if self.player.game_log:
                 self.player.game_log.add_message("Can't reach that location!", "system")
     
@@ -0,0 +1,422 @@
+"""
+Non-blocking conversation pipeline for AI NPCs.
+
+This module moves AI NPC conversations off the game loop:
+- GooseSession runs a goose subprocess with a reader thread feeding a line queue
+- ConversationPipeline gives every NPC a worker thread that answers its requests in order
+- Replies come back as events (partial text, done, cancelled) on one queue that
+  the main loop drains each frame, so callbacks always run on the main thread
+"""
+
+import os
+import queue
+import shlex
+import subprocess
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+# Command used to start goose - override with GOOSE_BIN (e.g. a fake goose for tests)
+GOOSE_BIN_ENV = "GOOSE_BIN"
+
+# Default seconds a reply may take before whatever arrived so far is used
+DEFAULT_TIMEOUT = 30.0
+
+# Seconds an NPC's worker thread waits for another message before it stops
+WORKER_IDLE_TIMEOUT = 30.0
+
+# Output that means goose is ready for the next message
+READY_SIGNALS = ("Goose is running! Enter your instructions",)
+
+
+def goose_command() -> List[str]:
+    """Command prefix for running goose"""
+    return shlex.split(os.environ.get(GOOSE_BIN_ENV, "goose"))
+
+
+class GooseSession:
+    """A long-lived goose subprocess whose output is read by a background thread"""
+
+    def __init__(self, cmd: List[str], env: Optional[Dict[str, str]] = None):
+        """
+        Start the process
+
+        Args:
+            cmd: Command line to run
+            env: Environment for the process
+        """
+        self.process = subprocess.Popen(
+            cmd,
+            env=env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1  # Line buffered
+        )
+        self.lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._reader = threading.Thread(target=self._read_output, daemon=True)
+        self._reader.start()
+
+    def _read_output(self):
+        """Reader thread: forward output lines to the queue, then None at EOF"""
+        try:
+            for line in self.process.stdout:
+                self.lines.put(line)
+        except (OSError, ValueError):
+            pass  # Pipe closed underneath us
+        finally:
+            self.lines.put(None)
+
+    def is_alive(self) -> bool:
+        """Check if the process is still running"""
+        return self.process.poll() is None
+
+    def drain(self) -> List[str]:
+        """Discard and return any output that hasn't been read yet"""
+        drained = []
+        while True:
+            try:
+                line = self.lines.get_nowait()
+            except queue.Empty:
+                return drained
+            if line is None:
+                self.lines.put(None)  # Keep the EOF marker for later readers
+                return drained
+            drained.append(line)
+
+    def wait_until_ready(self, timeout: float, cancelled: Optional[threading.Event] = None) -> bool:
+        """
+        Wait for goose's ready banner instead of sleeping a fixed time
+
+        Args:
+            timeout: Seconds to wait
+            cancelled: Event that aborts the wait when set
+
+        Returns:
+            True if goose is ready (or still running quietly when the time is up)
+        """
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if cancelled is not None and cancelled.is_set():
+                return False
+            try:
+                line = self.lines.get(timeout=0.05)
+            except queue.Empty:
+                continue
+            if line is None:
+                return False
+            if any(signal in line for signal in READY_SIGNALS):
+                return True
+        return self.is_alive()
+
+    def send(self, message: str):
+        """Send one line of input"""
+        self.process.stdin.write(f"{message}\n")
+        self.process.stdin.flush()
+
+    def read_response(self, timeout: float, idle_threshold: float, completion_signals: List[str],
+                      on_line: Optional[Callable[[str], None]] = None,
+                      cancelled: Optional[threading.Event] = None) -> List[str]:
+        """
+        Read a reply until a completion signal, a pause in the output, the timeout or cancellation
+
+        Args:
+            timeout: Most seconds to wait for the reply
+            idle_threshold: Seconds without output after which the reply is complete
+            completion_signals: Phrases (case-insensitive) that end a reply
+            on_line: Called with each non-empty line as it arrives
+            cancelled: Event that stops reading when set
+
+        Returns:
+            The non-empty lines read
+        """
+        response_lines: List[str] = []
+        start_time = time.monotonic()
+        last_activity_time = start_time
+        signals = [signal.lower() for signal in completion_signals]
+
+        while time.monotonic() - start_time < timeout:
+            if cancelled is not None and cancelled.is_set():
+                break
+            try:
+                line = self.lines.get(timeout=0.05)
+            except queue.Empty:
+                if response_lines and time.monotonic() - last_activity_time > idle_threshold:
+                    break
+                continue
+
+            if line is None:
+                self.lines.put(None)
+                break
+            line = line.strip()
+            if not line:
+                continue
+
+            response_lines.append(line)
+            last_activity_time = time.monotonic()
+            if on_line:
+                on_line(line)
+
+            if any(signal in line.lower() for signal in signals):
+                # Pick up anything printed right after the signal
+                response_lines.extend(
+                    extra.strip() for extra in self._read_trailing(0.3) if extra.strip()
+                )
+                break
+
+        return response_lines
+
+    def _read_trailing(self, window: float) -> List[str]:
+        """Lines that arrive within a short window"""
+        trailing = []
+        deadline = time.monotonic() + window
+        while time.monotonic() < deadline:
+            try:
+                line = self.lines.get(timeout=0.05)
+            except queue.Empty:
+                continue
+            if line is None:
+                self.lines.put(None)
+                break
+            trailing.append(line)
+        return trailing
+
+    def close(self, timeout: float = 5.0):
+        """Ask goose to exit, terminating it if it doesn't"""
+        if self.is_alive():
+            try:
+                self.send("exit")
+                self.process.wait(timeout=timeout)
+            except (OSError, ValueError, subprocess.TimeoutExpired):
+                self.process.terminate()
+                try:
+                    self.process.wait(timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    self.process.kill()
+        for pipe in (self.process.stdin, self.process.stdout):
+            try:
+                pipe.close()
+            except (OSError, ValueError):
+                pass
+
+
+class ConversationEvent:
+    """Something that happened to a conversation request, delivered on the main thread"""
+
+    PARTIAL = "partial"      # More of the reply arrived; text is the reply so far
+    DONE = "done"            # The reply is complete; text is the final reply
+    CANCELLED = "cancelled"  # The request was cancelled; text is empty
+
+    def __init__(self, kind: str, request: "ConversationRequest", text: str = ""):
+        self.kind = kind
+        self.request = request
+        self.text = text
+
+    def __repr__(self):
+        return f"ConversationEvent({self.kind!r}, {self.request.npc_name!r}, {self.text[:30]!r})"
+
+
+class ConversationRequest:
+    """A message waiting for an NPC's reply"""
+
+    def __init__(self, npc, message: str, context: str, on_event: Optional[Callable[[ConversationEvent], None]],
+                 timeout: float):
+        self.npc = npc
+        self.npc_name = getattr(npc, 'name', '?')
+        self.message = message
+        self.context = context
+        self.on_event = on_event
+        self.timeout = timeout
+        self.cancelled = threading.Event()
+        self.submitted_at = time.monotonic()
+        self.response: Optional[str] = None
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self.cancelled.is_set()
+
+
+class ConversationPipeline:
+    """
+    Answers NPC messages on worker threads and hands the replies to the main loop
+
+    Each NPC gets its own worker thread and request queue, so its goose session
+    sees one message at a time and a slow NPC never holds up another. The NPC
+    does the work through answer_ai_message(message, context, on_partial,
+    cancelled, timeout), which returns the final reply text. Events are queued
+    and only delivered by dispatch(), which the game calls once per frame.
+
+    A worker that has had nothing to do for idle_timeout seconds stops and
+    lets go of its NPC - NPCs evicted with their chunk are re-created as new
+    objects, so workers for the old ones would otherwise pile up.
+    """
+
+    def __init__(self, idle_timeout: float = WORKER_IDLE_TIMEOUT):
+        """
+        Initialize the pipeline
+
+        Args:
+            idle_timeout: Seconds a worker waits for another message before it stops
+        """
+        self.idle_timeout = idle_timeout
+        self.events: "queue.Queue[ConversationEvent]" = queue.Queue()
+        self._workers: Dict[int, threading.Thread] = {}
+        self._requests: Dict[int, "queue.Queue[Optional[ConversationRequest]]"] = {}
+        self._active: Dict[int, List[ConversationRequest]] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def submit(self, npc, message: str, context: str = "",
+               on_event: Optional[Callable[[ConversationEvent], None]] = None,
+               timeout: float = DEFAULT_TIMEOUT) -> ConversationRequest:
+        """
+        Queue a message for an NPC without waiting for the reply
+
+        Args:
+            npc: NPC providing answer_ai_message
+            message: The player's message
+            context: Game context for the prompt
+            on_event: Called from dispatch() with each ConversationEvent for this request
+            timeout: Seconds the reply may take
+
+        Returns:
+            The request, which can be cancelled
+        """
+        request = ConversationRequest(npc, message, context, on_event, timeout)
+        key = id(npc)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Conversation pipeline is shut down")
+            self._active.setdefault(key, []).append(request)
+            requests = self._requests.get(key)
+            if requests is None:
+                requests = self._requests[key] = queue.Queue()
+                worker = threading.Thread(target=self._work, args=(npc, requests),
+                                          name=f"npc-conversation-{request.npc_name}", daemon=True)
+                self._workers[key] = worker
+                worker.start()
+        requests.put(request)
+        return request
+
+    def cancel(self, npc) -> int:
+        """
+        Cancel an NPC's queued and in-progress requests
+
+        Returns:
+            Number of requests cancelled
+        """
+        with self._lock:
+            requests = list(self._active.get(id(npc), []))
+        for request in requests:
+            request.cancelled.set()
+        return len(requests)
+
+    def pending(self, npc) -> int:
+        """Number of an NPC's requests that haven't finished"""
+        with self._lock:
+            return len(self._active.get(id(npc), []))
+
+    def worker_count(self) -> int:
+        """Number of NPC worker threads running"""
+        with self._lock:
+            return len(self._workers)
+
+    def _work(self, npc, requests: "queue.Queue[Optional[ConversationRequest]]"):
+        """Worker thread: answer one NPC's requests in order, stopping once it's idle"""
+        key = id(npc)
+        while True:
+            try:
+                request = requests.get(timeout=self.idle_timeout)
+            except queue.Empty:
+                with self._lock:
+                    # submit() registers a request under the lock before queueing it, so
+                    # with none active the next submit() starts a new worker instead
+                    if self._active.get(key) or self._requests.get(key) is not requests:
+                        continue
+                    del self._requests[key]
+                    del self._workers[key]
+                    self._active.pop(key, None)
+                return
+            if request is None:
+                return
+            try:
+                if request.is_cancelled:
+                    continue
+
+                def on_partial(text, request=request):
+                    if not request.is_cancelled:
+                        self.events.put(ConversationEvent(ConversationEvent.PARTIAL, request, text))
+
+                try:
+                    request.response = npc.answer_ai_message(
+                        request.message, request.context, on_partial=on_partial,
+                        cancelled=request.cancelled, timeout=request.timeout
+                    )
+                except Exception as e:
+                    print(f"❌ [Conversations] {request.npc_name} failed to answer: {e}")
+                    request.response = ""
+            finally:
+                with self._lock:
+                    active = self._active.get(id(npc), [])
+                    if request in active:
+                        active.remove(request)
+                kind = ConversationEvent.CANCELLED if request.is_cancelled else ConversationEvent.DONE
+                self.events.put(ConversationEvent(kind, request, request.response or ""))
+
+    def dispatch(self, max_events: Optional[int] = None) -> int:
+        """
+        Deliver queued events to their callbacks - call once per frame on the main thread
+
+        Args:
+            max_events: Stop after this many events (None for all queued)
+
+        Returns:
+            Number of events delivered
+        """
+        delivered = 0
+        while max_events is None or delivered < max_events:
+            try:
+                event = self.events.get_nowait()
+            except queue.Empty:
+                break
+            delivered += 1
+            if event.request.on_event:
+                try:
+                    event.request.on_event(event)
+                except Exception as e:
+                    print(f"❌ [Conversations] Error delivering {event}: {e}")
+        return delivered
+
+    def shutdown(self, timeout: float = 5.0):
+        """Cancel everything and stop the worker threads"""
+        with self._lock:
+            self._closed = True
+            requests = [request for active in self._active.values() for request in active]
+            queues = list(self._requests.values())
+            workers = list(self._workers.values())
+        for request in requests:
+            request.cancelled.set()
+        for request_queue in queues:
+            request_queue.put(None)
+        for worker in workers:
+            worker.join(timeout)
+
+
+_pipeline: Optional[ConversationPipeline] = None
+_pipeline_lock = threading.Lock()
+
+
+def get_conversation_pipeline(create: bool = True) -> Optional[ConversationPipeline]:
+    """Get the shared conversation pipeline, creating it on first use"""
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is None and create:
+            _pipeline = ConversationPipeline()
+        return _pipeline
+
+
+def dispatch_conversation_events() -> int:
+    """Deliver NPC replies that arrived since the last frame (no-op before the first conversation)"""
+    pipeline = get_conversation_pipeline(create=False)
+    return pipeline.dispatch() if pipeline else 0
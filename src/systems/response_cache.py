@@ -0,0 +1,260 @@
+"""
+Response cache and context diffing for AI NPC prompts.
+
+- ResponseCache keeps replies to opening messages (greetings and other first
+  messages of a conversation) keyed on recipe, normalized message and a digest of
+  the game context, so the same greeting in the same situation doesn't go back to
+  the model. Entries expire after a TTL, the least recently used go first when
+  the cache is full, and the cache is saved to disk between sessions.
+- ContextDiff remembers which game-state fields a conversation has already been
+  told, so follow-up messages only carry the fields that changed.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+CACHE_FILE = os.path.join("saves", "npc_response_cache.json")
+DEFAULT_TTL = 24 * 60 * 60.0
+DEFAULT_MAX_ENTRIES = 256
+
+# Context fields that change all the time without changing what an NPC would say
+VOLATILE_FIELDS = ("NPC ID", "Player Position")
+
+# Separators used by BaseAINPC._get_game_context and GameContext.get_context
+FIELD_SEPARATOR = " | "
+VALUE_SEPARATOR = ": "
+
+
+def normalize_message(message: str) -> str:
+    """Lower case, single spaces and no trailing punctuation - "Hello!" and "hello" are the same message"""
+    return re.sub(r'\s+', ' ', message).strip().lower().rstrip('.!?,;: ')
+
+
+def parse_context(context: str) -> Dict[str, str]:
+    """
+    Split a game context string into its fields
+
+    Args:
+        context: "Key: value | Key: value | free text" as built by the context providers
+
+    Returns:
+        Ordered fields - parts without a key map to an empty value
+    """
+    fields: Dict[str, str] = {}
+    for part in context.split(FIELD_SEPARATOR):
+        part = part.strip()
+        if not part:
+            continue
+        name, separator, value = part.partition(VALUE_SEPARATOR)
+        if separator:
+            fields[name.strip()] = value.strip()
+        else:
+            fields[part] = ""
+    return fields
+
+
+def format_fields(fields: Dict[str, str]) -> str:
+    """Join fields back into the context format"""
+    return FIELD_SEPARATOR.join(f"{name}{VALUE_SEPARATOR}{value}" if value else name
+                                for name, value in fields.items())
+
+
+def context_digest(context: str, ignored: Iterable[str] = VOLATILE_FIELDS) -> str:
+    """Digest of a context's fields, leaving out the volatile ones"""
+    ignored = set(ignored)
+    fields = sorted((name, value) for name, value in parse_context(context).items() if name not in ignored)
+    return hashlib.sha256(json.dumps(fields).encode('utf-8')).hexdigest()
+
+
+class ResponseCache:
+    """Content-addressed cache of NPC replies with TTL and LRU eviction, saved as JSON"""
+
+    def __init__(self, path: Optional[str] = CACHE_FILE, ttl: float = DEFAULT_TTL,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Initialize the cache
+
+        Args:
+            path: File the cache is loaded from and saved to (None keeps it in memory)
+            ttl: Seconds an entry stays valid
+            max_entries: Most entries kept
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        # key -> {"response": str, "created": wall clock time}, least recently used first
+        self.entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    def configure(self, path: Optional[str] = CACHE_FILE, ttl: Optional[float] = None,
+                  max_entries: Optional[int] = None):
+        """Change the cache file or limits - a new file is loaded on next use"""
+        with self._lock:
+            if path != self.path:
+                self.path = path
+                self.entries.clear()
+                self._loaded = False
+            if ttl is not None:
+                self.ttl = ttl
+            if max_entries is not None:
+                self.max_entries = max(1, max_entries)
+                self._trim()
+
+    @staticmethod
+    def key(recipe: str, message: str, context: str) -> str:
+        """Cache key for a recipe, message and context"""
+        parts = [recipe, normalize_message(message), context_digest(context)]
+        return hashlib.sha256('\0'.join(parts).encode('utf-8')).hexdigest()
+
+    def get(self, recipe: str, message: str, context: str) -> Optional[str]:
+        """
+        Look up a cached reply
+
+        Returns:
+            The reply, or None if there isn't a fresh one
+        """
+        key = self.key(recipe, message, context)
+        with self._lock:
+            self._ensure_loaded()
+            entry = self.entries.get(key)
+            if entry is not None and time.time() - entry["created"] > self.ttl:
+                del self.entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry["response"]
+
+    def put(self, recipe: str, message: str, context: str, response: str):
+        """Store a reply and save the cache"""
+        key = self.key(recipe, message, context)
+        with self._lock:
+            self._ensure_loaded()
+            self.entries[key] = {"response": response, "created": time.time()}
+            self.entries.move_to_end(key)
+            self._trim()
+            self._save()
+
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            self.entries.clear()
+            self._loaded = True
+            self._save()
+
+    def _trim(self):
+        """Evict least recently used entries over the limit (call with the lock held)"""
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def _ensure_loaded(self):
+        """Load the cache file on first use (call with the lock held)"""
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r') as f:
+                entries = self._parse_entries(json.load(f))
+        except (OSError, ValueError) as e:
+            # A damaged or foreign file is discarded - the next put() writes a fresh one
+            print(f"⚠️  [ResponseCache] Could not load {self.path}: {e}")
+            return
+        now = time.time()
+        # Saved least recently used first, so the order carries over
+        for key, entry in entries:
+            if now - entry["created"] <= self.ttl:
+                self.entries[key] = entry
+        self._trim()
+
+    @staticmethod
+    def _parse_entries(data) -> List[Tuple[str, Dict]]:
+        """
+        Check a loaded cache file has the shape _save writes
+
+        Returns:
+            (key, entry) pairs, least recently used first
+
+        Raises:
+            ValueError: If the data isn't a cache file or any entry is malformed
+        """
+        if not isinstance(data, dict) or not isinstance(data.get("entries"), list):
+            raise ValueError("not a response cache file")
+        entries = []
+        for item in data["entries"]:
+            if not (isinstance(item, list) and len(item) == 2 and isinstance(item[0], str)
+                    and isinstance(item[1], dict) and isinstance(item[1].get("response"), str)
+                    and isinstance(item[1].get("created"), (int, float))):
+                raise ValueError(f"malformed entry {str(item)[:60]}")
+            entries.append((item[0], item[1]))
+        return entries
+
+    def _save(self):
+        """Write the cache file (call with the lock held)"""
+        if not self.path:
+            return
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, 'w') as f:
+                json.dump({"version": 1, "entries": list(self.entries.items())}, f)
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            print(f"⚠️  [ResponseCache] Could not save {self.path}: {e}")
+
+
+class ContextDiff:
+    """The game state one conversation has been told, so follow-ups only send what changed"""
+
+    def __init__(self):
+        self.sent: Optional[Dict[str, str]] = None
+
+    def changes(self, context: str) -> str:
+        """
+        Context to send with the next message
+
+        Returns:
+            Every field on the first message, then only fields that changed
+            (removed "Key: value" fields are sent as "none"), or "" if nothing changed
+        """
+        fields = parse_context(context)
+        if self.sent is None:
+            return format_fields(fields)
+        changed = {name: value for name, value in fields.items() if self.sent.get(name) != value}
+        changed.update({name: "none" for name, value in self.sent.items() if value and name not in fields})
+        return format_fields(changed)
+
+    def commit(self, context: str):
+        """Record that the conversation has been told this context"""
+        self.sent = parse_context(context)
+
+    def reset(self):
+        """Forget what was sent - the next message carries the full context"""
+        self.sent = None
+
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Get the shared response cache"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache()
+        return _cache
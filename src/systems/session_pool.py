@@ -0,0 +1,326 @@
+"""
+Shared pool of long-lived goose sessions for AI NPCs.
+
+Starting goose takes seconds, and an idle session is a whole child process, so
+NPCs borrow sessions from one pool instead of each keeping their own:
+- Sessions are keyed by (recipe file, NPC id) so every NPC keeps its own conversation
+- At most max_sessions run at once; the least recently used idle session makes room
+- Sessions idle for longer than idle_timeout are closed
+- Sessions for NPCs near the player can be started ahead of the first chat
+"""
+
+import shutil
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .npc_conversations import GooseSession, goose_command
+
+SessionKey = Tuple[str, str]
+
+# Starts a session - called with True when an earlier session for the key should be resumed
+SessionStarter = Callable[[bool], Optional[GooseSession]]
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_IDLE_TIMEOUT = 300.0
+METRIC_SAMPLES = 256
+
+_goose_paths: Dict[str, Optional[str]] = {}
+
+
+def goose_available() -> bool:
+    """Check the goose executable is on the PATH (looked up once per command, not per message)"""
+    executable = goose_command()[0]
+    if executable not in _goose_paths:
+        _goose_paths[executable] = shutil.which(executable)
+    return _goose_paths[executable] is not None
+
+
+class PooledSession:
+    """A session in the pool and who is using it"""
+
+    def __init__(self, key: SessionKey, session: GooseSession):
+        self.key = key
+        self.session = session
+        self.in_use = False
+        self.last_used = time.monotonic()
+
+
+class SessionPool:
+    """
+    Bounded, LRU-evicting pool of goose sessions
+
+    acquire() hands out a key's session, starting one if needed, and waits
+    when the key is busy or every slot holds a session in use. release()
+    returns it. Sessions closed to make room or after idling are closed on a
+    background thread so the caller never waits on goose shutting down.
+    """
+
+    def __init__(self, max_sessions: int = DEFAULT_POOL_SIZE, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        """
+        Initialize the pool
+
+        Args:
+            max_sessions: Most sessions running at once
+            idle_timeout: Seconds a session may sit unused before it is closed
+        """
+        self.max_sessions = max(1, max_sessions)
+        self.idle_timeout = idle_timeout
+        self._entries: "OrderedDict[SessionKey, PooledSession]" = OrderedDict()  # Least recently used first
+        self._starting: Set[SessionKey] = set()
+        self._started: Set[SessionKey] = set()  # Keys that have had a session, so can resume it
+        self._condition = threading.Condition()
+
+        # Metrics - latencies are kept for the most recent METRIC_SAMPLES acquires
+        self.hits = 0
+        self.cold_start_count = 0
+        self.cold_starts: "deque[float]" = deque(maxlen=METRIC_SAMPLES)
+        self.failed_starts = 0
+        self.evictions = 0
+        self.expired = 0
+        self.queue_waits: "deque[float]" = deque(maxlen=METRIC_SAMPLES)
+        self.acquire_timeouts = 0
+
+    def configure(self, max_sessions: Optional[int] = None, idle_timeout: Optional[float] = None):
+        """Change the pool size or idle timeout (extra sessions go as they become idle)"""
+        with self._condition:
+            if max_sessions is not None:
+                self.max_sessions = max(1, max_sessions)
+            if idle_timeout is not None:
+                self.idle_timeout = idle_timeout
+            self._condition.notify_all()
+
+    def acquire(self, key: SessionKey, start: SessionStarter, timeout: float = 30.0,
+                cancelled: Optional[threading.Event] = None) -> Optional[GooseSession]:
+        """
+        Borrow the session for a key, starting it if needed
+
+        Args:
+            key: (recipe file, NPC id)
+            start: Starts a new session when the key has none
+            timeout: Most seconds to wait for the key or a free slot
+            cancelled: Event that abandons the wait when set
+
+        Returns:
+            The session, or None if it couldn't be started in time
+        """
+        requested_at = time.monotonic()
+        to_close = []
+        try:
+            with self._condition:
+                while True:
+                    if cancelled is not None and cancelled.is_set():
+                        return None
+
+                    entry = self._entries.get(key)
+                    if entry is not None and not entry.in_use:
+                        if entry.session.is_alive():
+                            entry.in_use = True
+                            self._entries.move_to_end(key)
+                            self.hits += 1
+                            self.queue_waits.append(time.monotonic() - requested_at)
+                            return entry.session
+                        # Goose exited while idle - start again
+                        del self._entries[key]
+                        to_close.append(entry.session)
+                        continue
+
+                    if entry is None and key not in self._starting:
+                        if len(self._entries) + len(self._starting) >= self.max_sessions:
+                            evicted = self._evict_idle()
+                            if evicted is not None:
+                                to_close.append(evicted)
+                        if len(self._entries) + len(self._starting) < self.max_sessions:
+                            self._starting.add(key)
+                            resume = key in self._started
+                            self.queue_waits.append(time.monotonic() - requested_at)
+                            break
+
+                    if time.monotonic() - requested_at >= timeout:
+                        self.acquire_timeouts += 1
+                        return None
+                    self._condition.wait(0.05)
+        finally:
+            self._close_later(to_close)
+
+        return self._start(key, start, resume)
+
+    def _start(self, key: SessionKey, start: SessionStarter, resume: bool) -> Optional[GooseSession]:
+        """Cold start a session for a key reserved in _starting"""
+        started_at = time.monotonic()
+        session = None
+        try:
+            session = start(resume)
+        finally:
+            with self._condition:
+                self._starting.discard(key)
+                if session is not None:
+                    entry = self._entries[key] = PooledSession(key, session)
+                    entry.in_use = True
+                    self._started.add(key)
+                    self.cold_start_count += 1
+                    self.cold_starts.append(time.monotonic() - started_at)
+                else:
+                    self.failed_starts += 1
+                self._condition.notify_all()
+        return session
+
+    def release(self, key: SessionKey, discard: bool = False, exit_timeout: float = 5.0):
+        """
+        Return a borrowed session
+
+        Args:
+            key: Key the session was acquired with
+            discard: Close the session instead of keeping it (e.g. goose is stuck mid-reply)
+            exit_timeout: Seconds goose gets to exit before it is terminated
+        """
+        with self._condition:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry.in_use = False
+            entry.last_used = time.monotonic()
+            if discard or not entry.session.is_alive():
+                del self._entries[key]
+            else:
+                entry = None
+            self._condition.notify_all()
+        if entry is not None:
+            self._close_later([entry.session], exit_timeout)
+
+    def discard(self, key: SessionKey) -> bool:
+        """Close a key's session if it isn't in use, returning whether there was one to close"""
+        with self._condition:
+            entry = self._entries.get(key)
+            if entry is None or entry.in_use:
+                return False
+            del self._entries[key]
+            self._condition.notify_all()
+        self._close_later([entry.session])
+        return True
+
+    def has_session(self, key: SessionKey) -> bool:
+        """Check if a key has a running or starting session"""
+        with self._condition:
+            return key in self._entries or key in self._starting
+
+    def _evict_idle(self) -> Optional[GooseSession]:
+        """Remove the least recently used idle session (call with the lock held)"""
+        for key, entry in self._entries.items():
+            if not entry.in_use:
+                del self._entries[key]
+                self.evictions += 1
+                self._condition.notify_all()
+                return entry.session
+        return None
+
+    def reap_idle(self, now: Optional[float] = None) -> int:
+        """
+        Close sessions that have been idle longer than idle_timeout - cheap enough to call every frame
+
+        Returns:
+            Number of sessions closed
+        """
+        now = time.monotonic() if now is None else now
+        with self._condition:
+            expired = [key for key, entry in self._entries.items()
+                       if not entry.in_use and now - entry.last_used > self.idle_timeout]
+            sessions = [self._entries.pop(key).session for key in expired]
+            self.expired += len(sessions)
+            if sessions:
+                self._condition.notify_all()
+        self._close_later(sessions)
+        return len(sessions)
+
+    def prewarm(self, starters: Iterable[Tuple[SessionKey, SessionStarter]]) -> Optional[threading.Thread]:
+        """
+        Start sessions in the background before they're needed
+
+        Only free slots are used - sessions already running are never evicted
+        to make room for a guess.
+
+        Args:
+            starters: (key, start) pairs, most likely to be needed first
+
+        Returns:
+            The thread doing the work, or None if there was nothing to start
+        """
+        with self._condition:
+            free = self.max_sessions - len(self._entries) - len(self._starting)
+            pending = [(key, start) for key, start in starters
+                       if key not in self._entries and key not in self._starting][:max(0, free)]
+        if not pending:
+            return None
+
+        def warm():
+            for key, start in pending:
+                with self._condition:
+                    if (key in self._entries or key in self._starting or
+                            len(self._entries) + len(self._starting) >= self.max_sessions):
+                        continue
+                    self._starting.add(key)
+                    resume = key in self._started
+                if self._start(key, start, resume) is not None:
+                    self.release(key)
+
+        thread = threading.Thread(target=warm, name="goose-prewarm", daemon=True)
+        thread.start()
+        return thread
+
+    def metrics(self) -> Dict[str, float]:
+        """Pool statistics - session counts, cold start latency and queue wait in milliseconds"""
+        with self._condition:
+            active = sum(1 for entry in self._entries.values() if entry.in_use)
+            cold_starts = list(self.cold_starts)
+            waits = list(self.queue_waits)
+            return {
+                "max_sessions": self.max_sessions,
+                "active_sessions": active,
+                "idle_sessions": len(self._entries) - active,
+                "starting_sessions": len(self._starting),
+                "hits": self.hits,
+                "cold_starts": self.cold_start_count,
+                "cold_start_avg_ms": 1000 * sum(cold_starts) / len(cold_starts) if cold_starts else 0.0,
+                "cold_start_max_ms": 1000 * max(cold_starts) if cold_starts else 0.0,
+                "failed_starts": self.failed_starts,
+                "evictions": self.evictions,
+                "expired": self.expired,
+                "queue_wait_avg_ms": 1000 * sum(waits) / len(waits) if waits else 0.0,
+                "queue_wait_max_ms": 1000 * max(waits) if waits else 0.0,
+                "acquire_timeouts": self.acquire_timeouts,
+            }
+
+    def _close_later(self, sessions: List[GooseSession], exit_timeout: float = 5.0):
+        """Close sessions on a background thread"""
+        if not sessions:
+            return
+
+        def close():
+            for session in sessions:
+                session.close(exit_timeout)
+
+        threading.Thread(target=close, name="goose-close", daemon=True).start()
+
+    def shutdown(self, timeout: float = 5.0):
+        """Close every idle session now (the pool can still be used afterwards)"""
+        with self._condition:
+            entries = [entry for entry in self._entries.values() if not entry.in_use]
+            for entry in entries:
+                del self._entries[entry.key]
+            self._condition.notify_all()
+        for entry in entries:
+            entry.session.close(timeout)
+
+
+_pool: Optional[SessionPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_session_pool(create: bool = True) -> Optional[SessionPool]:
+    """Get the shared session pool, creating it on first use"""
+    global _pool
+    with _pool_lock:
+        if _pool is None and create:
+            _pool = SessionPool()
+        return _pool
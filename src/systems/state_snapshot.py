@@ -0,0 +1,289 @@
+"""
+Immutable snapshots of game state for readers off the main thread.
+
+The MCP server answers queries like get_player_info on its own thread, while
+the game loop keeps changing the player, NPCs and chunks. Rather than reading
+live objects mid-update, the game loop captures a GameSnapshot every few
+frames and publishes it by replacing a single reference. Readers take that
+reference once and answer from it, so neither side takes a lock and a reader
+never sees half of one frame and half of another.
+"""
+
+import math
+import time
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+DEFAULT_INTERVAL_FRAMES = 5
+DEFAULT_NPC_RADIUS = 15.0
+MAX_NEARBY_NPCS = 20
+
+
+def freeze(value: Any) -> Any:
+    """Read-only copy of plain data - dicts become mappingproxies, lists become tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Plain, JSON serializable copy of frozen data"""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+class GameSnapshot:
+    """Game state as of one frame - read-only once built"""
+
+    __slots__ = ("frame", "timestamp", "player", "inventory", "equipment",
+                 "nearby_npcs", "active_quests", "chunks")
+
+    def __init__(self, frame: int = 0, player: Optional[Dict[str, Any]] = None,
+                 inventory: Optional[Dict[str, Any]] = None, equipment: Optional[Dict[str, Any]] = None,
+                 nearby_npcs=(), active_quests=(), chunks: Optional[Dict[str, Any]] = None):
+        set_field = object.__setattr__
+        set_field(self, "frame", frame)
+        set_field(self, "timestamp", time.time())
+        set_field(self, "player", freeze(player) if player is not None else None)
+        set_field(self, "inventory", freeze(inventory or {"items": [], "max_size": 0}))
+        set_field(self, "equipment", freeze(equipment or {}))
+        set_field(self, "nearby_npcs", freeze(list(nearby_npcs)))
+        set_field(self, "active_quests", freeze(list(active_quests)))
+        set_field(self, "chunks", freeze(chunks or {"loaded": 0}))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("GameSnapshot is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError("GameSnapshot is read-only")
+
+    @property
+    def has_player(self) -> bool:
+        return self.player is not None
+
+    @property
+    def inventory_space(self) -> int:
+        """Free inventory slots"""
+        return max(0, self.inventory["max_size"] - len(self.inventory["items"]))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain copy of the whole snapshot"""
+        return {name: thaw(getattr(self, name)) for name in self.__slots__}
+
+
+EMPTY_SNAPSHOT = GameSnapshot()
+
+
+def capture_player(player) -> Dict[str, Any]:
+    """Player stats"""
+    return {
+        "health": getattr(player, 'health', 100),
+        "max_health": getattr(player, 'max_health', 100),
+        "level": getattr(player, 'level', 1),
+        "experience": getattr(player, 'experience', 0),
+        "gold": getattr(player, 'gold', 0),
+        "attack_damage": getattr(player, 'attack_damage', 25),
+        "defense": getattr(player, 'defense', 5),
+        "stamina": getattr(player, 'stamina', 50),
+        "max_stamina": getattr(player, 'max_stamina', 50),
+        "position": {
+            "x": getattr(player, 'x', 0),
+            "y": getattr(player, 'y', 0)
+        },
+    }
+
+
+def capture_inventory(player) -> Dict[str, Any]:
+    """Inventory contents and capacity"""
+    inventory = getattr(player, 'inventory', None)
+    items = getattr(inventory, 'items', inventory) or []
+    return {
+        "items": [{
+            "name": getattr(item, 'name', str(item)),
+            "type": getattr(item, 'item_type', 'misc'),
+            "value": getattr(item, 'value', 0),
+        } for item in items],
+        "max_size": getattr(inventory, 'max_size', len(items)),
+    }
+
+
+def capture_equipment(player) -> Dict[str, Any]:
+    """Names of equipped items"""
+    equipment = {}
+    if getattr(player, 'equipped_weapon', None):
+        equipment['weapon'] = player.equipped_weapon.name
+    if getattr(player, 'equipped_armor', None):
+        equipment['armor'] = player.equipped_armor.name
+    return equipment
+
+
+def capture_nearby_npcs(level, player, radius: float = DEFAULT_NPC_RADIUS):
+    """NPCs within radius of the player, nearest first"""
+    if level is None or player is None:
+        return []
+    px, py = player.x, player.y
+    index = level.get_spatial_index() if hasattr(level, 'get_spatial_index') else None
+    candidates = index.query_list(px, py, radius, "npcs") if index is not None else getattr(level, 'npcs', [])
+
+    nearby = []
+    for npc in candidates:
+        distance = math.hypot(npc.x - px, npc.y - py)
+        if distance <= radius:
+            nearby.append({
+                "name": npc.name,
+                "x": npc.x,
+                "y": npc.y,
+                "distance": round(distance, 1),
+                "has_shop": getattr(npc, 'has_shop', False),
+                "ai_enabled": getattr(npc, 'is_ai_enabled', False),
+            })
+    nearby.sort(key=lambda npc: npc["distance"])
+    return nearby[:MAX_NEARBY_NPCS]
+
+
+def capture_active_quests(quest_manager):
+    """Active quests with their objective text"""
+    if quest_manager is None:
+        return []
+    return [{
+        "id": quest.id,
+        "title": quest.title,
+        "description": quest.description,
+        "status": quest.status,
+        "objectives": [quest.get_objective_text(i) for i in range(len(quest.objectives))],
+    } for quest in quest_manager.active_quests.values()]
+
+
+def capture_chunks(level, player=None) -> Dict[str, Any]:
+    """Summary of the loaded chunks"""
+    chunk_manager = getattr(level, 'chunk_manager', None)
+    if chunk_manager is None:
+        return {"loaded": 0}
+    loaded = chunk_manager.loaded_chunks
+    summary = {
+        "loaded": len(loaded),
+        "buildings": sum(len(getattr(chunk, 'buildings', ())) for chunk in loaded.values()),
+        "entities": sum(len(chunk.entities) for chunk in loaded.values()),
+    }
+    if player is not None and hasattr(chunk_manager, 'world_to_chunk_coords'):
+        summary["player_chunk"] = list(chunk_manager.world_to_chunk_coords(player.x, player.y))
+    return summary
+
+
+def capture_snapshot(game, frame: int = 0, npc_radius: float = DEFAULT_NPC_RADIUS) -> GameSnapshot:
+    """
+    Capture the game's state - main thread only
+
+    Args:
+        game: Game to capture
+        frame: Frame number the snapshot belongs to
+        npc_radius: Tiles around the player NPCs are included within
+
+    Returns:
+        New snapshot (EMPTY_SNAPSHOT fields when there's no player yet)
+    """
+    player = getattr(game, 'player', None)
+    if player is None:
+        return GameSnapshot(frame)
+    level = getattr(game, 'current_level', None)
+    return GameSnapshot(
+        frame=frame,
+        player=capture_player(player),
+        inventory=capture_inventory(player),
+        equipment=capture_equipment(player),
+        nearby_npcs=capture_nearby_npcs(level, player, npc_radius),
+        active_quests=capture_active_quests(getattr(game, 'quest_manager', None)),
+        chunks=capture_chunks(level, player),
+    )
+
+
+class SnapshotPublisher:
+    """
+    Publishes a snapshot every few frames for other threads to read
+
+    The game loop calls update() once per frame; readers call latest(). The
+    published snapshot is swapped in with one assignment, so readers see
+    either the old snapshot or the new one and never wait.
+    """
+
+    def __init__(self, interval_frames: int = DEFAULT_INTERVAL_FRAMES, npc_radius: float = DEFAULT_NPC_RADIUS):
+        """
+        Initialize the publisher
+
+        Args:
+            interval_frames: Frames between snapshots
+            npc_radius: Tiles around the player NPCs are included within
+        """
+        self.interval_frames = max(1, interval_frames)
+        self.npc_radius = npc_radius
+        self.frame = 0
+        self.dirty = True
+        self._snapshot = EMPTY_SNAPSHOT
+
+        # Metrics
+        self.published = 0
+        self.last_capture_ms = 0.0
+
+    def latest(self) -> GameSnapshot:
+        """Most recently published snapshot - safe from any thread"""
+        return self._snapshot
+
+    def mark_dirty(self):
+        """Publish on the next update rather than waiting for the interval (e.g. after MCP commands ran)"""
+        self.dirty = True
+
+    def update(self, game) -> bool:
+        """
+        Count a frame and publish if it's time - main thread only
+
+        Returns:
+            True if a new snapshot was published
+        """
+        self.frame += 1
+        if not self.dirty and self.frame % self.interval_frames:
+            return False
+        self.publish(game)
+        return True
+
+    def publish(self, game) -> GameSnapshot:
+        """Capture and publish a snapshot now - main thread only"""
+        started = time.perf_counter()
+        snapshot = capture_snapshot(game, self.frame, self.npc_radius)
+        self._snapshot = snapshot  # Single reference swap
+        self.dirty = False
+        self.published += 1
+        self.last_capture_ms = 1000 * (time.perf_counter() - started)
+        return snapshot
+
+
+def player_info(snapshot: GameSnapshot) -> Dict[str, Any]:
+    """get_player_info tool result from a snapshot"""
+    if not snapshot.has_player:
+        return {"error": "Player not available", "success": False}
+    player = thaw(snapshot.player)
+    player["inventory_count"] = len(snapshot.inventory["items"])
+    player["equipped_items"] = thaw(snapshot.equipment)
+    return {"success": True, "player": player, "frame": snapshot.frame}
+
+
+def world_info(snapshot: GameSnapshot) -> Dict[str, Any]:
+    """get_world_info tool result from a snapshot"""
+    return {
+        "success": True,
+        "world": {
+            "current_level": "Town Square",
+            "time_of_day": "Day",
+            "weather": "Clear",
+            "nearby_npcs": thaw(snapshot.nearby_npcs),
+            "nearby_items": [],
+            "active_quests": thaw(snapshot.active_quests),
+            "chunks": thaw(snapshot.chunks),
+            "available_actions": ["move", "interact", "inventory"]
+        },
+        "frame": snapshot.frame
+    }
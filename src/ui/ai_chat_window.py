@@ -19,6 +19,7 @@ class AIChatWindow:
         self.scroll_offset = 0
         self.max_visible_lines = 10
         self.npc_reference = None  # Reference to the NPC we're chatting with
+        self.pending_replies = 0  # NPC replies still being worked on
         
         # Initialize fonts
         self._init_fonts()
@@ -45,6 +46,47 @@ class AIChatWindow:
         if len(self.chat_history) > self.max_visible_lines:
             self.scroll_offset = len(self.chat_history) - self.max_visible_lines
     
+    def request_reply(self, message: str):
+        """Ask the NPC to answer a message, showing the reply as it streams in"""
+        npc = self.npc_reference
+        context = npc._get_game_context(getattr(npc, 'current_player', None))
+        
+        # NPCs without the conversation pipeline answer synchronously
+        if not hasattr(npc, 'request_ai_message'):
+            self.add_message(npc.name, npc.send_ai_message(message, context))
+            return
+        
+        entry = {"sender": npc.name, "message": "", "pending": True}
+        self.chat_history.append(entry)
+        self._scroll_to_bottom()
+        self.pending_replies += 1
+        
+        def on_event(event):
+            if event.kind == event.PARTIAL:
+                entry["message"] = event.text
+                return
+            
+            self.pending_replies -= 1
+            entry["pending"] = False
+            if event.kind == event.CANCELLED:
+                if entry in self.chat_history:
+                    self.chat_history.remove(entry)
+                    self._scroll_to_bottom()
+            else:
+                entry["message"] = event.text
+        
+        npc.request_ai_message(message, context, on_event)
+    
+    def _scroll_to_bottom(self):
+        """Keep the newest messages in view"""
+        self.scroll_offset = max(0, len(self.chat_history) - self.max_visible_lines)
+    
+    def close(self):
+        """Close the window, cancelling replies that haven't arrived"""
+        self.is_active = False
+        if self.pending_replies and hasattr(self.npc_reference, 'cancel_ai_message'):
+            self.npc_reference.cancel_ai_message()
+    
     def handle_input(self, event: pygame.event.Event) -> bool:
         """Handle keyboard input for chat. Returns True if event was handled."""
         if not self.is_active:
@@ -59,12 +101,8 @@ class AIChatWindow:
                     # Add player message to chat
                     self.add_message("Player", message)
                     
-                    # Get AI response from the NPC
-                    context = self.npc_reference._get_game_context(
-                        getattr(self.npc_reference, 'current_player', None)
-                    )
-                    ai_response = self.npc_reference.send_ai_message(message, context)
-                    self.add_message(self.npc_reference.name, ai_response)
+                    # Ask the NPC without waiting - the reply arrives in a later frame
+                    self.request_reply(message)
                     
                 return True
                 
@@ -73,7 +111,7 @@ class AIChatWindow:
                 return True
                 
             elif event.key == pygame.K_ESCAPE:
-                self.is_active = False
+                self.close()
                 return True
                 
             elif event.key == pygame.K_UP:
@@ -150,8 +188,12 @@ class AIChatWindow:
             sender_text = self.small_font.render(f"{msg['sender']}:", True, sender_color)
             screen.blit(sender_text, (x + self.padding, current_y))
             
-            # Render message with word wrapping
-            message_lines = self._wrap_text(msg["message"], self.width - self.padding * 2 - 120)
+            # Render message with word wrapping, with a thinking indicator while the reply streams in
+            text = msg["message"]
+            if msg.get("pending"):
+                dots = "." * (1 + pygame.time.get_ticks() // 400 % 3)
+                text = f"{text} {dots}" if text else f"*thinking{dots}*"
+            message_lines = self._wrap_text(text, self.width - self.padding * 2 - 120)
             for j, line in enumerate(message_lines):
                 if current_y + (j + 1) * 18 > chat_area_y + chat_area_height:
                     break  # Don't draw beyond the chat area
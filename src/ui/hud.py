@@ -4,6 +4,7 @@ HUD (Heads-Up Display) - In-game UI elements
 
 import pygame
 import math
+from .retained_panel import RetainedPanel
 
 class HUD:
     """Heads-up display for in-game UI elements"""
@@ -11,11 +12,12 @@ class HUD:
     def __init__(self, game):
         self.game = game
         self.player = game.player
+        self.assets = game.asset_loader
         
-        # Fonts
-        self.font = pygame.font.Font(None, 24)
-        self.small_font = pygame.font.Font(None, 20)
-        self.large_font = pygame.font.Font(None, 32)
+        # Fonts, shared with the rest of the UI
+        self.font = self.assets.get_font(24)
+        self.small_font = self.assets.get_font(20)
+        self.large_font = self.assets.get_font(32)
         
         # Colors
         self.colors = {
@@ -29,29 +31,46 @@ class HUD:
             'slot_bg': (60, 60, 60),
             'slot_border': (100, 100, 100)
         }
+        
+        # Bottom panel surface, created on the first render
+        self.panel = None
     
     def render(self, screen):
         """Render the complete HUD"""
         screen_width = screen.get_width()
         screen_height = screen.get_height()
         
-        # Create UI panel at bottom
+        # UI panel at bottom, kept between frames - only sections whose values changed are redrawn
         ui_height = 150
-        ui_panel = pygame.Surface((screen_width, ui_height))
-        ui_panel.fill(self.colors['panel_bg'])
-        
-        # Draw border
-        pygame.draw.rect(ui_panel, self.colors['panel_border'], (0, 0, screen_width, ui_height), 2)
+        if self.panel is None or self.panel.size != (screen_width, ui_height):
+            self.panel = RetainedPanel((screen_width, ui_height), self.colors['panel_bg'], self.colors['panel_border'])
         
         # Render different sections
-        self.render_player_stats(ui_panel)
-        self.render_equipment_slots(ui_panel, screen_width)
-        self.render_xp_bar(ui_panel, screen_width)
-        self.render_movement_mode_indicator(ui_panel, screen_width)
-        self.render_debug_keys_indicator(ui_panel, screen_width)
+        player = self.player
+        weapon = player.equipped_weapon
+        armor = player.equipped_armor
+        movement_system = getattr(player, 'movement_system', None)
+        level = getattr(self.game, 'current_level', None)
+        self.panel.update((
+            ("stats", pygame.Rect(2, 2, 276, ui_height - 4),
+             (int(player.health), player.max_health, int(player.stamina), player.max_stamina, player.level, player.gold),
+             self.render_player_stats),
+            ("equipment", pygame.Rect(150, 28, 400, ui_height - 30),
+             (weapon, weapon and weapon.name, weapon and weapon.sprite, armor, armor and armor.name, armor and armor.sprite),
+             lambda surface: self.render_equipment_slots(surface, screen_width)),
+            ("xp", pygame.Rect(20, 5, screen_width - 40, 20),
+             (player.experience, player.experience_to_next),
+             lambda surface: self.render_xp_bar(surface, screen_width)),
+            ("movement_mode", pygame.Rect(screen_width - 90, 30, 80, 45),
+             movement_system.movement_mode if movement_system else None,
+             lambda surface: self.render_movement_mode_indicator(surface, screen_width)),
+            ("debug_keys", pygame.Rect(screen_width - 130, 80, 120, 40),
+             bool(level and hasattr(level, 'chunk_manager')),
+             lambda surface: self.render_debug_keys_indicator(surface, screen_width))
+        ))
         
         # Blit the UI panel to the screen
-        screen.blit(ui_panel, (0, screen_height - ui_height))
+        screen.blit(self.panel.surface, (0, screen_height - ui_height))
     
     def render_player_stats(self, surface):
         """Render player health, stamina, level, and gold"""
@@ -63,8 +82,8 @@ class HUD:
         level_text = f"Level {self.player.level}"
         gold_text = f"Gold: {self.player.gold}"
         
-        level_surface = self.small_font.render(level_text, True, self.colors['gold_color'])
-        gold_surface = self.small_font.render(gold_text, True, self.colors['gold_color'])
+        level_surface = self.assets.render_text(self.small_font, level_text, self.colors['gold_color'])
+        gold_surface = self.assets.render_text(self.small_font, gold_text, self.colors['gold_color'])
         surface.blit(level_surface, (stats_x, 15))
         surface.blit(gold_surface, (stats_x, 35))
     
@@ -85,7 +104,7 @@ class HUD:
         
         # Health text
         health_text = f"{int(self.player.health)}"
-        health_surface = self.small_font.render(health_text, True, self.colors['text_color'])
+        health_surface = self.assets.render_text(self.small_font, health_text, self.colors['text_color'])
         health_rect = health_surface.get_rect(center=health_center)
         surface.blit(health_surface, health_rect)
         
@@ -104,7 +123,7 @@ class HUD:
         
         # Stamina text
         stamina_text = f"{int(self.player.stamina)}"
-        stamina_surface = self.small_font.render(stamina_text, True, self.colors['text_color'])
+        stamina_surface = self.assets.render_text(self.small_font, stamina_text, self.colors['text_color'])
         stamina_rect = stamina_surface.get_rect(center=stamina_center)
         surface.blit(stamina_surface, stamina_rect)
     
@@ -150,12 +169,12 @@ class HUD:
                 surface.blit(scaled_sprite, sprite_rect)
             
             # Weapon name below slot
-            weapon_name = self.small_font.render(self.player.equipped_weapon.name, True, self.colors['text_color'])
+            weapon_name = self.assets.render_text(self.small_font, self.player.equipped_weapon.name, self.colors['text_color'])
             weapon_name_rect = weapon_name.get_rect(center=(weapon_rect.centerx, weapon_rect.bottom + 15))
             surface.blit(weapon_name, weapon_name_rect)
         else:
             # Empty slot indicator
-            empty_text = self.small_font.render("No Weapon", True, (150, 150, 150))
+            empty_text = self.assets.render_text(self.small_font, "No Weapon", (150, 150, 150))
             empty_rect = empty_text.get_rect(center=weapon_rect.center)
             surface.blit(empty_text, empty_rect)
         
@@ -174,12 +193,12 @@ class HUD:
                 surface.blit(scaled_sprite, sprite_rect)
             
             # Armor name below slot
-            armor_name = self.small_font.render(self.player.equipped_armor.name, True, self.colors['text_color'])
+            armor_name = self.assets.render_text(self.small_font, self.player.equipped_armor.name, self.colors['text_color'])
             armor_name_rect = armor_name.get_rect(center=(armor_rect.centerx, armor_rect.bottom + 15))
             surface.blit(armor_name, armor_name_rect)
         else:
             # Empty slot indicator
-            empty_text = self.small_font.render("No Armor", True, (150, 150, 150))
+            empty_text = self.assets.render_text(self.small_font, "No Armor", (150, 150, 150))
             empty_rect = empty_text.get_rect(center=armor_rect.center)
             surface.blit(empty_text, empty_rect)
     
@@ -205,7 +224,7 @@ class HUD:
         
         # XP text
         xp_text = f"XP: {self.player.experience}/{self.player.experience_to_next}"
-        xp_surface = self.small_font.render(xp_text, True, self.colors['text_color'])
+        xp_surface = self.assets.render_text(self.small_font, xp_text, self.colors['text_color'])
         xp_rect = xp_surface.get_rect(center=(xp_bar_x + xp_bar_width // 2, xp_bar_y + xp_bar_height // 2))
         surface.blit(xp_surface, xp_rect)
     
@@ -228,13 +247,13 @@ class HUD:
             
             # Mode text
             mode_color = (100, 255, 100) if mode == "wasd" else (100, 150, 255)
-            mode_surface = self.small_font.render(mode_text, True, mode_color)
+            mode_surface = self.assets.render_text(self.small_font, mode_text, mode_color)
             mode_rect = mode_surface.get_rect(center=indicator_rect.center)
             surface.blit(mode_surface, mode_rect)
             
             # F5 hint text below
             hint_text = "F5"
-            hint_surface = pygame.font.Font(None, 16).render(hint_text, True, (150, 150, 150))
+            hint_surface = self.assets.render_text(self.assets.get_font(16), hint_text, (150, 150, 150))
             hint_rect = hint_surface.get_rect(center=(indicator_rect.centerx, indicator_rect.bottom + 10))
             surface.blit(hint_surface, hint_rect)
     
@@ -257,12 +276,12 @@ class HUD:
             
             # Debug text
             debug_text = "DEBUG"
-            debug_surface = pygame.font.Font(None, 18).render(debug_text, True, (200, 200, 255))
+            debug_surface = self.assets.render_text(self.assets.get_font(18), debug_text, (200, 200, 255))
             debug_rect = debug_surface.get_rect(center=(indicator_rect.centerx, indicator_rect.y + 12))
             surface.blit(debug_surface, debug_rect)
             
             # F6 hint text
             f6_text = "F6: Refresh Chunk"
-            f6_surface = pygame.font.Font(None, 16).render(f6_text, True, (150, 150, 200))
+            f6_surface = self.assets.render_text(self.assets.get_font(16), f6_text, (150, 150, 200))
             f6_rect = f6_surface.get_rect(center=(indicator_rect.centerx, indicator_rect.y + 28))
             surface.blit(f6_surface, f6_rect)
@@ -0,0 +1,126 @@
+"""
+Retained-mode UI panel - a surface kept between frames, redrawn widget by widget
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import pygame
+
+# A widget declared for a frame: name, area on the panel, the values it shows, and how to draw it
+Widget = Tuple[str, pygame.Rect, Any, Callable[[pygame.Surface], None]]
+
+
+class RetainedPanel:
+    """
+    A UI panel whose surface is kept and only partly redrawn each frame
+
+    The owner declares its widgets every frame with the values each one
+    shows (health, gold, the equipped weapon...). update() compares those
+    with the values the widget was last drawn with and redraws only the
+    widgets that changed, so an idle panel costs a few comparisons and one
+    blit instead of a new surface with everything drawn on it again.
+
+    A widget only draws inside its rect - drawing is clipped to it. A
+    redrawn widget's area is cleared to the background, so widgets whose
+    rects overlap it are redrawn too, in the order they were declared, as
+    if the whole panel had been drawn from scratch.
+    """
+
+    def __init__(self, size: Tuple[int, int], background: Tuple[int, int, int],
+                 border: Optional[Tuple[int, int, int]] = None, border_width: int = 2):
+        """
+        Initialize retained panel
+
+        Args:
+            size: Panel width and height in pixels
+            background: Fill colour behind the widgets
+            border: Colour of a border around the panel, or None
+            border_width: Width of the border in pixels
+        """
+        self.surface = pygame.Surface(size)
+        self.background = background
+        self.border = border
+        self.border_width = border_width
+        # Widget name -> (rect, values) it was last drawn with
+        self.drawn: Dict[str, Tuple[pygame.Rect, Any]] = {}
+        # Panel areas redrawn by the last update
+        self.dirty_rects: List[pygame.Rect] = []
+
+        # Metrics
+        self.redraws = 0
+
+        self.invalidate()
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return self.surface.get_size()
+
+    def invalidate(self):
+        """Clear the panel so every widget is drawn again on the next update"""
+        self.drawn.clear()
+        self.surface.fill(self.background)
+        self._draw_border()
+
+    def update(self, widgets: Sequence[Widget]) -> List[pygame.Rect]:
+        """
+        Redraw the widgets whose values or rect changed since they were last drawn
+
+        Args:
+            widgets: (name, rect, values, draw) for every widget on the panel, back to front.
+                draw(surface) draws the widget at its place on the panel surface.
+
+        Returns:
+            Areas of the panel that were redrawn (empty when nothing changed)
+        """
+        drawn = self.drawn
+        areas = []
+        redraw = []
+        for index, (name, rect, values, _) in enumerate(widgets):
+            previous = drawn.get(name)
+            if previous is None or previous[0] != rect or previous[1] != values:
+                redraw.append(index)
+                areas.append(rect)
+                if previous is not None and previous[0] != rect:
+                    areas.append(previous[0])
+
+        if redraw or len(drawn) != len(widgets):
+            # Widgets that are gone leave their area to be cleared
+            declared = {widget[0] for widget in widgets}
+            for name in [name for name in drawn if name not in declared]:
+                areas.append(drawn.pop(name)[0])
+
+        if not areas:
+            self.dirty_rects = []
+            return self.dirty_rects
+
+        # Whatever overlaps a cleared area has to be drawn again, and clears its own area in turn
+        pending = [index for index in range(len(widgets)) if index not in redraw]
+        grown = True
+        while grown and pending:
+            grown = False
+            for index in list(pending):
+                rect = widgets[index][1]
+                if rect.collidelist(areas) != -1:
+                    pending.remove(index)
+                    redraw.append(index)
+                    areas.append(rect)
+                    grown = True
+
+        surface = self.surface
+        for area in areas:
+            surface.fill(self.background, area)
+        for index in sorted(redraw):
+            name, rect, values, draw = widgets[index]
+            surface.set_clip(rect)
+            draw(surface)
+            drawn[name] = (pygame.Rect(rect), values)
+        surface.set_clip(None)
+        self._draw_border()
+
+        self.redraws += len(redraw)
+        self.dirty_rects = areas
+        return areas
+
+    def _draw_border(self):
+        if self.border is not None:
+            pygame.draw.rect(self.surface, self.border, self.surface.get_rect(), self.border_width)
@@ -0,0 +1,230 @@
+"""
+Wall Face Atlas Module
+
+Pre-renders the textured, lit and masked wall and roof faces drawn by
+WallRenderer into a single atlas surface, so drawing a face is one blit.
+"""
+
+import pygame
+from typing import Dict, Optional, Tuple
+
+# Wall height in pixels used by the wall renderer
+WALL_HEIGHT = 48
+
+# Lighting per face direction as (tint color, intensity), None for unlit faces
+FACE_LIGHTING = {
+    "north": ((255, 255, 255), 1.2),  # Brightest face (highlight)
+    "east": None,                     # Normal lighting
+    "south": ((180, 180, 180), 0.8),  # Darker faces (shadow)
+    "west": ((180, 180, 180), 0.8),
+    "top": None
+}
+
+SIDE_FACES = ("north", "east", "south", "west")
+BORDER_COLOR = (100, 100, 100)
+
+Shape = Tuple[Tuple[int, int], ...]
+
+
+def apply_tint(surface, tint_color, intensity=1.0):
+    """Return a copy of a surface multiplied by a tint color"""
+    tinted_surface = surface.copy()
+
+    # Create tint overlay
+    tint_overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+
+    # Adjust tint color by intensity
+    adjusted_tint = (
+        min(255, int(tint_color[0] * intensity)),
+        min(255, int(tint_color[1] * intensity)),
+        min(255, int(tint_color[2] * intensity))
+    )
+
+    tint_overlay.fill(adjusted_tint)
+    tinted_surface.blit(tint_overlay, (0, 0), special_flags=pygame.BLEND_MULT)
+
+    return tinted_surface
+
+
+def wall_face_points(screen_x, floor_y, tile_width, tile_height, wall_height=WALL_HEIGHT):
+    """
+    Corner points of every face of a wall tile
+
+    Args:
+        screen_x: Screen X of the tile center
+        floor_y: Screen Y of the tile center at floor level
+        tile_width: Isometric tile width
+        tile_height: Isometric tile height
+        wall_height: Wall height in pixels
+
+    Returns:
+        Dictionary of face direction to its four corner points
+    """
+    # Base diamond points (floor level)
+    top_point = (screen_x, floor_y - tile_height // 2)
+    right_point = (screen_x + tile_width // 2, floor_y)
+    bottom_point = (screen_x, floor_y + tile_height // 2)
+    left_point = (screen_x - tile_width // 2, floor_y)
+
+    # Top diamond points (wall height) - walls extend upward from floor level
+    top_top = (screen_x, floor_y - tile_height // 2 - wall_height)
+    right_top = (screen_x + tile_width // 2, floor_y - wall_height)
+    bottom_top = (screen_x, floor_y + tile_height // 2 - wall_height)
+    left_top = (screen_x - tile_width // 2, floor_y - wall_height)
+
+    return {
+        "north": [left_point, top_point, top_top, left_top],
+        "east": [top_point, right_point, right_top, top_top],
+        "south": [bottom_point, right_point, right_top, bottom_top],
+        "west": [left_point, bottom_point, bottom_top, left_top],
+        "top": [top_top, right_top, bottom_top, left_top]
+    }
+
+
+def face_shape(face_points) -> Tuple[float, float, Shape]:
+    """
+    Split face points into a position and a position-independent shape
+
+    Returns:
+        (min_x, min_y, points relative to the bounding box rounded to pixels)
+    """
+    min_x = min(p[0] for p in face_points)
+    min_y = min(p[1] for p in face_points)
+    shape = tuple((int(round(p[0] - min_x)), int(round(p[1] - min_y))) for p in face_points)
+    return min_x, min_y, shape
+
+
+def render_face(texture, face_direction, shape: Shape, rotate=False, border=True):
+    """
+    Render one textured, lit and masked face
+
+    Args:
+        texture: Source texture surface
+        face_direction: "north", "east", "south", "west" or "top"
+        shape: Face corner points relative to its bounding box
+        rotate: Rotate the texture 45 degrees first (roof textures on top faces)
+        border: Outline the face
+
+    Returns:
+        SRCALPHA surface the size of the face's bounding box, or None if empty
+    """
+    face_width = max(p[0] for p in shape) + 1
+    face_height = max(p[1] for p in shape) + 1
+    if face_width <= 0 or face_height <= 0:
+        return None
+
+    # Create face surface
+    face_surface = pygame.Surface((face_width, face_height), pygame.SRCALPHA)
+
+    if rotate:
+        # Rotate roof texture to match isometric orientation
+        texture = pygame.transform.rotate(texture, 45)
+    scaled_texture = pygame.transform.scale(texture, (face_width, face_height))
+
+    # Apply lighting based on face direction
+    lighting = FACE_LIGHTING.get(face_direction)
+    if lighting:
+        scaled_texture = apply_tint(scaled_texture, lighting[0], lighting[1])
+
+    face_surface.blit(scaled_texture, (0, 0))
+
+    # Mask the texture to the face shape
+    mask_surface = pygame.Surface((face_width, face_height), pygame.SRCALPHA)
+    pygame.draw.polygon(mask_surface, (255, 255, 255, 255), shape)
+    face_surface.blit(mask_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+
+    if border:
+        pygame.draw.polygon(face_surface, BORDER_COLOR, shape, 1)
+
+    return face_surface
+
+
+class WallFaceAtlas:
+    """
+    Every wall and roof face the wall renderer draws, packed into one surface
+
+    Faces depend only on the texture, the face direction (which sets the
+    lighting) and the tile geometry, so all combinations for the standard
+    geometry are rendered once up front. Faces with any other shape are
+    rendered on first use and kept separately.
+    """
+
+    def __init__(self, tile_width, tile_height, wall_texture, window_texture=None, roof_texture=None,
+                 wall_height=WALL_HEIGHT):
+        """
+        Build the atlas
+
+        Args:
+            tile_width: Isometric tile width
+            tile_height: Isometric tile height
+            wall_texture: Texture for wall sides and plain top faces
+            window_texture: Texture for window wall sides
+            roof_texture: Texture for roof top faces (rotated 45 degrees)
+            wall_height: Wall height in pixels
+        """
+        self.sources = (wall_texture, window_texture, roof_texture)
+        self.face_rects: Dict[Tuple, pygame.Rect] = {}
+        self.extra_faces: Dict[Tuple, Tuple[pygame.Surface, Optional[pygame.Surface]]] = {}
+
+        # (texture, direction, rotate, border) combinations the renderer uses
+        combinations = []
+        if wall_texture:
+            combinations += [(wall_texture, direction, False, True) for direction in SIDE_FACES + ("top",)]
+        if window_texture:
+            combinations += [(window_texture, direction, False, True) for direction in SIDE_FACES]
+        if roof_texture:
+            combinations.append((roof_texture, "top", True, False))
+
+        points = wall_face_points(0, 0, tile_width, tile_height, wall_height)
+        faces = []
+        for texture, direction, rotate, border in combinations:
+            shape = face_shape(points[direction])[2]
+            sprite = render_face(texture, direction, shape, rotate, border)
+            if sprite is not None:
+                faces.append((self.face_key(texture, direction, shape, rotate, border), sprite))
+
+        # Pack faces left to right in a single row
+        atlas_width = sum(sprite.get_width() for _, sprite in faces) or 1
+        atlas_height = max((sprite.get_height() for _, sprite in faces), default=1)
+        self.surface = pygame.Surface((atlas_width, atlas_height), pygame.SRCALPHA)
+        x = 0
+        for key, sprite in faces:
+            # Max blend onto the cleared atlas copies pixels and alpha unchanged
+            self.surface.blit(sprite, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self.face_rects[key] = pygame.Rect(x, 0, sprite.get_width(), sprite.get_height())
+            x += sprite.get_width()
+
+    @staticmethod
+    def face_key(texture, face_direction, shape: Shape, rotate=False, border=True) -> Tuple:
+        return (id(texture), face_direction, shape, rotate, border)
+
+    def matches(self, wall_texture, window_texture, roof_texture) -> bool:
+        """Check if the atlas was built from these textures"""
+        return all(a is b for a, b in zip(self.sources, (wall_texture, window_texture, roof_texture)))
+
+    def blit_face(self, surface, texture, face_points, face_direction, rotate=False, border=True):
+        """
+        Draw a face with a single blit
+
+        Args:
+            surface: Destination surface
+            texture: Texture the face uses
+            face_points: Face corner points in screen coordinates
+            face_direction: "north", "east", "south", "west" or "top"
+            rotate: Rotate the texture 45 degrees first (roof textures on top faces)
+            border: Outline the face
+        """
+        min_x, min_y, shape = face_shape(face_points)
+        key = self.face_key(texture, face_direction, shape, rotate, border)
+
+        rect = self.face_rects.get(key)
+        if rect is not None:
+            surface.blit(self.surface, (min_x, min_y), rect)
+            return
+
+        if key not in self.extra_faces:
+            # Keep the texture alive with its face so the id in the key stays unique
+            self.extra_faces[key] = (texture, render_face(texture, face_direction, shape, rotate, border))
+        sprite = self.extra_faces[key][1]
+        if sprite is not None:
+            surface.blit(sprite, (min_x, min_y))
@@ -8,6 +8,8 @@ including wall creation, loading, rendering, and utility methods.
 import pygame
 from typing import Optional, Tuple, List
 
+from .wall_face_atlas import WallFaceAtlas, apply_tint
+
 
 class WallRenderer:
     """Handles all wall-related rendering and sprite management"""
@@ -404,61 +406,11 @@ class WallRenderer:
     def render_textured_wall_face_with_custom_texture(self, surface, face_points, face_direction, custom_texture):
         """Render a single wall face with a custom texture"""
         if custom_texture and len(face_points) == 4:
-            # Create a temporary surface for the face
-            min_x = min(p[0] for p in face_points)
-            max_x = max(p[0] for p in face_points)
-            min_y = min(p[1] for p in face_points)
-            max_y = max(p[1] for p in face_points)
-            
-            face_width = int(max_x - min_x) + 1
-            face_height = int(max_y - min_y) + 1
-            
-            if face_width > 0 and face_height > 0:
-                # Create face surface
-                face_surface = pygame.Surface((face_width, face_height), pygame.SRCALPHA)
-                
-                # FIXED: For roof texture on top faces, rotate it 45 degrees first
-                if face_direction == "top":
-                    # Rotate roof texture to match isometric orientation
-                    rotated_texture = pygame.transform.rotate(custom_texture, 45)
-                    scaled_texture = pygame.transform.scale(rotated_texture, (face_width, face_height))
-                else:
-                    # For side faces, use texture as-is
-                    scaled_texture = pygame.transform.scale(custom_texture, (face_width, face_height))
-                
-                # Apply lighting based on face direction
-                if face_direction == "north":
-                    # Brightest face (highlight)
-                    tinted_texture = self.apply_tint_to_surface(scaled_texture, (255, 255, 255), 1.2)
-                elif face_direction == "east":
-                    # Normal lighting
-                    tinted_texture = scaled_texture
-                elif face_direction in ["south", "west"]:
-                    # Darker faces (shadow)
-                    tinted_texture = self.apply_tint_to_surface(scaled_texture, (180, 180, 180), 0.8)
-                else:  # top
-                    # Top face - normal lighting
-                    tinted_texture = scaled_texture
-                
-                face_surface.blit(tinted_texture, (0, 0))
-                
-                # Create a mask for the face shape
-                adjusted_points = [(p[0] - min_x, p[1] - min_y) for p in face_points]
-                
-                # Create mask surface
-                mask_surface = pygame.Surface((face_width, face_height), pygame.SRCALPHA)
-                pygame.draw.polygon(mask_surface, (255, 255, 255, 255), adjusted_points)
-                
-                # Apply mask to textured surface
-                face_surface.blit(mask_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-                
-                # Blit the textured face to the main surface
-                surface.blit(face_surface, (min_x, min_y))
-                
-                # FIXED: Don't draw border on roof faces to avoid grid lines
-                # Only draw borders on side faces, not top faces (roofs)
-                if face_direction != "top":
-                    pygame.draw.polygon(surface, (100, 100, 100), face_points, 1)
+            # Roof texture on top faces is rotated to match the isometric orientation,
+            # and roof faces get no border to avoid grid lines
+            is_top = face_direction == "top"
+            self.get_face_atlas().blit_face(surface, custom_texture, face_points, face_direction,
+                                            rotate=is_top, border=not is_top)
         else:
             # Fallback to solid color rendering
             color = (80, 40, 20)  # Dark brown fallback for roof
@@ -594,53 +546,8 @@ class WallRenderer:
             current_texture = self.wall_texture
         
         if current_texture and len(face_points) == 4:
-            # Create a temporary surface for the face
-            min_x = min(p[0] for p in face_points)
-            max_x = max(p[0] for p in face_points)
-            min_y = min(p[1] for p in face_points)
-            max_y = max(p[1] for p in face_points)
-            
-            face_width = int(max_x - min_x) + 1
-            face_height = int(max_y - min_y) + 1
-            
-            if face_width > 0 and face_height > 0:
-                # Create face surface
-                face_surface = pygame.Surface((face_width, face_height), pygame.SRCALPHA)
-                
-                # Scale texture to fit the face
-                scaled_texture = pygame.transform.scale(current_texture, (face_width, face_height))
-                
-                # Apply lighting based on face direction
-                if face_direction == "north":
-                    # Brightest face (highlight)
-                    tinted_texture = self.apply_tint_to_surface(scaled_texture, (255, 255, 255), 1.2)
-                elif face_direction == "east":
-                    # Normal lighting
-                    tinted_texture = scaled_texture
-                elif face_direction in ["south", "west"]:
-                    # Darker faces (shadow)
-                    tinted_texture = self.apply_tint_to_surface(scaled_texture, (180, 180, 180), 0.8)
-                else:  # top
-                    # Top face - normal lighting
-                    tinted_texture = scaled_texture
-                
-                face_surface.blit(tinted_texture, (0, 0))
-                
-                # Create a mask for the face shape
-                adjusted_points = [(p[0] - min_x, p[1] - min_y) for p in face_points]
-                
-                # Create mask surface
-                mask_surface = pygame.Surface((face_width, face_height), pygame.SRCALPHA)
-                pygame.draw.polygon(mask_surface, (255, 255, 255, 255), adjusted_points)
-                
-                # Apply mask to textured surface
-                face_surface.blit(mask_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-                
-                # Blit the textured face to the main surface
-                surface.blit(face_surface, (min_x, min_y))
-                
-                # Draw border
-                pygame.draw.polygon(surface, (100, 100, 100), face_points, 1)
+            # Pre-rendered, lit and masked face from the atlas
+            self.get_face_atlas().blit_face(surface, current_texture, face_points, face_direction)
         else:
             # Fallback to solid color rendering
             # Don't use window-specific colors for top faces
@@ -658,6 +565,18 @@ class WallRenderer:
             pygame.draw.polygon(surface, color, face_points)
             pygame.draw.polygon(surface, (100, 100, 100), face_points, 1)
 
+    def get_face_atlas(self):
+        """Get the pre-rendered wall and roof face atlas, rebuilding it if the textures changed"""
+        wall_texture = getattr(self, 'wall_texture', None)
+        window_texture = getattr(self, 'wall_texture_window', None)
+        roof_texture = self.asset_loader.get_image("roof_texture")
+        
+        atlas = getattr(self, 'face_atlas', None)
+        if atlas is None or not atlas.matches(wall_texture, window_texture, roof_texture):
+            atlas = self.face_atlas = WallFaceAtlas(self.tile_width, self.tile_height,
+                                                    wall_texture, window_texture, roof_texture)
+        return atlas
+
     def is_corner_wall(self, tile_type):
         """Check if a tile type is a corner wall"""
         corner_types = [
@@ -708,12 +627,15 @@ class WallRenderer:
 
     def is_wall_tile(self, tile_type):
         """Check if a tile type is any kind of wall"""
-        wall_types = [
-            self.TILE_WALL, self.TILE_WALL_CORNER_TL, self.TILE_WALL_CORNER_TR,
-            self.TILE_WALL_CORNER_BL, self.TILE_WALL_CORNER_BR,
-            self.TILE_WALL_HORIZONTAL, self.TILE_WALL_VERTICAL, self.TILE_WALL_WINDOW,
-            self.TILE_WALL_WINDOW_HORIZONTAL, self.TILE_WALL_WINDOW_VERTICAL
-        ]
+        # Built once - this runs for every visible tile each frame
+        wall_types = getattr(self, '_wall_types', None)
+        if wall_types is None:
+            wall_types = self._wall_types = frozenset([
+                self.TILE_WALL, self.TILE_WALL_CORNER_TL, self.TILE_WALL_CORNER_TR,
+                self.TILE_WALL_CORNER_BL, self.TILE_WALL_CORNER_BR,
+                self.TILE_WALL_HORIZONTAL, self.TILE_WALL_VERTICAL, self.TILE_WALL_WINDOW,
+                self.TILE_WALL_WINDOW_HORIZONTAL, self.TILE_WALL_WINDOW_VERTICAL
+            ])
         return tile_type in wall_types
 
     def has_wall_or_door_at(self, x, y):
@@ -737,19 +659,4 @@ class WallRenderer:
 
     def apply_tint_to_surface(self, surface, tint_color, intensity=1.0):
         """Apply a tint to a surface for lighting effects"""
-        tinted_surface = surface.copy()
-        
-        # Create tint overlay
-        tint_overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-        
-        # Adjust tint color by intensity
-        adjusted_tint = (
-            min(255, int(tint_color[0] * intensity)),
-            min(255, int(tint_color[1] * intensity)),
-            min(255, int(tint_color[2] * intensity))
-        )
-        
-        tint_overlay.fill(adjusted_tint)
-        tinted_surface.blit(tint_overlay, (0, 0), special_flags=pygame.BLEND_MULT)
-        
-        return tinted_surface
+        return apply_tint(surface, tint_color, intensity)
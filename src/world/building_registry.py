@@ -0,0 +1,128 @@
+"""
+Building Registry Module
+
+Records of the buildings placed in a chunk - footprint, doors and interior
+extent - written when the chunk is generated and saved with it, so
+renderers and pathfinding can look a building up instead of flood-filling
+tiles to rediscover it.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+# Chunk tile ids (see LevelBase)
+TILE_DOOR = 5
+TILE_BRICK = 13
+WALL_TILES = frozenset((4, 6, 7, 8, 9, 10, 11, 12, 14, 15))
+BUILDING_TILES = WALL_TILES | {TILE_DOOR, TILE_BRICK}
+
+Bounds = Tuple[int, int, int, int]
+
+
+def door_orientation(tiles, local_x, local_y) -> str:
+    """
+    Orientation of a door from the walls beside it
+
+    Uses the same rule as DoorPathfinder: "horizontal" when at least as many
+    walls are to the north and south as to the east and west.
+    """
+    size = len(tiles)
+
+    def is_wall(x, y):
+        return 0 <= x < size and 0 <= y < size and tiles[y][x] in WALL_TILES
+
+    north_south = is_wall(local_x, local_y - 1) + is_wall(local_x, local_y + 1)
+    east_west = is_wall(local_x - 1, local_y) + is_wall(local_x + 1, local_y)
+    return "horizontal" if north_south >= east_west else "vertical"
+
+
+def make_building_record(building_id: str, name: str, tiles, local_x: int, local_y: int,
+                         width: int, height: int, origin: Tuple[int, int]) -> Dict[str, Any]:
+    """
+    Describe a building placed in a chunk
+
+    Args:
+        building_id: Unique id for the building
+        name: Template or building type name
+        tiles: The chunk's tile rows after the building was placed
+        local_x, local_y: Top-left corner of the footprint in chunk coordinates
+        width, height: Footprint size in tiles
+        origin: World coordinates of the chunk's top-left tile
+
+    Returns:
+        JSON-serializable record with world coordinates: footprint bounds
+        (inclusive), doors as [x, y, orientation] and the interior floor bounds
+    """
+    origin_x, origin_y = origin
+    doors = []
+    interior = None
+    for y in range(local_y, local_y + height):
+        for x in range(local_x, local_x + width):
+            tile = tiles[y][x]
+            if tile == TILE_DOOR:
+                doors.append([origin_x + x, origin_y + y, door_orientation(tiles, x, y)])
+            elif tile == TILE_BRICK:
+                world_x, world_y = origin_x + x, origin_y + y
+                if interior is None:
+                    interior = [world_x, world_y, world_x, world_y]
+                else:
+                    interior = [min(interior[0], world_x), min(interior[1], world_y),
+                                max(interior[2], world_x), max(interior[3], world_y)]
+
+    return {
+        'id': building_id,
+        'name': name,
+        'bounds': [origin_x + local_x, origin_y + local_y,
+                   origin_x + local_x + width - 1, origin_y + local_y + height - 1],
+        'doors': doors,
+        'interior': interior
+    }
+
+
+def find_buildings(tiles, origin: Tuple[int, int], id_prefix: str) -> List[Dict[str, Any]]:
+    """
+    Rebuild building records from a chunk's tiles
+
+    Used for chunks saved before buildings were recorded at generation time.
+    Each 4-connected group of wall, door and floor tiles becomes a building.
+
+    Args:
+        tiles: The chunk's tile rows
+        origin: World coordinates of the chunk's top-left tile
+        id_prefix: Prefix for the generated building ids
+
+    Returns:
+        List of building records
+    """
+    size = len(tiles)
+    visited = set()
+    buildings = []
+    for start_y in range(size):
+        for start_x in range(size):
+            if (start_x, start_y) in visited or tiles[start_y][start_x] not in BUILDING_TILES:
+                continue
+
+            # Flood fill the connected building tiles
+            min_x = max_x = start_x
+            min_y = max_y = start_y
+            to_visit = [(start_x, start_y)]
+            visited.add((start_x, start_y))
+            while to_visit:
+                x, y = to_visit.pop()
+                min_x, max_x = min(min_x, x), max(max_x, x)
+                min_y, max_y = min(min_y, y), max(max_y, y)
+                for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                    if (0 <= nx < size and 0 <= ny < size and (nx, ny) not in visited
+                            and tiles[ny][nx] in BUILDING_TILES):
+                        visited.add((nx, ny))
+                        to_visit.append((nx, ny))
+
+            buildings.append(make_building_record(
+                f"{id_prefix}_{len(buildings)}", "building", tiles,
+                min_x, min_y, max_x - min_x + 1, max_y - min_y + 1, origin
+            ))
+    return buildings
+
+
+def building_bounds(building: Optional[Dict[str, Any]]) -> Optional[Bounds]:
+    """Footprint of a building record as (min_x, min_y, max_x, max_y), or None"""
+    return tuple(building['bounds']) if building else None
@@ -53,7 +53,7 @@ class BuildingTemplateManager:
         if not os.path.exists(self.templates_dir):
             return
         
-        for filename in os.listdir(self.templates_dir):
+        for filename in sorted(os.listdir(self.templates_dir)):  # Stable order keeps template picks deterministic
             if filename.endswith('.json'):
                 template_name = filename[:-5]  # Remove .json extension
                 self.load_template(template_name)
@@ -182,7 +182,7 @@ class BuildingTemplateManager:
         
         # Use seed for deterministic selection if provided
         if seed is not None:
-            random.seed(seed)
+            return random.Random(seed).choice(suitable_templates)
         
         return random.choice(suitable_templates)
     
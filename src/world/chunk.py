@@ -3,9 +3,27 @@ Individual chunk representation
 """
 
 import json
+import mmap
 import os
+import struct
+from itertools import chain
 from typing import List, Dict, Any, Optional, Tuple
 
+from .building_registry import find_buildings
+
+
+# Binary chunk layout (little endian):
+#   header  - magic, version, plane size, chunk coords, seed, flags, section lengths
+#   tiles   - size*size uint8 tile ids, row major
+#   biomes  - size*size uint8 indices into the biome palette, row major
+#   palette - newline separated biome names (utf-8)
+#   entities - compact JSON list of entity dicts
+#   buildings - compact JSON list of building records (version 2+)
+CHUNK_MAGIC = b'RPGC'
+CHUNK_FORMAT_VERSION = 2
+CHUNK_HEADER = struct.Struct('<4sHHiiqB3xIII')
+CHUNK_HEADER_V1 = struct.Struct('<4sHHiiqB3xII')  # No buildings section
+
 
 class Chunk:
     """
@@ -31,9 +49,13 @@ class Chunk:
         self.tiles: List[List[int]] = []
         self.biomes: List[List[str]] = []
         self.entities: List[Dict[str, Any]] = []
+        self.buildings: List[Dict[str, Any]] = []  # Building records from generation
         self.is_generated = False
         self.is_loaded = False
         
+        # Local tile -> building record, built on first lookup
+        self._building_lookup: Optional[Dict[Tuple[int, int], Dict[str, Any]]] = None
+        
     def get_world_bounds(self) -> Tuple[int, int, int, int]:
         """Get world coordinates for this chunk"""
         start_x = self.chunk_x * self.CHUNK_SIZE
@@ -67,6 +89,32 @@ class Chunk:
         """Remove entity from this chunk"""
         self.entities = [e for e in self.entities if e.get('id') != entity_id]
     
+    def add_building(self, building: Dict[str, Any]):
+        """Record a building placed in this chunk"""
+        self.buildings.append(building)
+        self._building_lookup = None
+    
+    def get_building_at(self, local_x: int, local_y: int) -> Optional[Dict[str, Any]]:
+        """Get the building whose footprint covers a local tile"""
+        if self._building_lookup is None:
+            start_x, start_y, _, _ = self.get_world_bounds()
+            lookup = {}
+            for building in self.buildings:
+                min_x, min_y, max_x, max_y = building['bounds']
+                for y in range(min_y - start_y, max_y - start_y + 1):
+                    for x in range(min_x - start_x, max_x - start_x + 1):
+                        lookup[(x, y)] = building
+            self._building_lookup = lookup
+        return self._building_lookup.get((local_x, local_y))
+    
+    def _set_buildings(self, buildings: Optional[List[Dict[str, Any]]]):
+        """Use saved building records, or rebuild them for chunks saved without"""
+        if buildings is None:
+            buildings = find_buildings(self.tiles, self.get_world_bounds()[:2],
+                                       f"building_{self.chunk_x}_{self.chunk_y}") if self.tiles else []
+        self.buildings = buildings
+        self._building_lookup = None
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert chunk to dictionary for serialization"""
         return {
@@ -76,6 +124,7 @@ class Chunk:
             'tiles': self.tiles,
             'biomes': self.biomes,
             'entities': self.entities,
+            'buildings': self.buildings,
             'is_generated': self.is_generated
         }
     
@@ -87,25 +136,155 @@ class Chunk:
         self.tiles = data['tiles']
         self.biomes = data['biomes']
         self.entities = data['entities']
+        self._set_buildings(data.get('buildings'))
         self.is_generated = data['is_generated']
         self.is_loaded = True
     
+    def to_bytes(self) -> bytes:
+        """Serialize chunk to the compact binary format"""
+        size = len(self.tiles)
+        palette = sorted(set(chain.from_iterable(self.biomes)))
+        palette_index = {biome: i for i, biome in enumerate(palette)}
+        
+        tile_plane = bytes(chain.from_iterable(self.tiles))
+        biome_plane = bytes(map(palette_index.__getitem__, chain.from_iterable(self.biomes)))
+        palette_bytes = '\n'.join(palette).encode('utf-8')
+        entity_bytes = json.dumps(self.entities, separators=(',', ':')).encode('utf-8')
+        building_bytes = json.dumps(self.buildings, separators=(',', ':')).encode('utf-8')
+        
+        header = CHUNK_HEADER.pack(
+            CHUNK_MAGIC, CHUNK_FORMAT_VERSION, size,
+            self.chunk_x, self.chunk_y, self.world_seed,
+            1 if self.is_generated else 0,
+            len(palette_bytes), len(entity_bytes), len(building_bytes)
+        )
+        return b''.join((header, tile_plane, biome_plane, palette_bytes, entity_bytes, building_bytes))
+    
+    @staticmethod
+    def read_planes(buffer) -> Tuple[Dict[str, Any], memoryview, memoryview, List[str]]:
+        """
+        Read the tile and biome planes of a binary chunk without decoding entities
+        
+        Args:
+            buffer: Any buffer holding a binary chunk (bytes, mmap, memoryview)
+            
+        Returns:
+            (header, tile_plane, biome_plane, biome_palette) - the planes are
+            zero-copy memoryviews into buffer, so release them before closing it
+        """
+        view = memoryview(buffer)
+        try:
+            magic, version = struct.unpack_from('<4sH', view, 0)
+            if magic != CHUNK_MAGIC or version not in (1, CHUNK_FORMAT_VERSION):
+                raise ValueError(f"Not a v1-v{CHUNK_FORMAT_VERSION} binary chunk")
+            
+            if version == 1:
+                header_struct = CHUNK_HEADER_V1
+                fields = CHUNK_HEADER_V1.unpack_from(view, 0) + (None,)
+            else:
+                header_struct = CHUNK_HEADER
+                fields = CHUNK_HEADER.unpack_from(view, 0)
+            _, _, size, chunk_x, chunk_y, world_seed, flags, palette_len, entity_len, building_len = fields
+            
+            plane_len = size * size
+            tile_start = header_struct.size
+            biome_start = tile_start + plane_len
+            palette_start = biome_start + plane_len
+            entity_start = palette_start + palette_len
+            building_start = entity_start + entity_len
+            if len(view) < building_start + (building_len or 0):
+                raise ValueError("Truncated binary chunk")
+            
+            palette_bytes = bytes(view[palette_start:entity_start])
+            header = {
+                'chunk_x': chunk_x,
+                'chunk_y': chunk_y,
+                'world_seed': world_seed,
+                'size': size,
+                'is_generated': bool(flags & 1),
+                'entity_offset': entity_start,
+                'entity_length': entity_len,
+                'building_offset': building_start,
+                'building_length': building_len  # None for v1 chunks
+            }
+            palette = palette_bytes.decode('utf-8').split('\n') if palette_bytes else []
+            return header, view[tile_start:biome_start], view[biome_start:palette_start], palette
+        except Exception:
+            # Don't leave the view to the traceback - a mmap can't be closed while it's exported
+            view.release()
+            raise
+    
+    def from_bytes(self, buffer):
+        """Load chunk from a binary buffer"""
+        header, tile_plane, biome_plane, palette = self.read_planes(buffer)
+        try:
+            size = header['size']
+            lookup = palette.__getitem__
+            self.tiles = [list(tile_plane[i:i + size]) for i in range(0, size * size, size)]
+            self.biomes = [list(map(lookup, biome_plane[i:i + size])) for i in range(0, size * size, size)]
+            
+            entity_start = header['entity_offset']
+            entity_bytes = bytes(memoryview(buffer)[entity_start:entity_start + header['entity_length']])
+            
+            building_bytes = None
+            if header['building_length'] is not None:
+                building_start = header['building_offset']
+                building_bytes = bytes(memoryview(buffer)[building_start:building_start + header['building_length']])
+        finally:
+            tile_plane.release()
+            biome_plane.release()
+        
+        self.chunk_x = header['chunk_x']
+        self.chunk_y = header['chunk_y']
+        self.world_seed = header['world_seed']
+        self.entities = json.loads(entity_bytes) if entity_bytes else []
+        self._set_buildings(json.loads(building_bytes) if building_bytes is not None else None)
+        self.is_generated = header['is_generated']
+        self.is_loaded = True
+    
     def get_filename(self, world_dir: str) -> str:
         """Get filename for this chunk"""
+        return os.path.join(world_dir, f"chunk_{self.chunk_x}_{self.chunk_y}.chunk")
+    
+    def get_legacy_filename(self, world_dir: str) -> str:
+        """Get filename used by the old JSON chunk format"""
         return os.path.join(world_dir, f"chunk_{self.chunk_x}_{self.chunk_y}.json")
     
     def save_to_file(self, world_dir: str):
         """Save chunk to file"""
         os.makedirs(world_dir, exist_ok=True)
         filename = self.get_filename(world_dir)
+        temp_filename = filename + '.tmp'
+        
+        # Write to a temp file and swap it in so readers never see a partial chunk
+        with open(temp_filename, 'wb') as f:
+            f.write(self.to_bytes())
+        os.replace(temp_filename, filename)
         
-        with open(filename, 'w') as f:
-            json.dump(self.to_dict(), f, separators=(',', ':'))  # Compact JSON
+        # The binary file supersedes any JSON copy from older saves
+        legacy_filename = self.get_legacy_filename(world_dir)
+        if os.path.exists(legacy_filename):
+            os.remove(legacy_filename)
     
     def load_from_file(self, world_dir: str) -> bool:
         """Load chunk from file. Returns True if successful."""
         filename = self.get_filename(world_dir)
         
+        if os.path.exists(filename):
+            try:
+                with open(filename, 'rb') as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                        self.from_bytes(mapped)
+                return True
+            except (ValueError, KeyError, IndexError, struct.error, OSError):
+                pass
+        
+        return self._load_legacy_file(world_dir)
+    
+    def _load_legacy_file(self, world_dir: str) -> bool:
+        """Load chunk from the old JSON format. Returns True if successful."""
+        filename = self.get_legacy_filename(world_dir)
+        
         if not os.path.exists(filename):
             return False
         
@@ -122,4 +301,6 @@ class Chunk:
         self.tiles = []
         self.biomes = []
         self.entities = []
+        self.buildings = []
+        self._building_lookup = None
         self.is_loaded = False
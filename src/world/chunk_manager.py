@@ -4,17 +4,204 @@ Manages loading/unloading of world chunks
 
 import os
 import math
+import struct
+import threading
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 from typing import Dict, List, Tuple, Optional, Set
 from .chunk import Chunk
 from .world_generator import WorldGenerator
 
 
+# One generator per worker process, reused across chunk requests
+_worker_generators: Dict[int, WorldGenerator] = {}
+
+
+def _generate_chunk_in_worker(world_seed: int, chunk_x: int, chunk_y: int) -> bytes:
+    """Generate a chunk in a pool worker and return it in the binary chunk format"""
+    generator = _worker_generators.get(world_seed)
+    if generator is None:
+        generator = _worker_generators[world_seed] = WorldGenerator(world_seed)
+    return generator.generate_chunk(chunk_x, chunk_y).to_bytes()
+
+
+class RegionFile:
+    """
+    Packs REGION_SIZE x REGION_SIZE chunks into one file with an offset table
+    
+    Layout: a fixed header with one (offset, length, capacity) entry per chunk
+    slot, followed by chunk payloads in the binary chunk format. Rewriting a
+    chunk reuses its slot when the payload still fits, otherwise the payload is
+    appended and the old slot becomes dead space until the region is compacted.
+    """
+    
+    REGION_SIZE = 32  # 32x32 chunks per region file
+    MAGIC = b'RPGR'
+    VERSION = 1
+    HEADER = struct.Struct('<4sHH')
+    ENTRY = struct.Struct('<QII')  # offset, length, capacity
+    SLOT_ALIGNMENT = 512  # Slots are padded so small edits can be rewritten in place
+    
+    def __init__(self, path: str):
+        """
+        Open (or create) a region file
+        
+        Args:
+            path: Path of the region file
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        self.write_count = 0
+        self.slot_count = self.REGION_SIZE * self.REGION_SIZE
+        self.table_offset = self.HEADER.size
+        self.data_offset = self.table_offset + self.slot_count * self.ENTRY.size
+        self.entries: List[Tuple[int, int, int]] = [(0, 0, 0)] * self.slot_count
+        self._file = None
+        self._open()
+    
+    @classmethod
+    def region_coords(cls, chunk_x: int, chunk_y: int) -> Tuple[int, int]:
+        """Get the region containing a chunk"""
+        return chunk_x // cls.REGION_SIZE, chunk_y // cls.REGION_SIZE
+    
+    @classmethod
+    def get_filename(cls, world_dir: str, region_x: int, region_y: int) -> str:
+        """Get filename for a region"""
+        return os.path.join(world_dir, f"region_{region_x}_{region_y}.region")
+    
+    def _slot(self, chunk_x: int, chunk_y: int) -> int:
+        """Get the header slot index for a chunk"""
+        return (chunk_y % self.REGION_SIZE) * self.REGION_SIZE + (chunk_x % self.REGION_SIZE)
+    
+    def _open(self):
+        """Open the region file and read its offset table"""
+        if not os.path.exists(self.path):
+            with open(self.path, 'wb') as f:
+                f.write(self.HEADER.pack(self.MAGIC, self.VERSION, self.REGION_SIZE))
+                f.write(b'\0' * (self.slot_count * self.ENTRY.size))
+        
+        self._file = open(self.path, 'r+b')
+        header = self._file.read(self.data_offset)
+        try:
+            if len(header) < self.data_offset:
+                raise ValueError(f"Truncated region header in {self.path}")
+            magic, version, region_size = self.HEADER.unpack_from(header, 0)
+            if magic != self.MAGIC or version != self.VERSION or region_size != self.REGION_SIZE:
+                raise ValueError(f"Unsupported region file: {self.path}")
+            entries = list(self.ENTRY.iter_unpack(header[self.table_offset:self.data_offset]))
+        except (ValueError, struct.error) as e:
+            self._file.close()
+            self._file = None
+            raise ValueError(f"Corrupt region file {self.path}: {e}") from e
+        
+        self.entries = entries
+    
+    def has_chunk(self, chunk_x: int, chunk_y: int) -> bool:
+        """Check whether the region holds a chunk"""
+        return self.entries[self._slot(chunk_x, chunk_y)][1] > 0
+    
+    def chunk_count(self) -> int:
+        """Number of chunks stored in this region, read from the header"""
+        return sum(1 for _, length, _ in self.entries if length > 0)
+    
+    def stored_chunks(self) -> List[Tuple[int, int]]:
+        """Local (x, y) slot coordinates of every chunk stored in this region"""
+        return [(slot % self.REGION_SIZE, slot // self.REGION_SIZE)
+                for slot, (_, length, _) in enumerate(self.entries) if length > 0]
+    
+    def read_chunk(self, chunk_x: int, chunk_y: int) -> Optional[bytes]:
+        """Read a chunk's payload, or None if the region doesn't hold it"""
+        with self.lock:
+            offset, length, _ = self.entries[self._slot(chunk_x, chunk_y)]
+            if length == 0:
+                return None
+            self._file.seek(offset)
+            return self._file.read(length)
+    
+    def write_chunk(self, chunk_x: int, chunk_y: int, payload: bytes):
+        """Write a chunk's payload without touching the rest of the region"""
+        slot = self._slot(chunk_x, chunk_y)
+        with self.lock:
+            offset, _, capacity = self.entries[slot]
+            if len(payload) > capacity:
+                # Doesn't fit the old slot - append a new one at the end of the file
+                self._file.seek(0, os.SEEK_END)
+                offset = self._file.tell()
+                capacity = -(-len(payload) // self.SLOT_ALIGNMENT) * self.SLOT_ALIGNMENT
+                self._file.write(payload.ljust(capacity, b'\0'))
+            else:
+                self._file.seek(offset)
+                self._file.write(payload)
+            
+            self.entries[slot] = (offset, len(payload), capacity)
+            self._file.seek(self.table_offset + slot * self.ENTRY.size)
+            self._file.write(self.ENTRY.pack(offset, len(payload), capacity))
+            self._file.flush()
+            self.write_count += 1
+    
+    def waste_ratio(self) -> float:
+        """Fraction of the payload area not referenced by any live slot"""
+        with self.lock:
+            self._file.seek(0, os.SEEK_END)
+            payload_area = self._file.tell() - self.data_offset
+            live = sum(capacity for _, length, capacity in self.entries if length > 0)
+        return (payload_area - live) / payload_area if payload_area > 0 else 0.0
+    
+    def compact(self) -> bool:
+        """
+        Rewrite the region with only live chunk payloads
+        
+        The rewrite happens outside the lock, so it's safe to call from a
+        background thread. If a chunk was written meanwhile the compacted copy
+        is stale and is discarded; the next compaction pass will retry.
+        
+        Returns:
+            True if the region was compacted
+        """
+        with self.lock:
+            write_count = self.write_count
+            payloads = []
+            for slot, (offset, length, _) in enumerate(self.entries):
+                if length > 0:
+                    self._file.seek(offset)
+                    payloads.append((slot, self._file.read(length)))
+        
+        temp_path = self.path + '.compact'
+        entries = [(0, 0, 0)] * self.slot_count
+        with open(temp_path, 'wb') as f:
+            f.write(self.HEADER.pack(self.MAGIC, self.VERSION, self.REGION_SIZE))
+            f.seek(self.data_offset)
+            for slot, payload in payloads:
+                capacity = -(-len(payload) // self.SLOT_ALIGNMENT) * self.SLOT_ALIGNMENT
+                entries[slot] = (f.tell(), len(payload), capacity)
+                f.write(payload.ljust(capacity, b'\0'))
+            f.seek(self.table_offset)
+            f.write(b''.join(self.ENTRY.pack(*entry) for entry in entries))
+        
+        with self.lock:
+            if self.write_count != write_count:
+                os.remove(temp_path)
+                return False
+            self._file.close()
+            os.replace(temp_path, self.path)
+            self._open()
+        return True
+    
+    def close(self):
+        """Close the underlying file"""
+        with self.lock:
+            if self._file:
+                self._file.close()
+                self._file = None
+
+
 class ChunkManager:
     """
     Manages world chunks - loading, unloading, and streaming
     """
     
-    def __init__(self, world_seed: int, world_name: str = "default", asset_loader=None):
+    def __init__(self, world_seed: int, world_name: str = "default", asset_loader=None,
+                 async_generation: bool = False, max_workers: Optional[int] = None):
         """
         Initialize chunk manager
         
@@ -22,6 +209,8 @@ class ChunkManager:
             world_seed: Seed for world generation
             world_name: Name of the world (for save directory)
             asset_loader: Asset loader for entities
+            async_generation: Generate missing chunks in worker processes instead of the game loop
+            max_workers: Worker process count for async generation (defaults to CPU count - 1)
         """
         self.world_seed = world_seed
         self.world_name = world_name
@@ -39,6 +228,26 @@ class ChunkManager:
         self.load_radius = 2  # Load chunks within 2 chunk radius (was 1)
         self.unload_radius = 4  # Unload chunks beyond 4 chunk radius (was 2)
         
+        # Region files packing many chunks per file
+        self.regions: Dict[Tuple[int, int], RegionFile] = {}
+        self.loose_chunks: Set[Tuple[int, int]] = set()  # Loaded from per-chunk files, migrated on save
+        self.compaction_threshold = 0.5  # Compact when over half a region is dead space
+        self._compaction_thread: Optional[threading.Thread] = None
+        
+        # Asynchronous generation - chunks are generated in worker processes and
+        # installed on the main thread by update_loaded_chunks
+        self.async_generation = async_generation
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) - 1)
+        self.max_in_flight = self.max_workers * 2  # Keep the rest queued so they can be re-prioritised
+        self.pending_chunks: Dict[Tuple[int, int], Future] = {}
+        self.generation_queue: List[Tuple[int, int]] = []
+        self.last_player_position: Optional[Tuple[float, float]] = None
+        self.player_heading: Tuple[float, float] = (0.0, 0.0)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        
+        # Objects with a tile_changed(world_x, world_y, tile_type) method, told about set_tile edits
+        self.tile_listeners: List[object] = []
+        
         print(f"ChunkManager initialized for world '{world_name}' with seed {world_seed}")
     
     def world_to_chunk_coords(self, world_x: float, world_y: float) -> Tuple[int, int]:
@@ -53,31 +262,233 @@ class ChunkManager:
         world_y = chunk_y * Chunk.CHUNK_SIZE
         return world_x, world_y
     
-    def get_chunk(self, chunk_x: int, chunk_y: int) -> Optional[Chunk]:
-        """Get a chunk, loading it if necessary"""
+    def get_chunk(self, chunk_x: int, chunk_y: int, blocking: bool = True) -> Optional[Chunk]:
+        """
+        Get a chunk, loading it if necessary
+        
+        Args:
+            chunk_x, chunk_y: Chunk coordinates
+            blocking: In async mode, wait for generation instead of returning None
+            
+        Returns:
+            The chunk, or None if it's still being generated (non-blocking async
+            requests only - see is_chunk_pending)
+        """
         chunk_key = (chunk_x, chunk_y)
         
         # Return if already loaded
         if chunk_key in self.loaded_chunks:
             return self.loaded_chunks[chunk_key]
         
-        # Try to load from file
-        chunk = Chunk(chunk_x, chunk_y, self.world_seed)
-        if chunk.load_from_file(self.world_dir):
+        # Try to load from disk
+        chunk = self.load_chunk(chunk_x, chunk_y)
+        if chunk:
             self.loaded_chunks[chunk_key] = chunk
             return chunk
         
+        if self.async_generation:
+            self.request_chunk(chunk_x, chunk_y)
+            if not blocking:
+                return None
+            return self.wait_for_chunks([chunk_key]).get(chunk_key)
+        
         # Generate new chunk
         chunk = self.world_generator.generate_chunk(chunk_x, chunk_y, self.asset_loader)
-        chunk.save_to_file(self.world_dir)
+        self.save_chunk(chunk)
         self.loaded_chunks[chunk_key] = chunk
         
         return chunk
     
+    def is_chunk_pending(self, chunk_x: int, chunk_y: int) -> bool:
+        """Check whether a chunk is queued or being generated in the background"""
+        chunk_key = (chunk_x, chunk_y)
+        return chunk_key in self.pending_chunks or chunk_key in self.generation_queue
+    
+    def request_chunk(self, chunk_x: int, chunk_y: int):
+        """Queue a chunk for background generation"""
+        chunk_key = (chunk_x, chunk_y)
+        if chunk_key in self.loaded_chunks or self.is_chunk_pending(chunk_x, chunk_y):
+            return
+        self.generation_queue.append(chunk_key)
+        self._submit_queued_chunks()
+    
+    def wait_for_chunks(self, chunk_keys: List[Tuple[int, int]]) -> Dict[Tuple[int, int], Chunk]:
+        """
+        Block until the given chunks are loaded, generating them in parallel
+        
+        Args:
+            chunk_keys: Chunk coordinates to wait for
+            
+        Returns:
+            Dictionary of chunk coordinates to loaded chunks
+        """
+        for chunk_x, chunk_y in chunk_keys:
+            self.get_chunk(chunk_x, chunk_y, blocking=False)
+        
+        # Wanted chunks jump the queue so they are submitted first
+        wanted = set(chunk_keys)
+        self.generation_queue.sort(key=lambda key: key not in wanted)
+        
+        while True:
+            missing = [key for key in chunk_keys if key not in self.loaded_chunks]
+            if not missing:
+                break
+            for chunk_x, chunk_y in missing:
+                self.request_chunk(chunk_x, chunk_y)
+            self._submit_queued_chunks()
+            wait(list(self.pending_chunks.values()), return_when=FIRST_COMPLETED)
+            self.install_generated_chunks()
+        
+        return {key: self.loaded_chunks[key] for key in chunk_keys}
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Create the generation worker pool on first use"""
+        if self._executor is None:
+            # Spawn rather than fork - the game process holds a display and server threads
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                 mp_context=multiprocessing.get_context("spawn"))
+        return self._executor
+    
+    def _submit_queued_chunks(self):
+        """Hand the highest priority queued chunks to the worker pool"""
+        while self.generation_queue and len(self.pending_chunks) < self.max_in_flight:
+            chunk_key = self.generation_queue.pop(0)
+            self.pending_chunks[chunk_key] = self._get_executor().submit(
+                _generate_chunk_in_worker, self.world_seed, *chunk_key
+            )
+    
+    def _chunk_priority(self, chunk_key: Tuple[int, int], player_chunk_x: int, player_chunk_y: int) -> float:
+        """Lower is sooner - nearby chunks first, favouring the direction the player is heading"""
+        dx = chunk_key[0] - player_chunk_x
+        dy = chunk_key[1] - player_chunk_y
+        distance = math.hypot(dx, dy)
+        if distance == 0:
+            return 0.0
+        heading_x, heading_y = self.player_heading
+        alignment = (dx * heading_x + dy * heading_y) / distance
+        return distance - 0.75 * alignment
+    
+    def install_generated_chunks(self) -> int:
+        """
+        Install chunks finished by the worker pool - must run on the main thread
+        
+        Returns:
+            Number of chunks installed
+        """
+        finished = [key for key, future in self.pending_chunks.items() if future.done()]
+        for chunk_key in finished:
+            future = self.pending_chunks.pop(chunk_key)
+            chunk_x, chunk_y = chunk_key
+            try:
+                chunk = Chunk(chunk_x, chunk_y, self.world_seed)
+                chunk.from_bytes(future.result())
+            except Exception as e:
+                # Don't keep re-queueing a chunk the workers can't build
+                print(f"Warning: Background generation of chunk ({chunk_x}, {chunk_y}) failed: {e}")
+                chunk = self.world_generator.generate_chunk(chunk_x, chunk_y, self.asset_loader)
+            
+            self.save_chunk(chunk)
+            self.loaded_chunks[chunk_key] = chunk
+        
+        if finished:
+            self._submit_queued_chunks()
+        return len(finished)
+    
+    def get_region(self, chunk_x: int, chunk_y: int, create: bool = True) -> Optional[RegionFile]:
+        """Get the region file holding a chunk, opening it if necessary"""
+        region_key = RegionFile.region_coords(chunk_x, chunk_y)
+        region = self.regions.get(region_key)
+        if region:
+            return region
+        
+        filename = RegionFile.get_filename(self.world_dir, *region_key)
+        if not create and not os.path.exists(filename):
+            return None
+        
+        try:
+            region = RegionFile(filename)
+        except ValueError as e:
+            # Keep the damaged file for inspection and start the region afresh - its chunks regenerate
+            corrupt_path = self._set_aside(filename)
+            print(f"Warning: {e} - moved to {corrupt_path}")
+            if not create:
+                return None
+            region = RegionFile(filename)
+        
+        self.regions[region_key] = region
+        return region
+    
+    def _set_aside(self, filename: str) -> str:
+        """Rename a damaged region file out of the way without replacing an earlier one"""
+        corrupt_path = filename + '.corrupt'
+        copy = 1
+        while os.path.exists(corrupt_path):
+            copy += 1
+            corrupt_path = f"{filename}.corrupt{copy}"
+        os.replace(filename, corrupt_path)
+        return corrupt_path
+    
+    def load_chunk(self, chunk_x: int, chunk_y: int) -> Optional[Chunk]:
+        """Load a chunk from its region file, falling back to per-chunk files"""
+        chunk = Chunk(chunk_x, chunk_y, self.world_seed)
+        
+        region = self.get_region(chunk_x, chunk_y, create=False)
+        if region:
+            payload = region.read_chunk(chunk_x, chunk_y)
+            if payload:
+                try:
+                    chunk.from_bytes(payload)
+                    return chunk
+                except (ValueError, KeyError, IndexError, struct.error):
+                    print(f"Warning: Corrupt chunk ({chunk_x}, {chunk_y}) in {region.path}")
+        
+        # Worlds saved before region files keep one file per chunk
+        if chunk.load_from_file(self.world_dir):
+            self.loose_chunks.add((chunk_x, chunk_y))
+            return chunk
+        
+        return None
+    
+    def save_chunk(self, chunk: Chunk):
+        """Save a chunk into its region file"""
+        region = self.get_region(chunk.chunk_x, chunk.chunk_y)
+        region.write_chunk(chunk.chunk_x, chunk.chunk_y, chunk.to_bytes())
+        
+        # Drop the per-chunk file once the region holds the chunk
+        chunk_key = (chunk.chunk_x, chunk.chunk_y)
+        if chunk_key in self.loose_chunks:
+            self.loose_chunks.discard(chunk_key)
+            for filename in (chunk.get_filename(self.world_dir), chunk.get_legacy_filename(self.world_dir)):
+                if os.path.exists(filename):
+                    os.remove(filename)
+    
+    def compact_regions(self, background: bool = True):
+        """
+        Compact region files whose dead space exceeds the compaction threshold
+        
+        Args:
+            background: Run on a worker thread instead of blocking the caller
+        """
+        if self._compaction_thread and self._compaction_thread.is_alive():
+            return
+        
+        regions = list(self.regions.values())
+        
+        def compact():
+            for region in regions:
+                if region.waste_ratio() > self.compaction_threshold:
+                    region.compact()
+        
+        if background:
+            self._compaction_thread = threading.Thread(target=compact, name="RegionCompaction", daemon=True)
+            self._compaction_thread.start()
+        else:
+            compact()
+    
     def get_tile(self, world_x: int, world_y: int) -> Optional[int]:
-        """Get tile at world coordinates"""
+        """Get tile at world coordinates (None while the chunk is pending)"""
         chunk_x, chunk_y = self.world_to_chunk_coords(world_x, world_y)
-        chunk = self.get_chunk(chunk_x, chunk_y)
+        chunk = self.get_chunk(chunk_x, chunk_y, blocking=False)
         
         if not chunk:
             return None
@@ -88,9 +499,9 @@ class ChunkManager:
         return chunk.get_tile(local_x, local_y)
     
     def get_biome(self, world_x: int, world_y: int) -> Optional[str]:
-        """Get biome at world coordinates"""
+        """Get biome at world coordinates (None while the chunk is pending)"""
         chunk_x, chunk_y = self.world_to_chunk_coords(world_x, world_y)
-        chunk = self.get_chunk(chunk_x, chunk_y)
+        chunk = self.get_chunk(chunk_x, chunk_y, blocking=False)
         
         if not chunk:
             return None
@@ -100,6 +511,42 @@ class ChunkManager:
         
         return chunk.get_biome(local_x, local_y)
     
+    def get_building_at(self, world_x: int, world_y: int) -> Optional[Dict]:
+        """Get the building record covering a world tile (None if none or the chunk is pending)"""
+        chunk_x, chunk_y = self.world_to_chunk_coords(world_x, world_y)
+        chunk = self.get_chunk(chunk_x, chunk_y, blocking=False)
+        
+        if not chunk:
+            return None
+        
+        local_x = world_x - (chunk_x * Chunk.CHUNK_SIZE)
+        local_y = world_y - (chunk_y * Chunk.CHUNK_SIZE)
+        
+        return chunk.get_building_at(local_x, local_y)
+    
+    def get_buildings_near(self, world_x: int, world_y: int, radius: int) -> List[Dict]:
+        """
+        Get building records whose footprint is within radius tiles of a world tile
+        
+        Buildings never straddle chunks, so only the loaded chunks the search
+        square touches are checked.
+        """
+        min_chunk_x, min_chunk_y = self.world_to_chunk_coords(world_x - radius, world_y - radius)
+        max_chunk_x, max_chunk_y = self.world_to_chunk_coords(world_x + radius, world_y + radius)
+        
+        buildings = []
+        for chunk_y in range(min_chunk_y, max_chunk_y + 1):
+            for chunk_x in range(min_chunk_x, max_chunk_x + 1):
+                chunk = self.loaded_chunks.get((chunk_x, chunk_y))
+                if not chunk:
+                    continue
+                for building in chunk.buildings:
+                    min_x, min_y, max_x, max_y = building['bounds']
+                    if (min_x - radius <= world_x <= max_x + radius and
+                            min_y - radius <= world_y <= max_y + radius):
+                        buildings.append(building)
+        return buildings
+    
     def set_tile(self, world_x: int, world_y: int, tile_type: int):
         """Set tile at world coordinates"""
         chunk_x, chunk_y = self.world_to_chunk_coords(world_x, world_y)
@@ -110,13 +557,20 @@ class ChunkManager:
             local_y = world_y - (chunk_y * Chunk.CHUNK_SIZE)
             chunk.set_tile(local_x, local_y, tile_type)
             
+            for listener in self.tile_listeners:
+                listener.tile_changed(world_x, world_y, tile_type)
+            
             # Save chunk after modification
-            chunk.save_to_file(self.world_dir)
+            self.save_chunk(chunk)
     
     def update_loaded_chunks(self, player_x: float, player_y: float):
         """Update which chunks are loaded based on player position"""
         player_chunk_x, player_chunk_y = self.world_to_chunk_coords(player_x, player_y)
         
+        if self.async_generation:
+            self.install_generated_chunks()
+            self._update_player_heading(player_x, player_y)
+        
         # Determine which chunks should be loaded
         chunks_to_load: Set[Tuple[int, int]] = set()
         for dx in range(-self.load_radius, self.load_radius + 1):
@@ -129,7 +583,14 @@ class ChunkManager:
         for chunk_key in chunks_to_load:
             if chunk_key not in self.loaded_chunks:
                 chunk_x, chunk_y = chunk_key
-                self.get_chunk(chunk_x, chunk_y)
+                self.get_chunk(chunk_x, chunk_y, blocking=False)
+        
+        if self.async_generation:
+            # Drop queued chunks the player has moved away from and re-prioritise the rest
+            self.generation_queue = [key for key in self.generation_queue
+                                     if max(abs(key[0] - player_chunk_x), abs(key[1] - player_chunk_y)) <= self.unload_radius]
+            self.generation_queue.sort(key=lambda key: self._chunk_priority(key, player_chunk_x, player_chunk_y))
+            self._submit_queued_chunks()
         
         # Unload distant chunks
         chunks_to_unload = []
@@ -142,9 +603,22 @@ class ChunkManager:
         
         for chunk_key in chunks_to_unload:
             chunk = self.loaded_chunks[chunk_key]
-            chunk.save_to_file(self.world_dir)  # Save before unloading
+            self.save_chunk(chunk)  # Save before unloading
             chunk.unload()
             del self.loaded_chunks[chunk_key]
+        
+        if chunks_to_unload:
+            self.compact_regions()
+    
+    def _update_player_heading(self, player_x: float, player_y: float):
+        """Track the player's movement direction for generation prioritisation"""
+        if self.last_player_position:
+            dx = player_x - self.last_player_position[0]
+            dy = player_y - self.last_player_position[1]
+            distance = math.hypot(dx, dy)
+            if distance > 0.01:
+                self.player_heading = (dx / distance, dy / distance)
+        self.last_player_position = (player_x, player_y)
     
     def get_loaded_chunks(self) -> List[Chunk]:
         """Get all currently loaded chunks"""
@@ -161,7 +635,7 @@ class ChunkManager:
         # Check all chunks in range
         for chunk_x in range(min_chunk_x, max_chunk_x + 1):
             for chunk_y in range(min_chunk_y, max_chunk_y + 1):
-                chunk = self.get_chunk(chunk_x, chunk_y)
+                chunk = self.get_chunk(chunk_x, chunk_y, blocking=False)  # Pending chunks have no entities yet
                 if chunk:
                     # Add chunk offset to entity positions
                     chunk_world_x, chunk_world_y = self.chunk_to_world_coords(chunk_x, chunk_y)
@@ -181,22 +655,52 @@ class ChunkManager:
         
         if chunk:
             chunk.remove_entity(entity_id)
-            chunk.save_to_file(self.world_dir)  # Save immediately
+            self.save_chunk(chunk)  # Save immediately
             print(f"Removed entity {entity_id} from chunk ({chunk_x}, {chunk_y})")
     
     def save_all_chunks(self):
         """Save all loaded chunks to disk"""
         for chunk in self.loaded_chunks.values():
-            chunk.save_to_file(self.world_dir)
+            self.save_chunk(chunk)
+    
+    def close(self):
+        """Stop background work and close all region files"""
+        if self._executor:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        self.pending_chunks.clear()
+        self.generation_queue.clear()
+        if self._compaction_thread:
+            self._compaction_thread.join()
+        for region in self.regions.values():
+            region.close()
+        self.regions.clear()
     
     def get_world_info(self) -> Dict:
         """Get information about the world"""
-        chunk_files = [f for f in os.listdir(self.world_dir) if f.startswith('chunk_') and f.endswith('.json')]
+        generated_chunks: Set[Tuple[int, int]] = set()
+        
+        for filename in os.listdir(self.world_dir):
+            name, extension = os.path.splitext(filename)
+            parts = name.split('_')
+            if len(parts) != 3:
+                continue
+            
+            if parts[0] == 'region' and extension == '.region':
+                # Count chunks from the region header rather than the payloads
+                region_x, region_y = int(parts[1]), int(parts[2])
+                base_x, base_y = region_x * RegionFile.REGION_SIZE, region_y * RegionFile.REGION_SIZE
+                region = self.get_region(base_x, base_y, create=False)
+                if region:
+                    generated_chunks.update((base_x + x, base_y + y) for x, y in region.stored_chunks())
+            elif parts[0] == 'chunk' and extension in ('.chunk', '.json'):
+                # Worlds saved before region files may still hold per-chunk files
+                generated_chunks.add((int(parts[1]), int(parts[2])))
         
         return {
             'world_name': self.world_name,
             'world_seed': self.world_seed,
-            'total_chunks_generated': len(chunk_files),
+            'total_chunks_generated': len(generated_chunks),
             'loaded_chunks': len(self.loaded_chunks),
             'world_directory': self.world_dir
         }
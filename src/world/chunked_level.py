@@ -5,6 +5,7 @@ Level implementation that uses the chunk system
 from typing import List, Dict, Any, Optional
 from ..level.level_base import LevelBase
 from .chunk_manager import ChunkManager
+from .entity_residency import EntityResidencyManager
 
 
 class ChunkedLevel(LevelBase):
@@ -25,6 +26,9 @@ class ChunkedLevel(LevelBase):
         self.world_seed = world_seed or 12345
         self.chunk_manager = ChunkManager(self.world_seed, f"world_{self.world_seed}")
         
+        # Live entities for the chunks around the player
+        self.entity_residency = EntityResidencyManager(self, self.chunk_manager, self.create_entity_from_data)
+        
         # Override tile access methods to use chunks
         self._original_tiles = None  # Don't use the base class tiles array
         
@@ -59,106 +63,100 @@ class ChunkedLevel(LevelBase):
         super().update()
     
     def update_entities_from_chunks(self):
-        """Update entity lists from loaded chunks"""
-        # Get entities near player
-        entities = self.chunk_manager.get_entities_in_area(
-            self.player.x, self.player.y, radius=100
-        )
-        
-        # Clear existing objects, NPCs, and enemies (they'll be repopulated from chunks)
-        self.objects = []
+        """Add entities for chunks entering the radius around the player and drop those leaving it"""
+        if not hasattr(self, 'objects'):
+            self.objects = []
         if not hasattr(self, 'npcs'):
             self.npcs = []
-        else:
-            self.npcs.clear()
-        
         if not hasattr(self, 'enemies'):
             self.enemies = []
-        else:
-            self.enemies.clear()
         
-        # Convert chunk entities back to game entities
-        for entity_data in entities:
-            if entity_data['type'] == 'object':
-                try:
-                    from ..entities.base import Entity
-                    obj = Entity(
-                        entity_data['world_x'], 
-                        entity_data['world_y'],
-                        entity_data['name'],
-                        entity_type="object",
-                        blocks_movement=True,
-                        asset_loader=self.asset_loader
-                    )
-                    self.objects.append(obj)
-                except Exception as e:
-                    print(f"Warning: Failed to create object entity: {e}")
-            
-            elif entity_data['type'] == 'npc':
-                try:
-                    print(f"🏗️  Creating NPC from entity_data:")
-                    print(f"   - Name: {entity_data.get('name', 'UNKNOWN')}")
-                    print(f"   - Position: ({entity_data.get('world_x', 'N/A')}, {entity_data.get('world_y', 'N/A')})")
-                    print(f"   - Has is_background: {'is_background' in entity_data}")
-                    if 'is_background' in entity_data:
-                        print(f"   - is_background value: {entity_data['is_background']}")
-                    print(f"   - Has building: {'building' in entity_data}")
-                    print(f"   - Has shop: {'has_shop' in entity_data}")
-                    
-                    from ..entities.npc import NPC
-                    npc = NPC(
-                        entity_data['world_x'],
-                        entity_data['world_y'], 
-                        entity_data['name'],
-                        asset_loader=self.asset_loader,
-                        auto_create_sprite=False  # We'll create it after setting properties
-                    )
-                    print(f"   ✅ NPC object created: {npc.name}")
-                    
-                    # Set additional NPC properties
-                    if 'building' in entity_data:
-                        npc.building = entity_data['building']
-                        print(f"   🏠 Set building: {npc.building}")
-                    if 'has_shop' in entity_data:
-                        npc.has_shop = entity_data['has_shop']
-                        print(f"   🛒 Set has_shop: {npc.has_shop}")
-                    if 'is_background' in entity_data:
-                        npc.is_background = entity_data['is_background']
-                        print(f"   🎭 Set is_background: {npc.is_background}")
-                    
-                    # Now create the sprite with all properties set
-                    print(f"   🎨 Creating sprite for NPC...")
-                    npc.create_npc_sprite()
-                    print(f"   ✅ Sprite created successfully")
-                    
-                    self.npcs.append(npc)
-                    print(f"   📋 Added NPC to level: {npc.name}")
-                except Exception as e:
-                    print(f"   ❌ Warning: Failed to create NPC entity: {e}")
-                    import traceback
-                    traceback.print_exc()
-            
-            elif entity_data['type'] == 'enemy':
-                try:
-                    from ..entities.enemy import Enemy
-                    enemy = Enemy(
-                        entity_data['world_x'],
-                        entity_data['world_y'],
-                        entity_data['name'],
-                        asset_loader=self.asset_loader
-                    )
-                    # Set additional enemy properties from saved data
-                    if 'health' in entity_data:
-                        enemy.health = entity_data['health']
-                        enemy.max_health = entity_data.get('max_health', entity_data['health'])
-                    if 'damage' in entity_data:
-                        enemy.damage = entity_data['damage']
-                    if 'id' in entity_data:
-                        enemy.entity_id = entity_data['id']
-                    
-                    self.enemies.append(enemy)
-                except Exception as e:
-                    print(f"Warning: Failed to create enemy entity: {e}")
+        self.entity_residency.update(self.player.x, self.player.y)
+    
+    def create_entity_from_data(self, entity_data: Dict, world_x: float, world_y: float):
+        """Convert a chunk entity back to a game entity"""
+        if entity_data['type'] == 'object':
+            try:
+                from ..entities.base import Entity
+                obj = Entity(
+                    world_x, 
+                    world_y,
+                    entity_data['name'],
+                    entity_type="object",
+                    blocks_movement=True,
+                    asset_loader=self.asset_loader
+                )
+                return obj
+            except Exception as e:
+                print(f"Warning: Failed to create object entity: {e}")
+        
+        elif entity_data['type'] == 'npc':
+            try:
+                print(f"🏗️  Creating NPC from entity_data:")
+                print(f"   - Name: {entity_data.get('name', 'UNKNOWN')}")
+                print(f"   - Position: ({world_x}, {world_y})")
+                print(f"   - Has is_background: {'is_background' in entity_data}")
+                if 'is_background' in entity_data:
+                    print(f"   - is_background value: {entity_data['is_background']}")
+                print(f"   - Has building: {'building' in entity_data}")
+                print(f"   - Has shop: {'has_shop' in entity_data}")
+                
+                from ..entities.npc import NPC
+                npc = NPC(
+                    world_x,
+                    world_y, 
+                    entity_data['name'],
+                    asset_loader=self.asset_loader,
+                    auto_create_sprite=False  # We'll create it after setting properties
+                )
+                print(f"   ✅ NPC object created: {npc.name}")
+                
+                # Set additional NPC properties
+                if 'building' in entity_data:
+                    npc.building = entity_data['building']
+                    print(f"   🏠 Set building: {npc.building}")
+                if 'has_shop' in entity_data:
+                    npc.has_shop = entity_data['has_shop']
+                    print(f"   🛒 Set has_shop: {npc.has_shop}")
+                if 'is_background' in entity_data:
+                    npc.is_background = entity_data['is_background']
+                    print(f"   🎭 Set is_background: {npc.is_background}")
+                
+                # Now create the sprite with all properties set
+                print(f"   🎨 Creating sprite for NPC...")
+                npc.create_npc_sprite()
+                print(f"   ✅ Sprite created successfully")
+                
+                print(f"   📋 Added NPC to level: {npc.name}")
+                return npc
+            except Exception as e:
+                print(f"   ❌ Warning: Failed to create NPC entity: {e}")
+                import traceback
+                traceback.print_exc()
+        
+        elif entity_data['type'] == 'enemy':
+            try:
+                from ..entities.enemy import Enemy
+                enemy = Enemy(
+                    world_x,
+                    world_y,
+                    entity_data['name'],
+                    asset_loader=self.asset_loader
+                )
+                # Set additional enemy properties from saved data
+                if 'health' in entity_data:
+                    enemy.health = entity_data['health']
+                    enemy.max_health = entity_data.get('max_health', entity_data['health'])
+                if 'damage' in entity_data:
+                    enemy.damage = entity_data['damage']
+                if 'id' in entity_data:
+                    enemy.entity_id = entity_data['id']
+                
+                return enemy
+            except Exception as e:
+                print(f"Warning: Failed to create enemy entity: {e}")
+        
+        return None
     
     def get_walkable(self, x: int, y: int) -> float:
         """Get walkability at world coordinates"""
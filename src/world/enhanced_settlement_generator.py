@@ -8,6 +8,7 @@ import math
 from typing import List, Dict, Tuple, Optional, Any, Set
 from dataclasses import dataclass
 from .building_template_manager import BuildingTemplateManager, BuildingTemplate
+from ..procedural_generation.src.seeding import derive_seed, make_rng
 
 
 class BuildingRegistry:
@@ -207,8 +208,7 @@ class EnhancedSettlementGenerator:
             Settlement data with buildings, NPCs, and layout information
         """
         # Create deterministic random for this settlement
-        settlement_seed = hash((self.world_seed, chunk_x, chunk_y, settlement_type)) % (2**31)
-        settlement_random = random.Random(settlement_seed)
+        settlement_random = make_rng(self.world_seed, chunk_x, chunk_y, settlement_type)
         
         # Select layout template
         layout_options = self.SETTLEMENT_LAYOUTS.get(settlement_type, ['medium_village'])
@@ -493,7 +493,7 @@ class EnhancedSettlementGenerator:
             # Select appropriate template
             template = self.building_manager.select_random_template(
                 building_type, size_category, biome, 
-                seed=hash((settlement_type, i, building_type)) % (2**31)
+                seed=derive_seed(settlement_type, i, building_type)
             )
             
             if template:
@@ -0,0 +1,245 @@
+"""
+Entity residency for chunk-based levels
+
+Keeps the live game objects for the chunks around the player. Entities are
+instantiated only when their chunk enters the residency radius and dropped
+only when it leaves, so NPC sessions, AI and combat state survive updates.
+"""
+
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+ChunkKey = Tuple[int, int]
+
+# Level list that holds each entity type
+ENTITY_LISTS = {
+    'npc': 'npcs',
+    'enemy': 'enemies',
+    'object': 'objects',
+    'chest': 'chests',
+    'item': 'items',
+    'furniture': 'furniture'
+}
+
+
+class EntityResidencyManager:
+    """
+    Tracks which chunks have their entities resident in a level
+
+    The level keeps its usual entity lists (npcs, enemies, ...). This manager
+    adds to and removes from them per chunk, remembering which live object
+    came from which chunk entity id. Listeners with entity_added(list_name,
+    entity) and entity_removed(list_name, entity) methods are told about
+    every change.
+    """
+
+    def __init__(self, level, chunk_manager, create_entity: Callable, radius: int = 2):
+        """
+        Initialize residency manager
+
+        Args:
+            level: Level owning the entity lists
+            chunk_manager: ChunkManager providing chunks
+            create_entity: Callable(entity_data, world_x, world_y) returning a game object or None
+            radius: Chunk radius kept resident around the player
+        """
+        self.level = level
+        self.chunk_manager = chunk_manager
+        self.create_entity = create_entity
+        self.radius = radius
+
+        # chunk key -> {entity id: (list name, game object, chunk entity data)}
+        self.resident_chunks: Dict[ChunkKey, Dict[str, Tuple[str, object, Dict]]] = {}
+        # Chunks in the radius whose data was not ready at the last update
+        self.pending_chunks: Set[ChunkKey] = set()
+        self.center: Optional[ChunkKey] = None
+
+        self.listeners: List[object] = []
+
+    def update(self, world_x: float, world_y: float, blocking: bool = False) -> bool:
+        """
+        Bring residency in line with the player's position
+
+        Moves within the same chunk return immediately unless a chunk in the
+        radius is still waiting for generation.
+
+        Args:
+            world_x: Player world X position
+            world_y: Player world Y position
+            blocking: Wait for chunks that are still being generated
+
+        Returns:
+            True if any entities were added or removed
+        """
+        center = self.chunk_manager.world_to_chunk_coords(world_x, world_y)
+        if center == self.center and not self.pending_chunks:
+            return False
+
+        changed = False
+        if center != self.center:
+            self.center = center
+            wanted = self.chunks_in_radius(center)
+
+            leaving = [key for key in self.resident_chunks if key not in wanted]
+            if leaving:
+                self.evict_chunks(leaving)
+                changed = True
+
+            self.pending_chunks = {key for key in wanted if key not in self.resident_chunks}
+
+        for key in sorted(self.pending_chunks, key=lambda k: abs(k[0] - center[0]) + abs(k[1] - center[1])):
+            chunk = self.chunk_manager.get_chunk(key[0], key[1], blocking=blocking)
+            if chunk is None:
+                continue
+            self.admit_chunk(chunk)
+            self.pending_chunks.discard(key)
+            changed = True
+
+        return changed
+
+    def chunks_in_radius(self, center: ChunkKey) -> Set[ChunkKey]:
+        """Chunk keys within the residency radius of a center chunk"""
+        center_x, center_y = center
+        return {
+            (chunk_x, chunk_y)
+            for chunk_y in range(center_y - self.radius, center_y + self.radius + 1)
+            for chunk_x in range(center_x - self.radius, center_x + self.radius + 1)
+        }
+
+    def admit_chunk(self, chunk) -> int:
+        """
+        Instantiate a chunk's entities and add them to the level lists
+
+        Args:
+            chunk: Loaded chunk
+
+        Returns:
+            Number of entities added
+        """
+        key = (chunk.chunk_x, chunk.chunk_y)
+        if key in self.resident_chunks:
+            return 0
+
+        chunk_world_x = chunk.chunk_x * chunk.CHUNK_SIZE
+        chunk_world_y = chunk.chunk_y * chunk.CHUNK_SIZE
+        residents = {}
+
+        for index, entity_data in enumerate(chunk.entities):
+            list_name = ENTITY_LISTS.get(entity_data.get('type'))
+            if list_name is None:
+                continue
+
+            entity_id = self.entity_id(entity_data, key, index)
+            if entity_id in residents:
+                entity_id = f"{entity_id}#{index}"
+
+            world_x = entity_data['x'] + chunk_world_x
+            world_y = entity_data['y'] + chunk_world_y
+            entity = self.create_entity(entity_data, world_x, world_y)
+            if entity is None:
+                continue
+
+            getattr(self.level, list_name).append(entity)
+            residents[entity_id] = (list_name, entity, entity_data)
+            for listener in self.listeners:
+                listener.entity_added(list_name, entity)
+
+        self.resident_chunks[key] = residents
+        return len(residents)
+
+    def evict_chunks(self, keys: List[ChunkKey]):
+        """
+        Remove the entities of several chunks from the level lists
+
+        Args:
+            keys: Chunk keys to evict
+        """
+        removed_by_list: Dict[str, Set[int]] = {}
+        for key in keys:
+            residents = self.resident_chunks.pop(key, None)
+            if not residents:
+                continue
+            for list_name, entity, _ in residents.values():
+                removed_by_list.setdefault(list_name, set()).add(id(entity))
+                for listener in self.listeners:
+                    listener.entity_removed(list_name, entity)
+
+        # Filter each list once, in place so other references stay valid
+        for list_name, removed_ids in removed_by_list.items():
+            entities = getattr(self.level, list_name)
+            entities[:] = [entity for entity in entities if id(entity) not in removed_ids]
+
+    def remove_entity(self, entity) -> bool:
+        """
+        Remove a resident entity for good - from its level list and from its chunk's data
+
+        Used when an entity is destroyed (a killed enemy), so re-admitting
+        its chunk doesn't bring it back. The chunk is saved straight away.
+
+        Args:
+            entity: Live game object
+
+        Returns:
+            True if the entity was resident and has been removed
+        """
+        for key, residents in self.resident_chunks.items():
+            for entity_id, (list_name, resident, entity_data) in residents.items():
+                if resident is entity:
+                    break
+            else:
+                continue
+
+            del residents[entity_id]
+            entities = getattr(self.level, list_name)
+            if entity in entities:
+                entities.remove(entity)
+            for listener in self.listeners:
+                listener.entity_removed(list_name, entity)
+
+            chunk = self.chunk_manager.get_chunk(key[0], key[1])
+            if chunk is not None and entity_data in chunk.entities:
+                chunk.entities.remove(entity_data)
+                self.chunk_manager.save_chunk(chunk)
+            return True
+        return False
+
+    def invalidate_chunk(self, chunk_x: int, chunk_y: int):
+        """
+        Drop a chunk's live entities so they are rebuilt from chunk data
+
+        Args:
+            chunk_x: Chunk X coordinate
+            chunk_y: Chunk Y coordinate
+        """
+        key = (chunk_x, chunk_y)
+        self.evict_chunks([key])
+        if self.center is not None and key in self.chunks_in_radius(self.center):
+            self.pending_chunks.add(key)
+
+    def clear(self):
+        """Forget all residency (the level lists are left to the caller)"""
+        self.resident_chunks.clear()
+        self.pending_chunks.clear()
+        self.center = None
+
+    def get_resident_entities(self, chunk_x: int, chunk_y: int) -> List[object]:
+        """Live game objects that came from a chunk"""
+        residents = self.resident_chunks.get((chunk_x, chunk_y), {})
+        return [entity for _, entity, _ in residents.values()]
+
+    @staticmethod
+    def entity_id(entity_data: Dict, chunk_key: ChunkKey, index: int) -> str:
+        """
+        Stable identifier for a chunk entity
+
+        Args:
+            entity_data: Entity dictionary from the chunk
+            chunk_key: Chunk the entity belongs to
+            index: Position in the chunk's entity list
+
+        Returns:
+            The entity's own id, or one derived from its chunk and position
+        """
+        entity_id = entity_data.get('id')
+        if entity_id:
+            return str(entity_id)
+        return f"{entity_data.get('type')}_{chunk_key[0]}_{chunk_key[1]}_{index}"
@@ -7,6 +7,7 @@ import random
 from typing import List, Dict, Any, Optional
 from .enhanced_settlement_generator import EnhancedSettlementGenerator
 from .settlement_manager import ChunkSettlementManager
+from ..procedural_generation.src.seeding import derive_seed
 
 
 class SettlementIntegrator:
@@ -19,6 +20,7 @@ class SettlementIntegrator:
         self.width = width
         self.height = height
         self.seed = seed
+        self.rng = random.Random(seed)
         
         # Initialize both generators
         self.enhanced_generator = EnhancedSettlementGenerator(width, height, seed)
@@ -73,7 +75,7 @@ class SettlementIntegrator:
                     
                     # Generate enhanced settlement
                     settlement_info = self.enhanced_generator.generate_enhanced_settlement(
-                        tiles, start_x, start_y, settlement_type, biome, seed=hash((start_x, start_y, settlement_type)) % (2**31)
+                        tiles, start_x, start_y, settlement_type, biome, seed=derive_seed(start_x, start_y, settlement_type)
                     )
                     
                     if settlement_info:
@@ -118,8 +120,8 @@ class SettlementIntegrator:
         # Try to find suitable locations
         for attempt in range(100):
             # Random position with margins
-            x = random.randint(10, self.width - required_width - 10)
-            y = random.randint(10, self.height - required_height - 10)
+            x = self.rng.randint(10, self.width - required_width - 10)
+            y = self.rng.randint(10, self.height - required_height - 10)
             
             # Check biome compatibility
             center_biome = biome_map[y + required_height // 2][x + required_width // 2]
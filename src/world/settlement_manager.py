@@ -3,9 +3,9 @@ Settlement manager for chunk-based worlds
 Handles settlement placement across infinite worlds with proper density
 """
 
-import random
 import math
 from typing import List, Dict, Tuple, Optional, Any
+from ..procedural_generation.src.seeding import make_rng
 
 
 class ChunkSettlementManager:
@@ -161,8 +161,7 @@ class ChunkSettlementManager:
             Settlement type to generate, or None
         """
         # Create deterministic random for this chunk
-        chunk_seed = hash((self.world_seed, chunk_x, chunk_y, "settlement")) % (2**31)
-        chunk_random = random.Random(chunk_seed)
+        chunk_random = make_rng(self.world_seed, chunk_x, chunk_y, "settlement")
         
         # Find dominant biome in chunk
         if not biome_data:
@@ -204,8 +203,7 @@ class ChunkSettlementManager:
         config = self.SETTLEMENT_TEMPLATES[settlement_type]
         
         # Create deterministic random for this settlement
-        settlement_seed = hash((self.world_seed, chunk_x, chunk_y, settlement_type)) % (2**31)
-        settlement_random = random.Random(settlement_seed)
+        settlement_random = make_rng(self.world_seed, chunk_x, chunk_y, settlement_type)
         
         # Calculate world position within chunk (center-ish)
         chunk_size = 64  # From Chunk.CHUNK_SIZE
@@ -7,7 +7,9 @@ import math
 from typing import List, Dict, Any, Tuple
 from ..procedural_generation.src.biome_generator import BiomeGenerator
 from ..procedural_generation.src.enhanced_entity_spawner import EnhancedEntitySpawner
+from ..procedural_generation.src.seeding import derive_seed, make_rng
 from .chunk import Chunk
+from .building_registry import make_building_record
 from .settlement_manager import ChunkSettlementManager
 from .enhanced_settlement_generator import EnhancedSettlementGenerator
 from .settlement_patterns import SettlementPatternGenerator
@@ -29,7 +31,6 @@ class WorldGenerator:
         self.settlement_manager = ChunkSettlementManager(world_seed)
         self.enhanced_settlement_generator = EnhancedSettlementGenerator(world_seed)  # Add enhanced generator
         self.pattern_generator = SettlementPatternGenerator()
-        random.seed(world_seed)
         
     def generate_chunk(self, chunk_x: int, chunk_y: int, asset_loader=None) -> Chunk:
         """
@@ -45,7 +46,7 @@ class WorldGenerator:
         chunk = Chunk(chunk_x, chunk_y, self.world_seed)
         
         # Create chunk-specific seed based on world seed and chunk position
-        chunk_seed = hash((self.world_seed, chunk_x, chunk_y)) % (2**31)
+        chunk_seed = self.get_chunk_seed(chunk_x, chunk_y)
         
         print(f"🌍 Generating chunk ({chunk_x}, {chunk_y})...")
         
@@ -62,44 +63,43 @@ class WorldGenerator:
         # STEP 2: Generate base entities (objects and enemies)
         entity_spawner = EnhancedEntitySpawner(Chunk.CHUNK_SIZE, Chunk.CHUNK_SIZE, chunk_seed)
         
-        # Generate objects for this chunk
+        # Plan objects for this chunk - entities are only created when the chunk becomes resident
         try:
-            objects = entity_spawner.spawn_objects(chunk.tiles, chunk.biomes, [], asset_loader)
+            objects = entity_spawner.plan_objects(chunk.tiles, chunk.biomes, [])
             for obj in objects:
-                entity_data = {
+                chunk.add_entity({
                     'type': 'object',
-                    'name': obj.name if hasattr(obj, 'name') else 'Unknown',
-                    'x': obj.x if hasattr(obj, 'x') else 0,
-                    'y': obj.y if hasattr(obj, 'y') else 0,
-                    'id': f"{obj.name}_{obj.x}_{obj.y}" if hasattr(obj, 'name') and hasattr(obj, 'x') and hasattr(obj, 'y') else f"obj_{len(chunk.entities)}"
-                }
-                chunk.add_entity(entity_data)
+                    'name': obj.name,
+                    'x': obj.x,
+                    'y': obj.y,
+                    'id': f"{obj.name}_{obj.x}_{obj.y}"
+                })
             
-            # Generate enemies for this chunk
-            enemies = entity_spawner.spawn_enemies(chunk.tiles, chunk.biomes, [], asset_loader)
+            # Plan enemies for this chunk
+            enemies = entity_spawner.plan_enemies(chunk.tiles, chunk.biomes, [])
             for enemy in enemies[:10]:
                 entity_data = {
                     'type': 'enemy',
-                    'name': enemy.name if hasattr(enemy, 'name') else 'Enemy',
-                    'x': enemy.x if hasattr(enemy, 'x') else 0,
-                    'y': enemy.y if hasattr(enemy, 'y') else 0,
-                    'health': enemy.health if hasattr(enemy, 'health') else 100,
-                    'damage': enemy.damage if hasattr(enemy, 'damage') else 10,
-                    'id': f"{enemy.name}_{enemy.x}_{enemy.y}" if hasattr(enemy, 'name') and hasattr(enemy, 'x') and hasattr(enemy, 'y') else f"enemy_{len(chunk.entities)}"
+                    'name': enemy.name,
+                    'x': enemy.x,
+                    'y': enemy.y,
+                    'health': enemy.health,
+                    'damage': enemy.damage,
+                    'id': f"{enemy.name}_{enemy.x}_{enemy.y}"
                 }
                 
-                # Check if this is a ranged enemy and store ranged-specific data
-                if hasattr(enemy, 'weapon_type'):
+                # Store ranged-specific data for ranged enemies
+                if enemy.weapon:
                     entity_data['enemy_subtype'] = 'ranged'
-                    entity_data['weapon_type'] = enemy.weapon_type
-                    print(f"  🏹 Storing ranged enemy: {enemy.name} with weapon {enemy.weapon_type}")
+                    entity_data['weapon_type'] = enemy.weapon
+                    print(f"  🏹 Storing ranged enemy: {enemy.name} with weapon {enemy.weapon}")
                 else:
                     entity_data['enemy_subtype'] = 'melee'
                     print(f"  ⚔️  Storing melee enemy: {enemy.name}")
                 
                 chunk.add_entity(entity_data)
             
-            print(f"  ✅ Generated {len(objects)} objects and {len(enemies)} enemies")
+            print(f"  ✅ Planned {len(objects)} objects and {len(enemies)} enemies")
             
         except Exception as e:
             print(f"  ⚠️  Warning: Entity generation failed: {e}")
@@ -201,6 +201,7 @@ class WorldGenerator:
             Number of buildings successfully placed
         """
         buildings_placed = 0
+        placed_footprints = []
         
         # Clear the settlement area first (but preserve some base terrain)
         settlement_width = settlement_data.get('width', 20)
@@ -231,16 +232,28 @@ class WorldGenerator:
                     )
                     if tiles_placed > 0:
                         buildings_placed += 1
+                        placed_footprints.append((building_data['template_name'], chunk_x, chunk_y,
+                                                  min(len(building_tiles[0]), Chunk.CHUNK_SIZE - chunk_x),
+                                                  min(len(building_tiles), Chunk.CHUNK_SIZE - chunk_y)))
                         print(f"    🏠 Applied {building_data['template_name']} template at ({chunk_x}, {chunk_y}) - {tiles_placed} tiles")
                 else:
                     # Fallback to basic building if no template tiles
-                    settlement_random = random.Random(hash((self.world_seed, chunk.chunk_x, chunk.chunk_y, building_data['template_name'])))
+                    settlement_random = make_rng(self.world_seed, chunk.chunk_x, chunk.chunk_y, building_data['template_name'])
                     tiles_placed = self._create_building_on_chunk(chunk, chunk_x, chunk_y, 
                                                                 building_width, building_height, settlement_random)
                     if tiles_placed > 0:
                         buildings_placed += 1
+                        placed_footprints.append((building_data['template_name'], chunk_x, chunk_y,
+                                                  building_width, building_height))
                         print(f"    🏠 Created fallback building at ({chunk_x}, {chunk_y}) - {tiles_placed} tiles")
         
+        # Record the buildings once all are placed, so overlaps don't leave stale doors
+        origin = chunk.get_world_bounds()[:2]
+        for index, (name, chunk_x, chunk_y, width, height) in enumerate(placed_footprints):
+            building_id = f"building_{chunk.chunk_x}_{chunk.chunk_y}_{index}"
+            chunk.add_building(make_building_record(building_id, name, chunk.tiles,
+                                                    chunk_x, chunk_y, width, height, origin))
+        
         return buildings_placed
     
     def _spawn_furniture_from_templates(self, chunk: Chunk, settlement_data: Dict[str, Any], 
@@ -606,7 +619,7 @@ class WorldGenerator:
         
         # Apply buildings from pattern
         buildings_placed = 0
-        settlement_random = random.Random(hash((self.world_seed, chunk.chunk_x, chunk.chunk_y, "pattern_buildings")))
+        settlement_random = make_rng(self.world_seed, chunk.chunk_x, chunk.chunk_y, "pattern_buildings")
         
         for building_info in pattern.get_building_positions():
             building_x = offset_x + building_info['x']
@@ -688,7 +701,7 @@ class WorldGenerator:
     
     def get_chunk_seed(self, chunk_x: int, chunk_y: int) -> int:
         """Get deterministic seed for a specific chunk"""
-        return hash((self.world_seed, chunk_x, chunk_y)) % (2**31)
+        return derive_seed(self.world_seed, chunk_x, chunk_y)
     
     def _place_settlement_buildings_on_chunk(self, chunk: Chunk, settlement_data: Dict[str, Any]) -> int:
         """
@@ -726,8 +739,7 @@ class WorldGenerator:
             print(f"      Adjusted settlement position: ({local_settlement_x}, {local_settlement_y})")
         
         # Create settlement seed for deterministic building placement
-        settlement_seed = hash((self.world_seed, chunk.chunk_x, chunk.chunk_y, "buildings")) % (2**31)
-        settlement_random = random.Random(settlement_seed)
+        settlement_random = make_rng(self.world_seed, chunk.chunk_x, chunk.chunk_y, "buildings")
         
         # FIXED: Place central stone area (smaller and guaranteed to fit)
         center_size = max(2, min(settlement_size) // 8)  # Smaller center, minimum 2x2
@@ -1041,7 +1053,7 @@ class WorldGenerator:
         return features_placed
     
     def _add_randomized_doors_to_chunk(self, chunk: Chunk, start_x: int, start_y: int, 
-                                      width: int, height: int) -> int:
+                                      width: int, height: int, building_random: random.Random) -> int:
         """
         Add doors to buildings with randomized placement on different sides
         
@@ -1049,6 +1061,7 @@ class WorldGenerator:
             chunk: Chunk to modify
             start_x, start_y: Building starting position
             width, height: Building dimensions
+            building_random: Random generator for this building
             
         Returns:
             Number of door tiles placed
@@ -1058,7 +1071,7 @@ class WorldGenerator:
         door_weights = [0.35, 0.2, 0.2, 0.25]  # Bottom slightly favored, but all sides possible
         
         # Choose a random side for the door
-        chosen_side = random.choices(door_sides, weights=door_weights)[0]
+        chosen_side = building_random.choices(door_sides, weights=door_weights)[0]
         
         # Place door based on chosen side
         if chosen_side == 'bottom':